@@ -2,17 +2,76 @@
 FastAPI application factory with common configurations and exception handlers.
 """
 import logging
+import zlib
+from typing import Callable
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 
+from consts.const import GZIP_REQUEST_MAX_BYTES
 from consts.exceptions import AppException, QuotaExceededError
 
 
 logger = logging.getLogger(__name__)
 
 
+class GZipRequest(Request):
+    """Request whose gzip-encoded body is decompressed incrementally, up to a size cap."""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            if self.headers.get("content-encoding", "").strip().lower() == "gzip":
+                self._body = await self._decompressed_body()
+            else:
+                self._body = await super().body()
+        return self._body
+
+    async def _decompressed_body(self) -> bytes:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        body = bytearray()
+        try:
+            async for chunk in self.stream():
+                data = chunk
+                while data:
+                    # Never inflate more than one byte past the cap
+                    body += decompressor.decompress(data, GZIP_REQUEST_MAX_BYTES - len(body) + 1)
+                    self._check_decompressed_size(body)
+                    data = decompressor.unconsumed_tail
+            body += decompressor.flush()
+        except zlib.error:
+            raise HTTPException(status_code=400, detail="Invalid gzip request body")
+        self._check_decompressed_size(body)
+        if not decompressor.eof:
+            raise HTTPException(status_code=400, detail="Invalid gzip request body")
+        return bytes(body)
+
+    @staticmethod
+    def _check_decompressed_size(body: bytearray) -> None:
+        if len(body) > GZIP_REQUEST_MAX_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Decompressed request body exceeds {GZIP_REQUEST_MAX_BYTES} bytes")
+
+
+class GZipRequestRoute(APIRoute):
+    """
+    Route class accepting gzip-encoded request bodies.
+
+    Data-process forward tasks compress large indexing payloads, so only the
+    routers they call use it: ``APIRouter(route_class=GZipRequestRoute)``.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def gzip_route_handler(request: Request) -> Response:
+            return await original_route_handler(GZipRequest(request.scope, request.receive))
+
+        return gzip_route_handler
+
+
 def create_app(
     title: str = "Nexent API",
     description: str = "",
@@ -64,6 +123,13 @@ def create_app(
         except ImportError:
             logger.warning("Monitoring utilities not available")
 
+    # Install the shared embedding and search result caches when the app starts serving
+    try:
+        from utils.cache_utils import init_caches
+        app.on_event("startup")(init_caches)
+    except ImportError:
+        logger.warning("Cache utilities not available")
+
     return app
 
 
@@ -10,6 +10,7 @@ from http import HTTPStatus
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Header, HTTPException, Query
+from nexent.monitor import get_monitoring_buffer
 from sqlalchemy import text
 
 from consts.const import (
@@ -20,6 +21,7 @@ from consts.const import (
 from consts.model import ConversationResponse
 from database.client import get_monitoring_db_session
 from utils.auth_utils import get_current_user_id
+from utils.cache_utils import get_cache_stats
 
 logger = logging.getLogger("monitoring_app")
 
@@ -147,3 +149,23 @@ async def get_monitoring_status_endpoint():
         message="success",
         data=get_monitoring_status(),
     )
+
+
+@router.get("/caches", response_model=ConversationResponse)
+async def get_cache_stats_endpoint():
+    """Return hit ratio and savings of the embedding and search result caches for sizing them."""
+    return ConversationResponse(
+        code=0,
+        message="success",
+        data=get_cache_stats(),
+    )
+
+
+@router.get("/record_buffer", response_model=ConversationResponse)
+async def get_record_buffer_stats_endpoint():
+    """Return monitoring record buffer depth and dropped/invalid/written record counters."""
+    return ConversationResponse(
+        code=0,
+        message="success",
+        data=get_monitoring_buffer().stats(),
+    )
@@ -24,12 +24,14 @@ from utils.auth_utils import get_current_user_id
 from utils.file_management_utils import get_all_files_status
 from database.knowledge_db import get_index_name_by_knowledge_name, get_knowledge_record
 from database.model_management_db import get_model_by_model_id
+from apps.app_factory import GZipRequestRoute
 from apps.permission_utils import (
     require_knowledge_base_edit_permission,
     require_knowledge_base_read_permission,
 )
 
-router = APIRouter(prefix="/indices")
+# Forward tasks send gzip-compressed indexing payloads to these routes
+router = APIRouter(prefix="/indices", route_class=GZipRequestRoute)
 service = ElasticSearchService()
 logger = logging.getLogger("vectordatabase_app")
 
@@ -465,6 +467,8 @@ def create_index_documents(
             None, alias="X-Task-Id", description="Task ID for progress tracking"),
         large_mode: bool = Query(
             False, description="Force large-batch path when current request chunk count is below threshold"),
+        skip_refresh: bool = Query(
+            False, description="Skip the index refresh; the caller refreshes once via POST /{index_name}/refresh"),
 ):
     """
     Index documents with embeddings, creating the index if it doesn't exist.
@@ -493,6 +497,7 @@ def create_index_documents(
             task_id=task_id,
             large_mode=large_mode,
             model_id=saved_embedding_model_id,
+            skip_refresh=skip_refresh,
         )
     except HTTPException:
         raise
@@ -526,6 +531,25 @@ async def get_index_files(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error indexing documents: {error_msg}")
 
 
+@router.post("/{index_name}/refresh")
+def refresh_index(
+        index_name: str = Path(..., description="Name of the index"),
+        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+        authorization: Optional[str] = Header(None),
+):
+    """Make documents indexed with skip_refresh searchable."""
+    try:
+        user_id, tenant_id = get_current_user_id(authorization)
+        require_knowledge_base_edit_permission(index_name, user_id, tenant_id)
+        return ElasticSearchService.refresh_index(index_name, vdb_core)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error refreshing index {index_name}: {str(e)}")
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error refreshing index: {str(e)}")
+
+
 @router.delete("/{index_name}/documents")
 async def delete_documents(
         index_name: str = Path(..., description="Name of the index"),
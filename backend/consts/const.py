@@ -28,6 +28,16 @@ ES_PASSWORD = os.getenv("ELASTIC_PASSWORD")
 ES_USERNAME = "elastic"
 ELASTICSEARCH_SERVICE = os.getenv("ELASTICSEARCH_SERVICE")
 
+# Embedding cache keyed by (model, dimension, sha256(text)); 0 entries disables it.
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "20000"))
+EMBEDDING_CACHE_REDIS_ENABLED = os.getenv("EMBEDDING_CACHE_REDIS_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_TTL_SECONDS = int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(7 * 86400)))
+
+# Knowledge-base search result cache, invalidated by per-index write generations; 0 entries disables it.
+SEARCH_RESULT_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_RESULT_CACHE_MAX_ENTRIES", "2000"))
+SEARCH_RESULT_CACHE_REDIS_ENABLED = os.getenv("SEARCH_RESULT_CACHE_REDIS_ENABLED", "true").lower() == "true"
+SEARCH_RESULT_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_RESULT_CACHE_TTL_SECONDS", "300"))
+
 # Data Processing Service Configuration
 DATA_PROCESS_SERVICE = os.getenv("DATA_PROCESS_SERVICE")
 CLIP_MODEL_PATH = os.getenv("CLIP_MODEL_PATH")
@@ -236,10 +246,20 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 RUNTIME_STATE_REDIS_URL = os.getenv("RUNTIME_STATE_REDIS_URL") or REDIS_URL
 RUNTIME_STREAM_TTL_SECONDS = int(os.getenv("RUNTIME_STREAM_TTL_SECONDS", "86400"))
 RUNTIME_STREAM_MAX_LEN = int(os.getenv("RUNTIME_STREAM_MAX_LEN", "10000"))
+# Stream chunks are pipelined to Redis in batches collected over this window.
+RUNTIME_STREAM_BATCH_WINDOW_SECONDS = float(os.getenv("RUNTIME_STREAM_BATCH_WINDOW_SECONDS", "0.05"))
+RUNTIME_STREAM_BATCH_MAX_SIZE = int(os.getenv("RUNTIME_STREAM_BATCH_MAX_SIZE", "200"))
 RUNTIME_RUN_TTL_SECONDS = int(os.getenv("RUNTIME_RUN_TTL_SECONDS", "86400"))
 RUNTIME_CANCEL_TTL_SECONDS = int(os.getenv("RUNTIME_CANCEL_TTL_SECONDS", "86400"))
 RUNTIME_COMPLETED_TTL_SECONDS = int(os.getenv("RUNTIME_COMPLETED_TTL_SECONDS", "300"))
 RUNTIME_CANCEL_POLL_INTERVAL_SECONDS = float(os.getenv("RUNTIME_CANCEL_POLL_INTERVAL_SECONDS", "1.0"))
+# Write-behind buffer for streamed message units: pending appends are flushed
+# when either threshold is crossed, at unit boundaries and on stream end.
+STREAM_UNIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("STREAM_UNIT_FLUSH_INTERVAL_SECONDS", "0.5"))
+STREAM_UNIT_FLUSH_BYTES = int(os.getenv("STREAM_UNIT_FLUSH_BYTES", "4096"))
+# Max observer messages waiting for the SSE consumer before the agent thread
+# is paused (0 = unbounded).
+AGENT_RUN_MESSAGE_QUEUE_MAXSIZE = int(os.getenv("AGENT_RUN_MESSAGE_QUEUE_MAXSIZE", "0"))
 NORTHBOUND_IDEMPOTENCY_TTL_SECONDS = int(os.getenv("NORTHBOUND_IDEMPOTENCY_TTL_SECONDS", "600"))
 NORTHBOUND_RATE_LIMIT_ENABLED = os.getenv("NORTHBOUND_RATE_LIMIT_ENABLED", "true").lower() == "true"
 NORTHBOUND_RATE_LIMIT_PER_MINUTE = int(os.getenv("NORTHBOUND_RATE_LIMIT_PER_MINUTE", "120"))
@@ -251,6 +271,11 @@ DP_REDIS_CHUNKS_POLL_INTERVAL_MS = int(
 FORWARD_REDIS_RETRY_DELAY_S = int(
     os.getenv("FORWARD_REDIS_RETRY_DELAY_S", "5"))
 FORWARD_REDIS_RETRY_MAX = int(os.getenv("FORWARD_REDIS_RETRY_MAX", "12"))
+# Index each split part as soon as it is processed instead of waiting for the whole file (opt-in).
+DP_PIPELINED_FORWARD_ENABLED = os.getenv(
+    "DP_PIPELINED_FORWARD_ENABLED", "false").lower() == "true"
+# Largest decompressed body accepted from a gzip-encoded indexing request; larger gets 413.
+GZIP_REQUEST_MAX_BYTES = int(os.getenv("GZIP_REQUEST_MAX_BYTES", str(256 * 1024 * 1024)))
 
 
 # Ray Configuration
@@ -338,6 +363,11 @@ DEFAULT_MAXIMUM_CHUNK_SIZE = 1536
 # MCP Server
 LOCAL_MCP_SERVER = os.getenv("NEXENT_MCP_SERVER")
 MCP_MANAGEMENT_API = os.getenv("MCP_MANAGEMENT_API", "http://localhost:5015")
+# MCP tool discovery: parallel servers, per-server timeout, and tool list cache TTLs
+MCP_TOOL_DISCOVERY_CONCURRENCY = int(os.getenv("MCP_TOOL_DISCOVERY_CONCURRENCY", "8"))
+MCP_TOOL_DISCOVERY_TIMEOUT_S = float(os.getenv("MCP_TOOL_DISCOVERY_TIMEOUT_S", "15"))
+MCP_TOOL_CACHE_TTL_S = float(os.getenv("MCP_TOOL_CACHE_TTL_S", "300"))
+MCP_TOOL_CACHE_STALE_TTL_S = float(os.getenv("MCP_TOOL_CACHE_STALE_TTL_S", "3600"))
 
 
 # Invite code
@@ -642,3 +672,24 @@ STREAMABLE_CONTENT_TYPES = frozenset([
 
 # SSE streaming event type for status messages
 STREAM_STATUS_EVENT = "event: stream_status\n"
+
+
+# =============================================================================
+# Agent Evaluation Runner Configuration
+# =============================================================================
+
+AGENT_EVAL_CASE_CONCURRENCY = int(os.getenv("AGENT_EVAL_CASE_CONCURRENCY", "4"))
+"""Agent runs executed concurrently within one evaluation run."""
+
+AGENT_EVAL_JUDGE_CONCURRENCY = int(os.getenv("AGENT_EVAL_JUDGE_CONCURRENCY", "4"))
+"""Judge calls executed concurrently within one evaluation run, pipelined with agent runs."""
+
+AGENT_EVAL_TENANT_MAX_CONCURRENCY = int(os.getenv("AGENT_EVAL_TENANT_MAX_CONCURRENCY", "8"))
+"""Agent runs executed concurrently per tenant across all of its evaluation runs in this process."""
+
+AGENT_EVAL_TENANT_RATE_PER_MINUTE = int(os.getenv("AGENT_EVAL_TENANT_RATE_PER_MINUTE", "0"))
+"""Agent runs started per minute per tenant; 0 disables the rate limit."""
+
+AGENT_EVAL_STATUS_FLUSH_SIZE = int(os.getenv("AGENT_EVAL_STATUS_FLUSH_SIZE", "20"))
+AGENT_EVAL_STATUS_FLUSH_INTERVAL_S = float(os.getenv("AGENT_EVAL_STATUS_FLUSH_INTERVAL_S", "5"))
+"""Case status updates are written in batches of this size, or at least this often."""
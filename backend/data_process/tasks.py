@@ -2,6 +2,7 @@
 Celery tasks for data processing and vector storage
 """
 import asyncio
+import gzip
 import json
 import logging
 import math
@@ -12,6 +13,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional, List, Tuple
 
 import aiohttp
+import orjson
 import requests
 import re
 import ray
@@ -32,6 +34,7 @@ from consts.const import (
     FORWARD_REDIS_RETRY_MAX,
     DP_REDIS_CHUNKS_WAIT_TIMEOUT_S,
     DP_REDIS_CHUNKS_POLL_INTERVAL_MS,
+    DP_PIPELINED_FORWARD_ENABLED,
     RAY_ACTOR_NUM_CPUS,
     RAY_NUM_CPUS,
     DISABLE_RAY_DASHBOARD,
@@ -50,6 +53,142 @@ ASYNC_SPLIT_RETRY_MAX = max(
     FORWARD_REDIS_RETRY_MAX * 5, FORWARD_REDIS_RETRY_MAX)
 FORWARD_ES_CHUNK_BATCH_SIZE = 64
 IMAGE_METADATA_PROCESS_SOURCE = "UniversalImageExtractor"
+CHUNK_PAYLOAD_TTL_S = 2 * 60 * 60
+FORWARD_HTTP_TIMEOUT_S = 600
+FORWARD_HTTP_POOL_LIMIT = 32
+FORWARD_HTTP_KEEPALIVE_S = 60
+# Request bodies at least this large are sent gzip-compressed
+FORWARD_GZIP_MIN_BYTES = 64 * 1024
+
+
+def _encode_chunks(chunks: List[Dict[str, Any]]) -> bytes:
+    """Serialize a chunk list into a compact UTF-8 JSON frame."""
+    try:
+        return orjson.dumps(chunks, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects a few values the stdlib accepts (e.g. >64-bit ints)
+        return json.dumps(chunks, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_chunks(payload: Any) -> Any:
+    """Parse a chunk frame; raises json.JSONDecodeError on invalid payloads."""
+    return orjson.loads(payload)
+
+
+def _manifest_key(redis_key: str) -> str:
+    return f"{redis_key}:parts"
+
+
+def _part_redis_key(task_id: str, part_index: int) -> str:
+    return f"dp:{task_id}:part:{part_index}"
+
+
+def _read_chunk_manifest(client: Any, redis_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the part manifest written by aggregate_store_chunks, or None when the
+    chunks were stored as a single list under ``redis_key``.
+    """
+    raw = client.get(_manifest_key(redis_key))
+    if not raw:
+        return None
+    try:
+        manifest = _decode_chunks(raw)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("parts"), list):
+        return None
+    return manifest
+
+
+class _PartChunkStream:
+    """
+    Chunks of an async-split file, read part by part from Redis.
+
+    Iterating fetches and decodes one part frame at a time, so the merged chunk
+    list is never built or stored. ``len()`` comes from the manifest.
+    """
+
+    def __init__(self, client: Any, manifest: Dict[str, Any]):
+        self._client = client
+        self._parts = [part for part in manifest.get("parts") or [] if part.get("key")]
+        self._count = int(manifest.get("count") or 0)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for part in self._parts:
+            cached = self._client.get(part["key"])
+            if not cached:
+                raise RuntimeError(f"Chunk part '{part['key']}' expired or missing in Redis")
+            part_chunks = _decode_chunks(cached)
+            if isinstance(part_chunks, list):
+                yield from part_chunks
+
+
+def _iter_pipelined_parts(
+    client: Any,
+    task_id: str,
+    redis_key: str,
+    idle_timeout_s: int,
+    poll_interval_ms: int,
+):
+    """
+    Yield the chunk list of each split part, in part order, as soon as it lands in Redis.
+
+    Parts are picked up while later parts are still being processed. Once the split
+    is marked ready, the manifest lists the remaining non-empty parts and ends the
+    stream (failed parts never write a key, so they are skipped there).
+    Raises TimeoutError when no part lands, the awaited one or a later one,
+    within ``idle_timeout_s``.
+    """
+    ready_key = f"{redis_key}:ready"
+    consumed = set()
+    next_index = 0
+    # Indices past next_index whose key already exists; parts finish out of order
+    landed_ahead = set()
+    lookahead = _estimate_parallel_parts()
+    deadline = time.time() + idle_timeout_s
+
+    while True:
+        part_key = _part_redis_key(task_id, next_index)
+        cached = client.get(part_key)
+        if cached:
+            part_chunks = _decode_chunks(cached)
+            consumed.add(part_key)
+            landed_ahead.discard(next_index)
+            next_index += 1
+            deadline = time.time() + idle_timeout_s
+            yield part_chunks if isinstance(part_chunks, list) else []
+            continue
+
+        if client.get(ready_key):
+            manifest = _read_chunk_manifest(client, redis_key) or {"parts": []}
+            for part in manifest["parts"]:
+                key = part.get("key")
+                if not key or key in consumed:
+                    continue
+                cached = client.get(key)
+                if not cached:
+                    raise RuntimeError(f"Chunk part '{key}' expired or missing in Redis")
+                part_chunks = _decode_chunks(cached)
+                yield part_chunks if isinstance(part_chunks, list) else []
+            return
+
+        # A slow part must not time out the file while later parts keep landing
+        frontier = max(landed_ahead, default=next_index) + lookahead
+        newly_landed = [
+            index for index in range(next_index + 1, frontier + 1)
+            if index not in landed_ahead and client.exists(_part_redis_key(task_id, index))
+        ]
+        if newly_landed:
+            landed_ahead.update(newly_landed)
+            deadline = time.time() + idle_timeout_s
+        elif time.time() > deadline:
+            raise TimeoutError(
+                f"Timed out waiting for split part '{part_key}' after {idle_timeout_s}s"
+            )
+        time.sleep(max(0.01, poll_interval_ms / 1000.0))
 
 
 def _wait_for_split_ready(redis_key: str, timeout_s: int, poll_interval_ms: int) -> int:
@@ -69,10 +208,13 @@ def _wait_for_split_ready(redis_key: str, timeout_s: int, poll_interval_ms: int)
 
     while time.time() < deadline:
         if client.get(ready_key):
+            manifest = _read_chunk_manifest(client, redis_key)
+            if manifest is not None:
+                return int(manifest.get("count") or 0)
             cached = client.get(redis_key)
             if cached:
                 try:
-                    chunks = json.loads(cached)
+                    chunks = _decode_chunks(cached)
                     return len(chunks) if isinstance(chunks, list) else 0
                 except Exception:
                     return 0
@@ -332,6 +474,24 @@ def run_async(coro):
         raise
 
 
+def _refresh_index_via_http_sync(
+    *,
+    base_url: str,
+    index_name: str,
+    authorization: Optional[str] = None,
+    timeout_s: float = 30.0,
+) -> None:
+    base = (base_url or "").rstrip("/")
+    if not base:
+        raise RuntimeError("ELASTICSEARCH_SERVICE is not configured")
+    headers = {"Authorization": authorization} if authorization else None
+    resp = requests.post(
+        f"{base}/indices/{index_name}/refresh", headers=headers, timeout=timeout_s)
+    if resp.status_code >= 400:
+        raise RuntimeError(
+            f"ElasticSearch service returned HTTP {resp.status_code}: {resp.text}")
+
+
 def _delete_source_file_via_http_sync(
     *,
     base_url: str,
@@ -489,12 +649,18 @@ def _load_forward_chunks(
                             "original_filename": filename
                         }, ensure_ascii=False))
                     )
-            cached = client.get(redis_key)
-            if cached:
+            manifest = _read_chunk_manifest(client, redis_key)
+            cached = None if manifest is not None else client.get(redis_key)
+            if manifest is not None:
+                logger.debug(
+                    f"[{self.request.id}] FORWARD TASK: Streaming {manifest.get('count', 0)} chunks "
+                    f"from {len(manifest['parts'])} parts of '{redis_key}'")
+                chunks = _PartChunkStream(client, manifest)
+            elif cached:
                 try:
                     logger.debug(
                         f"[{self.request.id}] FORWARD TASK: Retrieved Redis key '{redis_key}', payload_length={len(cached)}")
-                    chunks = json.loads(cached)
+                    chunks = _decode_chunks(cached)
                 except json.JSONDecodeError as jde:
                     # Log raw prefix to help diagnose incorrect writes
                     raw_preview = cached[:120] if isinstance(
@@ -584,6 +750,44 @@ def _load_forward_chunks(
     return chunks, split_async, original_source, original_index_name, filename
 
 
+def _format_forward_chunks(
+    request_id: str,
+    chunks: Any,
+    *,
+    start_index: int,
+    filename: str,
+    source: str,
+    source_type: str,
+    file_size: int,
+) -> List[Dict[str, Any]]:
+    """Format raw chunks as expected by the Elasticsearch API, skipping empty ones."""
+    formatted_chunks = []
+    for i, chunk in enumerate(chunks, start=start_index):
+        # Extract text and metadata
+        content = chunk.get("content", "")
+        metadata = chunk.get("metadata", {})
+
+        # Validate chunk content
+        if not content or len(content.strip()) == 0:
+            logger.warning(
+                f"[{request_id}] FORWARD TASK: Chunk {i+1} has empty text content, skipping")
+            continue
+
+        formatted_chunks.append({
+            "metadata": metadata,
+            "filename": filename,
+            "path_or_url": source,
+            "content": content,
+            "process_source": chunk.get("process_source", "Unstructured"),
+            "source_type": source_type,
+            "file_size": file_size,
+            "create_time": metadata.get("creation_date"),
+            "date": metadata.get("date"),
+            "index": i,
+        })
+    return formatted_chunks
+
+
 def _extract_error_code_from_es_response(
     parsed_body: Optional[Dict[str, Any]],
     text: str,
@@ -610,6 +814,99 @@ def _extract_error_code_from_es_response(
         return None
 
 
+class _ForwardHttpPool:
+    """
+    Worker-scoped aiohttp session on a long-lived background event loop.
+
+    Forward tasks in the same worker process share one keep-alive connection
+    pool instead of building a connector, session and event loop per call.
+    The loop is recreated after a fork, so each prefork child owns its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+        self._session = None
+        self._stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "bytes_sent": 0,
+            "bytes_uncompressed": 0,
+        }
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid() or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="forward-http-loop", daemon=True).start()
+                self._loop = loop
+                self._pid = os.getpid()
+                self._session = None
+            return self._loop
+
+    def run(self, coro):
+        """Run a coroutine on the pool loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def _on_connection_created(self, session, ctx, params):
+        self._stats["connections_created"] += 1
+
+    async def _on_connection_reused(self, session, ctx, params):
+        self._stats["connections_reused"] += 1
+
+    async def get_session(self):
+        """Return the shared session, creating it on first use in the calling loop."""
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_created)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=False,
+                    limit=FORWARD_HTTP_POOL_LIMIT,
+                    keepalive_timeout=FORWARD_HTTP_KEEPALIVE_S,
+                ),
+                timeout=aiohttp.ClientTimeout(total=FORWARD_HTTP_TIMEOUT_S),
+                trace_configs=[trace_config],
+            )
+            logger.info(
+                f"[ForwardHttpPool] Created pooled HTTP session in process {os.getpid()} "
+                f"(limit={FORWARD_HTTP_POOL_LIMIT}, keepalive={FORWARD_HTTP_KEEPALIVE_S}s)")
+        return self._session
+
+    def record_request(self, bytes_sent: int, bytes_uncompressed: int) -> None:
+        self._stats["requests"] += 1
+        self._stats["bytes_sent"] += bytes_sent
+        self._stats["bytes_uncompressed"] += bytes_uncompressed
+        if self._stats["requests"] % 100 == 0:
+            logger.info(f"[ForwardHttpPool] Stats: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+
+_forward_http_pool = _ForwardHttpPool()
+
+
+def get_forward_http_stats() -> Dict[str, int]:
+    """Request, connection reuse and payload byte counters of this worker process."""
+    return _forward_http_pool.get_stats()
+
+
+def _encode_forward_body(chunks: List[Dict[str, Any]]) -> Tuple[bytes, Dict[str, str], int]:
+    """
+    Serialize an indexing payload, gzip-compressing it when it is large.
+    Returns (body, extra headers, uncompressed size).
+    """
+    body = _encode_chunks(chunks)
+    if len(body) < FORWARD_GZIP_MIN_BYTES:
+        return body, {}, len(body)
+    return gzip.compress(body, compresslevel=5), {"Content-Encoding": "gzip"}, len(body)
+
+
 def _send_chunks_to_es(
     chunks: List[Dict[str, Any]],
     index_name: str,
@@ -618,6 +915,7 @@ def _send_chunks_to_es(
     source: str = "",
     original_filename: str = "",
     large_mode: bool = False,
+    skip_refresh: bool = False,
 ) -> Dict[str, Any]:
     async def _post():
         elasticsearch_url = ELASTICSEARCH_SERVICE
@@ -636,39 +934,42 @@ def _send_chunks_to_es(
         if task_id:
             headers["X-Task-Id"] = task_id
         try:
-            connector = aiohttp.TCPConnector(verify_ssl=False)
-            timeout = aiohttp.ClientTimeout(total=600)
-
             request_params: Dict[str, str] = {}
 
             if large_mode:
                 request_params["large_mode"] = "true"
+            if skip_refresh:
+                request_params["skip_refresh"] = "true"
+
+            body, encoding_headers, raw_size = _encode_forward_body(chunks)
+            headers.update(encoding_headers)
+
+            session = await _forward_http_pool.get_session()
+            _forward_http_pool.record_request(len(body), raw_size)
+            async with session.post(
+                full_url,
+                headers=headers,
+                data=body,
+                params=request_params,
+                raise_for_status=False
+            ) as response:
+                text = await response.text()
+                status = response.status
+                parsed_body = _parse_json_or_none(text)
+
+                if status >= 400:
+                    error_code = _extract_error_code_from_es_response(
+                        parsed_body, text)
+                    if error_code:
+                        raise Exception(json.dumps({
+                            "error_code": error_code
+                        }, ensure_ascii=False))
+
+                    raise Exception(
+                        f"ElasticSearch service returned HTTP {status}")
 
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                async with session.post(
-                    full_url,
-                    headers=headers,
-                    json=chunks,
-                    params=request_params,
-                    raise_for_status=False
-                ) as response:
-                    text = await response.text()
-                    status = response.status
-                    parsed_body = _parse_json_or_none(text)
-
-                    if status >= 400:
-                        error_code = _extract_error_code_from_es_response(
-                            parsed_body, text)
-                        if error_code:
-                            raise Exception(json.dumps({
-                                "error_code": error_code
-                            }, ensure_ascii=False))
-
-                        raise Exception(
-                            f"ElasticSearch service returned HTTP {status}")
-
-                    result = parsed_body if isinstance(parsed_body, dict) else await response.json()
-                    return result
+                result = parsed_body if isinstance(parsed_body, dict) else await response.json()
+                return result
 
         except aiohttp.ClientConnectorError as e:
             logger.error(
@@ -698,7 +999,7 @@ def _send_chunks_to_es(
                 original_filename=original_filename,
             )
 
-    return run_async(_post())
+    return _forward_http_pool.run(_post())
 
 
 @ray.remote(num_cpus=0)
@@ -876,12 +1177,13 @@ def process_part(
 
         import redis
         client = redis.Redis.from_url(REDIS_BACKEND_URL, decode_responses=True)
-        client.set(part_redis_key, json.dumps(chunks, ensure_ascii=False))
-        client.expire(part_redis_key, 2 * 60 * 60)
+        client.set(part_redis_key, _encode_chunks(chunks))
+        client.expire(part_redis_key, CHUNK_PAYLOAD_TTL_S)
 
         return {
             "part_redis_key": part_redis_key,
             "chunks_count": len(chunks),
+            "image_metadata_chunk_count": _count_image_metadata_chunks(chunks),
         }
     except Exception as e:
         logger.error(
@@ -925,7 +1227,11 @@ def aggregate_store_chunks(
         original_filename: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Hidden sub-task to aggregate part chunks and store into Redis for forward task.
+    Hidden sub-task to publish the stored part chunks for the forward task.
+
+    Parts stay in their own Redis keys; only a small manifest (part keys and
+    counts) is written under ``<redis_key>:parts``, so the chunks are not
+    re-read, merged and re-serialized here.
     """
     if not REDIS_BACKEND_URL:
         raise Exception(json.dumps({
@@ -936,39 +1242,37 @@ def aggregate_store_chunks(
             "original_filename": original_filename
         }, ensure_ascii=False))
 
+    parts = []
+    for part_result in parts_results or []:
+        part_key = (part_result or {}).get("part_redis_key")
+        part_count = int((part_result or {}).get("chunks_count") or 0)
+        if not part_key or part_count <= 0:
+            continue
+        parts.append({
+            "key": part_key,
+            "count": part_count,
+            "image_metadata": int(part_result.get("image_metadata_chunk_count") or 0),
+        })
+    chunks_count = sum(part["count"] for part in parts)
+    manifest = {
+        "parts": parts,
+        "count": chunks_count,
+        "image_metadata": sum(part["image_metadata"] for part in parts),
+    }
+
     try:
         import redis
         client = redis.Redis.from_url(
             REDIS_BACKEND_URL, decode_responses=True)
-
-        merged: List[Dict[str, Any]] = []
-        for part_result in parts_results or []:
-            part_key = (part_result or {}).get("part_redis_key")
-            if not part_key:
-                continue
-            cached = client.get(part_key)
-            if not cached:
-                continue
-            try:
-                part_chunks = json.loads(cached)
-                if isinstance(part_chunks, list):
-                    merged.extend(part_chunks)
-            except Exception:
-                continue
-            # best-effort cleanup for part payload key
-            try:
-                client.delete(part_key)
-            except Exception:
-                pass
-
-        serialized = json.dumps(merged, ensure_ascii=False)
-        client.set(redis_key, serialized)
-        client.expire(redis_key, 2 * 60 * 60)
+        manifest_key = _manifest_key(redis_key)
+        client.set(manifest_key, json.dumps(manifest))
+        client.expire(manifest_key, CHUNK_PAYLOAD_TTL_S)
         ready_key = f"{redis_key}:ready"
         client.set(ready_key, "1")
-        client.expire(ready_key, 2 * 60 * 60)
+        client.expire(ready_key, CHUNK_PAYLOAD_TTL_S)
         logger.info(
-            f"[{self.request.id}] PROCESS TASK: Stored aggregated chunks in Redis at key '{redis_key}', count={len(merged)}")
+            f"[{self.request.id}] PROCESS TASK: Stored chunk manifest in Redis at key '{manifest_key}', "
+            f"parts={len(parts)}, count={chunks_count}")
     except Exception as exc:
         raise Exception(json.dumps({
             "message": f"Failed to store chunks to Redis: {str(exc)}",
@@ -979,7 +1283,7 @@ def aggregate_store_chunks(
         }, ensure_ascii=False))
 
     return {
-        "chunks_count": len(merged),
+        "chunks_count": chunks_count,
         "redis_key": redis_key,
         "source": source,
         "index_name": index_name,
@@ -1000,9 +1304,13 @@ def forward_part(
         batch_index: Optional[int] = None,
         total_batches: Optional[int] = None,
         large_mode: Optional[bool] = False,
+        skip_refresh: Optional[bool] = False,
 ) -> Dict[str, Any]:
     """
     Forward sub-task that indexes a chunk batch.
+
+    With skip_refresh the batch is left unrefreshed; the parent refreshes the
+    index once after joining every batch.
     """
     try:
         # Respect cancellation from parent task if available
@@ -1023,6 +1331,7 @@ def forward_part(
             source=source,
             original_filename=original_filename,
             large_mode=large_mode,
+            skip_refresh=skip_refresh,
         )
 
         if not isinstance(es_result, dict) or not es_result.get("success"):
@@ -1083,6 +1392,20 @@ def aggregate_forward_parts(
     """
     Aggregate forward_part results.
     """
+    return _sum_forward_results(
+        parts_results,
+        source=source,
+        index_name=index_name,
+        original_filename=original_filename,
+    )
+
+
+def _sum_forward_results(
+    parts_results: List[Dict[str, Any]],
+    source: Optional[str] = None,
+    index_name: Optional[str] = None,
+    original_filename: Optional[str] = None,
+) -> Dict[str, Any]:
     total_indexed = 0
     total_submitted = 0
     for result in parts_results or []:
@@ -1101,6 +1424,158 @@ def aggregate_forward_parts(
     }
 
 
+def _forward_split_parts_pipelined(
+    self: Task,
+    *,
+    ctx: _ForwardContext,
+    processed_data: Dict[str, Any],
+    source: str,
+    index_name: str,
+    source_type: str,
+    original_filename: Optional[str],
+    filename: Optional[str],
+    authorization: Optional[str],
+) -> Optional[Tuple[Dict[str, Any], int, int]]:
+    """
+    Index an async-split file part by part while later parts are still processing.
+
+    Each part is formatted and dispatched as forward_part batches as soon as it
+    lands in Redis; the batch results are joined once every part has been seen.
+    Returns (es_result, total_chunks, formatted_count), or None if the task was
+    cancelled mid-stream.
+    """
+    task_id = ctx.task_id
+    redis_key = processed_data.get('redis_key')
+    split_task_id = processed_data.get('task_id') or task_id
+    if not REDIS_BACKEND_URL:
+        raise Exception(json.dumps({
+            "message": "REDIS_BACKEND_URL not configured to retrieve chunks",
+            "index_name": index_name,
+            "task_name": "forward",
+            "source": source,
+            "original_filename": original_filename
+        }, ensure_ascii=False))
+
+    import redis
+    client = redis.Redis.from_url(REDIS_BACKEND_URL, decode_responses=True)
+
+    # Compute once per file to avoid repeated IO/MinIO calls inside loop
+    file_size = get_file_size(source_type, source) if isinstance(
+        source, str) else 0
+    filename_resolved = filename or (os.path.basename(source) if source and isinstance(
+        source, str) else "")
+
+    self.update_state(
+        state=states.STARTED,
+        meta={
+            'source': source,
+            'index_name': index_name,
+            'original_filename': filename,
+            'task_name': 'forward',
+            'start_time': ctx.start_time,
+            'stage': 'vectorizing_and_storing',
+            'total_chunks': 0,  # Grows as parts finish processing
+            'processed_chunks': 0
+        }
+    )
+    redis_service = None
+    try:
+        redis_service = get_redis_service()
+        redis_service.save_progress_info(task_id, 0, 0)
+    except Exception as progress_init_exc:
+        logger.warning(
+            f"[{self.request.id}] FORWARD TASK: Failed to initialize progress in Redis: "
+            f"{progress_init_exc}"
+        )
+
+    total_chunks = 0
+    formatted_count = 0
+    pending_results = []
+    idle_timeout_s = DP_REDIS_CHUNKS_WAIT_TIMEOUT_S + max(1, PER_WAVE_TIMEOUT)
+    for part_chunks in _iter_pipelined_parts(
+        client,
+        split_task_id,
+        redis_key,
+        idle_timeout_s=idle_timeout_s,
+        poll_interval_ms=DP_REDIS_CHUNKS_POLL_INTERVAL_MS,
+    ):
+        if _is_forward_task_cancelled(ctx):
+            logger.info(
+                f"[{self.request.id}] FORWARD TASK: Detected cancellation flag for task {task_id}; "
+                f"stopping pipelined forwarding after {total_chunks} chunks.")
+            return None
+
+        formatted_chunks = _format_forward_chunks(
+            str(self.request.id),
+            part_chunks,
+            start_index=total_chunks,
+            filename=filename_resolved,
+            source=source,
+            source_type=source_type,
+            file_size=file_size,
+        )
+        total_chunks += len(part_chunks)
+        formatted_count += len(formatted_chunks)
+        if redis_service is not None and part_chunks:
+            try:
+                redis_service.extend_progress_total(task_id, len(part_chunks))
+            except Exception as progress_exc:
+                logger.warning(
+                    f"[{self.request.id}] FORWARD TASK: Failed to update progress total: {progress_exc}")
+
+        for batch in _build_balanced_batches(
+            formatted_chunks=formatted_chunks,
+            batch_size=FORWARD_ES_CHUNK_BATCH_SIZE,
+        ):
+            pending_results.append(forward_part.s(
+                chunks=batch,
+                index_name=index_name,
+                authorization=authorization,
+                parent_task_id=task_id,
+                parent_total_chunks=None,
+                source=source,
+                original_filename=original_filename,
+                batch_index=len(pending_results) + 1,
+                total_batches=None,
+                large_mode=True,
+                skip_refresh=True,
+            ).set(queue='forward_q').apply_async())
+        logger.info(
+            f"[{self.request.id}] FORWARD TASK: Dispatched {len(formatted_chunks)} chunks of a finished part "
+            f"({formatted_count} so far, {len(pending_results)} batches) to index '{index_name}'")
+
+    if formatted_count == 0:
+        raise Exception(json.dumps({
+            "message": "No valid chunks to forward after formatting",
+            "index_name": index_name,
+            "task_name": "forward",
+            "source": source,
+            "original_filename": original_filename,
+            "error_code": "no_valid_chunks"
+        }, ensure_ascii=False))
+
+    with allow_join_result():
+        parts_results = [result.get() for result in pending_results]
+    # Batches were written without refreshing; make the whole file searchable at once
+    try:
+        _refresh_index_via_http_sync(
+            base_url=ELASTICSEARCH_SERVICE,
+            index_name=index_name,
+            authorization=authorization,
+        )
+    except Exception as refresh_exc:
+        logger.warning(
+            f"[{self.request.id}] FORWARD TASK: Failed to refresh index '{index_name}', "
+            f"chunks become searchable at the next periodic refresh: {refresh_exc}")
+    es_result = _sum_forward_results(
+        parts_results,
+        source=source,
+        index_name=index_name,
+        original_filename=original_filename,
+    )
+    return es_result, total_chunks, formatted_count
+
+
 def _split_file_for_processing(
     request_id: str,
     source: str,
@@ -1204,7 +1679,7 @@ def _run_processing_for_parts(
             part_bytes=part,
             filename=filename_for_processing,
             chunking_strategy=chunking_strategy,
-            part_redis_key=f"dp:{task_id}:part:{idx}",
+            part_redis_key=_part_redis_key(task_id, idx),
             source=source,
             source_type=source_type,
             model_id=embedding_model_id,
@@ -1222,6 +1697,12 @@ def _run_processing_for_parts(
         f"[{request_id}] PROCESS TASK: Dispatching {len(parts)} part tasks...")
     chord(group_tasks)(callback)
 
+    if DP_PIPELINED_FORWARD_ENABLED:
+        # forward picks up each part as it lands; the chord still publishes the manifest
+        logger.info(
+            f"[{request_id}] PROCESS TASK: Pipelined forward enabled; not waiting for split aggregation")
+        return True, None, None
+
     split_wait_timeout = _compute_split_wait_timeout(len(parts))
     logger.info(
         f"[{request_id}] PROCESS TASK: Waiting split aggregation, timeout={split_wait_timeout}s, "
@@ -1271,7 +1752,10 @@ def _process_source_with_split(
         params=params,
     )
 
-    if split_async:
+    if split_async and split_chunk_count is None:
+        logger.info(
+            f"[{request_id}] PROCESS TASK: Async split dispatched; chunks are indexed as parts finish")
+    elif split_async:
         logger.info(
             f"[{request_id}] PROCESS TASK: Async split finished with {split_chunk_count or 0} chunks")
     else:
@@ -1429,7 +1913,11 @@ def process(
             raise NotImplementedError(
                 f"Source type '{source_type}' not yet supported")
 
-        if split_async:
+        split_pipelined = split_async and split_chunk_count is None
+        if split_pipelined:
+            # Parts are still being processed; forward counts and indexes them as they land.
+            chunk_count = 0
+        elif split_async:
             chunk_count = split_chunk_count or 0
             if chunk_count == 0:
                 raise _build_no_valid_chunks_error(
@@ -1438,16 +1926,21 @@ def process(
                     source=source,
                     original_filename=original_filename,
                 )
-            # For async split, chunks are persisted in Redis; count image-metadata chunks from cached payload.
+            # For async split, chunks are persisted in Redis; the part manifest carries the
+            # image-metadata count, older single-key payloads are counted directly.
             try:
                 if REDIS_BACKEND_URL:
                     import redis
                     redis_key = f"dp:{task_id}:chunks"
                     client = redis.Redis.from_url(
                         REDIS_BACKEND_URL, decode_responses=True)
-                    cached = client.get(redis_key)
-                    if cached:
-                        cached_chunks = json.loads(cached)
+                    manifest = _read_chunk_manifest(client, redis_key)
+                    cached = None if manifest is not None else client.get(redis_key)
+                    if manifest is not None:
+                        image_metadata_chunk_count = int(
+                            manifest.get("image_metadata") or 0)
+                    elif cached:
+                        cached_chunks = _decode_chunks(cached)
                         if isinstance(cached_chunks, list):
                             image_metadata_chunk_count = _count_image_metadata_chunks(
                                 cached_chunks)
@@ -1465,9 +1958,10 @@ def process(
                 )
             image_metadata_chunk_count = _count_image_metadata_chunks(chunks)
 
-        logger.info(
-            f"[{self.request.id}] PROCESS TASK: Chunk composition: total={chunk_count}, "
-            f"image_metadata={image_metadata_chunk_count}, text={max(0, chunk_count - image_metadata_chunk_count)}")
+        if not split_pipelined:
+            logger.info(
+                f"[{self.request.id}] PROCESS TASK: Chunk composition: total={chunk_count}, "
+                f"image_metadata={image_metadata_chunk_count}, text={max(0, chunk_count - image_metadata_chunk_count)}")
 
         # Update task state to SUCCESS after Ray processing completes
         # This transitions from STARTED (PROCESSING) to SUCCESS (WAIT_FOR_FORWARDING)
@@ -1498,6 +1992,7 @@ def process(
             'original_filename': original_filename,
             'task_id': task_id,
             'split_async': split_async,
+            'split_pipelined': split_pipelined,
             'image_metadata_chunk_count': image_metadata_chunk_count,
         }
 
@@ -1668,145 +2163,151 @@ def forward(
             )
             return _build_forward_cancelled_result(ctx)
 
-        chunks, split_async, original_source, original_index_name, filename = _load_forward_chunks(
-            self,
-            processed_data=processed_data,
-            original_source=original_source,
-            original_index_name=original_index_name,
-            filename=filename,
-        )
-
-        # Calculate total chunks for progress tracking
-        total_chunks = len(chunks) if chunks else 0
-        formatted_chunks = []
-        # Compute once per file to avoid repeated IO/MinIO calls inside loop
-        file_size = get_file_size(source_type, original_source) if isinstance(
-            original_source, str) else 0
-        filename_resolved = filename or (os.path.basename(original_source) if original_source and isinstance(
-            original_source, str) else "")
-        for i, chunk in enumerate(chunks):
-            # Extract text and metadata
-            content = chunk.get("content", "")
-            metadata = chunk.get("metadata", {})
-
-            # Validate chunk content
-            if not content or len(content.strip()) == 0:
-                logger.warning(
-                    f"[{self.request.id}] FORWARD TASK: Chunk {i+1} has empty text content, skipping")
-                continue
-
-            # Format as expected by the Elasticsearch API
-            formatted_chunk = {
-                "metadata": metadata,
-                "filename": filename_resolved,
-                "path_or_url": original_source,
-                "content": content,
-                "process_source": chunk.get("process_source", "Unstructured"),
-                "source_type": source_type,
-                "file_size": file_size,
-                "create_time": metadata.get("creation_date"),
-                "date": metadata.get("date"),
-                "index": i,
-            }
-            formatted_chunks.append(formatted_chunk)
-
-        if len(formatted_chunks) == 0:
-            raise Exception(json.dumps({
-                "message": "No valid chunks to forward after formatting",
-                "index_name": original_index_name,
-                "task_name": "forward",
-                "source": original_source,
-                "original_filename": original_filename,
-                "error_code": "no_valid_chunks"
-            }, ensure_ascii=False))
-
-        logger.info(
-            f"[{self.request.id}] FORWARD TASK: Starting ES indexing for {len(formatted_chunks)} chunks to index '{original_index_name}'...")
-
-        # Update task state with total chunks before starting vectorization
-        self.update_state(
-            state=states.STARTED,
-            meta={
-                'source': original_source,
-                'index_name': original_index_name,
-                'original_filename': filename,
-                'task_name': 'forward',
-                'start_time': start_time,
-                'stage': 'vectorizing_and_storing',
-                'total_chunks': total_chunks,
-                'processed_chunks': 0  # Will be updated during vectorization via Redis
-            }
-        )
-        try:
-            redis_service = get_redis_service()
-            redis_service.save_progress_info(task_id, 0, total_chunks)
-        except Exception as progress_init_exc:
-            logger.warning(
-                f"[{self.request.id}] FORWARD TASK: Failed to initialize progress in Redis: "
-                f"{progress_init_exc}"
-            )
-
-        if len(formatted_chunks) < FORWARD_ES_CHUNK_BATCH_SIZE:
-            es_result = _send_chunks_to_es(
-                chunks=formatted_chunks,
-                index_name=original_index_name,
-                authorization=authorization,
-                task_id=task_id,
+        if processed_data.get('split_pipelined'):
+            if processed_data.get('source'):
+                original_source = processed_data.get('source')
+            if processed_data.get('index_name'):
+                original_index_name = processed_data.get('index_name')
+            if processed_data.get('original_filename'):
+                filename = processed_data.get('original_filename')
+            pipelined = _forward_split_parts_pipelined(
+                self,
+                ctx=ctx,
+                processed_data=processed_data,
                 source=original_source,
+                index_name=original_index_name,
+                source_type=source_type,
                 original_filename=original_filename,
-                large_mode=False,
+                filename=filename,
+                authorization=authorization,
             )
+            if pipelined is None:
+                return _build_forward_cancelled_result(ctx)
+            es_result, total_chunks, formatted_count = pipelined
         else:
-            batches = _build_balanced_batches(
-                formatted_chunks=formatted_chunks,
-                batch_size=FORWARD_ES_CHUNK_BATCH_SIZE,
+            chunks, split_async, original_source, original_index_name, filename = _load_forward_chunks(
+                self,
+                processed_data=processed_data,
+                original_source=original_source,
+                original_index_name=original_index_name,
+                filename=filename,
+            )
+
+            # Calculate total chunks for progress tracking
+            total_chunks = len(chunks) if chunks else 0
+            # Compute once per file to avoid repeated IO/MinIO calls inside loop
+            file_size = get_file_size(source_type, original_source) if isinstance(
+                original_source, str) else 0
+            filename_resolved = filename or (os.path.basename(original_source) if original_source and isinstance(
+                original_source, str) else "")
+            formatted_chunks = _format_forward_chunks(
+                str(self.request.id),
+                chunks,
+                start_index=0,
+                filename=filename_resolved,
+                source=original_source,
+                source_type=source_type,
+                file_size=file_size,
             )
-            total_batches = len(batches)
-            image_chunks_total = sum(
-                1 for chunk in formatted_chunks if chunk.get("process_source") == IMAGE_METADATA_PROCESS_SOURCE
+
+            formatted_count = len(formatted_chunks)
+            if formatted_count == 0:
+                raise Exception(json.dumps({
+                    "message": "No valid chunks to forward after formatting",
+                    "index_name": original_index_name,
+                    "task_name": "forward",
+                    "source": original_source,
+                    "original_filename": original_filename,
+                    "error_code": "no_valid_chunks"
+                }, ensure_ascii=False))
+
+            logger.info(
+                f"[{self.request.id}] FORWARD TASK: Starting ES indexing for {len(formatted_chunks)} chunks to index '{original_index_name}'...")
+
+            # Update task state with total chunks before starting vectorization
+            self.update_state(
+                state=states.STARTED,
+                meta={
+                    'source': original_source,
+                    'index_name': original_index_name,
+                    'original_filename': filename,
+                    'task_name': 'forward',
+                    'start_time': start_time,
+                    'stage': 'vectorizing_and_storing',
+                    'total_chunks': total_chunks,
+                    'processed_chunks': 0  # Will be updated during vectorization via Redis
+                }
             )
-            image_distribution = [
-                sum(
-                    1
-                    for chunk in batch
-                    if chunk.get("process_source") == IMAGE_METADATA_PROCESS_SOURCE
+            try:
+                redis_service = get_redis_service()
+                redis_service.save_progress_info(task_id, 0, total_chunks)
+            except Exception as progress_init_exc:
+                logger.warning(
+                    f"[{self.request.id}] FORWARD TASK: Failed to initialize progress in Redis: "
+                    f"{progress_init_exc}"
                 )
-                for batch in batches
-            ]
-            logger.info(
-                f"[{self.request.id}] FORWARD TASK: Batch distribution ready: total_batches={total_batches}, "
-                f"batch_size={FORWARD_ES_CHUNK_BATCH_SIZE}, image_metadata_total={image_chunks_total}, "
-                f"image_per_batch={image_distribution}")
-            group_tasks = group(
-                forward_part.s(
-                    chunks=batch,
+
+            if len(formatted_chunks) < FORWARD_ES_CHUNK_BATCH_SIZE:
+                es_result = _send_chunks_to_es(
+                    chunks=formatted_chunks,
                     index_name=original_index_name,
                     authorization=authorization,
-                    parent_task_id=task_id,
-                    parent_total_chunks=total_chunks,
+                    task_id=task_id,
                     source=original_source,
                     original_filename=original_filename,
-                    batch_index=idx + 1,
-                    total_batches=total_batches,
-                    # If request was split into multiple groups, force all groups to use large path.
-                    large_mode=True,
-                ).set(queue='forward_q') for idx, batch in enumerate(batches)
-            )
-            callback = aggregate_forward_parts.s(
-                source=original_source,
-                index_name=original_index_name,
-                original_filename=original_filename
-            ).set(queue='forward_q')
-            result = chord(group_tasks)(callback)
-            with allow_join_result():
-                es_result = result.get()
+                    large_mode=False,
+                )
+            else:
+                batches = _build_balanced_batches(
+                    formatted_chunks=formatted_chunks,
+                    batch_size=FORWARD_ES_CHUNK_BATCH_SIZE,
+                )
+                total_batches = len(batches)
+                image_chunks_total = sum(
+                    1 for chunk in formatted_chunks if chunk.get("process_source") == IMAGE_METADATA_PROCESS_SOURCE
+                )
+                image_distribution = [
+                    sum(
+                        1
+                        for chunk in batch
+                        if chunk.get("process_source") == IMAGE_METADATA_PROCESS_SOURCE
+                    )
+                    for batch in batches
+                ]
+                logger.info(
+                    f"[{self.request.id}] FORWARD TASK: Batch distribution ready: total_batches={total_batches}, "
+                    f"batch_size={FORWARD_ES_CHUNK_BATCH_SIZE}, image_metadata_total={image_chunks_total}, "
+                    f"image_per_batch={image_distribution}")
+                group_tasks = group(
+                    forward_part.s(
+                        chunks=batch,
+                        index_name=original_index_name,
+                        authorization=authorization,
+                        parent_task_id=task_id,
+                        parent_total_chunks=total_chunks,
+                        source=original_source,
+                        original_filename=original_filename,
+                        batch_index=idx + 1,
+                        total_batches=total_batches,
+                        # If request was split into multiple groups, force all groups to use large path.
+                        large_mode=True,
+                    ).set(queue='forward_q') for idx, batch in enumerate(batches)
+                )
+                callback = aggregate_forward_parts.s(
+                    source=original_source,
+                    index_name=original_index_name,
+                    original_filename=original_filename
+                ).set(queue='forward_q')
+                result = chord(group_tasks)(callback)
+                with allow_join_result():
+                    es_result = result.get()
         logger.debug(
             f"[{self.request.id}] FORWARD TASK: API response from main_server for source '{original_source}': {es_result}")
 
         if isinstance(es_result, dict) and es_result.get("success"):
             total_indexed = es_result.get("total_indexed", 0)
             total_submitted = es_result.get(
-                "total_submitted", len(formatted_chunks))
+                "total_submitted", formatted_count)
             logger.debug(f"[{self.request.id}] FORWARD TASK: main_server reported {total_indexed}/{total_submitted} documents indexed successfully for '{original_source}'. Message: {es_result.get('message')}")
 
             if total_indexed < total_submitted:
@@ -1846,14 +2347,14 @@ def forward(
         # Get final indexed count from result
         final_processed = 0
         if isinstance(es_result, dict) and es_result.get("success"):
-            final_processed = es_result.get("total_indexed", len(chunks))
+            final_processed = es_result.get("total_indexed", total_chunks)
 
         logger.info(
             f"[{self.request.id}] FORWARD TASK: Updating task state to SUCCESS after ES indexing completion")
         self.update_state(
             state=states.SUCCESS,
             meta={
-                'chunks_stored': len(chunks),
+                'chunks_stored': total_chunks,
                 'storage_time': end_time - start_time,
                 'source': original_source,
                 'index_name': original_index_name,
@@ -1867,14 +2368,14 @@ def forward(
         )
 
         logger.info(
-            f"[{self.request.id}] FORWARD TASK: Successfully stored {len(chunks)} chunks to index {original_index_name} in {end_time - start_time:.2f}s")
+            f"[{self.request.id}] FORWARD TASK: Successfully stored {total_chunks} chunks to index {original_index_name} in {end_time - start_time:.2f}s")
 
         return {
             'task_id': task_id,
             'source': original_source,
             'index_name': original_index_name,
             'original_filename': original_filename,
-            'chunks_stored': len(chunks),
+            'chunks_stored': total_chunks,
             'storage_time': end_time - start_time,
             'es_result': es_result
         }
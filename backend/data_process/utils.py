@@ -14,6 +14,17 @@ from .app import app as celery_app
 
 logger = logging.getLogger("data_process.utils")
 
+# Per-index sorted set of task IDs (score = registration time), written by the worker
+TASK_REGISTRY_KEY_PREFIX = "dp:index_tasks:"
+# Set once every pre-registry task has been registered; no index is scanned again after that
+TASK_REGISTRY_MIGRATED_KEY = "dp:index_task_registry:migrated"
+# Registry keys outlive any single task; refreshed on every registration
+TASK_REGISTRY_TTL_SECONDS = 7 * 24 * 3600
+# Task names shown in the knowledge base task list
+REGISTERED_TASK_NAMES = frozenset({'process', 'forward', 'process_and_forward'})
+# Registered tasks without result meta are pruned only after this grace period
+TASK_REGISTRY_PRUNE_GRACE_SECONDS = 300
+
 
 def get_all_task_ids_from_redis(redis_client: redis.Redis) -> List[str]:
     """
@@ -24,8 +35,9 @@ def get_all_task_ids_from_redis(redis_client: redis.Redis) -> List[str]:
     """
     task_ids = []
     try:
-        # Get all keys matching Celery result pattern
-        result_keys = redis_client.keys('celery-task-meta-*')
+        # SCAN instead of KEYS so a large backend does not block Redis
+        result_keys = redis_client.scan_iter(
+            match='celery-task-meta-*', count=1000)
 
         # Extract task IDs from keys
         for key in result_keys:
@@ -44,6 +56,229 @@ def get_all_task_ids_from_redis(redis_client: redis.Redis) -> List[str]:
     return task_ids
 
 
+def _apply_task_meta(status_info: Dict[str, Any], task_id: str, status: Optional[str],
+                     info: Any, progress_info: Optional[Dict[str, int]]) -> None:
+    """
+    Fill status_info in place from a task's backend state
+
+    Args:
+        status_info: Basic status dict to update
+        task_id: Celery task ID
+        status: Celery task state
+        info: Task result / meta (exception instance for failed tasks)
+        progress_info: Real-time progress from Redis, if any
+    """
+    # Add metadata from task state
+    if info and isinstance(info, dict):
+        # For successful tasks, the result may contain metadata
+        metadata = info
+
+        # Get task_name from metadata if available
+        if 'task_name' in metadata:
+            status_info['task_name'] = metadata['task_name']
+
+        # Add timestamps if available
+        if 'start_time' in metadata:
+            status_info['created_at'] = metadata['start_time']
+
+        # Extract index_name from metadata
+        if 'index_name' in metadata:
+            status_info['index_name'] = metadata['index_name']
+
+        if 'source' in metadata:
+            status_info['path_or_url'] = metadata['source']
+
+        if 'original_filename' in metadata:
+            status_info['original_filename'] = metadata['original_filename']
+
+        # Get progress info from metadata
+        if 'total_chunks' in metadata:
+            status_info['total_chunks'] = metadata['total_chunks']
+        if 'processed_chunks' in metadata:
+            status_info['processed_chunks'] = metadata['processed_chunks']
+
+        # Redis progress takes precedence over metadata for active tasks
+        if progress_info:
+            status_info['processed_chunks'] = progress_info.get('processed_chunks', status_info.get('processed_chunks'))
+            status_info['total_chunks'] = progress_info.get('total_chunks', status_info.get('total_chunks'))
+
+    # Add error information for failed tasks
+    if status == 'FAILURE':
+        try:
+            error_json = None
+            try:
+                error_json = json.loads(str(info))
+            except Exception as e:
+                logger.error(
+                    f"Failed to load result.info as a json: {str(e)}")
+                error_json = None
+
+            if isinstance(error_json, dict):
+                if error_json.get('message') is not None:
+                    status_info['error'] = error_json.get('message')
+                if error_json.get('index_name') is not None:
+                    status_info['index_name'] = error_json.get('index_name')
+                if error_json.get('task_name') is not None:
+                    status_info['task_name'] = error_json.get('task_name')
+                if error_json.get('source') is not None:
+                    status_info['path_or_url'] = error_json.get('source')
+                if error_json.get('original_filename') is not None:
+                    status_info['original_filename'] = error_json.get(
+                        'original_filename')
+            else:
+                # fallback: compatible with previous format
+                status_info['error'] = str(info) if info else "Unknown error"
+        except Exception as e:
+            logger.warning(
+                f"Could not parse error info for task {task_id}, falling back. Error: {e}")
+            status_info['error'] = str(info) if info else "Unknown error"
+        logger.debug(
+            f"Task {task_id} failed with error: {status_info['error']}")
+
+    # Add result information for successful tasks
+    if status == 'SUCCESS' and info and isinstance(info, dict):
+        # Include specific result fields that are useful for API
+        for key in ['chunks_count', 'processing_time', 'storage_time', 'es_result']:
+            if key in info:
+                status_info[key] = info[key]
+
+
+def _unavailable_task_info(task_id: str, error: str) -> Dict[str, Any]:
+    """Minimal FAILURE status for a task whose state cannot be read"""
+    return {
+        'id': task_id,
+        'status': 'FAILURE',
+        'created_at': '',
+        'updated_at': '',
+        'error': error,
+        'index_name': '',
+        'task_name': '',
+        'path_or_url': '',
+        'original_filename': '',
+    }
+
+
+def register_index_task(redis_client: redis.Redis, index_name: str, task_id: str) -> None:
+    """
+    Record a task in the per-index task registry
+
+    Args:
+        redis_client: Redis client on the result backend
+        index_name: Knowledge base the task belongs to
+        task_id: Celery task ID
+    """
+    key = f"{TASK_REGISTRY_KEY_PREFIX}{index_name}"
+    pipe = redis_client.pipeline()
+    # NX keeps the first registration time, so retries do not reset pruning age
+    pipe.zadd(key, {task_id: time.time()}, nx=True)
+    pipe.expire(key, TASK_REGISTRY_TTL_SECONDS)
+    pipe.execute()
+
+
+def get_index_task_ids_from_redis(redis_client: redis.Redis, index_name: str) -> Dict[str, float]:
+    """
+    Get the task IDs registered for an index
+
+    Returns:
+        Mapping of task ID to registration timestamp
+    """
+    task_ids: Dict[str, float] = {}
+    try:
+        entries = redis_client.zrange(
+            f"{TASK_REGISTRY_KEY_PREFIX}{index_name}", 0, -1, withscores=True)
+        for member, score in entries:
+            if isinstance(member, bytes):
+                member = member.decode('utf-8')
+            task_ids[member] = float(score)
+    except Exception as e:
+        logger.warning(
+            f"Failed to get registered task IDs for index {index_name}: {str(e)}")
+    return task_ids
+
+
+def remove_index_tasks(redis_client: redis.Redis, index_name: str, task_ids: List[str]) -> None:
+    """Drop task IDs whose result meta has expired from the per-index registry"""
+    if not task_ids:
+        return
+    try:
+        redis_client.zrem(f"{TASK_REGISTRY_KEY_PREFIX}{index_name}", *task_ids)
+    except Exception as e:
+        logger.warning(
+            f"Failed to prune task registry for index {index_name}: {str(e)}")
+
+
+def get_tasks_info_batch(redis_client: redis.Redis, task_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Read status information for many tasks with one MGET and one progress pipeline
+
+    Args:
+        redis_client: Redis client on the result backend
+        task_ids: Celery task IDs
+
+    Returns:
+        Mapping of task ID to status information, or None when the task has no
+        stored result meta yet (queued, or expired)
+    """
+    if not task_ids:
+        return {}
+
+    raw_metas = redis_client.mget(
+        [f"celery-task-meta-{task_id}" for task_id in task_ids])
+
+    progress_map: Dict[str, Optional[Dict[str, int]]] = {}
+    try:
+        from services.redis_service import get_redis_service
+        progress_map = get_redis_service().batch_get_progress_info(task_ids)
+    except Exception as e:
+        logger.debug(f"Failed to batch get progress from Redis: {str(e)}")
+
+    backend = celery_app.backend
+    infos: Dict[str, Optional[Dict[str, Any]]] = {}
+    current_time = time.time()
+    for task_id, raw in zip(task_ids, raw_metas):
+        if raw is None:
+            infos[task_id] = None
+            continue
+        try:
+            meta = backend.decode_result(raw)
+        except ValueError as e:
+            if "Exception information must include the exception type" in str(e):
+                infos[task_id] = _unavailable_task_info(
+                    task_id, 'Legacy task error: exception type missing, forcibly marked as FAILURE.')
+            else:
+                infos[task_id] = _unavailable_task_info(
+                    task_id, f"Cannot retrieve task status: {str(e)}")
+            continue
+        except Exception as e:
+            logger.warning(f"Error decoding status for task {task_id}: {str(e)}")
+            infos[task_id] = _unavailable_task_info(
+                task_id, f"Cannot retrieve task status: {str(e)}")
+            continue
+
+        status = meta.get('status') or 'PENDING'
+        status_info = {
+            'id': task_id,
+            'index_name': '',
+            'task_name': '',
+            'path_or_url': '',
+            'original_filename': '',
+            'status': status,
+            'created_at': current_time,
+            'updated_at': current_time,
+            'error': None
+        }
+        try:
+            _apply_task_meta(status_info, task_id, status,
+                             meta.get('result'), progress_map.get(task_id))
+        except Exception as e:
+            logger.warning(
+                f"Error getting metadata for task {task_id}: {str(e)}")
+            status_info['error'] = f"Metadata access error: {str(e)}"
+        infos[task_id] = status_info
+
+    return infos
+
+
 async def get_task_info(task_id: str) -> Dict[str, Any]:
     """
     Get task status and metadata
@@ -100,99 +335,16 @@ async def get_task_info(task_id: str) -> Dict[str, Any]:
         # If backend is available, try to get metadata
         if backend_available:
             try:
-                # Add metadata from task state
-                if result.info:
-                    if isinstance(result.info, dict):
-                        # For successful tasks, the result may contain metadata
-                        metadata = result.info
-
-                        # Get task_name from metadata if available
-                        if 'task_name' in metadata:
-                            status_info['task_name'] = metadata['task_name']
-
-                        # Add timestamps if available
-                        if 'start_time' in metadata:
-                            status_info['created_at'] = metadata['start_time']
-
-                        # Extract index_name from metadata
-                        if 'index_name' in metadata:
-                            status_info['index_name'] = metadata['index_name']
-
-                        if 'source' in metadata:
-                            status_info['path_or_url'] = metadata['source']
-
-                        if 'original_filename' in metadata:
-                            status_info['original_filename'] = metadata['original_filename']
-                        
-                        # Get progress info from metadata
-                        if 'total_chunks' in metadata:
-                            status_info['total_chunks'] = metadata['total_chunks']
-                        if 'processed_chunks' in metadata:
-                            status_info['processed_chunks'] = metadata['processed_chunks']
-                        
-                        # Always try to get latest progress from Redis (real-time updates during vectorization)
-                        # Redis progress takes precedence over metadata for active tasks
-                        try:
-                            from services.redis_service import get_redis_service
-                            redis_service = get_redis_service()
-                            progress_info = redis_service.get_progress_info(task_id)
-                            if progress_info:
-                                # Use Redis progress as primary source (updated in real-time)
-                                status_info['processed_chunks'] = progress_info.get('processed_chunks', status_info.get('processed_chunks'))
-                                status_info['total_chunks'] = progress_info.get('total_chunks', status_info.get('total_chunks'))
-                        except Exception as e:
-                            logger.debug(f"Failed to get progress from Redis for task {task_id}: {str(e)}")
-                # Add error information for failed tasks
-                if result.failed():
+                progress_info = None
+                if result.info and isinstance(result.info, dict):
+                    # Always try to get latest progress from Redis (real-time updates during vectorization)
                     try:
-                        info = str(result.info)
-                        error_json = None
-                        if isinstance(info, str):
-                            try:
-                                error_json = json.loads(info)
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to load result.info as a json: {str(e)}")
-                                error_json = None
-                        else:
-                            logger.warning(
-                                f"Cannot parse result.info into a string: {type(result.info)}")
-
-                        if error_json:
-                            if error_json.get('message') is not None:
-                                status_info['error'] = error_json.get(
-                                    'message')
-                            if error_json.get('index_name') is not None:
-                                status_info['index_name'] = error_json.get(
-                                    'index_name')
-                            if error_json.get('task_name') is not None:
-                                status_info['task_name'] = error_json.get(
-                                    'task_name')
-                            if error_json.get('source') is not None:
-                                status_info['path_or_url'] = error_json.get(
-                                    'source')
-                            if error_json.get('original_filename') is not None:
-                                status_info['original_filename'] = error_json.get(
-                                    'original_filename')
-                        else:
-                            # fallback: compatible with previous format
-                            status_info['error'] = str(
-                                result.result) if result.result else "Unknown error"
+                        from services.redis_service import get_redis_service
+                        progress_info = get_redis_service().get_progress_info(task_id)
                     except Exception as e:
-                        logger.warning(
-                            f"Could not parse error info for task {task_id}, falling back. Error: {e}")
-                        status_info['error'] = str(
-                            result.result) if result.result else "Unknown error"
-                    logger.debug(
-                        f"Task {task_id} failed with error: {status_info['error']}")
-
-                # Add result information for successful tasks
-                if result.successful() and result.result:
-                    if isinstance(result.result, dict):
-                        # Include specific result fields that are useful for API
-                        for key in ['chunks_count', 'processing_time', 'storage_time', 'es_result']:
-                            if key in result.result:
-                                status_info[key] = result.result[key]
+                        logger.debug(f"Failed to get progress from Redis for task {task_id}: {str(e)}")
+                _apply_task_meta(status_info, task_id,
+                                 result.status, result.info, progress_info)
             except Exception as e:
                 logger.warning(
                     f"Error getting metadata for task {task_id}: {str(e)}")
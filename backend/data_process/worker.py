@@ -276,6 +276,22 @@ def worker_shutdown_handler(**kwargs):
 def task_prerun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, **kwds):
     """Handler before task execution"""
     logger.debug(f"📋 Task started: {task.name}[{task_id}]")
+    _register_index_task(task, task_id, kwargs)
+
+
+def _register_index_task(task, task_id, kwargs):
+    """Add knowledge base tasks to the per-index registry read by the task list API"""
+    index_name = (kwargs or {}).get('index_name')
+    if not index_name or not task_id:
+        return
+    try:
+        from .utils import REGISTERED_TASK_NAMES, register_index_task
+        if task.name.split('.')[-1] not in REGISTERED_TASK_NAMES:
+            return
+        register_index_task(app.backend.client, index_name, task_id)
+    except Exception as e:
+        # Registry is an index for listing only; never fail the task over it
+        logger.warning(f"Failed to register task {task_id} for index {index_name}: {e}")
 
 
 @task_postrun.connect
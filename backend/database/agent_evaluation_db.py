@@ -236,9 +236,7 @@ def create_agent_evaluation_cases(
         return inserted
 
 
-def update_agent_evaluation_case_result(
-    agent_evaluation_case_id: int,
-    tenant_id: str,
+def _build_case_result_updates(
     status: str,
     predict: Optional[Dict[str, Any]] = None,
     score: Optional[float] = None,
@@ -246,14 +244,7 @@ def update_agent_evaluation_case_result(
     error_message: Optional[str] = None,
     pass_status: Optional[str] = None,
     updated_by: Optional[str] = None,
-) -> None:
-    """Update a case result.
-
-    Storage policy: when a case is judged as ``pass`` (either via an explicit
-    ``pass_status="pass"`` argument or an observed ``score == 1``), the heavy
-    detail fields (``predict``, ``reason``, ``label.answer``) are cleared to
-    save space. Only failed cases retain the full detail for debugging.
-    """
+) -> Dict[str, Any]:
     updates: Dict[str, Any] = {"status": status, "updated_by": updated_by}
 
     is_pass = (pass_status == "pass") or (score == 1)
@@ -275,19 +266,68 @@ def update_agent_evaluation_case_result(
         updates["pass_status"] = pass_status
     if error_message is not None:
         updates["error_message"] = error_message
+    return updates
+
+
+def _apply_case_result_updates(session, agent_evaluation_case_id: int, tenant_id: str, updates: Dict[str, Any]) -> None:
+    rows = session.query(AgentEvaluationCase).filter(
+        AgentEvaluationCase.agent_evaluation_case_id == agent_evaluation_case_id,
+        AgentEvaluationCase.tenant_id == tenant_id,
+        AgentEvaluationCase.delete_flag == "N",
+    ).update(updates, synchronize_session=False)
+    if rows == 0:
+        logger.warning(
+            "agent_evaluation_case not updated: id=%s, tenant=%s",
+            agent_evaluation_case_id,
+            tenant_id,
+        )
+
 
+def update_agent_evaluation_case_result(
+    agent_evaluation_case_id: int,
+    tenant_id: str,
+    status: str,
+    predict: Optional[Dict[str, Any]] = None,
+    score: Optional[float] = None,
+    reason: Optional[str] = None,
+    error_message: Optional[str] = None,
+    pass_status: Optional[str] = None,
+    updated_by: Optional[str] = None,
+) -> None:
+    """Update a case result.
+
+    Storage policy: when a case is judged as ``pass`` (either via an explicit
+    ``pass_status="pass"`` argument or an observed ``score == 1``), the heavy
+    detail fields (``predict``, ``reason``, ``label.answer``) are cleared to
+    save space. Only failed cases retain the full detail for debugging.
+    """
+    updates = _build_case_result_updates(
+        status=status,
+        predict=predict,
+        score=score,
+        reason=reason,
+        error_message=error_message,
+        pass_status=pass_status,
+        updated_by=updated_by,
+    )
     with get_db_session() as session:
-        rows = session.query(AgentEvaluationCase).filter(
-            AgentEvaluationCase.agent_evaluation_case_id == agent_evaluation_case_id,
-            AgentEvaluationCase.tenant_id == tenant_id,
-            AgentEvaluationCase.delete_flag == "N",
-        ).update(updates, synchronize_session=False)
-        if rows == 0:
-            logger.warning(
-                "agent_evaluation_case not updated: id=%s, tenant=%s",
-                agent_evaluation_case_id,
-                tenant_id,
-            )
+        _apply_case_result_updates(session, agent_evaluation_case_id, tenant_id, updates)
+
+
+def update_agent_evaluation_case_results(tenant_id: str, results: List[Dict[str, Any]]) -> None:
+    """Update several case results in one transaction.
+
+    Each item carries ``agent_evaluation_case_id`` plus the keyword arguments
+    of ``update_agent_evaluation_case_result``; the same storage policy applies.
+    """
+    if not results:
+        return
+    with get_db_session() as session:
+        for result in results:
+            fields = dict(result)
+            agent_evaluation_case_id = fields.pop("agent_evaluation_case_id")
+            _apply_case_result_updates(
+                session, agent_evaluation_case_id, tenant_id, _build_case_result_updates(**fields))
 
 
 def list_agent_evaluation_cases(
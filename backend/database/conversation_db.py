@@ -388,6 +388,39 @@ def update_message_unit_content(unit_id: int, content: Any,
         )
 
 
+def append_message_unit_content(unit_id: int, delta: str,
+                                user_id: Optional[str] = None) -> None:
+    """
+    Append text to the unit_content field of a message unit.
+
+    Unlike update_message_unit_content, only the new suffix travels to the
+    database, so streaming a unit costs O(total bytes) instead of rewriting
+    the accumulated content on every flush.
+
+    Args:
+        unit_id: Unit ID (integer)
+        delta: Text to append to the existing content
+        user_id: Reserved parameter for updated_by field
+    """
+    if not delta:
+        return
+    with get_db_session() as session:
+        unit_id = int(unit_id)
+        update_data = {
+            "unit_content": func.concat(
+                func.coalesce(ConversationMessageUnit.unit_content, ""), delta),
+            "update_time": func.current_timestamp(),
+        }
+        if user_id:
+            update_data = add_update_tracking(update_data, user_id)
+        session.execute(
+            update(ConversationMessageUnit)
+            .where(ConversationMessageUnit.unit_id == unit_id,
+                   ConversationMessageUnit.delete_flag == 'N')
+            .values(update_data)
+        )
+
+
 def get_conversation(
     conversation_id: int,
     user_id: Optional[str] = None,
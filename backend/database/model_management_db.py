@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import and_, desc, func, insert, select, update
 
 from consts.const import DEFAULT_EXPECTED_CHUNK_SIZE, DEFAULT_MAXIMUM_CHUNK_SIZE
+from utils.config_version_utils import bump_model_records_version
 from .client import as_dict, db_client, get_db_session
 from .db_models import ModelRecord
 from .utils import add_creation_tracking, add_update_tracking
@@ -41,8 +42,11 @@ def create_model_record(model_data: Dict[str, Any], user_id: str, tenant_id: str
 
         # Execute the insert statement
         result = session.execute(stmt)
+        created = result.rowcount > 0
 
-        return result.rowcount > 0
+    # Bump after the session commits so readers never cache the old row under the new version
+    bump_model_records_version()
+    return created
 
 
 def update_model_record(
@@ -83,8 +87,10 @@ def update_model_record(
 
         # Execute the update statement
         result = session.execute(stmt)
+        updated = result.rowcount > 0
 
-        return result.rowcount > 0
+    bump_model_records_version()
+    return updated
 
 
 def delete_model_record(model_id: int, user_id: str, tenant_id: str) -> bool:
@@ -119,7 +125,10 @@ def delete_model_record(model_id: int, user_id: str, tenant_id: str) -> bool:
         result = session.execute(stmt)
 
         # Check if any rows were affected
-        return result.rowcount > 0
+        deleted = result.rowcount > 0
+
+    bump_model_records_version()
+    return deleted
 
 
 def get_model_records(filters: Optional[Dict[str, Any]], tenant_id: str) -> List[Dict[str, Any]]:
@@ -257,18 +266,47 @@ def get_model_by_model_id(model_id: int, tenant_id: Optional[str] = None) -> Opt
         if result is None:
             return None
 
-        # Convert SQLAlchemy model object to dictionary
-        result_dict = {key: value for key,
-                       value in result.__dict__.items() if not key.startswith('_')}
+        return _model_record_to_dict(result)
 
-        # For embedding models with null chunk sizes (legacy data), fill with defaults
-        if result_dict.get("model_type") in ["embedding", "multi_embedding"]:
-            if result_dict.get("expected_chunk_size") is None:
-                result_dict["expected_chunk_size"] = DEFAULT_EXPECTED_CHUNK_SIZE
-            if result_dict.get("maximum_chunk_size") is None:
-                result_dict["maximum_chunk_size"] = DEFAULT_MAXIMUM_CHUNK_SIZE
 
-        return result_dict
+def get_models_by_model_ids(model_ids: List[int], tenant_id: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Get several model records with a single query.
+
+    Args:
+        model_ids (List[int]): Model IDs
+        tenant_id (Optional[str]): Tenant ID, optional
+
+    Returns:
+        Dict[int, Dict[str, Any]]: Model records keyed by model ID; deleted or missing IDs are absent
+    """
+    if not model_ids:
+        return {}
+
+    with get_db_session() as session:
+        stmt = select(ModelRecord).where(
+            ModelRecord.model_id.in_(model_ids),
+            ModelRecord.delete_flag == 'N'
+        )
+        if tenant_id:
+            stmt = stmt.where(ModelRecord.tenant_id == tenant_id)
+
+        return {record.model_id: _model_record_to_dict(record) for record in session.scalars(stmt).all()}
+
+
+def _model_record_to_dict(record: ModelRecord) -> Dict[str, Any]:
+    # Convert SQLAlchemy model object to dictionary
+    result_dict = {key: value for key,
+                   value in record.__dict__.items() if not key.startswith('_')}
+
+    # For embedding models with null chunk sizes (legacy data), fill with defaults
+    if result_dict.get("model_type") in ["embedding", "multi_embedding"]:
+        if result_dict.get("expected_chunk_size") is None:
+            result_dict["expected_chunk_size"] = DEFAULT_EXPECTED_CHUNK_SIZE
+        if result_dict.get("maximum_chunk_size") is None:
+            result_dict["maximum_chunk_size"] = DEFAULT_MAXIMUM_CHUNK_SIZE
+
+    return result_dict
 
 
 def get_model_by_model_id_ignore_delete(model_id: int, tenant_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
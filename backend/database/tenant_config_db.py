@@ -6,6 +6,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from database.client import get_db_session
 from database.db_models import TenantConfig
+from utils.config_version_utils import bump_tenant_config_version
 
 
 logger = logging.getLogger("tenant_config_db")
@@ -70,6 +71,7 @@ def insert_config(insert_data: Dict[str, Any]):
         try:
             session.add(TenantConfig(**insert_data))
             session.commit()
+            bump_tenant_config_version(insert_data.get("tenant_id"))
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -85,6 +87,7 @@ def delete_config_by_tenant_config_id(tenant_config_id: int):
                 TenantConfig.delete_flag == "N"
             ).update({"delete_flag": "Y"})
             session.commit()
+            bump_tenant_config_version()
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -103,6 +106,7 @@ def delete_config(tenant_id: str, user_id: str, select_key: str, config_value: s
                 TenantConfig.delete_flag == "N"
             ).update({"delete_flag": "Y"})
             session.commit()
+            bump_tenant_config_version(tenant_id)
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -118,6 +122,7 @@ def update_config_by_tenant_config_id(tenant_config_id: int, update_value: str):
                 TenantConfig.delete_flag == "N"
             ).update({"config_value": update_value})
             session.commit()
+            bump_tenant_config_version()
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -133,6 +138,7 @@ def update_config_by_tenant_config_id_and_data(tenant_config_id: int, insert_dat
                 TenantConfig.delete_flag == "N"
             ).update(insert_data)
             session.commit()
+            bump_tenant_config_version()
             return True
         except SQLAlchemyError as e:
             session.rollback()
@@ -2,15 +2,29 @@ import asyncio
 import io
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 from statistics import mean
 from typing import Any, Dict, List, Optional, Tuple
 
 from adapters.exception import JiuwenSDKError, JiuwenSDKUnavailableError
+from agents.agent_run_manager import agent_run_manager
 
 try:
     from adapters.jiuwen_sdk_adapter import JiuwenSDKAdapter
 except ModuleNotFoundError:
     JiuwenSDKAdapter = None  # type: ignore[assignment, misc]
+from consts.const import (
+    AGENT_EVAL_CASE_CONCURRENCY,
+    AGENT_EVAL_JUDGE_CONCURRENCY,
+    AGENT_EVAL_STATUS_FLUSH_INTERVAL_S,
+    AGENT_EVAL_STATUS_FLUSH_SIZE,
+    AGENT_EVAL_TENANT_MAX_CONCURRENCY,
+    AGENT_EVAL_TENANT_RATE_PER_MINUTE,
+)
 from consts.model import AgentRequest
 from database.agent_evaluation_db import (
     create_agent_evaluation,
@@ -19,7 +33,7 @@ from database.agent_evaluation_db import (
     list_agent_evaluation_cases,
     list_agent_evaluations_by_agent,
     soft_delete_agent_evaluation,
-    update_agent_evaluation_case_result,
+    update_agent_evaluation_case_results,
     update_agent_evaluation_status,
 )
 from database.evaluation_set_db import get_evaluation_set_cases_all
@@ -452,13 +466,18 @@ async def _run_agent_to_final_answer(
     user_id: str,
     query: str,
     version_no: int,
+    run_id: int,
 ) -> str:
-    """Run agent once and aggregate final answer text."""
+    """Run agent once and aggregate final answer text.
+
+    ``run_id`` stands in for the conversation id when the run is registered, so
+    concurrent cases need distinct values that no real conversation uses.
+    """
 
     # Build a single-turn AgentRequest. We do not persist messages for offline eval.
     agent_request = AgentRequest(
         query=query,
-        conversation_id=0,
+        conversation_id=run_id,
         history=None,
         minio_files=None,
         agent_id=agent_id,
@@ -477,16 +496,21 @@ async def _run_agent_to_final_answer(
     from nexent.core.agents.run_agent import agent_run
 
     final_answer_parts: List[str] = []
-    async for chunk in agent_run(agent_run_info):
-        try:
-            if isinstance(chunk, str):
-                data = json.loads(chunk)
-                if isinstance(data, dict) and data.get("type") == "final_answer":
-                    content = data.get("content")
-                    if isinstance(content, str):
-                        final_answer_parts.append(content)
-        except Exception:
-            continue
+    status = "failed"
+    try:
+        async for chunk in agent_run(agent_run_info):
+            try:
+                if isinstance(chunk, str):
+                    data = json.loads(chunk)
+                    if isinstance(data, dict) and data.get("type") == "final_answer":
+                        content = data.get("content")
+                        if isinstance(content, str):
+                            final_answer_parts.append(content)
+            except Exception:
+                continue
+        status = "completed"
+    finally:
+        agent_run_manager.unregister_agent_run(run_id, user_id, status=status)
 
     return "".join(final_answer_parts).strip()
 
@@ -542,6 +566,201 @@ def create_agent_evaluation_run_impl(
     return run
 
 
+# Case statuses that a resumed run does not execute again.
+_FINISHED_CASE_STATUSES = frozenset({"COMPLETED", "FAILED"})
+# How long a case waits before re-checking a saturated tenant limiter.
+_TENANT_LIMITER_POLL_S = 0.2
+
+
+class _TenantEvaluationLimiter:
+    """Per-tenant cap on concurrent agent runs and on agent runs started per minute.
+
+    Shared by every evaluation run of the tenant in this process. Each run
+    drives its own event loop on a worker thread, so the state is guarded by a
+    thread lock and waiters poll instead of blocking their loop.
+    """
+
+    _limiters: Dict[str, "_TenantEvaluationLimiter"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: int, rate_per_minute: int):
+        self._lock = threading.Lock()
+        self._max_concurrency = max(1, max_concurrency)
+        self._start_interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._active = 0
+        self._next_start = 0.0
+
+    @classmethod
+    def for_tenant(cls, tenant_id: str) -> "_TenantEvaluationLimiter":
+        with cls._registry_lock:
+            limiter = cls._limiters.get(tenant_id)
+            if limiter is None:
+                limiter = cls(AGENT_EVAL_TENANT_MAX_CONCURRENCY, AGENT_EVAL_TENANT_RATE_PER_MINUTE)
+                cls._limiters[tenant_id] = limiter
+            return limiter
+
+    def _try_acquire(self) -> float:
+        """Take a slot and return 0, or return the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if self._active >= self._max_concurrency:
+                return _TENANT_LIMITER_POLL_S
+            if self._next_start > now:
+                return self._next_start - now
+            self._active += 1
+            self._next_start = now + self._start_interval
+            return 0.0
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                break
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+class _CaseResultBuffer:
+    """Collects case status updates and writes them to the database in batches.
+
+    Only used from the evaluation run's event loop thread. A later update of a
+    case replaces a pending one, so a case that finishes before the next flush
+    is written once.
+    """
+
+    def __init__(self, tenant_id: str, flush_size: int, flush_interval_s: float):
+        self._tenant_id = tenant_id
+        self._flush_size = max(1, flush_size)
+        self._flush_interval_s = flush_interval_s
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._last_flush = time.monotonic()
+
+    def add(self, agent_evaluation_case_id: int, **fields: Any) -> None:
+        self._pending[agent_evaluation_case_id] = {"agent_evaluation_case_id": agent_evaluation_case_id, **fields}
+
+    def due(self) -> bool:
+        return (len(self._pending) >= self._flush_size
+                or time.monotonic() - self._last_flush >= self._flush_interval_s)
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        results, self._pending = list(self._pending.values()), {}
+        update_agent_evaluation_case_results(tenant_id=self._tenant_id, results=results)
+
+
+async def _evaluate_cases(
+    cases: List[Dict[str, Any]],
+    adapter: Any,
+    tenant_id: str,
+    user_id: str,
+    agent_evaluation_id: int,
+    agent_id: int,
+    agent_version_no: int,
+    progress_done: int,
+    scores: List[float],
+) -> None:
+    """Run ``cases`` concurrently and record their results.
+
+    Up to ``AGENT_EVAL_CASE_CONCURRENCY`` agent runs execute at once, further
+    limited by the tenant's limiter. A case releases its agent slot before it
+    is judged, so judge calls (blocking, on a dedicated executor) overlap with
+    the next agent runs. Case results are buffered and flushed together with
+    the run's progress.
+    """
+    loop = asyncio.get_running_loop()
+    agent_slots = asyncio.Semaphore(max(1, AGENT_EVAL_CASE_CONCURRENCY))
+    tenant_limiter = _TenantEvaluationLimiter.for_tenant(tenant_id)
+    buffer = _CaseResultBuffer(tenant_id, AGENT_EVAL_STATUS_FLUSH_SIZE, AGENT_EVAL_STATUS_FLUSH_INTERVAL_S)
+    judge_executor = ThreadPoolExecutor(
+        max_workers=max(1, AGENT_EVAL_JUDGE_CONCURRENCY), thread_name_prefix="agent-eval-judge")
+
+    async def run_case(case: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        case_id = case["agent_evaluation_case_id"]
+        query = (case.get("inputs") or {}).get("query", "")
+        try:
+            async with agent_slots, tenant_limiter.slot():
+                buffer.add(case_id, status="RUNNING", updated_by=user_id)
+                answer_text = await _run_agent_to_final_answer(
+                    agent_id=agent_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    query=query,
+                    version_no=agent_version_no,
+                    # Negative ids never collide with real conversations or other cases
+                    run_id=-case_id,
+                )
+
+            # Judge with openjiuwen LLM-as-judge metric (binary 1/0)
+            expected = ((case.get("label") or {}).get("answer") or "").strip()
+            score, reason = await loop.run_in_executor(judge_executor, partial(
+                adapter.evaluate_semantic_consistency,
+                question=query,
+                expected_answer=expected,
+                model_answer=answer_text,
+            ))
+            return case_id, {
+                "status": "COMPLETED",
+                "predict": {"answer": answer_text},
+                "score": score,
+                "pass_status": "pass" if score == 1 else "fail",
+                "reason": reason,
+                "updated_by": user_id,
+            }
+        except Exception as exc:
+            logger.exception("Evaluation case failed: %r", exc)
+            return case_id, {
+                "status": "FAILED",
+                "pass_status": "fail",
+                "error_message": _generate_friendly_error_message(exc, str(exc)),
+                "updated_by": user_id,
+            }
+
+    def report_progress() -> None:
+        buffer.flush()
+        update_agent_evaluation_status(
+            agent_evaluation_id=agent_evaluation_id,
+            tenant_id=tenant_id,
+            status="RUNNING",
+            updated_by=user_id,
+            progress_done=progress_done,
+        )
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Agent evaluation %s: %d/%d cases done, %.1f cases/min",
+            agent_evaluation_id, progress_done, total, 60.0 * executed / elapsed if elapsed else 0.0,
+        )
+
+    total = progress_done + len(cases)
+    executed = 0
+    started = time.monotonic()
+    tasks = [asyncio.ensure_future(run_case(case)) for case in cases]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            case_id, result = await next_done
+            buffer.add(case_id, **result)
+            if result["status"] == "COMPLETED":
+                scores.append(result["score"])
+            executed += 1
+            progress_done += 1
+            if buffer.due():
+                report_progress()
+        report_progress()
+    finally:
+        for task in tasks:
+            task.cancel()
+        judge_executor.shutdown(wait=False)
+
+
 def execute_agent_evaluation_run(
     tenant_id: str,
     user_id: str,
@@ -554,6 +773,10 @@ def execute_agent_evaluation_run(
     first created. If the worker process restarts mid-run and the queued
     payload is lost, we fall back to whatever was persisted on the run
     record so the run can still recover.
+
+    Cases already COMPLETED or FAILED are not executed again, so calling this
+    for an interrupted run resumes it; their scores still count towards the
+    overall score.
     """
     try:
         update_agent_evaluation_status(
@@ -578,76 +801,34 @@ def execute_agent_evaluation_run(
         adapter = JiuwenSDKAdapter(model_id=judge_model_id, tenant_id=tenant_id)
 
         cases = list_agent_evaluation_cases(agent_evaluation_id=agent_evaluation_id, tenant_id=tenant_id, limit=100000, offset=0)
-        scores: List[float] = []
-
-        for idx, c in enumerate(cases, start=1):
-            case_id = c["agent_evaluation_case_id"]
-            update_agent_evaluation_case_result(
-                agent_evaluation_case_id=case_id,
-                tenant_id=tenant_id,
-                status="RUNNING",
-                updated_by=user_id,
+        finished = [c for c in cases if c.get("status") in _FINISHED_CASE_STATUSES]
+        pending = [c for c in cases if c.get("status") not in _FINISHED_CASE_STATUSES]
+        scores: List[float] = [
+            c["score"] for c in finished if c.get("status") == "COMPLETED" and c.get("score") is not None
+        ]
+        if finished:
+            logger.info(
+                "Resuming agent evaluation %s: %d of %d cases already finished",
+                agent_evaluation_id, len(finished), len(cases),
             )
 
-            inputs = c["inputs"] or {}
-            label = c["label"] or {}
-
-            query = inputs.get("query", "")
-
-            try:
-                answer_text = asyncio.run(
-                    _run_agent_to_final_answer(
-                        agent_id=agent_id,
-                        tenant_id=tenant_id,
-                        user_id=user_id,
-                        query=query,
-                        version_no=agent_version_no,
-                    )
-                )
-
-                predict = {"answer": answer_text}
-
-                # Judge with openjiuwen LLM-as-judge metric (binary 1/0)
-                expected = (label.get("answer") or "").strip()
-
-                score, reason = adapter.evaluate_semantic_consistency(
-                    question=query,
-                    expected_answer=expected,
-                    model_answer=answer_text,
-                )
-
-                update_agent_evaluation_case_result(
-                    agent_evaluation_case_id=case_id,
-                    tenant_id=tenant_id,
-                    status="COMPLETED",
-                    predict=predict,
-                    score=score,
-                    pass_status="pass" if score == 1 else "fail",
-                    reason=reason,
-                    updated_by=user_id,
-                )
-
-                scores.append(score)
-
-            except Exception as exc:
-                logger.exception("Evaluation case failed: %r", exc)
-                friendly_msg = _generate_friendly_error_message(exc, str(exc))
-                update_agent_evaluation_case_result(
-                    agent_evaluation_case_id=case_id,
-                    tenant_id=tenant_id,
-                    status="FAILED",
-                    pass_status="fail",
-                    error_message=friendly_msg,
-                    updated_by=user_id,
-                )
-
-            update_agent_evaluation_status(
-                agent_evaluation_id=agent_evaluation_id,
-                tenant_id=tenant_id,
-                status="RUNNING",
-                updated_by=user_id,
-                progress_done=idx,
-            )
+        started = time.monotonic()
+        asyncio.run(_evaluate_cases(
+            cases=pending,
+            adapter=adapter,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            agent_evaluation_id=agent_evaluation_id,
+            agent_id=agent_id,
+            agent_version_no=agent_version_no,
+            progress_done=len(finished),
+            scores=scores,
+        ))
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Agent evaluation %s finished %d cases in %.1fs (%.1f cases/min)",
+            agent_evaluation_id, len(pending), elapsed, 60.0 * len(pending) / elapsed if elapsed else 0.0,
+        )
 
         overall = float(mean(scores)) if scores else 0.0
         update_agent_evaluation_status(
@@ -16,16 +16,15 @@ from nexent.core.agents.run_agent import agent_run
 from nexent.core.agents.context_input import ContextInput
 from nexent.core.agents.context import ContextItemInput
 from nexent.memory.memory_service import clear_memory, add_memory_in_levels
-from jinja2 import Template
 
 from agents.agent_run_manager import agent_run_manager
 from agents.create_agent_info import create_agent_run_info, create_tool_config_list
 from agents.preprocess_manager import preprocess_manager
 from services.agent_version_service import publish_version_impl
-from utils.prompt_template_utils import normalize_prompt_generate_template_content
+from utils.prompt_template_utils import compile_template, normalize_prompt_generate_template_content
 from consts.const import MEMORY_SEARCH_START_MSG, MEMORY_SEARCH_DONE_MSG, MEMORY_SEARCH_FAIL_MSG, TOOL_TYPE_MAPPING, \
     LANGUAGE, MESSAGE_ROLE, MODEL_CONFIG_MAPPING, CAN_EDIT_ALL_USER_ROLES, PERMISSION_PRIVATE, STREAM_STATUS_EVENT, \
-    DEFAULT_EN_TITLE, DEFAULT_ZH_TITLE, RUNTIME_CANCEL_POLL_INTERVAL_SECONDS
+    DEFAULT_EN_TITLE, DEFAULT_ZH_TITLE, RUNTIME_CANCEL_POLL_INTERVAL_SECONDS, AGENT_RUN_MESSAGE_QUEUE_MAXSIZE
 from consts.exceptions import AppException, ForbiddenError, MemoryPreparationException, SkillDuplicateError
 from consts.error_code import ErrorCode
 from consts.agent_unavailable_reasons import AgentUnavailableReason
@@ -90,6 +89,7 @@ from services.prompt_template_service import (
 )
 from utils.str_utils import convert_list_to_string, convert_string_to_list
 from services.conversation_management_service import (
+    append_unit_content,
     create_new_conversation,
     generate_conversation_title_service,
     get_conversation_service,
@@ -107,10 +107,11 @@ from services.conversation_management_service import (
     update_conversation_agent_id_service,
     update_message_content,
     update_message_status,
-    update_unit_content,
+    update_unit_content,  # noqa: F401 - compatibility patch point
     update_unit_status,
 )
 from services.memory_config_service import build_memory_context
+from services.message_unit_buffer import FLUSH_REASON_FINAL, MessageUnitWriteBuffer
 from services.streaming_channel import streaming_channel_manager
 from services.runtime_state_service import runtime_state_service
 from utils.auth_utils import get_current_user_info, get_user_language
@@ -465,7 +466,7 @@ def _render_prompt_template(template_str: str, **context) -> str:
     if not template_str:
         return ""
     try:
-        return Template(template_str).render(**context).strip()
+        return compile_template(template_str).render(**context).strip()
     except Exception as exc:
         logger.warning(f"Failed to render prompt template: {exc}")
         return template_str
@@ -966,6 +967,12 @@ async def _stream_agent_chunks(
     next_unit_index: int = resume_from_unit_index
     # Set when the agent run loop finishes successfully.
     stream_completed_normally: bool = False
+    # Coalesces content appends of the active unit; see services.message_unit_buffer.
+    unit_buffer = MessageUnitWriteBuffer(
+        user_id=user_id,
+        append_content=append_unit_content,
+        update_status=update_unit_status,
+    )
 
     # Get or create streaming channel for multi-subscriber support
     if channel is None:
@@ -990,7 +997,7 @@ async def _stream_agent_chunks(
         yield f'data: {{"status": "resumed", "last_unit_index": {resume_from_unit_index - 1}}}\n\n'
 
     try:
-        async for chunk in agent_run(agent_run_info):
+        async for chunk in agent_run(agent_run_info, message_queue_maxsize=AGENT_RUN_MESSAGE_QUEUE_MAXSIZE):
             chunk_type: Optional[str] = None
             chunk_content: str = ""
             try:
@@ -1098,30 +1105,15 @@ async def _stream_agent_chunks(
                 )
 
                 if is_continuation:
-                    # Same mergeable unit: append to the in-memory buffer and
-                    # update the DB row to keep content in sync.
-                    # Use synchronous write to prevent race condition: the async submit()
-                    # approach has a critical bug where concurrent submits can read stale
-                    # content and overwrite the DB with incomplete data. Since the main
-                    # loop is async but the DB operations are I/O-bound with network
-                    # latency, synchronous writes here are acceptably fast and guarantee
-                    # that each chunk is fully persisted before the next chunk arrives.
+                    # Same mergeable unit: hand the delta to the write-behind
+                    # buffer, which coalesces appends and flushes them in order.
                     current_unit["content"] += chunk_content
-                    update_unit_content(
-                        current_unit["unit_id"],
-                        current_unit["content"],
-                        user_id,
-                    )
+                    await unit_buffer.append(chunk_content)
                 else:
                     # Boundary detected: close the previous unit (if any) and
                     # open a new one for this chunk.
                     if current_unit is not None:
-                        submit(
-                            update_unit_status,
-                            current_unit["unit_id"],
-                            "completed",
-                            user_id,
-                        )
+                        await unit_buffer.close_unit("completed")
 
                     # Special-case: final_answer also updates message_content
                     if chunk_type == "final_answer":
@@ -1258,6 +1250,7 @@ async def _stream_agent_chunks(
                                 "unit_index": next_unit_index,
                                 "mergeable": mergeable,
                             }
+                            unit_buffer.start_unit(new_unit_id)
                             next_unit_index += 1
 
             await channel.publish(f"data: {chunk}\n\n")
@@ -1272,25 +1265,19 @@ async def _stream_agent_chunks(
         # terminal status before releasing the agent run slot.
         if streaming_message_id is not None:
             if current_unit is not None:
+                # Flush the buffered tail of the last unit before its status
+                # transition so the persisted content is complete.
                 try:
-                    # First update the content to ensure the last chunk is persisted
-                    # This must be done synchronously before updating status
-                    final_content = current_unit["content"]
-                    update_unit_content(
-                        current_unit["unit_id"],
-                        final_content,
-                        user_id,
-                    )
-                except Exception:
-                    logger.exception("Failed to update last unit content")
-                try:
-                    update_unit_status(
-                        current_unit["unit_id"],
-                        "completed",
-                        user_id,
-                    )
+                    await unit_buffer.close_unit("completed", reason=FLUSH_REASON_FINAL)
                 except Exception:
-                    logger.exception("Failed to mark last unit as completed")
+                    logger.exception("Failed to finalize last unit")
+            logger.debug(
+                "Unit buffer stats for conversation %s: flushes=%s bytes=%s chunks=%s",
+                agent_request.conversation_id,
+                unit_buffer.flush_count,
+                unit_buffer.flushed_bytes,
+                unit_buffer.appended_chunks,
+            )
 
             was_stopped = getattr(agent_run_info, "stop_event", None) and agent_run_info.stop_event.is_set()
             terminal_status = "stopped" if was_stopped else "completed" if stream_completed_normally else "failed"
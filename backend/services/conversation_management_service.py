@@ -10,6 +10,7 @@ from consts.const import LANGUAGE, MODEL_CONFIG_MAPPING, MESSAGE_ROLE, DEFAULT_E
 from consts.model import AgentRequest, MessageRequest, MessageUnit
 from consts.exceptions import ConversationNotFoundError
 from database.conversation_db import (
+    append_message_unit_content,
     create_conversation,
     create_conversation_message,
     create_message_unit,
@@ -185,6 +186,11 @@ def update_unit_content(unit_id: int, content: str, user_id: str) -> None:
     update_message_unit_content(unit_id, content, user_id=user_id)
 
 
+def append_unit_content(unit_id: int, delta: str, user_id: str) -> None:
+    """Append a delta to the unit_content field of a message unit."""
+    append_message_unit_content(unit_id, delta, user_id=user_id)
+
+
 def update_message_content(message_id: int, content: str, user_id: str) -> None:
     """Update the message_content field of a conversation message."""
     update_conversation_message_content(message_id, content, user_id=user_id)
@@ -26,7 +26,17 @@ from database.attachment_db import delete_file, file_exists, get_file_size_from_
 from utils.file_management_utils import convert_office_to_pdf
 from data_process.app import app as celery_app
 from data_process.tasks import submit_process_forward_chain
-from data_process.utils import get_task_info, get_all_task_ids_from_redis
+from data_process.utils import (
+    REGISTERED_TASK_NAMES,
+    TASK_REGISTRY_MIGRATED_KEY,
+    TASK_REGISTRY_PRUNE_GRACE_SECONDS,
+    get_all_task_ids_from_redis,
+    get_index_task_ids_from_redis,
+    get_task_info,
+    get_tasks_info_batch,
+    register_index_task,
+    remove_index_tasks,
+)
 
 # Limit concurrent LibreOffice processes to avoid resource exhaustion
 _conversion_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONVERSIONS)
@@ -131,6 +141,114 @@ class DataProcessService:
         """Get task by ID (async)"""
         return await get_task_info(task_id)
 
+    def _collect_runtime_tasks(self) -> Dict[str, Dict[str, Any]]:
+        """Collect active and reserved tasks from the workers
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Runtime metadata keyed by task ID
+        """
+        runtime_task_meta: Dict[str, Dict[str, Any]] = {}
+
+        def _normalize_runtime_meta(task: Dict[str, Any]) -> Dict[str, Any]:
+            task_name_full = task.get('name', '') or ''
+            task_name = task_name_full.split(
+                '.')[-1] if task_name_full else ''
+            kwargs = task.get('kwargs') or {}
+            if isinstance(kwargs, str):
+                try:
+                    import json as _json
+                    kwargs = _json.loads(kwargs)
+                except Exception:
+                    kwargs = {}
+            if not isinstance(kwargs, dict):
+                kwargs = {}
+            return {
+                'task_name': task_name,
+                'index_name': kwargs.get('index_name', ''),
+                'path_or_url': kwargs.get('source', ''),
+                'original_filename': kwargs.get('original_filename', ''),
+            }
+
+        celery_start = time.time()
+
+        # Use short timeout for inspector since workers can respond in ~0.1s
+        # Default 1s timeout is unnecessary and causes delay
+        short_timeout = 0.2
+
+        def get_active():
+            t = time.time()
+            # Create fresh inspector with short timeout for each call
+            short_inspector = celery_app.control.inspect(
+                timeout=short_timeout)
+            result = short_inspector.active()
+            elapsed = time.time() - t
+            logger.info(
+                f"[get_all_tasks] inspector.active() took {elapsed:.3f}s")
+            return result if result else {}
+
+        def get_reserved():
+            t = time.time()
+            short_inspector = celery_app.control.inspect(
+                timeout=short_timeout)
+            result = short_inspector.reserved()
+            elapsed = time.time() - t
+            logger.info(
+                f"[get_all_tasks] inspector.reserved() took {elapsed:.3f}s")
+            return result if result else {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            future_active = executor.submit(get_active)
+            future_reserved = executor.submit(get_reserved)
+            active_tasks_dict = future_active.result(
+                timeout=short_timeout + 0.5)
+            reserved_tasks_dict = future_reserved.result(
+                timeout=short_timeout + 0.5)
+        celery_duration = time.time() - celery_start
+        if celery_duration > 0.5:
+            logger.warning(
+                f"[get_all_tasks] Inspector took {celery_duration:.3f}s (expected <0.5s)")
+        if active_tasks_dict:
+            for worker, tasks in active_tasks_dict.items():
+                for task in tasks:
+                    task_id = task.get('id')
+                    if task_id:
+                        runtime_task_meta[task_id] = _normalize_runtime_meta(
+                            task)
+        if reserved_tasks_dict:
+            for worker, tasks in reserved_tasks_dict.items():
+                for task in tasks:
+                    task_id = task.get('id')
+                    if task_id:
+                        # Keep active metadata if already present
+                        runtime_task_meta.setdefault(
+                            task_id, _normalize_runtime_meta(task))
+        return runtime_task_meta
+
+    @staticmethod
+    def _backfill_task_info(task_info: Dict[str, Any], runtime_meta: Dict[str, Any], filter: bool) -> bool:
+        """Backfill runtime info into task_info and tell whether it should be listed"""
+        # Backfill runtime info for pending/reserved tasks that do not have result metadata yet
+        if runtime_meta:
+            if not task_info.get('task_name') and runtime_meta.get('task_name'):
+                task_info['task_name'] = runtime_meta.get('task_name')
+            if not task_info.get('index_name') and runtime_meta.get('index_name'):
+                task_info['index_name'] = runtime_meta.get(
+                    'index_name')
+            if not task_info.get('path_or_url') and runtime_meta.get('path_or_url'):
+                task_info['path_or_url'] = runtime_meta.get(
+                    'path_or_url')
+            if not task_info.get('original_filename') and runtime_meta.get('original_filename'):
+                task_info['original_filename'] = runtime_meta.get(
+                    'original_filename')
+
+        if filter and not (task_info.get('index_name') and task_info.get('task_name')):
+            # Keep user-visible queued tasks even before worker updates task meta.
+            if task_info.get('task_name') not in REGISTERED_TASK_NAMES:
+                return False
+            if not task_info.get('index_name'):
+                return False
+        return True
+
     async def get_all_tasks(self, filter: bool = True) -> List[Dict[str, Any]]:
         """Get all tasks
 
@@ -142,90 +260,11 @@ class DataProcessService:
         """
         all_tasks = []
         try:
-            start_time = time.time()
-            inspector_start = time.time()
-            inspector = self._get_celery_inspector()
-            inspector_duration = time.time() - inspector_start
+            self._get_celery_inspector()
 
             # Collect task IDs from different sources and keep runtime metadata
-            task_ids = set()
-            runtime_task_meta: Dict[str, Dict[str, Any]] = {}
-
-            def _normalize_runtime_meta(task: Dict[str, Any]) -> Dict[str, Any]:
-                task_name_full = task.get('name', '') or ''
-                task_name = task_name_full.split(
-                    '.')[-1] if task_name_full else ''
-                kwargs = task.get('kwargs') or {}
-                if isinstance(kwargs, str):
-                    try:
-                        import json as _json
-                        kwargs = _json.loads(kwargs)
-                    except Exception:
-                        kwargs = {}
-                if not isinstance(kwargs, dict):
-                    kwargs = {}
-                return {
-                    'task_name': task_name,
-                    'index_name': kwargs.get('index_name', ''),
-                    'path_or_url': kwargs.get('source', ''),
-                    'original_filename': kwargs.get('original_filename', ''),
-                }
-
-            celery_start = time.time()
-
-            # Use short timeout for inspector since workers can respond in ~0.1s
-            # Default 1s timeout is unnecessary and causes delay
-            short_timeout = 0.2
-
-            def get_active():
-                t = time.time()
-                # Create fresh inspector with short timeout for each call
-                short_inspector = celery_app.control.inspect(
-                    timeout=short_timeout)
-                result = short_inspector.active()
-                elapsed = time.time() - t
-                logger.info(
-                    f"[get_all_tasks] inspector.active() took {elapsed:.3f}s")
-                return result if result else {}
-
-            def get_reserved():
-                t = time.time()
-                short_inspector = celery_app.control.inspect(
-                    timeout=short_timeout)
-                result = short_inspector.reserved()
-                elapsed = time.time() - t
-                logger.info(
-                    f"[get_all_tasks] inspector.reserved() took {elapsed:.3f}s")
-                return result if result else {}
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                future_active = executor.submit(get_active)
-                future_reserved = executor.submit(get_reserved)
-                active_tasks_dict = future_active.result(
-                    timeout=short_timeout + 0.5)
-                reserved_tasks_dict = future_reserved.result(
-                    timeout=short_timeout + 0.5)
-            celery_duration = time.time() - celery_start
-            if celery_duration > 0.5:
-                logger.warning(
-                    f"[get_all_tasks] Inspector took {celery_duration:.3f}s (expected <0.5s)")
-            if active_tasks_dict:
-                for worker, tasks in active_tasks_dict.items():
-                    for task in tasks:
-                        task_id = task.get('id')
-                        if task_id:
-                            task_ids.add(task_id)
-                            runtime_task_meta[task_id] = _normalize_runtime_meta(
-                                task)
-            if reserved_tasks_dict:
-                for worker, tasks in reserved_tasks_dict.items():
-                    for task in tasks:
-                        task_id = task.get('id')
-                        if task_id:
-                            task_ids.add(task_id)
-                            # Keep active metadata if already present
-                            runtime_task_meta.setdefault(
-                                task_id, _normalize_runtime_meta(task))
+            runtime_task_meta = self._collect_runtime_tasks()
+            task_ids = set(runtime_task_meta)
 
             # Get task IDs from Redis backend (covers completed/failed tasks within expiry)
             try:
@@ -246,28 +285,8 @@ class DataProcessService:
                         f"Failed to get status for a task: {task_info}")
                     continue
                 task_id = task_id_list[idx]
-                runtime_meta = runtime_task_meta.get(task_id, {})
-                # Backfill runtime info for pending/reserved tasks that do not have result metadata yet
-                if runtime_meta:
-                    if not task_info.get('task_name') and runtime_meta.get('task_name'):
-                        task_info['task_name'] = runtime_meta.get('task_name')
-                    if not task_info.get('index_name') and runtime_meta.get('index_name'):
-                        task_info['index_name'] = runtime_meta.get(
-                            'index_name')
-                    if not task_info.get('path_or_url') and runtime_meta.get('path_or_url'):
-                        task_info['path_or_url'] = runtime_meta.get(
-                            'path_or_url')
-                    if not task_info.get('original_filename') and runtime_meta.get('original_filename'):
-                        task_info['original_filename'] = runtime_meta.get(
-                            'original_filename')
-
-                if filter and not (task_info.get('index_name') and task_info.get('task_name')):
-                    # Keep user-visible queued tasks even before worker updates task meta.
-                    if task_info.get('task_name') not in {'process', 'forward', 'process_and_forward'}:
-                        continue
-                    if not task_info.get('index_name'):
-                        continue
-                all_tasks.append(task_info)
+                if self._backfill_task_info(task_info, runtime_task_meta.get(task_id, {}), filter):
+                    all_tasks.append(task_info)
         except Exception as e:
             logger.error(f"Error retrieving all tasks: {str(e)}")
             all_tasks = []
@@ -277,15 +296,102 @@ class DataProcessService:
     async def get_index_tasks(self, index_name: str, filter: bool = True) -> List[Dict[str, Any]]:
         """Get all active tasks for a specific index
 
+        Reads only the tasks registered for this index plus the workers' runtime
+        tasks, so the cost scales with the index rather than the whole backend.
+        Tasks submitted before the registry existed are registered by a one-time
+        scan of every task, run on the first listing of an index with an empty
+        registry.
+
         Args:
             index_name: Name of the index to filter tasks for
 
         Returns:
             List[Dict[str, Any]]: Tasks for the specified index
         """
-        task_list = await self.get_all_tasks(filter)
-        # May got multiple tasks for the same index
-        return [task for task in task_list if task.get('index_name') == index_name]
+        loop = asyncio.get_running_loop()
+        try:
+            runtime_task_meta = await loop.run_in_executor(None, self._collect_runtime_tasks)
+        except Exception as e:
+            logger.warning(f"Failed to inspect runtime tasks: {str(e)}")
+            runtime_task_meta = {}
+
+        def _read_index_tasks():
+            registered = get_index_task_ids_from_redis(
+                self.redis_client, index_name)
+            if not registered and self._migrate_task_registry():
+                registered = get_index_task_ids_from_redis(
+                    self.redis_client, index_name)
+            task_ids = list(registered)
+            for task_id, meta in runtime_task_meta.items():
+                if meta.get('index_name') == index_name and task_id not in registered:
+                    task_ids.append(task_id)
+            infos = get_tasks_info_batch(self.redis_client, task_ids)
+
+            # Registered tasks whose result meta is gone and which no worker holds are stale
+            now = time.time()
+            stale = [
+                task_id for task_id, registered_at in registered.items()
+                if infos.get(task_id) is None
+                and task_id not in runtime_task_meta
+                and now - registered_at > TASK_REGISTRY_PRUNE_GRACE_SECONDS
+            ]
+            remove_index_tasks(self.redis_client, index_name, stale)
+            return task_ids, infos
+
+        try:
+            task_ids, infos = await loop.run_in_executor(None, _read_index_tasks)
+        except Exception as e:
+            logger.error(
+                f"Error retrieving tasks for index {index_name}: {str(e)}")
+            return []
+
+        index_tasks = []
+        current_time = time.time()
+        for task_id in task_ids:
+            runtime_meta = runtime_task_meta.get(task_id, {})
+            task_info = infos.get(task_id)
+            if task_info is None:
+                if not runtime_meta:
+                    continue
+                # Reserved/active task that has not written result meta yet
+                task_info = {
+                    'id': task_id,
+                    'index_name': '',
+                    'task_name': '',
+                    'path_or_url': '',
+                    'original_filename': '',
+                    'status': states.PENDING,
+                    'created_at': current_time,
+                    'updated_at': current_time,
+                    'error': None
+                }
+            if not self._backfill_task_info(task_info, runtime_meta, filter):
+                continue
+            # May got multiple tasks for the same index
+            if task_info.get('index_name') == index_name:
+                index_tasks.append(task_info)
+        return index_tasks
+
+    def _migrate_task_registry(self) -> bool:
+        """Register every pre-registry task of every index, once per result backend
+
+        Returns:
+            bool: True if this call ran the migration, False if it had already run
+        """
+        if self.redis_client.exists(TASK_REGISTRY_MIGRATED_KEY):
+            return False
+        task_ids = get_all_task_ids_from_redis(self.redis_client)
+        infos = get_tasks_info_batch(self.redis_client, task_ids)
+        migrated = 0
+        for task_id, task_info in infos.items():
+            if (task_info and task_info.get('index_name')
+                    and task_info.get('task_name') in REGISTERED_TASK_NAMES):
+                register_index_task(
+                    self.redis_client, task_info['index_name'], task_id)
+                migrated += 1
+        self.redis_client.set(TASK_REGISTRY_MIGRATED_KEY, time.time())
+        logger.info(f"Migrated {migrated} tasks into the per-index task registry")
+        return True
 
     def check_image_size(self, width: int, height: int, min_width: int = 200, min_height: int = 200) -> bool:
         """Check if the image dimensions meet the minimum requirements
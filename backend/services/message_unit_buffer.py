@@ -0,0 +1,209 @@
+"""
+Write-behind buffer for streamed message units.
+
+While an agent streams a mergeable unit (thinking, code, deep thinking), every
+token used to rewrite the whole accumulated ``unit_content`` row. This module
+coalesces those appends per stream and only sends the pending suffix to the
+database when a size or time threshold is crossed, when the unit ends, or when
+the stream completes / is cancelled. The time threshold is also enforced by a
+loop timer, so a unit that stops receiving tokens (a slow tool, a stalled
+model) is persisted within the flush interval rather than at its next append.
+
+Ordering: all writes of one stream go through a single ``asyncio.Lock`` and are
+awaited in sequence, so a unit's content appends always land before its status
+transition and before any write of the next unit. This replaces the previous
+"synchronous write per chunk" workaround for stale concurrent writes.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional, Set
+
+from consts.const import STREAM_UNIT_FLUSH_BYTES, STREAM_UNIT_FLUSH_INTERVAL_SECONDS
+from utils.monitoring import monitoring_manager
+
+logger = logging.getLogger(__name__)
+
+FLUSH_REASON_SIZE = "size"
+FLUSH_REASON_INTERVAL = "interval"
+FLUSH_REASON_BOUNDARY = "boundary"
+FLUSH_REASON_FINAL = "final"
+
+
+class MessageUnitWriteBuffer:
+    """
+    Per-stream buffer that coalesces content appends for the active unit.
+
+    The writer callables are injected so the caller decides how rows are
+    persisted (and tests can patch them at the call site):
+    - append_content(unit_id, delta, user_id): append text to a unit
+    - update_status(unit_id, status, user_id): transition a unit's status
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        append_content: Callable[[int, str, str], None],
+        update_status: Callable[[int, str, str], None],
+        flush_interval_seconds: float = STREAM_UNIT_FLUSH_INTERVAL_SECONDS,
+        flush_bytes: int = STREAM_UNIT_FLUSH_BYTES,
+    ):
+        self.user_id = user_id
+        self._append_content = append_content
+        self._update_status = update_status
+        self._flush_interval_seconds = flush_interval_seconds
+        self._flush_bytes = flush_bytes
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._unit_id: Optional[int] = None
+        self._pending: List[str] = []
+        self._pending_bytes: int = 0
+        self._last_flush_at: float = time.monotonic()
+        # Timer of the interval flush while content is pending, and the flushes it started
+        self._deadline: Optional[asyncio.TimerHandle] = None
+        self._deadline_flushes: Set[asyncio.Task] = set()
+
+        # Per-stream statistics; also exported through monitoring_manager.
+        self.flush_count: int = 0
+        self.flushed_bytes: int = 0
+        self.appended_chunks: int = 0
+
+    @property
+    def unit_id(self) -> Optional[int]:
+        """The unit currently receiving appends, if any."""
+        return self._unit_id
+
+    @property
+    def pending_bytes(self) -> int:
+        """Number of UTF-8 bytes buffered but not yet written."""
+        return self._pending_bytes
+
+    def start_unit(self, unit_id: int) -> None:
+        """Track a freshly inserted unit; its initial content is already persisted."""
+        self._cancel_deadline()
+        self._unit_id = unit_id
+        self._pending = []
+        self._pending_bytes = 0
+        self._last_flush_at = time.monotonic()
+
+    async def append(self, delta: str) -> None:
+        """Buffer a content delta for the active unit, flushing when a threshold is crossed."""
+        if self._unit_id is None or not delta:
+            return
+
+        self._pending.append(delta)
+        self._pending_bytes += len(delta.encode("utf-8"))
+        self.appended_chunks += 1
+
+        if self._pending_bytes >= self._flush_bytes:
+            await self.flush(FLUSH_REASON_SIZE)
+        elif time.monotonic() - self._last_flush_at >= self._flush_interval_seconds:
+            await self.flush(FLUSH_REASON_INTERVAL)
+        else:
+            self._arm_deadline()
+
+    async def flush(self, reason: str = FLUSH_REASON_BOUNDARY) -> None:
+        """Write the pending suffix of the active unit. Failed writes stay buffered."""
+        async with self._lock:
+            await self._flush_locked(reason)
+
+    async def close_unit(self, status: str = "completed", reason: str = FLUSH_REASON_BOUNDARY) -> None:
+        """Flush the active unit and transition it to ``status``; no-op when idle."""
+        async with self._lock:
+            unit_id = self._unit_id
+            if unit_id is None:
+                return
+            try:
+                # Retry once, so a transient write error does not lose the tail
+                if not await self._flush_locked(reason):
+                    await self._flush_locked(reason)
+            finally:
+                # The unit is closed regardless of the outcome; a tail that still
+                # failed is dropped here rather than appended to the next unit.
+                if self._pending:
+                    logger.error(
+                        "Dropping %s unflushed bytes of unit %s after a failed retry",
+                        self._pending_bytes, unit_id)
+                    monitoring_manager.record_counter(
+                        "conversation.unit_buffer.dropped_bytes",
+                        self._pending_bytes,
+                        {"reason": reason},
+                        description="Bytes of streamed message units lost to failed flushes",
+                        unit="By",
+                    )
+                self._cancel_deadline()
+                self._unit_id = None
+                self._pending = []
+                self._pending_bytes = 0
+            try:
+                await asyncio.to_thread(self._update_status, unit_id, status, self.user_id)
+            except Exception:
+                logger.exception("Failed to mark unit %s as %s", unit_id, status)
+
+    def _arm_deadline(self) -> None:
+        """Schedule the interval flush of the pending content, unless one is already due."""
+        if self._deadline is not None or not self._pending:
+            return
+        delay = max(0.0, self._last_flush_at + self._flush_interval_seconds - time.monotonic())
+        self._deadline = asyncio.get_running_loop().call_later(delay, self._on_deadline)
+
+    def _cancel_deadline(self) -> None:
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+
+    def _on_deadline(self) -> None:
+        self._deadline = None
+        # The flush takes the stream lock, so it stays ordered with the other writes
+        task = asyncio.ensure_future(self.flush(FLUSH_REASON_INTERVAL))
+        self._deadline_flushes.add(task)
+        task.add_done_callback(self._deadline_flushes.discard)
+
+    async def _flush_locked(self, reason: str) -> bool:
+        """Write the pending suffix; returns False when the write failed and the suffix is kept."""
+        self._cancel_deadline()
+        if self._unit_id is None or not self._pending:
+            self._last_flush_at = time.monotonic()
+            return True
+
+        unit_id = self._unit_id
+        delta = "".join(self._pending)
+        delta_bytes = self._pending_bytes
+        self._pending = []
+        self._pending_bytes = 0
+        try:
+            await asyncio.to_thread(self._append_content, unit_id, delta, self.user_id)
+        except Exception:
+            logger.exception("Failed to flush %s bytes to unit %s", delta_bytes, unit_id)
+            # Keep the delta at the head of the buffer so the next flush retries it in order.
+            self._pending.insert(0, delta)
+            self._pending_bytes += delta_bytes
+            monitoring_manager.record_counter(
+                "conversation.unit_buffer.flush_errors",
+                1,
+                {"reason": reason},
+                description="Failed write-behind flushes of streamed message units",
+            )
+            self._last_flush_at = time.monotonic()
+            # Retry after another interval even if no further content arrives
+            self._arm_deadline()
+            return False
+        self._last_flush_at = time.monotonic()
+
+        self.flush_count += 1
+        self.flushed_bytes += delta_bytes
+        monitoring_manager.record_counter(
+            "conversation.unit_buffer.flushes",
+            1,
+            {"reason": reason},
+            description="Write-behind flushes of streamed message units",
+        )
+        monitoring_manager.record_counter(
+            "conversation.unit_buffer.flushed_bytes",
+            delta_bytes,
+            {"reason": reason},
+            description="Bytes appended to streamed message units",
+            unit="By",
+        )
+        return True
@@ -5,7 +5,7 @@ import sys
 import threading
 from typing import Optional, List
 
-from jinja2 import StrictUndefined, Template
+from jinja2 import StrictUndefined
 
 from nexent.core.tools.parallel_executor import ParallelExecutorTool
 
@@ -33,6 +33,7 @@ from services.agent_service import (
 from services.prompt_template_service import resolve_prompt_generate_template
 from utils.llm_utils import call_llm_for_system_prompt
 from utils.prompt_template_utils import (
+    compile_template,
     get_prompt_optimize_prompt_template,
     get_prompt_template,
     get_guardrail_regex_prompt_template,
@@ -321,7 +322,7 @@ def generate_and_save_system_prompt_impl(agent_id: int,
         greeting_system_prompt = greeting_template.get("GREETING_SYSTEM_PROMPT", "")
         greeting_user_prompt_template = greeting_template.get("USER_PROMPT", "")
 
-        greeting_user_prompt = Template(greeting_user_prompt_template, undefined=StrictUndefined).render({
+        greeting_user_prompt = compile_template(greeting_user_prompt_template, undefined=StrictUndefined).render({
             "display_name": final_results.get("agent_display_name", ""),
             "duty_description": final_results.get("duty", ""),
             "business_description": task_description,
@@ -533,7 +534,7 @@ def generate_guardrail_rules_impl(
         )
 
     prompt_template = get_guardrail_regex_prompt_template(language)
-    user_prompt = Template(
+    user_prompt = compile_template(
         prompt_template["GUARDRAIL_USER_PROMPT"], undefined=StrictUndefined
     ).render({"description": description})
 
@@ -855,7 +856,7 @@ def join_info_for_generate_system_prompt(prompt_for_generate, sub_agent_info_lis
     template_context["knowledge_base_names"] = kb_names_str
 
     # Generate content using template
-    content = Template(
+    content = compile_template(
         prompt_for_generate["user_prompt"], undefined=StrictUndefined).render(template_context)
     return content
 
@@ -900,7 +901,7 @@ def join_info_for_optimize_prompt_section(
         "knowledge_base_names": kb_names_str,
     }
 
-    return Template(
+    return compile_template(
         prompt_for_optimize["OPTIMIZE_USER_PROMPT"],
         undefined=StrictUndefined
     ).render(template_context)
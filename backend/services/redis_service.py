@@ -387,6 +387,10 @@ class RedisService:
                     logger.warning(f"Error processing task key {key} for cleanup: {str(e)}")
                     continue
 
+            # Drop the per-index task registry maintained by the worker
+            from data_process.utils import TASK_REGISTRY_KEY_PREFIX
+            self.backend_client.delete(f"{TASK_REGISTRY_KEY_PREFIX}{index_name}")
+
         except Exception as e:
             logger.error(f"Error cleaning up Celery tasks: {str(e)}")
             raise
@@ -767,6 +771,46 @@ class RedisService:
         logger.warning(f"Failed to increment progress for task {task_id}: too many concurrent updates")
         return False
 
+    def extend_progress_total(self, task_id: str, delta_total: int, ttl_hours: int = 24) -> bool:
+        """
+        Atomically grow the total chunk count of a task whose size is only known part by part.
+        """
+        if not task_id:
+            logger.error("Cannot extend progress total: task_id is empty")
+            return False
+        if delta_total <= 0:
+            return True
+
+        progress_key = f"progress:{task_id}"
+        ttl_seconds = ttl_hours * 3600
+        max_retries = 5
+
+        for attempt in range(max_retries):
+            pipe = self.client.pipeline()
+            try:
+                pipe.watch(progress_key)
+                raw = pipe.get(progress_key)
+                current_processed, current_total = self._parse_progress(raw, None)
+                payload = json.dumps({
+                    "processed_chunks": current_processed,
+                    "total_chunks": current_total + int(delta_total),
+                })
+
+                pipe.multi()
+                pipe.setex(progress_key, ttl_seconds, payload)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                continue
+            except Exception as exc:
+                logger.warning(f"Failed to extend progress total for task {task_id}: {exc}")
+                return False
+            finally:
+                pipe.reset()
+
+        logger.warning(f"Failed to extend progress total for task {task_id}: too many concurrent updates")
+        return False
+
     def _parse_progress(self, raw: Any, total_chunks: Optional[int]) -> Tuple[int, int]:
         """
         Parse persisted progress payload from Redis with tolerant fallback.
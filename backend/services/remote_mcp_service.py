@@ -1399,6 +1399,10 @@ async def refresh_mcp_service_tool_count(
     if not tool_names:
         raise MCPConnectionError("MCP server is unreachable or does not support MCP protocol")
 
+    # An explicit refresh must not be answered from the discovery cache afterwards
+    from services.tool_configuration_service import invalidate_mcp_tool_cache
+    invalidate_mcp_tool_cache(server_url)
+
     registry_json = record.get("registry_json") or {}
     registry_json["_toolNames"] = tool_names
 
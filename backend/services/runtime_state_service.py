@@ -3,6 +3,7 @@ import hashlib
 import logging
 import socket
 import time
+import weakref
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
@@ -10,14 +11,22 @@ try:
 except ImportError:
     redis = None
 
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
+
 from consts.const import (
     RUNTIME_CANCEL_TTL_SECONDS,
     RUNTIME_COMPLETED_TTL_SECONDS,
     RUNTIME_RUN_TTL_SECONDS,
     RUNTIME_STATE_REDIS_URL,
+    RUNTIME_STREAM_BATCH_MAX_SIZE,
+    RUNTIME_STREAM_BATCH_WINDOW_SECONDS,
     RUNTIME_STREAM_MAX_LEN,
     RUNTIME_STREAM_TTL_SECONDS,
 )
+from utils.monitoring import monitoring_manager
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +36,9 @@ class RuntimeStateService:
 
     def __init__(self):
         self._client: Optional[Any] = None
+        # One asyncio client per event loop; a client dies with the loop it is bound to
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = \
+            weakref.WeakKeyDictionary()
         self._pod_name = socket.gethostname()
 
     @property
@@ -48,6 +60,23 @@ class RuntimeStateService:
             )
         return self._client
 
+    @property
+    def async_client(self) -> Optional[Any]:
+        """Native asyncio Redis client bound to the running loop, or None if unavailable."""
+        if not self.enabled or redis_asyncio is None:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = redis_asyncio.from_url(
+                RUNTIME_STATE_REDIS_URL,
+                socket_timeout=5,
+                socket_connect_timeout=5,
+                decode_responses=True,
+            )
+            self._async_clients[loop] = client
+        return client
+
     def _run_key(self, user_id: str, conversation_id: int) -> str:
         return f"runtime:run:{user_id}:{conversation_id}"
 
@@ -178,6 +207,69 @@ class RuntimeStateService:
     async def append_stream_event_async(self, user_id: str, conversation_id: int, chunk: str) -> Optional[str]:
         return await asyncio.to_thread(self.append_stream_event, user_id, conversation_id, chunk)
 
+    def append_stream_events(self, user_id: str, conversation_id: int, chunks: List[str]) -> List[str]:
+        """Append several chunks in one pipelined round trip and refresh the TTL once."""
+        if not self.enabled or not chunks:
+            return []
+        try:
+            stream_key = self._stream_key(user_id, conversation_id)
+            pipe = self.client.pipeline(transaction=False)
+            for chunk in chunks:
+                pipe.xadd(
+                    stream_key,
+                    {"chunk": chunk},
+                    maxlen=RUNTIME_STREAM_MAX_LEN,
+                    approximate=True,
+                )
+            pipe.expire(stream_key, RUNTIME_STREAM_TTL_SECONDS)
+            results = pipe.execute()
+            return list(results[:len(chunks)])
+        except Exception as exc:
+            logger.warning("Failed to append runtime stream events: %s", exc)
+            return []
+
+    async def append_stream_events_async(
+        self,
+        user_id: str,
+        conversation_id: int,
+        chunks: List[str],
+    ) -> List[str]:
+        """
+        Async batch append using the native asyncio client.
+
+        Falls back to the pipelined sync client in a worker thread when the
+        asyncio client is unavailable or fails.
+        """
+        if not self.enabled or not chunks:
+            return []
+        try:
+            client = self.async_client
+        except Exception as exc:
+            logger.warning("Failed to create async runtime state client: %s", exc)
+            client = None
+        if client is not None:
+            try:
+                stream_key = self._stream_key(user_id, conversation_id)
+                pipe = client.pipeline(transaction=False)
+                for chunk in chunks:
+                    pipe.xadd(
+                        stream_key,
+                        {"chunk": chunk},
+                        maxlen=RUNTIME_STREAM_MAX_LEN,
+                        approximate=True,
+                    )
+                pipe.expire(stream_key, RUNTIME_STREAM_TTL_SECONDS)
+                results = await pipe.execute()
+                return list(results[:len(chunks)])
+            except Exception as exc:
+                logger.warning("Async runtime stream append failed, falling back to sync client: %s", exc)
+        monitoring_manager.record_counter(
+            "runtime.stream.batch_fallbacks",
+            1,
+            description="Stream event batches written through the sync fallback client",
+        )
+        return await asyncio.to_thread(self.append_stream_events, user_id, conversation_id, chunks)
+
     def mark_stream_completed(
         self,
         user_id: str,
@@ -316,4 +408,98 @@ class RuntimeStateService:
         return await asyncio.to_thread(self.consume_rate_limit, tenant_id, limit_per_minute)
 
 
+class StreamEventBatcher:
+    """
+    Per-channel write-behind batcher for runtime stream events.
+
+    publish() only enqueues; a background task collects chunks for up to
+    ``window_seconds`` (or until ``max_batch_size`` is reached) and writes
+    them with one pipelined XADD batch and a single EXPIRE. A single writer
+    task per channel preserves chunk order across batches.
+    """
+
+    def __init__(
+        self,
+        service: "RuntimeStateService",
+        user_id: str,
+        conversation_id: int,
+        window_seconds: float = RUNTIME_STREAM_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = RUNTIME_STREAM_BATCH_MAX_SIZE,
+    ):
+        self._service = service
+        self.user_id = user_id
+        self.conversation_id = conversation_id
+        self._window_seconds = max(0.0, window_seconds)
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: List[Tuple[str, float]] = []
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._flush_requested = False
+        self._task: Optional[asyncio.Task] = None
+
+        self.batches_written: int = 0
+        self.events_written: int = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, chunk: str) -> None:
+        """Queue a chunk for the next batch; never waits on Redis."""
+        self._pending.append((chunk, time.monotonic()))
+        if len(self._pending) >= self._max_batch_size:
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write everything queued so far; returns once Redis has the chunks."""
+        self._flush_requested = True
+        self._wakeup.set()
+        try:
+            while self._pending or (self._task is not None and not self._task.done()):
+                if self._task is None or self._task.done():
+                    self._task = asyncio.create_task(self._run())
+                await asyncio.shield(self._task)
+        finally:
+            self._flush_requested = False
+
+    async def _run(self) -> None:
+        while self._pending:
+            if not self._flush_requested and len(self._pending) < self._max_batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._window_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+
+            batch = self._pending[:self._max_batch_size]
+            del self._pending[:len(batch)]
+            await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[str, float]]) -> None:
+        oldest_enqueued_at = batch[0][1]
+        try:
+            await self._service.append_stream_events_async(
+                self.user_id,
+                self.conversation_id,
+                [chunk for chunk, _ in batch],
+            )
+        except Exception as exc:
+            logger.warning("Failed to write runtime stream batch: %s", exc)
+            return
+        self.batches_written += 1
+        self.events_written += len(batch)
+        monitoring_manager.record_histogram(
+            "runtime.stream.batch_size",
+            len(batch),
+            description="Stream events written per pipelined Redis batch",
+        )
+        monitoring_manager.record_histogram(
+            "runtime.stream.batch_lag",
+            time.monotonic() - oldest_enqueued_at,
+            description="Delay between publishing a chunk and writing it to Redis",
+            unit="s",
+        )
+
+
 runtime_state_service = RuntimeStateService()
@@ -10,7 +10,7 @@ import asyncio
 import logging
 from typing import Dict, Optional, AsyncIterator, List
 
-from services.runtime_state_service import runtime_state_service
+from services.runtime_state_service import StreamEventBatcher, runtime_state_service
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +48,13 @@ class StreamingChannel:
         self._completed: bool = False
         self._completion_status: Optional[str] = None
         self._error: Optional[str] = None
+        # Chunks are mirrored to the Redis runtime stream in pipelined batches
+        # so other replicas can resume; publish() never waits on Redis.
+        self._runtime_batcher = StreamEventBatcher(
+            runtime_state_service,
+            user_id=user_id,
+            conversation_id=conversation_id,
+        )
 
     def add_subscriber(self):
         """Increment subscriber count."""
@@ -87,15 +94,16 @@ class StreamingChannel:
         async with self._lock:
             self._history_buffer.append(chunk)
 
-        await runtime_state_service.append_stream_event_async(
-            user_id=self.user_id,
-            conversation_id=self.conversation_id,
-            chunk=chunk,
-        )
+        if runtime_state_service.enabled:
+            self._runtime_batcher.enqueue(chunk)
 
         # Wake up waiting subscribers immediately
         self._data_event.set()
 
+    async def flush_runtime_events(self):
+        """Wait until every published chunk has been written to the runtime stream."""
+        await self._runtime_batcher.flush()
+
     def complete(self, status: str = 'completed'):
         """
         Mark the stream as completed.
@@ -284,6 +292,8 @@ class StreamingChannelManager:
         channel = self.get_channel(conversation_id, user_id)
         if channel:
             channel.complete(status)
+            # Readers on other replicas must see every chunk before the done marker.
+            await channel.flush_runtime_events()
         await runtime_state_service.mark_stream_completed_async(
             user_id=user_id,
             conversation_id=conversation_id,
@@ -1,9 +1,11 @@
+import asyncio
+import hashlib
 import importlib
 import inspect
 import json
 import logging
 import time
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 from urllib.parse import urljoin
 
 import jsonref
@@ -12,7 +14,15 @@ from fastmcp import Client
 from fastmcp.client.transports import SSETransport, StreamableHttpTransport
 from pydantic_core import PydanticUndefined
 
-from consts.const import DATA_PROCESS_SERVICE, LOCAL_MCP_SERVER, MCP_MANAGEMENT_API
+from consts.const import (
+    DATA_PROCESS_SERVICE,
+    LOCAL_MCP_SERVER,
+    MCP_MANAGEMENT_API,
+    MCP_TOOL_CACHE_STALE_TTL_S,
+    MCP_TOOL_CACHE_TTL_S,
+    MCP_TOOL_DISCOVERY_CONCURRENCY,
+    MCP_TOOL_DISCOVERY_TIMEOUT_S,
+)
 from consts.exceptions import MCPConnectionError, NotFoundException, ToolExecutionException
 from consts.model import ToolInstanceInfoRequest, ToolInfo, ToolSourceEnum, ToolValidateRequest
 from consts.tool_labels import SYSTEM_MANAGED_TOOL_NAMES
@@ -50,6 +60,11 @@ from utils.tool_utils import get_local_tools_classes, get_local_tools_descriptio
 
 logger = logging.getLogger("tool_configuration_service")
 
+# Tool lists discovered from remote MCP servers: cache key -> (fetched_at, tools)
+_mcp_tool_cache: Dict[Tuple[str, str, str], Tuple[float, List[ToolInfo]]] = {}
+# In-flight background revalidations, one per cache key
+_mcp_tool_refreshes: Dict[Tuple[str, str, str], asyncio.Task] = {}
+
 
 def _create_mcp_transport(url: str, authorization_token: Optional[str] = None, custom_headers: Optional[Dict[str, Any]] = None):
     """
@@ -277,35 +292,140 @@ def get_langchain_tools() -> List[ToolInfo]:
     return tools_info
 
 
+def _mcp_tool_cache_key(
+    mcp_server_name: str,
+    remote_mcp_server: str,
+    tenant_id: Optional[str],
+    authorization_token: Optional[str],
+    custom_headers: Optional[Dict[str, Any]],
+) -> Tuple[str, str, str]:
+    """Cache key of a server's tool list: name, URL and a fingerprint of the credentials used"""
+    auth = json.dumps([tenant_id, authorization_token, custom_headers or {}],
+                      sort_keys=True, default=str)
+    return mcp_server_name, remote_mcp_server, hashlib.sha256(auth.encode("utf-8")).hexdigest()
+
+
+def invalidate_mcp_tool_cache(remote_mcp_server: Optional[str] = None) -> None:
+    """
+    Drop cached MCP tool lists
+
+    Args:
+        remote_mcp_server: Only drop entries for this server URL; drop everything when None
+    """
+    for key in list(_mcp_tool_cache):
+        if remote_mcp_server is None or key[1] == remote_mcp_server:
+            _mcp_tool_cache.pop(key, None)
+
+
+async def _fetch_mcp_tools(key: Tuple[str, str, str], server_kwargs: Dict[str, Any]) -> List[ToolInfo]:
+    tools = await asyncio.wait_for(
+        get_tool_from_remote_mcp_server(**server_kwargs), timeout=MCP_TOOL_DISCOVERY_TIMEOUT_S)
+    _mcp_tool_cache[key] = (time.monotonic(), tools)
+    return tools
+
+
+async def _revalidate_mcp_tools(key: Tuple[str, str, str], server_kwargs: Dict[str, Any]) -> None:
+    try:
+        await _fetch_mcp_tools(key, server_kwargs)
+    except Exception as e:
+        # Keep serving the stale list; the next request past the TTL retries
+        logger.warning(f"Background refresh of MCP tools from {key[1]} failed: {e}")
+    finally:
+        _mcp_tool_refreshes.pop(key, None)
+
+
+async def get_cached_mcp_tools(
+    mcp_server_name: str,
+    remote_mcp_server: str,
+    tenant_id: Optional[str] = None,
+    authorization_token: Optional[str] = None,
+    custom_headers: Optional[Dict[str, Any]] = None
+) -> List[ToolInfo]:
+    """
+    Get the tool list of a remote MCP server through the discovery cache
+
+    Lists younger than MCP_TOOL_CACHE_TTL_S are returned as is. Older lists, up to
+    MCP_TOOL_CACHE_STALE_TTL_S, are returned immediately while one background task
+    refreshes them. Anything older is fetched inline with a per-server timeout.
+
+    Raises:
+        MCPConnectionError: If the server cannot be reached and no usable list is cached
+    """
+    key = _mcp_tool_cache_key(mcp_server_name, remote_mcp_server,
+                              tenant_id, authorization_token, custom_headers)
+    server_kwargs = dict(
+        mcp_server_name=mcp_server_name,
+        remote_mcp_server=remote_mcp_server,
+        tenant_id=tenant_id,
+        authorization_token=authorization_token,
+        custom_headers=custom_headers,
+    )
+
+    cached = _mcp_tool_cache.get(key)
+    if cached is not None:
+        fetched_at, tools = cached
+        age = time.monotonic() - fetched_at
+        if age < MCP_TOOL_CACHE_STALE_TTL_S:
+            if age >= MCP_TOOL_CACHE_TTL_S and key not in _mcp_tool_refreshes:
+                _mcp_tool_refreshes[key] = asyncio.create_task(
+                    _revalidate_mcp_tools(key, server_kwargs))
+            return [tool.model_copy(deep=True) for tool in tools]
+
+    try:
+        tools = await _fetch_mcp_tools(key, server_kwargs)
+    except asyncio.TimeoutError:
+        raise MCPConnectionError(
+            f"timed out listing tools from remote MCP server {remote_mcp_server}")
+    return [tool.model_copy(deep=True) for tool in tools]
+
+
 async def get_all_mcp_tools(tenant_id: str) -> List[ToolInfo]:
     """
     Get metadata for all tools available from the MCP service
 
+    Servers are queried concurrently (at most MCP_TOOL_DISCOVERY_CONCURRENCY at a
+    time) through the tool list cache, so one slow server no longer delays the rest.
+
     Returns:
         List of ToolInfo objects for MCP tools, or empty list if connection fails
     """
     mcp_info = get_mcp_records_by_tenant(tenant_id=tenant_id)
-    tools_info = []
-    for record in mcp_info:
-        # Only scan MCP services that are explicitly enabled and currently healthy.
-        if bool(record.get("enabled")) and bool(record.get("status")):
+    semaphore = asyncio.Semaphore(MCP_TOOL_DISCOVERY_CONCURRENCY)
+
+    async def _discover(record: Dict[str, Any]) -> List[ToolInfo]:
+        async with semaphore:
             try:
-                tools_info.extend(await get_tool_from_remote_mcp_server(
+                return await get_cached_mcp_tools(
                     mcp_server_name=record["mcp_name"],
                     remote_mcp_server=record["mcp_server"],
                     tenant_id=tenant_id,
                     authorization_token=record.get("authorization_token"),
                     custom_headers=record.get("custom_headers"),
-                ))
+                )
             except Exception as e:
                 logger.error(f"mcp connection error: {str(e)}")
+                return []
+
+    # Only scan MCP services that are explicitly enabled and currently healthy.
+    active_records = [record for record in mcp_info
+                      if bool(record.get("enabled")) and bool(record.get("status"))]
+
+    async def _discover_default() -> List[ToolInfo]:
+        # The local outer-apis server is refreshed right before a scan, so it is never cached
+        default_mcp_url = urljoin(LOCAL_MCP_SERVER, "sse")
+        return await asyncio.wait_for(get_tool_from_remote_mcp_server(
+            mcp_server_name="outer-apis",
+            remote_mcp_server=default_mcp_url,
+            tenant_id=None
+        ), timeout=MCP_TOOL_DISCOVERY_TIMEOUT_S)
+
+    *record_tools, default_tools = await asyncio.gather(
+        *(_discover(record) for record in active_records),
+        _discover_default(),
+    )
 
-    default_mcp_url = urljoin(LOCAL_MCP_SERVER, "sse")
-    tools_info.extend(await get_tool_from_remote_mcp_server(
-        mcp_server_name="outer-apis",
-        remote_mcp_server=default_mcp_url,
-        tenant_id=None
-    ))
+    tools_info = [tool for tools in record_tools for tool in tools]
+    tools_info.extend(default_tools)
     return tools_info
 
 
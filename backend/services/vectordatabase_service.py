@@ -1323,6 +1323,7 @@ class ElasticSearchService:
             model_id: Optional[int] = Body(
                 None, description="ID of the embedding model to use"),
             large_mode: bool = False,
+            skip_refresh: bool = False,
     ):
         """
         Index documents and create vector embeddings, create index if it doesn't exist
@@ -1334,6 +1335,8 @@ class ElasticSearchService:
             vdb_core: VectorDatabaseCore instance
             task_id: Optional task ID for progress tracking
             model_id: Optional model ID for the embedding model
+            large_mode: Force the large-batch path
+            skip_refresh: Leave the refresh to a later refresh_index call
 
         Returns:
             IndexingResponse object containing indexing result information
@@ -1470,7 +1473,8 @@ class ElasticSearchService:
                     embedding_batch_size=embedding_batch_size,
                     large_mode=large_mode,
                     progress_callback=lambda processed, total: _update_progress(
-                        task_id, processed, total) if task_id else None
+                        task_id, processed, total) if task_id else None,
+                    skip_refresh=skip_refresh,
                 )
 
                 # Update final progress
@@ -1819,6 +1823,16 @@ class ElasticSearchService:
 
         return {"status": "success", "deleted_es_count": deleted_count, "deleted_minio": minio_result.get("success")}
 
+    @staticmethod
+    def refresh_index(
+            index_name: str = Path(..., description="Name of the index"),
+            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+    ):
+        """Make documents indexed with skip_refresh searchable."""
+        if not vdb_core.refresh_index(index_name):
+            raise Exception(f"Failed to refresh index {index_name}")
+        return {"status": "success"}
+
     @staticmethod
     def health_check(vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)):
         """
@@ -0,0 +1,77 @@
+"""Process-wide setup of the shared embedding and search result caches for backend services."""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+
+from nexent.core.models.embedding_cache import EmbeddingCache, get_embedding_cache, set_embedding_cache
+from nexent.core.utils.two_tier_cache import TwoTierCache
+from nexent.vector_database.search_result_cache import (
+    SearchResultCache,
+    get_search_result_cache,
+    set_search_result_cache,
+)
+
+from consts.const import (
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_CACHE_REDIS_ENABLED,
+    EMBEDDING_CACHE_TTL_SECONDS,
+    SEARCH_RESULT_CACHE_MAX_ENTRIES,
+    SEARCH_RESULT_CACHE_REDIS_ENABLED,
+    SEARCH_RESULT_CACHE_TTL_SECONDS,
+)
+from utils.redis_utils import get_redis_client
+
+logger = logging.getLogger("cache_utils")
+
+_init_lock = threading.Lock()
+
+
+class _CacheSetting(NamedTuple):
+    cache_class: Type[TwoTierCache]
+    getter: Callable[[], Optional[TwoTierCache]]
+    setter: Callable[[Optional[TwoTierCache]], None]
+    max_entries: int
+    redis_enabled: bool
+    ttl_seconds: int
+
+
+def _cache_settings() -> Dict[str, _CacheSetting]:
+    return {
+        "embedding": _CacheSetting(
+            EmbeddingCache, get_embedding_cache, set_embedding_cache,
+            EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_REDIS_ENABLED, EMBEDDING_CACHE_TTL_SECONDS),
+        "search_result": _CacheSetting(
+            SearchResultCache, get_search_result_cache, set_search_result_cache,
+            SEARCH_RESULT_CACHE_MAX_ENTRIES, SEARCH_RESULT_CACHE_REDIS_ENABLED, SEARCH_RESULT_CACHE_TTL_SECONDS),
+    }
+
+
+def init_caches() -> Dict[str, Optional[TwoTierCache]]:
+    """Install each shared cache once; a cache configured with 0 entries stays disabled (None)."""
+    caches: Dict[str, Optional[TwoTierCache]] = {}
+    with _init_lock:
+        for name, setting in _cache_settings().items():
+            cache = setting.getter()
+            if cache is None and setting.max_entries > 0:
+                redis_client = get_redis_client() if setting.redis_enabled else None
+                cache = setting.cache_class(
+                    max_entries=setting.max_entries,
+                    redis_client=redis_client,
+                    ttl_seconds=setting.ttl_seconds,
+                )
+                setting.setter(cache)
+                logger.info(
+                    f"{setting.cache_class.NAME} enabled: {setting.max_entries} local entries, "
+                    f"TTL {setting.ttl_seconds}s, Redis tier {'on' if redis_client is not None else 'off'}")
+            caches[name] = cache
+    return caches
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit ratio and savings of every shared cache, used to size them."""
+    stats = {}
+    for name, setting in _cache_settings().items():
+        cache = setting.getter()
+        stats[name] = cache.stats() if cache is not None else {"enabled": False}
+    return stats
@@ -1,11 +1,14 @@
 import json
 import logging
-from typing import Dict, Any
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 
 from pydantic import ValidationError
 from sqlalchemy.sql import func
 
-from database.model_management_db import get_model_by_model_id
+from database.model_management_db import get_model_by_model_id, get_models_by_model_ids
 from database.tenant_config_db import (
     delete_config_by_tenant_config_id,
     get_all_configs_by_tenant_id,
@@ -13,6 +16,7 @@ from database.tenant_config_db import (
     insert_config,
     update_config_by_tenant_config_id_and_data,
 )
+from utils.config_version_utils import get_config_versions
 
 logger = logging.getLogger("config_utils")
 
@@ -20,6 +24,11 @@ logger = logging.getLogger("config_utils")
 CONTEXT_SOFT_LIMIT_RATIO_KEY = "context.soft_limit_ratio"
 CONTEXT_POLICY_KEY = "context.policy"
 
+# Seconds a cached tenant snapshot is trusted before its Redis version stamps are re-read
+CONFIG_VERSION_CHECK_INTERVAL_S = 1.0
+# Upper bound on snapshot age, in case a version bump was lost
+CONFIG_SNAPSHOT_MAX_AGE_S = 300.0
+
 
 def safe_value(value):
     """Helper function for processing configuration values"""
@@ -54,36 +63,117 @@ def get_model_name_from_config(model_config: Dict[str, Any]) -> str:
     return f"{model_repo}/{model_name}"
 
 
+@dataclass
+class _TenantConfigSnapshot:
+    """Configs of one tenant plus the model records they reference, as of `versions`."""
+    configs: Dict[str, Any]
+    versions: Optional[Tuple[str, str, str]]
+    loaded_at: float
+    checked_at: float
+    models: Optional[Dict[int, Optional[Dict[str, Any]]]] = None
+
+
 class TenantConfigManager:
-    """Tenant configuration manager that reads configurations from the database on demand."""
+    """Tenant configuration manager with a per-tenant, version-stamped in-process cache.
+
+    Snapshots are revalidated against the Redis version stamps in
+    utils.config_version_utils, which every tenant config and model record write
+    bumps, so writes on any replica show up within CONFIG_VERSION_CHECK_INTERVAL_S.
+    Without Redis every call reads the database.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, _TenantConfigSnapshot] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "model_hits": 0, "model_misses": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counters and the number of cached tenants"""
+        with self._lock:
+            return {**self._stats, "tenants": len(self._snapshots)}
+
+    def invalidate(self, tenant_id: str):
+        """Drop the local snapshot of a tenant; other replicas follow the version bump"""
+        with self._lock:
+            self._snapshots.pop(tenant_id, None)
+
+    def _get_snapshot(self, tenant_id: str, force_reload: bool = False) -> _TenantConfigSnapshot:
+        now = time.monotonic()
+        with self._lock:
+            snapshot = None if force_reload else self._snapshots.get(tenant_id)
+
+        if snapshot is not None and now - snapshot.loaded_at < CONFIG_SNAPSHOT_MAX_AGE_S:
+            if now - snapshot.checked_at < CONFIG_VERSION_CHECK_INTERVAL_S:
+                self._count("hits")
+                return snapshot
+            versions = get_config_versions(tenant_id)
+            if versions is not None and versions == snapshot.versions:
+                snapshot.checked_at = now
+                self._count("hits")
+                return snapshot
+        else:
+            versions = get_config_versions(tenant_id)
+
+        # Versions are read before the database so a concurrent write always
+        # leaves this snapshot with an outdated stamp, never the reverse.
+        self._count("misses")
+        configs = get_all_configs_by_tenant_id(tenant_id)
+        if not configs:
+            logger.info(f"No configurations found for tenant {tenant_id}")
+        snapshot = _TenantConfigSnapshot(
+            configs={config["config_key"]: config["config_value"] for config in configs or []},
+            versions=versions,
+            loaded_at=now,
+            checked_at=now,
+        )
+        with self._lock:
+            if versions is None:
+                self._snapshots.pop(tenant_id, None)
+            else:
+                self._snapshots[tenant_id] = snapshot
+        return snapshot
+
+    def _get_model_record(self, snapshot: _TenantConfigSnapshot, model_id: int, tenant_id: str):
+        if snapshot.versions is None:
+            return get_model_by_model_id(model_id=model_id, tenant_id=tenant_id)
+
+        models = snapshot.models
+        if models is not None and model_id in models:
+            self._count("model_hits")
+        else:
+            self._count("model_misses")
+            # Resolve every model the tenant references in one query; later keys then hit
+            model_ids = {model_id}
+            for value in snapshot.configs.values():
+                if isinstance(value, str) and value.strip().isdigit():
+                    model_ids.add(int(value))
+            records = get_models_by_model_ids(list(model_ids), tenant_id=tenant_id)
+            models = {**(models or {}), **{mid: records.get(mid) for mid in model_ids}}
+            snapshot.models = models
+
+        record = models.get(model_id)
+        return dict(record) if record else None
 
     def load_config(self, tenant_id: str, force_reload: bool = False):
-        """Load configuration from database and update cache
+        """Load configuration from cache or database
 
         Args:
             tenant_id (str): The tenant ID to load configurations for
             force_reload (bool): Force reload from database ignoring cache
 
         Returns:
-            dict: The current configuration cache for the tenant
+            dict: The current configuration for the tenant
         """
         # Check if tenant_id is valid
         if not tenant_id:
             logger.warning("Invalid tenant ID provided")
             return {}
 
-        # Always load latest configurations directly from DB (no in-process cache).
-        configs = get_all_configs_by_tenant_id(tenant_id)
-
-        if not configs:
-            logger.info(f"No configurations found for tenant {tenant_id}")
-            return {}
-
-        tenant_configs = {}
-        for config in configs:
-            tenant_configs[config["config_key"]] = config["config_value"]
-
-        return tenant_configs
+        return dict(self._get_snapshot(tenant_id, force_reload).configs)
 
     def get_model_config(self, key: str, default=None, tenant_id: str | None = None):
         if default is None:
@@ -92,15 +182,16 @@ class TenantConfigManager:
             logger.warning(
                 f"No tenant_id specified when getting config for key: {key}")
             return default
-        tenant_config = self.load_config(tenant_id)
+        snapshot = self._get_snapshot(tenant_id)
+        tenant_config = snapshot.configs
 
         if key in tenant_config:
             model_id = tenant_config[key]
             if not model_id:  # Check if model_id is empty
                 return default
             try:
-                model_config = get_model_by_model_id(
-                    model_id=int(model_id), tenant_id=tenant_id)
+                model_config = self._get_model_record(
+                    snapshot, int(model_id), tenant_id)
                 return model_config if model_config else default
             except (ValueError, TypeError):
                 logger.warning(f"Invalid model_id format: {model_id}")
@@ -151,7 +242,7 @@ class TenantConfigManager:
             ) from exc
 
     def get_context_policy(self, tenant_id: str | None = None) -> dict[str, Any] | None:
-        """Return the tenant's optional JSON context policy without caching it."""
+        """Return the tenant's optional JSON context policy, parsed on every call."""
         if tenant_id is None:
             logger.warning("No tenant_id specified when getting context policy")
             return None
@@ -189,6 +280,7 @@ class TenantConfigManager:
         }
 
         insert_config(insert_data)
+        self.invalidate(tenant_id)
 
     def delete_single_config(self, tenant_id: str | None = None, key: str | None = None, ):
         """Delete configuration value in database"""
@@ -201,6 +293,7 @@ class TenantConfigManager:
         if existing_config:
             delete_config_by_tenant_config_id(
                 existing_config["tenant_config_id"])
+            self.invalidate(tenant_id)
             return
 
     def update_single_config(self, tenant_id: str | None = None, key: str | None = None):
@@ -218,6 +311,7 @@ class TenantConfigManager:
             }
             update_config_by_tenant_config_id_and_data(
                 existing_config["tenant_config_id"], update_data)
+            self.invalidate(tenant_id)
             return
 
 
@@ -0,0 +1,62 @@
+"""Redis version stamps that invalidate in-process config caches across replicas.
+
+Writers bump a counter after their database commit; readers compare the counters
+with the ones their cached snapshot was built from and reload on any change.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+from utils.redis_utils import get_redis_client
+
+logger = logging.getLogger("config_version_utils")
+
+TENANT_CONFIG_VERSION_KEY_PREFIX = "config_version:tenant:"
+# Bumped by tenant config writes that only know the row id, not the tenant
+ALL_TENANT_CONFIGS_VERSION_KEY = "config_version:tenant_configs"
+MODEL_RECORDS_VERSION_KEY = "config_version:model_records"
+
+
+def get_config_versions(tenant_id: str) -> Optional[Tuple[str, str, str]]:
+    """Read the version stamps that a tenant's cached config depends on.
+
+    Returns:
+        (tenant, all tenant configs, model records) versions, or None when Redis
+        is unavailable and callers must not trust any cached snapshot.
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        versions = client.mget([
+            f"{TENANT_CONFIG_VERSION_KEY_PREFIX}{tenant_id}",
+            ALL_TENANT_CONFIGS_VERSION_KEY,
+            MODEL_RECORDS_VERSION_KEY,
+        ])
+    except Exception as e:
+        logger.warning(f"Failed to read config versions for tenant {tenant_id}: {e}")
+        return None
+    return tuple(str(version or "0") for version in versions)
+
+
+def _bump(key: str) -> None:
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.incr(key)
+    except Exception as e:
+        logger.warning(f"Failed to bump config version {key}: {e}")
+
+
+def bump_tenant_config_version(tenant_id: Optional[str] = None) -> None:
+    """Invalidate cached configs of one tenant, or of every tenant when unknown."""
+    if tenant_id:
+        _bump(f"{TENANT_CONFIG_VERSION_KEY_PREFIX}{tenant_id}")
+    else:
+        _bump(ALL_TENANT_CONFIGS_VERSION_KEY)
+
+
+def bump_model_records_version() -> None:
+    """Invalidate cached model records of every tenant."""
+    _bump(MODEL_RECORDS_VERSION_KEY)
@@ -13,10 +13,9 @@ import random
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 from sklearn.cluster import KMeans
 from sklearn.metrics import silhouette_score
-from sklearn.metrics.pairwise import cosine_similarity
 
 from consts.const import LANGUAGE
 from database.model_management_db import get_model_by_model_id
@@ -25,12 +24,26 @@ from nexent.core.models import OpenAIModel
 from nexent.vector_database.base import VectorDatabaseCore
 from utils.llm_utils import call_llm_for_system_prompt
 from utils.prompt_template_utils import (
+    compile_template,
     get_document_summary_prompt_template,
     get_cluster_summary_reduce_prompt_template
 )
 
 logger = logging.getLogger("document_vector_utils")
 
+# Documents whose chunk queries are sent in one msearch request, and the chunk
+# budget of one request (chunks carry their embeddings, so responses get large)
+CHUNK_FETCH_BATCH_SIZE = 50
+CHUNK_FETCH_MAX_CHUNKS_PER_BATCH = 5000
+# Documents the K sweep fits on; larger sets are randomly subsampled
+K_SELECTION_SAMPLE_SIZE = 2000
+# Stop the K sweep after this many consecutive K values without a better silhouette
+K_SELECTION_PATIENCE = 3
+# Similarity matrix elements computed per block in duplicate detection (~16 MB float32)
+DUPLICATE_BLOCK_ELEMENTS = 4_000_000
+# Margin below the threshold for float32 candidates, which are re-checked in float64
+DUPLICATE_FLOAT32_MARGIN = 1e-4
+
 
 def get_documents_from_es(index_name: str, vdb_core: VectorDatabaseCore, sample_doc_count: int = 200) -> Dict[str, Dict]:
     """
@@ -75,42 +88,21 @@ def get_documents_from_es(index_name: str, vdb_core: VectorDatabaseCore, sample_
         
         logger.info(f"Sampled {sample_count} documents from {len(all_documents)} total documents")
         
-        # Step 3: Get all chunks for each sampled document
+        # Step 3: Get all chunks of the sampled documents, many documents per msearch request
         document_samples = {}
-        for doc_bucket in sampled_docs:
-            path_or_url = doc_bucket['key']
-            chunk_count = doc_bucket['doc_count']
-            
-            # Get all chunks for this document
-            chunks_query = {
-                "query": {
-                    "term": {"path_or_url": path_or_url}
-                },
-                "size": chunk_count,  # Get all chunks
-                "sort": [
-                    {
-                        "create_time": {
-                            "order": "asc",
-                            "missing": "_last"  # Put documents without create_time at the end
-                        }
+        for batch in _batch_document_buckets(sampled_docs):
+            for doc_bucket, chunks in zip(batch, _fetch_chunks_batch(index_name, vdb_core, batch)):
+                # Build document object
+                if chunks:
+                    doc_id = f"doc_{len(document_samples):04d}"
+                    document_samples[doc_id] = {
+                        "doc_id": doc_id,
+                        "path_or_url": doc_bucket['key'],
+                        "filename": chunks[0].get('filename', 'unknown'),
+                        "chunk_count": doc_bucket['doc_count'],
+                        "chunks": chunks,
+                        "file_size": chunks[0].get('file_size', 0)
                     }
-                ]
-            }
-            
-            chunks_response = vdb_core.search(index_name=index_name, query=chunks_query)
-            chunks = [hit['_source'] for hit in chunks_response['hits']['hits']]
-            
-            # Build document object
-            if chunks:
-                doc_id = f"doc_{len(document_samples):04d}"
-                document_samples[doc_id] = {
-                    "doc_id": doc_id,
-                    "path_or_url": path_or_url,
-                    "filename": chunks[0].get('filename', 'unknown'),
-                    "chunk_count": chunk_count,
-                    "chunks": chunks,
-                    "file_size": chunks[0].get('file_size', 0)
-                }
         
         logger.info(f"Successfully retrieved {len(document_samples)} documents with chunks")
         return document_samples
@@ -120,6 +112,77 @@ def get_documents_from_es(index_name: str, vdb_core: VectorDatabaseCore, sample_
         raise Exception(f"Failed to retrieve documents from Elasticsearch: {str(e)}")
 
 
+def _batch_document_buckets(doc_buckets: List[Dict]) -> List[List[Dict]]:
+    """
+    Split document buckets into msearch batches bounded by document and chunk count
+    
+    Args:
+        doc_buckets: Terms aggregation buckets with 'key' and 'doc_count'
+        
+    Returns:
+        List of batches in the original order; a document larger than the chunk
+        budget gets a batch of its own
+    """
+    batches = []
+    batch = []
+    batch_chunks = 0
+    for doc_bucket in doc_buckets:
+        chunk_count = doc_bucket['doc_count']
+        if batch and (len(batch) >= CHUNK_FETCH_BATCH_SIZE
+                      or batch_chunks + chunk_count > CHUNK_FETCH_MAX_CHUNKS_PER_BATCH):
+            batches.append(batch)
+            batch = []
+            batch_chunks = 0
+        batch.append(doc_bucket)
+        batch_chunks += chunk_count
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _fetch_chunks_batch(index_name: str, vdb_core: VectorDatabaseCore, doc_buckets: List[Dict]) -> List[List[Dict]]:
+    """
+    Get all chunks of several documents with a single msearch request
+    
+    Args:
+        index_name: Name of the index to query
+        vdb_core: VectorDatabaseCore instance
+        doc_buckets: Terms aggregation buckets with 'key' and 'doc_count'
+        
+    Returns:
+        One list of chunk sources per bucket, ordered by create_time
+    """
+    msearch_body = []
+    for doc_bucket in doc_buckets:
+        msearch_body.append({'index': index_name})
+        msearch_body.append({
+            "query": {
+                "term": {"path_or_url": doc_bucket['key']}
+            },
+            "size": doc_bucket['doc_count'],  # Get all chunks
+            "sort": [
+                {
+                    "create_time": {
+                        "order": "asc",
+                        "missing": "_last"  # Put documents without create_time at the end
+                    }
+                }
+            ]
+        })
+    
+    msearch_response = vdb_core.multi_search(body=msearch_body, index_name=index_name)
+    responses = msearch_response['responses']
+    if len(responses) != len(doc_buckets):
+        raise Exception(f"msearch returned {len(responses)} responses for {len(doc_buckets)} queries")
+    
+    chunks_per_document = []
+    for doc_bucket, response in zip(doc_buckets, responses):
+        if 'error' in response:
+            raise Exception(f"Error getting chunks for {doc_bucket['key']}: {response['error']}")
+        chunks_per_document.append([hit['_source'] for hit in response['hits']['hits']])
+    return chunks_per_document
+
+
 def calculate_document_embedding(doc_chunks: List[Dict], use_weighted: bool = True) -> Optional[np.ndarray]:
     """
     Calculate document-level embedding from chunk embeddings
@@ -197,9 +260,21 @@ def auto_determine_k(embeddings: np.ndarray, min_k: int = 3, max_k: int = 15) ->
         actual_max_k = min(max_k, n_samples // 10, 15)  # At least 10 samples per cluster
         actual_min_k = min(min_k, actual_max_k)
         
+        # Fit the sweep on a random sample; silhouette is O(n^2) and K-means cost
+        # grows with n, while the best K of a large sample matches the full set
+        if n_samples > K_SELECTION_SAMPLE_SIZE:
+            rng = np.random.default_rng(42)
+            sample_indices = np.sort(rng.choice(n_samples, K_SELECTION_SAMPLE_SIZE, replace=False))
+            sweep_embeddings = np.asarray(embeddings)[sample_indices]
+            logger.info(f"Selecting K on a sample of {K_SELECTION_SAMPLE_SIZE} of {n_samples} documents")
+        else:
+            sweep_embeddings = embeddings
+        n_sweep = len(sweep_embeddings)
+        
         # Try different K values and calculate silhouette score
         best_k = actual_min_k
         best_score = -1
+        since_best = 0
         
         k_range = range(actual_min_k, actual_max_k + 1)
         logger.info(f"Trying K values from {actual_min_k} to {actual_max_k}")
@@ -207,20 +282,28 @@ def auto_determine_k(embeddings: np.ndarray, min_k: int = 3, max_k: int = 15) ->
         for k in k_range:
             try:
                 kmeans = KMeans(n_clusters=k, random_state=42, n_init=10, max_iter=300)
-                labels = kmeans.fit_predict(embeddings)
+                labels = kmeans.fit_predict(sweep_embeddings)
                 
                 # Calculate silhouette score
-                score = silhouette_score(embeddings, labels, sample_size=min(1000, n_samples))
+                score = silhouette_score(sweep_embeddings, labels, sample_size=min(1000, n_sweep), random_state=42)
                 
                 logger.debug(f"K={k}, Silhouette Score={score:.4f}")
                 
                 if score > best_score:
                     best_score = score
                     best_k = k
+                    since_best = 0
+                else:
+                    since_best += 1
                     
             except Exception as e:
                 logger.warning(f"Error calculating K={k}: {str(e)}")
                 continue
+            
+            # Silhouette rarely recovers once it has fallen for several K in a row
+            if since_best >= K_SELECTION_PATIENCE:
+                logger.info(f"Stopping K sweep at K={k}: no improvement for {K_SELECTION_PATIENCE} values")
+                break
         
         logger.info(f"Optimal K determined: {best_k} (Silhouette Score: {best_score:.4f})")
         return best_k
@@ -233,6 +316,77 @@ def auto_determine_k(embeddings: np.ndarray, min_k: int = 3, max_k: int = 15) ->
         return heuristic_k
 
 
+def _find_duplicate_pairs(doc_to_cluster: Dict[str, int], doc_embeddings: Dict[str, np.ndarray],
+                          similarity_threshold: float) -> List[Tuple[str, str, int, int, float]]:
+    """
+    Find duplicate document pairs that sit in different clusters
+    
+    Cosine similarities are computed as blocked matrix products over normalized
+    embeddings instead of one pair at a time. Candidates are screened in float32
+    with a small margin and re-checked in float64, so the result is the same as
+    an exact pairwise comparison.
+    
+    Args:
+        doc_to_cluster: Mapping from document ID to its cluster ID
+        doc_embeddings: Dictionary mapping document IDs to their embeddings
+        similarity_threshold: Cosine similarity threshold to consider documents as duplicates
+        
+    Returns:
+        List of (doc_id1, doc_id2, cluster1, cluster2, similarity), ordered by
+        the position of doc_id1 then doc_id2 in doc_embeddings
+    """
+    doc_ids_list = list(doc_embeddings.keys())
+    n_docs = len(doc_ids_list)
+    if n_docs < 2:
+        return []
+    
+    embeddings = np.array([doc_embeddings[doc_id] for doc_id in doc_ids_list], dtype=np.float64)
+    norms = np.linalg.norm(embeddings, axis=1)
+    # Zero vectors stay zero and get similarity 0 with everything, as in sklearn
+    unit = embeddings / np.where(norms > 0, norms, 1.0)[:, None]
+    unit32 = unit.astype(np.float32)
+    
+    # Documents outside every cluster share label -1 and are never paired
+    cluster_labels = {}
+    labels = np.array([
+        cluster_labels.setdefault(doc_to_cluster[doc_id], len(cluster_labels))
+        if doc_to_cluster.get(doc_id) is not None else -1
+        for doc_id in doc_ids_list
+    ])
+    
+    candidate_threshold = similarity_threshold - DUPLICATE_FLOAT32_MARGIN
+    block_rows = max(1, DUPLICATE_BLOCK_ELEMENTS // n_docs)
+    merged_pairs = []
+    for start in range(0, n_docs, block_rows):
+        stop = min(start + block_rows, n_docs)
+        # Only the upper triangle (j > i) is needed, so skip columns before the block
+        similarities = unit32[start:stop] @ unit32[start:].T
+        rows, cols = np.nonzero(similarities >= candidate_threshold)
+        cols += start
+        rows += start
+        keep = (cols > rows) & (labels[rows] >= 0) & (labels[cols] >= 0) & (labels[rows] != labels[cols])
+        
+        for i, j in zip(rows[keep].tolist(), cols[keep].tolist()):
+            similarity = float(np.dot(unit[i], unit[j]))
+            if similarity < similarity_threshold:
+                continue
+            
+            # Check Euclidean distance too: documents that only point in the same
+            # direction but are far apart are not duplicates. Within 1% of the
+            # average magnitude they are likely the same content under another path_or_url
+            euclidean_distance = np.linalg.norm(embeddings[i] - embeddings[j])
+            avg_norm = (norms[i] + norms[j]) / 2.0
+            relative_distance_threshold = 0.01 * avg_norm if avg_norm > 0 else 0.1
+            
+            if euclidean_distance <= relative_distance_threshold:
+                doc_id1, doc_id2 = doc_ids_list[i], doc_ids_list[j]
+                cluster1, cluster2 = doc_to_cluster[doc_id1], doc_to_cluster[doc_id2]
+                merged_pairs.append((doc_id1, doc_id2, cluster1, cluster2, similarity))
+                logger.info(f"Found duplicate documents: {doc_id1} and {doc_id2} (similarity: {similarity:.4f}, distance: {euclidean_distance:.4f}) in different clusters {cluster1} and {cluster2}")
+    
+    return merged_pairs
+
+
 def merge_duplicate_documents_in_clusters(clusters: Dict[int, List[str]], doc_embeddings: Dict[str, np.ndarray], similarity_threshold: float = 0.98) -> Dict[int, List[str]]:
     """
     Post-process clusters to merge duplicate documents (same content but different path_or_url)
@@ -261,52 +415,7 @@ def merge_duplicate_documents_in_clusters(clusters: Dict[int, List[str]], doc_em
                 doc_to_cluster[doc_id] = cluster_id
         
         # Find duplicate pairs with high similarity
-        doc_ids_list = list(doc_embeddings.keys())
-        merged_pairs = []
-        
-        for i, doc_id1 in enumerate(doc_ids_list):
-            if doc_id1 not in doc_embeddings:
-                continue
-            
-            embedding1 = doc_embeddings[doc_id1]
-            
-            for j, doc_id2 in enumerate(doc_ids_list[i+1:], start=i+1):
-                if doc_id2 not in doc_embeddings:
-                    continue
-                
-                embedding2 = doc_embeddings[doc_id2]
-                
-                # Calculate cosine similarity
-                similarity = cosine_similarity(
-                    embedding1.reshape(1, -1),
-                    embedding2.reshape(1, -1)
-                )[0][0]
-                
-                # If similarity is very high, they are likely duplicates
-                if similarity >= similarity_threshold:
-                    cluster1 = doc_to_cluster.get(doc_id1)
-                    cluster2 = doc_to_cluster.get(doc_id2)
-                    
-                    # Only merge if they are in different clusters AND truly duplicates
-                    # Check both cosine similarity AND Euclidean distance to prevent false positives
-                    if cluster1 is not None and cluster2 is not None and cluster1 != cluster2:
-                        # Calculate Euclidean distance to ensure they're truly duplicates
-                        # Documents that are just in the same direction but far apart should not be merged
-                        euclidean_distance = np.linalg.norm(embedding1 - embedding2)
-                        
-                        # Normalize embeddings to get their magnitudes
-                        norm1 = np.linalg.norm(embedding1)
-                        norm2 = np.linalg.norm(embedding2)
-                        avg_norm = (norm1 + norm2) / 2.0
-                        
-                        # Relative distance threshold: if distance is less than 1% of average magnitude,
-                        # they are likely true duplicates (same content, different path_or_url)
-                        # This prevents merging documents that are just in similar directions
-                        relative_distance_threshold = 0.01 * avg_norm if avg_norm > 0 else 0.1
-                        
-                        if euclidean_distance <= relative_distance_threshold:
-                            merged_pairs.append((doc_id1, doc_id2, cluster1, cluster2, similarity))
-                            logger.info(f"Found duplicate documents: {doc_id1} and {doc_id2} (similarity: {similarity:.4f}, distance: {euclidean_distance:.4f}) in different clusters {cluster1} and {cluster2}")
+        merged_pairs = _find_duplicate_pairs(doc_to_cluster, doc_embeddings, similarity_threshold)
         
         # Merge duplicate documents into the same cluster
         if merged_pairs:
@@ -513,7 +622,7 @@ def summarize_document(document_content: str, filename: str, language: str = LAN
         system_prompt = prompts.get('system_prompt', '')
         user_prompt_template = prompts.get('user_prompt', '')
         
-        user_prompt = Template(user_prompt_template, undefined=StrictUndefined).render(
+        user_prompt = compile_template(user_prompt_template, undefined=StrictUndefined).render(
             filename=filename,
             content=document_content,
             max_words=max_words
@@ -573,7 +682,7 @@ def summarize_cluster(document_summaries: List[str], language: str = LANGUAGE["Z
         # Format document summaries
         summaries_text = "\n\n".join([f"Document {i+1}: {summary}" for i, summary in enumerate(document_summaries)])
         
-        user_prompt = Template(user_prompt_template, undefined=StrictUndefined).render(
+        user_prompt = compile_template(user_prompt_template, undefined=StrictUndefined).render(
             document_summaries=summaries_text,
             max_words=max_words
         )
@@ -2,7 +2,7 @@ import logging
 import os
 from typing import Dict, Any, Optional
 
-import yaml
+from nexent.core.utils.template_registry import compile_template, load_yaml_template
 
 from consts.const import LANGUAGE
 from consts.prompt_template import (
@@ -146,9 +146,8 @@ def get_prompt_template(template_type: str, language: str = LANGUAGE["ZH"], **kw
     backend_dir = os.path.dirname(current_dir)
     absolute_template_path = os.path.join(backend_dir, template_path.replace('backend/', ''))
 
-    # Read and return template content
-    with open(absolute_template_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    # Read and return template content (re-parsed only when the file changes)
+    return load_yaml_template(absolute_template_path)
 
 
 # For backward compatibility, keep original function names as wrapper functions
@@ -265,8 +264,6 @@ def get_skill_creation_simple_prompt_template(
     Returns:
         Dict[str, str]: Template with keys 'system_prompt' and 'user_prompt', rendered with variables
     """
-    from jinja2 import Template
-
     # Select template based on complexity
     template_path_map = {
         "simple": {
@@ -287,8 +284,7 @@ def get_skill_creation_simple_prompt_template(
     backend_dir = os.path.dirname(current_dir)
     absolute_template_path = os.path.join(backend_dir, template_path.replace('backend/', ''))
 
-    with open(absolute_template_path, 'r', encoding='utf-8') as f:
-        template_data = yaml.safe_load(f)
+    template_data = load_yaml_template(absolute_template_path)
 
     # Prepare template context with existing_skill info
     context = {
@@ -300,13 +296,13 @@ def get_skill_creation_simple_prompt_template(
     user_prompt_raw = template_data.get("user_prompt", "")
 
     try:
-        system_prompt = Template(system_prompt_raw).render(**context)
+        system_prompt = compile_template(system_prompt_raw).render(**context)
     except Exception as e:
         logger.warning(f"Failed to render system_prompt template: {e}, using raw content")
         system_prompt = system_prompt_raw
 
     try:
-        user_prompt = Template(user_prompt_raw).render(**context)
+        user_prompt = compile_template(user_prompt_raw).render(**context)
     except Exception as e:
         logger.warning(f"Failed to render user_prompt template: {e}, using raw content")
         user_prompt = user_prompt_raw
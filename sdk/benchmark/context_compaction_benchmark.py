@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for ContextManager soft-budget compaction on long agent runs.
+
+Builds agent memories with a growing number of action steps and times
+``ContextManager.assemble_final_context`` in adaptive-compact mode with a soft
+budget that forces compaction of every old action. ``RescanContextManager``
+keeps the previous compaction loop (re-render and re-estimate every item after
+each single compaction, ``list.index`` lookups) as a baseline; every run also
+checks that both produce identical messages.
+
+Run from this directory:
+
+    python context_compaction_benchmark.py
+    python context_compaction_benchmark.py --steps 50 100 200 400 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import paths  # noqa: F401 - side-effect: adds sdk/, backend/ to sys.path
+
+from smolagents.memory import ActionStep, TaskStep
+from smolagents.monitoring import Timing
+
+from nexent.core.agents.context import ContextItemInput, ContextManager, ContextManagerConfig
+from nexent.core.agents.context.models import ContextItemType
+
+
+class RescanContextManager(ContextManager):
+    """Previous implementation: full re-estimate after every single compaction."""
+
+    def _compact_to_soft_budget(self, items, purpose_stable, purpose_dynamic, tools):
+        result = list(items)
+        if self._estimate_items(result, purpose_stable, purpose_dynamic, tools) <= self._soft_input_budget_tokens():
+            return result
+        keep_recent = max(0, self.config.keep_recent_steps)
+        actions = [item for item in result if item.type == ContextItemType.CURRENT_ACTION]
+        old_actions = actions[:-keep_recent] if keep_recent else actions
+        recent_actions = actions[-keep_recent:] if keep_recent else []
+        other_items = [
+            item for item in result
+            if item.type != ContextItemType.CURRENT_ACTION and item.supports_compact
+        ]
+        for candidates in (old_actions, other_items, recent_actions):
+            savings = []
+            for item in candidates:
+                compact = item.compact()
+                saving = max(0, item.token_estimate - compact.token_estimate)
+                savings.append((saving, item.layout_key, item, compact))
+            for _, _, original, compact in sorted(savings, key=lambda row: (-row[0], row[1])):
+                index = result.index(original)
+                result[index] = compact
+                if self._estimate_items(result, purpose_stable, purpose_dynamic, tools) <= self._soft_input_budget_tokens():
+                    return result
+        return result
+
+
+@dataclass(frozen=True)
+class CompactionRun:
+    action_steps: int
+    incremental_ms: float
+    rescan_ms: float
+    speedup: float
+    identical_output: bool
+
+
+@dataclass(frozen=True)
+class ContextCompactionBenchmark:
+    runs: List[CompactionRun]
+    # Incremental assemble time per action step at the largest vs. smallest run;
+    # close to 1.0 means the per-step cost stays flat as the run grows.
+    incremental_per_step_growth: float
+    rescan_per_step_growth: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Memory:
+    def __init__(self, steps):
+        self.system_prompt = None
+        self.steps = list(steps)
+
+
+def build_memory(action_steps: int, observation_chars: int = 1200) -> _Memory:
+    """A task followed by ``action_steps`` tool-calling steps with bulky observations."""
+    actions = [ActionStep(
+        step_number=index + 1, timing=Timing(start_time=0), tool_calls=[],
+        observations=(f"row {index} " * observation_chars)[:observation_chars],
+        action_output=f"result {index}",
+        model_output=(f"reasoning {index} " * observation_chars)[:observation_chars],
+    ) for index in range(action_steps)]
+    return _Memory([TaskStep(task="Summarize every record in the dataset"), *actions])
+
+
+def _resource_items() -> list:
+    return [ContextItemInput(
+        id=f"tool:{name}", type="tool",
+        content={"name": name, "description": f"{name} tool " * 40, "inputs": {}, "output_type": "string"},
+        metadata={"render_group": "tools", "language": "en"},
+    ) for name in ("search", "fetch", "summarize")]
+
+
+def _assemble(manager_cls, memory: _Memory, repeat: int):
+    best = float("inf")
+    messages = None
+    for _ in range(repeat):
+        manager = manager_cls(ContextManagerConfig(
+            soft_input_budget_tokens=2000, hard_input_budget_tokens=10 ** 7, keep_recent_steps=4,
+            policy_layers={"request": {"processing_mode": "adaptive_compact"}},
+        ))
+        run = manager.prepare_run_context(memory, "You are a data analysis agent.", _resource_items())
+        started = time.process_time()
+        final = manager.assemble_final_context(
+            model=None, memory=memory, current_run_start_idx=0, run_context=run,
+        )
+        best = min(best, time.process_time() - started)
+        messages = final.messages
+    return best, messages
+
+
+def run_context_compaction_benchmark(
+    step_counts: Sequence[int] = (50, 100, 200, 400),
+    repeat: int = 3,
+) -> ContextCompactionBenchmark:
+    """Time one compacting assemble per step count with both compaction loops."""
+    runs = []
+    for steps in step_counts:
+        memory = build_memory(steps)
+        incremental_seconds, incremental_messages = _assemble(ContextManager, memory, repeat)
+        rescan_seconds, rescan_messages = _assemble(RescanContextManager, memory, repeat)
+        runs.append(CompactionRun(
+            action_steps=steps,
+            incremental_ms=round(incremental_seconds * 1000, 2),
+            rescan_ms=round(rescan_seconds * 1000, 2),
+            speedup=round(rescan_seconds / incremental_seconds, 2) if incremental_seconds else 0.0,
+            identical_output=incremental_messages == rescan_messages,
+        ))
+
+    def growth(attr: str) -> float:
+        first, last = runs[0], runs[-1]
+        first_per_step = getattr(first, attr) / first.action_steps
+        last_per_step = getattr(last, attr) / last.action_steps
+        return round(last_per_step / first_per_step, 2) if first_per_step else 0.0
+
+    return ContextCompactionBenchmark(
+        runs=runs,
+        incremental_per_step_growth=growth("incremental_ms"),
+        rescan_per_step_growth=growth("rescan_ms"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, nargs="+", default=[50, 100, 200, 400])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run_context_compaction_benchmark(args.steps, repeat=args.repeat)
+    print(json.dumps(result.to_dict(), indent=2))
+    if not all(run.identical_output for run in result.runs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
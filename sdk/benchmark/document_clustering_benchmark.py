@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the knowledge-base summary clustering stage.
+
+Builds a synthetic corpus of topic-clustered document embeddings, with a
+share of near-duplicate documents (the same content under another
+path_or_url), and measures the three costly steps of the summary pipeline:
+
+* chunk retrieval: one search per document (previous behaviour) against
+  batched msearch requests, on a fake vector database that adds a fixed
+  round-trip time per request;
+* K selection: the previous full-data K-means silhouette sweep against the
+  sampled sweep with early stopping of ``auto_determine_k``;
+* duplicate merge: the previous pairwise ``cosine_similarity`` loop against
+  the blocked matrix products of ``merge_duplicate_documents_in_clusters``.
+
+The pairwise loop is quadratic in Python calls, so it runs on the first
+``--baseline-docs`` documents only and its full-size time is extrapolated.
+Both detectors must find the same duplicate pairs on those documents.
+
+Run from this directory:
+
+    python document_clustering_benchmark.py
+    python document_clustering_benchmark.py --docs 20000 --dim 384 --skip-baseline-k
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import paths  # noqa: E402,F401 - side-effect: adds sdk/, backend/ to sys.path
+
+from utils import document_vector_utils  # noqa: E402
+from utils.document_vector_utils import (  # noqa: E402
+    _find_duplicate_pairs,
+    auto_determine_k,
+    get_documents_from_es,
+    merge_duplicate_documents_in_clusters,
+)
+
+
+def build_corpus(docs: int, dim: int, topics: int, duplicate_ratio: float, seed: int) -> Dict[str, np.ndarray]:
+    """Document embeddings drawn around ``topics`` centers; some are followed by a near copy."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(topics, dim)) * 3
+    vectors = []
+    while len(vectors) < docs:
+        vector = centers[rng.integers(topics)] + rng.normal(size=dim)
+        vectors.append(vector)
+        if rng.random() < duplicate_ratio and len(vectors) < docs:
+            vectors.append(vector + rng.normal(scale=1e-4, size=dim))
+    return {f"doc_{i:05d}": vector for i, vector in enumerate(vectors)}
+
+
+class FakeVectorDatabase:
+    """Serves a terms aggregation and chunk queries, sleeping ``rtt_ms`` per request."""
+
+    def __init__(self, docs: int, chunks_per_doc: int, rtt_ms: float):
+        self.buckets = [{"key": f"/kb/doc_{i:05d}.pdf", "doc_count": chunks_per_doc} for i in range(docs)]
+        self.rtt_s = rtt_ms / 1000
+        self.requests = 0
+
+    def _hits(self, query: dict) -> dict:
+        path = query["query"]["term"]["path_or_url"]
+        return {"hits": {"hits": [
+            {"_source": {"path_or_url": path, "filename": os.path.basename(path), "content": f"chunk {n}"}}
+            for n in range(query["size"])
+        ]}}
+
+    def search(self, index_name: str, query: dict) -> dict:
+        self.requests += 1
+        time.sleep(self.rtt_s)
+        if "aggs" in query:
+            return {"aggregations": {"unique_documents": {"buckets": self.buckets}}}
+        return self._hits(query)
+
+    def multi_search(self, body: List[dict], index_name: str) -> dict:
+        self.requests += 1
+        time.sleep(self.rtt_s)
+        return {"responses": [self._hits(query) for query in body[1::2]]}
+
+
+class PerDocumentSearch(FakeVectorDatabase):
+    """Previous behaviour: no msearch, so every document costs its own request."""
+
+    def multi_search(self, body: List[dict], index_name: str) -> dict:
+        return {"responses": [self.search(index_name, query) for query in body[1::2]]}
+
+
+def legacy_auto_determine_k(embeddings: np.ndarray, min_k: int = 3, max_k: int = 15) -> int:
+    """Previous K selection: fit every K of the range on all documents."""
+    n_samples = len(embeddings)
+    actual_max_k = min(max_k, n_samples // 10, 15)
+    best_k, best_score = min(min_k, actual_max_k), -1
+    for k in range(min(min_k, actual_max_k), actual_max_k + 1):
+        labels = KMeans(n_clusters=k, random_state=42, n_init=10, max_iter=300).fit_predict(embeddings)
+        score = silhouette_score(embeddings, labels, sample_size=min(1000, n_samples), random_state=42)
+        if score > best_score:
+            best_k, best_score = k, score
+    return best_k
+
+
+def legacy_find_duplicate_pairs(doc_to_cluster: Dict[str, int], doc_embeddings: Dict[str, np.ndarray],
+                                similarity_threshold: float) -> List[Tuple[str, str]]:
+    """Previous duplicate detection: one ``cosine_similarity`` call per document pair."""
+    doc_ids = list(doc_embeddings)
+    pairs = []
+    for i, doc_id1 in enumerate(doc_ids):
+        embedding1 = doc_embeddings[doc_id1]
+        for doc_id2 in doc_ids[i + 1:]:
+            embedding2 = doc_embeddings[doc_id2]
+            similarity = cosine_similarity(embedding1.reshape(1, -1), embedding2.reshape(1, -1))[0][0]
+            if similarity < similarity_threshold:
+                continue
+            cluster1, cluster2 = doc_to_cluster.get(doc_id1), doc_to_cluster.get(doc_id2)
+            if cluster1 is None or cluster2 is None or cluster1 == cluster2:
+                continue
+            avg_norm = (np.linalg.norm(embedding1) + np.linalg.norm(embedding2)) / 2.0
+            if np.linalg.norm(embedding1 - embedding2) <= (0.01 * avg_norm if avg_norm > 0 else 0.1):
+                pairs.append((doc_id1, doc_id2))
+    return pairs
+
+
+@dataclass(frozen=True)
+class DocumentClusteringBenchmark:
+    docs: int
+    dim: int
+    fetch_requests_per_document: int
+    fetch_requests_batched: int
+    fetch_per_document_s: float
+    fetch_batched_s: float
+    k_selection_full_s: float
+    k_selection_sampled_s: float
+    k_full: int
+    k_sampled: int
+    merge_baseline_docs: int
+    merge_pairwise_s: float
+    merge_pairwise_extrapolated_s: float
+    merge_blocked_s: float
+    duplicate_pairs: int
+    identical_duplicate_pairs: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def run_document_clustering_benchmark(
+    docs: int = 20000, dim: int = 256, topics: int = 12, duplicate_ratio: float = 0.01,
+    chunks_per_doc: int = 4, rtt_ms: float = 2.0, fetch_docs: int = 2000,
+    baseline_docs: int = 200, skip_baseline_k: bool = False, seed: int = 7,
+) -> DocumentClusteringBenchmark:
+    """Run the clustering stage on ``docs`` synthetic documents, old and new path."""
+    # Chunk retrieval, on a sample as the summary pipeline does
+    per_document = PerDocumentSearch(fetch_docs, chunks_per_doc, rtt_ms)
+    per_document_samples, fetch_per_document_s = _timed(get_documents_from_es, "kb", per_document, fetch_docs)
+    batched = FakeVectorDatabase(fetch_docs, chunks_per_doc, rtt_ms)
+    batched_samples, fetch_batched_s = _timed(get_documents_from_es, "kb", batched, fetch_docs)
+    assert len(per_document_samples) == len(batched_samples) == fetch_docs
+
+    doc_embeddings = build_corpus(docs, dim, topics, duplicate_ratio, seed)
+    embeddings = np.array(list(doc_embeddings.values()))
+
+    # K selection
+    k_sampled, k_sampled_s = _timed(auto_determine_k, embeddings)
+    if skip_baseline_k:
+        k_full, k_full_s = 0, 0.0
+    else:
+        k_full, k_full_s = _timed(legacy_auto_determine_k, embeddings)
+
+    # Duplicate merge, on the clusters the pipeline would produce
+    labels = KMeans(n_clusters=k_sampled, random_state=42, n_init=10, max_iter=300).fit_predict(embeddings)
+    clusters: Dict[int, List[str]] = {}
+    for doc_id, label in zip(doc_embeddings, labels):
+        clusters.setdefault(int(label), []).append(doc_id)
+    _, merge_blocked_s = _timed(merge_duplicate_documents_in_clusters, copy.deepcopy(clusters), doc_embeddings)
+
+    # The pairwise loop only runs on a prefix. Near copies nearly always share a
+    # K-means cluster, so compare both detectors under random cluster labels
+    rng = np.random.default_rng(seed)
+    doc_to_cluster = {doc_id: int(label) for doc_id, label in zip(doc_embeddings, rng.integers(k_sampled, size=docs))}
+    subset = dict(list(doc_embeddings.items())[:baseline_docs])
+    legacy_pairs, merge_pairwise_s = _timed(legacy_find_duplicate_pairs, doc_to_cluster, subset, 0.98)
+    blocked_pairs = [(a, b) for a, b, _, _, _ in _find_duplicate_pairs(doc_to_cluster, subset, 0.98)]
+
+    return DocumentClusteringBenchmark(
+        docs=docs,
+        dim=dim,
+        fetch_requests_per_document=per_document.requests,
+        fetch_requests_batched=batched.requests,
+        fetch_per_document_s=round(fetch_per_document_s, 3),
+        fetch_batched_s=round(fetch_batched_s, 3),
+        k_selection_full_s=round(k_full_s, 2),
+        k_selection_sampled_s=round(k_sampled_s, 2),
+        k_full=k_full,
+        k_sampled=k_sampled,
+        merge_baseline_docs=len(subset),
+        merge_pairwise_s=round(merge_pairwise_s, 2),
+        merge_pairwise_extrapolated_s=round(merge_pairwise_s * (docs / len(subset)) ** 2, 1),
+        merge_blocked_s=round(merge_blocked_s, 2),
+        duplicate_pairs=len(legacy_pairs),
+        identical_duplicate_pairs=legacy_pairs == blocked_pairs,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--topics", type=int, default=12)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.01)
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="simulated round trip per ES request")
+    parser.add_argument("--fetch-docs", type=int, default=2000, help="documents sampled for chunk retrieval")
+    parser.add_argument("--baseline-docs", type=int, default=200, help="documents the pairwise merge runs on")
+    parser.add_argument("--skip-baseline-k", action="store_true", help="skip the full-data K sweep (minutes)")
+    args = parser.parse_args()
+
+    # The merge logs every duplicate pair at INFO
+    logging.getLogger(document_vector_utils.logger.name).setLevel(logging.WARNING)
+    result = run_document_clustering_benchmark(
+        docs=args.docs, dim=args.dim, topics=args.topics, duplicate_ratio=args.duplicate_ratio,
+        rtt_ms=args.rtt_ms, fetch_docs=args.fetch_docs, baseline_docs=args.baseline_docs,
+        skip_baseline_k=args.skip_baseline_k)
+    print(json.dumps(result.to_dict(), indent=2))
+    if not result.identical_duplicate_pairs:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
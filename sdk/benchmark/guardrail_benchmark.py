@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for GuardrailEngine input screening over a multi-step run.
+
+Replays a synthetic ReAct run where every step resends the whole history to
+``GuardrailEngine.check_input`` and reports the total screening cost.
+``RescanGuardrailEngine`` keeps the previous implementation (rescan every
+message against every rule on every step, no literal prefilter) as a
+baseline; the benchmark also checks that both engines reach identical
+decisions on every step.
+
+Run from this directory:
+
+    python guardrail_benchmark.py
+    python guardrail_benchmark.py --steps 100 --rules 200 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import paths  # noqa: F401 - side-effect: adds sdk/, backend/ to sys.path
+
+from nexent.core.agents.agent_model import GuardrailConfig, GuardrailRule
+from nexent.core.agents.verification import GuardrailEngine
+
+
+class RescanGuardrailEngine(GuardrailEngine):
+    """Previous implementation: every message is rescanned by every rule on every call."""
+
+    def _scan_cached(self, text: str) -> List[tuple]:
+        results: List[tuple] = []
+        if not text:
+            return results
+        for compiled, rule in self._rules:
+            texts = [m.group(0) for m in compiled.finditer(text)]
+            if texts:
+                results.append((compiled, rule, texts))
+        return results
+
+
+@dataclass(frozen=True)
+class GuardrailBenchmark:
+    steps: int
+    rules: int
+    messages_screened: int
+    incremental_ms: float
+    rescan_ms: float
+    speedup: float
+    identical_decisions: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def synthetic_rules(count: int = 200) -> List[GuardrailRule]:
+    """Half keyword rules, half regex rules, like a typical tenant rule set."""
+    rules = []
+    for index in range(count):
+        if index % 2:
+            pattern = f"内部代号{index:03d}" if index % 4 == 1 else f"project-codename-{index:03d}"
+        else:
+            pattern = rf"\b(?:api|secret)_key_{index}\s*[:=]\s*\S+" if index % 4 == 0 else rf"\d{{3}}-\d{{2}}-{index:04d}"
+        rules.append(GuardrailRule(name=f"rule_{index}", pattern=pattern, severity="mask"))
+    return rules
+
+
+def synthetic_run(steps: int = 100) -> List[List[Dict[str, Any]]]:
+    """Build the prompt of every step: system + task, then one assistant/tool pair per step."""
+    history: List[Dict[str, Any]] = [
+        {"role": "system", "content": "You are a helpful agent. 请使用工具回答问题。" * 40},
+        {"role": "user", "content": "Summarize the quarterly planning documents in the knowledge base."},
+    ]
+    prompts = []
+    for step in range(steps):
+        history = history + [
+            {"role": "assistant", "content": f"Thought: step {step}, search again.\n代码：```py\nknowledge_base_search(query='plan {step}')\n```"},
+            {"role": "user", "content": (f"Observation: document {step} discusses budgets and milestones. "
+                                         "文档讨论了预算和里程碑。" * 12
+                                         + (" project-codename-003" if step % 25 == 0 else ""))},
+        ]
+        prompts.append(history)
+    return prompts
+
+
+def _replay(engine_cls, config: GuardrailConfig, prompts, repeat: int):
+    """Return the best CPU time over ``repeat`` runs and the per-step decisions."""
+    best = float("inf")
+    decisions = []
+    for _ in range(repeat):
+        engine = engine_cls(config)
+        decisions = []
+        started = time.process_time()
+        for messages in prompts:
+            decision = engine.check_input(messages)
+            decisions.append((decision.effective_action, decision.rule_name, decision.masked_messages))
+        best = min(best, time.process_time() - started)
+    return best, decisions
+
+
+def run_guardrail_benchmark(steps: int = 100, rules: int = 200, repeat: int = 1) -> GuardrailBenchmark:
+    """Screen a ``steps``-long run against ``rules`` rules with both engines."""
+    config = GuardrailConfig(enabled=True, rules=synthetic_rules(rules))
+    prompts = synthetic_run(steps)
+    incremental_s, incremental_decisions = _replay(GuardrailEngine, config, prompts, repeat)
+    rescan_s, rescan_decisions = _replay(RescanGuardrailEngine, config, prompts, repeat)
+    return GuardrailBenchmark(
+        steps=steps,
+        rules=rules,
+        messages_screened=sum(len(messages) for messages in prompts),
+        incremental_ms=round(incremental_s * 1e3, 2),
+        rescan_ms=round(rescan_s * 1e3, 2),
+        speedup=round(rescan_s / incremental_s, 2) if incremental_s else 0.0,
+        identical_decisions=incremental_decisions == rescan_decisions,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    result = run_guardrail_benchmark(steps=args.steps, rules=args.rules, repeat=args.repeat)
+    print(json.dumps(result.to_dict(), indent=2))
+    if not result.identical_decisions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
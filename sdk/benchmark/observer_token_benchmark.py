@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for MessageObserver streaming token classification.
+
+Replays token streams through ``MessageObserver.add_model_new_token`` and
+reports the per-token cost. ``RejoinMessageObserver`` keeps the previous
+implementation (re-join the whole buffer and re-run the regexes on every
+token) as a baseline; every replay also checks that both produce identical
+messages.
+
+Run from this directory:
+
+    python observer_token_benchmark.py
+    python observer_token_benchmark.py --tokens-file stream.json --repeat 20
+
+``--tokens-file`` takes a JSON list of token strings (or a list of such lists)
+recorded from a real model stream.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import paths  # noqa: F401 - side-effect: adds sdk/, backend/ to sys.path
+
+from nexent.core.utils.observer import Message, MessageObserver, ProcessType
+
+
+class RejoinMessageObserver(MessageObserver):
+    """Previous implementation: joins the full buffers and rescans them per token."""
+
+    def add_model_new_token(self, new_token):
+        self.think_buffer.append(new_token)
+        buffer_text = ''.join(self.think_buffer)
+
+        if not self.in_think_mode:
+            start_match = self.think_start_pattern.search(buffer_text)
+            if start_match:
+                self.in_think_mode = True
+                self.think_buffer.clear()
+                think_content = buffer_text[start_match.end():]
+                if think_content:
+                    self.think_buffer.append(think_content)
+
+        if self.in_think_mode:
+            end_match = self.think_end_pattern.search(buffer_text)
+            if end_match:
+                self.in_think_mode = False
+                think_content = buffer_text[:end_match.start()]
+                if think_content:
+                    self._emit(Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, think_content).to_json())
+                after_think = buffer_text[end_match.end():]
+                if after_think:
+                    self._process_normal_content(after_think)
+                self.think_buffer.clear()
+
+        while len(self.think_buffer) > self.MAX_TOKEN_BUFFER_SIZE:
+            accumulated_content = ''.join(list(self.think_buffer)[:-self.MAX_TOKEN_BUFFER_SIZE])
+            for _ in range(len(self.think_buffer) - self.MAX_TOKEN_BUFFER_SIZE):
+                self.think_buffer.popleft()
+            if accumulated_content:
+                if self.in_think_mode:
+                    self._emit(Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, accumulated_content).to_json())
+                else:
+                    self._process_normal_content(accumulated_content)
+
+    def _process_normal_content(self, content):
+        self.token_buffer.append(content)
+        buffer_text = ''.join(self.token_buffer)
+        match = self.code_pattern.search(buffer_text)
+        if match:
+            match_start = match.start()
+            if self.current_mode == ProcessType.MODEL_OUTPUT_THINKING:
+                prefix_text = buffer_text[:match_start]
+                if prefix_text:
+                    self._emit(Message(ProcessType.MODEL_OUTPUT_THINKING, prefix_text).to_json())
+                code_text = buffer_text[match_start:]
+                if code_text:
+                    self._emit(Message(ProcessType.MODEL_OUTPUT_CODE, code_text).to_json())
+                self.current_mode = ProcessType.MODEL_OUTPUT_CODE
+            else:
+                self._emit(Message(ProcessType.MODEL_OUTPUT_CODE, buffer_text).to_json())
+            self.token_buffer.clear()
+        elif len(self.token_buffer) > self.MAX_TOKEN_BUFFER_SIZE:
+            accumulated_content = ''.join(list(self.token_buffer)[:-self.MAX_TOKEN_BUFFER_SIZE])
+            for _ in range(len(self.token_buffer) - self.MAX_TOKEN_BUFFER_SIZE):
+                self.token_buffer.popleft()
+            self._emit(Message(self.current_mode, accumulated_content).to_json())
+
+
+@dataclass(frozen=True)
+class ObserverTokenBenchmark:
+    streams: int
+    tokens_per_pass: int
+    incremental_ns_per_token: float
+    rejoin_ns_per_token: float
+    speedup: float
+    identical_output: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def synthetic_streams(count: int = 8, token_chars: int = 4) -> List[List[str]]:
+    """Build streams shaped like model output: a think block, prose and a code block."""
+    think = "让我先分析一下这个问题，需要检索相关资料然后整理答案。" * 40
+    prose = "Thought: I will search the knowledge base first and then summarize the results. " * 20
+    code = "代码：```py\nresult = knowledge_base_search(query='nexent')\nprint(result)\n```<end_code>\n"
+    streams = []
+    for index in range(count):
+        text = f"<think>{think}</think>{prose}{code * (index % 3 + 1)}"
+        streams.append([text[i:i + token_chars] for i in range(0, len(text), token_chars)])
+    return streams
+
+
+def _replay(observer_cls, streams: Sequence[Sequence[str]], repeat: int):
+    """Return the best single-pass CPU time over ``repeat`` passes and the emitted messages."""
+    outputs = []
+    best = float("inf")
+    for _ in range(repeat):
+        outputs = []
+        elapsed = 0.0
+        for tokens in streams:
+            observer = observer_cls()
+            started = time.process_time()
+            for token in tokens:
+                observer.add_model_new_token(token)
+            observer.flush_remaining_tokens()
+            elapsed += time.process_time() - started
+            outputs.append(observer.get_cached_message())
+        best = min(best, elapsed)
+    return best, outputs
+
+
+def run_observer_token_benchmark(
+    streams: Sequence[Sequence[str]],
+    repeat: int = 5,
+) -> ObserverTokenBenchmark:
+    """Replay ``streams`` through both observers and compare cost and output."""
+    token_count = sum(len(tokens) for tokens in streams)
+    incremental_seconds, incremental_output = _replay(MessageObserver, streams, repeat)
+    rejoin_seconds, rejoin_output = _replay(RejoinMessageObserver, streams, repeat)
+    incremental_ns = incremental_seconds * 1e9 / max(token_count, 1)
+    rejoin_ns = rejoin_seconds * 1e9 / max(token_count, 1)
+    return ObserverTokenBenchmark(
+        streams=len(streams),
+        tokens_per_pass=token_count,
+        incremental_ns_per_token=round(incremental_ns, 1),
+        rejoin_ns_per_token=round(rejoin_ns, 1),
+        speedup=round(rejoin_ns / incremental_ns, 2) if incremental_ns else 0.0,
+        identical_output=incremental_output == rejoin_output,
+    )
+
+
+def _load_streams(path: str) -> List[List[str]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data and all(isinstance(token, str) for token in data):
+        return [data]
+    return [list(tokens) for tokens in data]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens-file", help="JSON list of recorded tokens, or a list of such lists")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--token-chars", type=int, default=4, help="token size for synthetic streams")
+    args = parser.parse_args()
+
+    streams = _load_streams(args.tokens_file) if args.tokens_file else synthetic_streams(
+        token_chars=args.token_chars)
+    result = run_observer_token_benchmark(streams, repeat=args.repeat)
+    print(json.dumps(result.to_dict(), indent=2))
+    if not result.identical_output:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
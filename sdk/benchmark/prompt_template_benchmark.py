@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for prompt template loading and rendering overhead.
+
+Measures the per-request template cost of two hot paths:
+
+* agent creation: loading the manager and managed agent prompt YAML files,
+  as ``create_agent_info`` does for every agent of a run;
+* per-step prompt building: rendering the final-answer and managed-agent
+  Jinja templates, as ``ContextManager`` and ``CoreAgent`` do on every step.
+
+The baseline re-reads and ``yaml.safe_load``s every file and builds a fresh
+``jinja2.Template`` on every render (the previous behaviour); the cached path
+goes through ``TemplateRegistry``. Both must produce identical prompts.
+
+Run from this directory:
+
+    python prompt_template_benchmark.py
+    python prompt_template_benchmark.py --requests 200 --steps 20 --language en
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+import yaml
+from jinja2 import StrictUndefined, Template
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from paths import BACKEND_DIR  # noqa: E402 - side-effect: adds sdk/, backend/ to sys.path
+
+from nexent.core.utils.template_registry import TemplateRegistry  # noqa: E402
+
+
+def agent_template_paths(language: str, managed_agents: int) -> List[str]:
+    """One manager template plus one managed template per sub-agent."""
+    prompts_dir = os.path.join(BACKEND_DIR, "prompts")
+    return [os.path.join(prompts_dir, f"manager_system_prompt_template_{language}.yaml")] + [
+        os.path.join(prompts_dir, f"managed_system_prompt_template_{language}.yaml")
+    ] * managed_agents
+
+
+class UncachedTemplates:
+    """Previous behaviour: parse every file and compile every template on each use."""
+
+    @staticmethod
+    def load_yaml(path: str) -> Any:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+
+    @staticmethod
+    def compile(source: str, **options: Any):
+        return Template(source, **options)
+
+
+@dataclass(frozen=True)
+class PromptTemplateBenchmark:
+    requests: int
+    steps: int
+    agent_creation_uncached_ms: float
+    agent_creation_cached_ms: float
+    agent_creation_speedup: float
+    step_prompt_uncached_us: float
+    step_prompt_cached_us: float
+    step_prompt_speedup: float
+    identical_prompts: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _create_agents(templates, paths: List[str]) -> List[Dict[str, Any]]:
+    loaded = []
+    for path in paths:
+        prompt_templates = templates.load_yaml(path)
+        prompt_templates["system_prompt"] = ""
+        loaded.append(prompt_templates)
+    return loaded
+
+
+def _build_step_prompts(templates, prompt_templates: Dict[str, Any], step: int) -> List[str]:
+    managed = prompt_templates["managed_agent"]
+    return [
+        templates.compile(prompt_templates["final_answer"]["post_messages"], undefined=StrictUndefined)
+        .render(task=f"Summarize the findings of step {step}"),
+        templates.compile(managed["task"], undefined=StrictUndefined)
+        .render({"name": "search_agent", "task": f"Find sources for step {step}"}),
+        templates.compile(managed["report"], undefined=StrictUndefined)
+        .render({"name": "search_agent", "final_answer": f"Report {step}"}),
+    ]
+
+
+def _replay(templates, paths: List[str], requests: int, steps: int):
+    """Return (agent creation seconds, step prompt seconds, produced prompts)."""
+    prompts = []
+    creation_s = 0.0
+    step_s = 0.0
+    for _ in range(requests):
+        started = time.process_time()
+        agents = _create_agents(templates, paths)
+        creation_s += time.process_time() - started
+
+        started = time.process_time()
+        for step in range(steps):
+            prompts.extend(_build_step_prompts(templates, agents[0], step))
+        step_s += time.process_time() - started
+    return creation_s, step_s, prompts
+
+
+def run_prompt_template_benchmark(
+    requests: int = 100, steps: int = 10, language: str = "zh", managed_agents: int = 2,
+) -> PromptTemplateBenchmark:
+    """Create ``requests`` agent runs of ``steps`` steps with and without the registry."""
+    paths = agent_template_paths(language, managed_agents)
+    uncached_creation, uncached_steps, uncached_prompts = _replay(UncachedTemplates, paths, requests, steps)
+    registry = TemplateRegistry()
+    cached_creation, cached_steps, cached_prompts = _replay(registry, paths, requests, steps)
+    step_count = requests * steps
+    return PromptTemplateBenchmark(
+        requests=requests,
+        steps=steps,
+        agent_creation_uncached_ms=round(uncached_creation * 1e3 / requests, 3),
+        agent_creation_cached_ms=round(cached_creation * 1e3 / requests, 3),
+        agent_creation_speedup=round(uncached_creation / cached_creation, 2) if cached_creation else 0.0,
+        step_prompt_uncached_us=round(uncached_steps * 1e6 / step_count, 1),
+        step_prompt_cached_us=round(cached_steps * 1e6 / step_count, 1),
+        step_prompt_speedup=round(uncached_steps / cached_steps, 2) if cached_steps else 0.0,
+        identical_prompts=uncached_prompts == cached_prompts,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--language", choices=["zh", "en"], default="zh")
+    parser.add_argument("--managed-agents", type=int, default=2)
+    args = parser.parse_args()
+
+    result = run_prompt_template_benchmark(
+        requests=args.requests, steps=args.steps, language=args.language, managed_agents=args.managed_agents)
+    print(json.dumps(result.to_dict(), indent=2))
+    if not result.identical_prompts:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
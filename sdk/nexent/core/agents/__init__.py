@@ -29,6 +29,7 @@ _EXPORTS = {
     "SandboxScope": (".sandbox", "SandboxScope"),
     "ShellPolicy": (".sandbox", "ShellPolicy"),
     "SandboxPoolManager": (".sandbox", "SandboxPoolManager"),
+    "MCPSessionPool": (".mcp_session_pool", "MCPSessionPool"),
     "build_python_executor": (".sandbox", "build_python_executor"),
     "cleanup_executor": (".sandbox", "cleanup_executor"),
     "release_python_executor": (".sandbox", "release_python_executor"),
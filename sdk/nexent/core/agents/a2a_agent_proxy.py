@@ -4,6 +4,7 @@ External A2A Agent Proxy Tool.
 This tool allows Nexent agents to call external A2A agents as sub-agents.
 It provides a unified interface for invoking remote A2A endpoints.
 """
+import asyncio
 import json
 import logging
 import uuid
@@ -14,6 +15,8 @@ from urllib.parse import urlparse
 
 import httpx
 
+from ..utils.async_runner import BackgroundLoopRunner
+
 # Protocol type constants (must match backend/database/a2a_agent_db.py definitions)
 PROTOCOL_JSONRPC = "JSONRPC"
 PROTOCOL_HTTP_JSON = "HTTP+JSON"
@@ -21,6 +24,10 @@ PROTOCOL_GRPC = "GRPC"
 
 logger = logging.getLogger("a2a_agent_proxy")
 
+# Connection limits of the per-endpoint clients shared by sync calls
+A2A_POOL_MAX_KEEPALIVE = 10
+A2A_POOL_MAX_CONNECTIONS = 50
+
 
 @dataclass
 class A2AAgentInfo:
@@ -34,6 +41,8 @@ class A2AAgentInfo:
     protocol_type: str = PROTOCOL_JSONRPC
     timeout: float = 300.0
     raw_card: Optional[Dict[str, Any]] = None
+    # Use HTTP/2 on the pooled client (needs the optional ``h2`` package)
+    http2: bool = False
 
     def get_protocol_type(self) -> str:
         """Get the protocol type for calling this agent.
@@ -81,35 +90,71 @@ class ExternalA2AAgentProxy:
     def __init__(
         self,
         agent_info: A2AAgentInfo,
-        stop_event: Optional[Event] = None
+        stop_event: Optional[Event] = None,
+        pooled: bool = False
     ):
         """Initialize the A2A agent proxy.
 
         Args:
             agent_info: Configuration for the external A2A agent.
             stop_event: Optional stop event for cancellation.
+            pooled: Borrow the endpoint's shared client from BackgroundLoopRunner
+                instead of opening a client per context. Only honored when the
+                context is entered on the runner's loop.
         """
         self.agent_info = agent_info
         self.stop_event = stop_event or Event()
+        self._pooled = pooled
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_client = False
 
     async def __aenter__(self):
+        runner = BackgroundLoopRunner.get_instance() if self._pooled else None
+        if runner is not None and asyncio.get_running_loop() is runner.loop:
+            parsed = urlparse(self.agent_info.url)
+            # The client carries the agent's timeout, so agents on one endpoint
+            # with different timeouts get separate pools
+            key = ("a2a", parsed.scheme, parsed.netloc, self.agent_info.http2, self.agent_info.timeout)
+            self._client = runner.get_client(key, self._new_pooled_client)
+            self._owns_client = False
+        else:
+            self._client = self._new_client(
+                http2=False,
+                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            )
+            self._owns_client = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._client and self._owns_client:
+            await self._client.aclose()
+
+    def _new_client(self, http2: bool, limits: "httpx.Limits") -> httpx.AsyncClient:
         # Configure httpx explicitly to match curl behavior
-        # - HTTP/2 disabled to use HTTP/1.1 like curl
+        # - HTTP/1.1 like curl unless HTTP/2 is requested
         # - trust_env=False to ignore proxy env vars
         # - limits configured for connection pool
-        self._client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             timeout=httpx.Timeout(self.agent_info.timeout),
-            http2=False,  # Force HTTP/1.1 like curl
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            http2=http2,
+            limits=limits,
             trust_env=False,  # Ignore HTTP_PROXY env vars
             follow_redirects=True,
         )
-        return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+    def _new_pooled_client(self) -> httpx.AsyncClient:
+        """Build the shared client of this agent's endpoint (falls back to HTTP/1.1 without h2)."""
+        limits = httpx.Limits(
+            max_keepalive_connections=A2A_POOL_MAX_KEEPALIVE,
+            max_connections=A2A_POOL_MAX_CONNECTIONS,
+        )
+        if self.agent_info.http2:
+            try:
+                return self._new_client(http2=True, limits=limits)
+            except ImportError:
+                logger.warning(f"HTTP/2 requested for A2A agent {self.agent_info.name} "
+                               f"but the h2 package is not installed, using HTTP/1.1")
+        return self._new_client(http2=False, limits=limits)
 
     def _build_headers(self) -> Dict[str, str]:
         """Build HTTP headers for A2A requests."""
@@ -256,7 +301,9 @@ class ExternalA2AAgentProxy:
     ) -> str:
         """Synchronous wrapper for calling external A2A agent.
 
-        This method runs the async call in a new event loop.
+        The call runs on the process-wide BackgroundLoopRunner with the
+        endpoint's pooled client, so repeated calls reuse connections and no
+        event loop or thread is created per call.
 
         Args:
             query: The user query.
@@ -266,45 +313,13 @@ class ExternalA2AAgentProxy:
         Returns:
             Extracted text response from the external agent.
         """
-        import asyncio
-        import threading
-
         async def execute():
-            async with self as proxy:
+            # A fresh proxy per call keeps concurrent sync_calls from sharing _client
+            async with ExternalA2AAgentProxy(self.agent_info, self.stop_event, pooled=True) as proxy:
                 response = await proxy.call(query, history, context)
                 return proxy.extract_text_from_response(response)
 
-        def run_in_new_loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(execute())
-            finally:
-                loop.close()
-
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No running loop, create and use new one directly
-            return run_in_new_loop()
-        else:
-            # Already in async context, run in a separate thread
-            result_container = [None]
-            exception_container = [None]
-
-            def thread_target():
-                try:
-                    result_container[0] = run_in_new_loop()
-                except Exception as e:
-                    exception_container[0] = e
-
-            thread = threading.Thread(target=thread_target)
-            thread.start()
-            thread.join()
-
-            if exception_container[0]:
-                raise exception_container[0]
-            return result_container[0]
+        return BackgroundLoopRunner.get_instance().run(execute())
 
     TERMINAL_STATE_KEYWORDS = frozenset(("COMPLETED", "FAILED", "CANCELED"))
 
@@ -615,10 +630,11 @@ Returns the external agent's response."""
         agent_info: A2AAgentInfo,
         query: str,
         history: Optional[List],
-        use_stream: bool
+        use_stream: bool,
+        pooled: bool = False
     ) -> str:
         """Execute A2A call and return accumulated text response."""
-        async with ExternalA2AAgentProxy(agent_info, self.stop_event) as proxy:
+        async with ExternalA2AAgentProxy(agent_info, self.stop_event, pooled=pooled) as proxy:
             if use_stream:
                 result_parts = []
                 async for text in proxy.extract_text_from_events(proxy.call_streaming(query, history)):
@@ -639,8 +655,6 @@ Returns the external agent's response."""
         Returns:
             External agent's response as string.
         """
-        import asyncio
-
         input_data, err = self._parse_forward_input(input_str)
         if err:
             logger.error(f"Failed to parse input JSON: {err}")
@@ -653,14 +667,9 @@ Returns the external agent's response."""
         agent_info = self.agent_configs.get(input_data["agent_id"])
 
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(
-                    self._execute_forward(agent_info, query, history, use_stream)
-                )
-            finally:
-                loop.close()
+            return BackgroundLoopRunner.get_instance().run(
+                self._execute_forward(agent_info, query, history, use_stream, pooled=True)
+            )
         except Exception as e:
             logger.error(f"A2A agent call failed: {e}", exc_info=True)
             return json.dumps({"error": f"Call failed: {str(e)}"})
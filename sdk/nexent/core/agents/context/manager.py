@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional, Sequence
 from smolagents.memory import ActionStep, AgentMemory, TaskStep
 
 from ...context_runtime.contracts import ContextEvidence, FinalContext
+from ...utils.template_registry import compile_template
 from ..summary_cache import CompressionCallRecord
 from .budget import extract_message_text, message_role
 from .config import ContextManagerConfig
@@ -29,6 +30,61 @@ from .step_renderer import StepRenderer
 logger = logging.getLogger("agent_context")
 
 
+class _RenderedSizeIndex:
+    """Running rendered-character total of a context, updated per swapped item.
+
+    Matches ``ContextManager._estimate_items`` without re-rendering everything:
+    an ungrouped item renders on its own, so its size comes from the manager's
+    per-item cache; items that share a ``render_group`` render as one message,
+    so only that group is re-rendered when one of its members is swapped.
+    """
+
+    def __init__(self, manager: "ContextManager", items, fixed_messages):
+        from .rendering import ContextItemRenderer
+        self._manager = manager
+        self._renderer = ContextItemRenderer()
+        self._groups: dict[str, list[ContextItem]] = {}
+        self._group_chars: dict[str, int] = {}
+        self._chars = sum(len(extract_message_text(message)) for message in fixed_messages)
+        for item in sorted(items, key=lambda item: item.layout_key):
+            group = item.metadata.get("render_group")
+            if group:
+                self._groups.setdefault(group, []).append(item)
+            else:
+                self._chars += manager._item_chars(item, self._renderer)
+        for group in self._groups:
+            self._render_group(group)
+
+    def tokens(self) -> int:
+        return max(0, int(self._chars / self._manager.config.chars_per_token))
+
+    def replace(self, original: ContextItem, replacement: ContextItem) -> None:
+        old_group = original.metadata.get("render_group")
+        new_group = replacement.metadata.get("render_group")
+        if old_group:
+            members = self._groups[old_group]
+            members[next(i for i, member in enumerate(members) if member is original)] = replacement
+            if new_group != old_group:
+                members.remove(replacement)
+        else:
+            self._chars -= self._manager._item_chars(original, self._renderer)
+        if new_group:
+            if new_group != old_group:
+                self._groups.setdefault(new_group, []).append(replacement)
+            self._groups[new_group].sort(key=lambda item: item.layout_key)
+            self._render_group(new_group)
+        else:
+            self._chars += self._manager._item_chars(replacement, self._renderer)
+        if old_group and old_group != new_group:
+            self._render_group(old_group)
+
+    def _render_group(self, group: str) -> None:
+        members = self._groups.get(group, [])
+        chars = sum(len(extract_message_text(message)) for message in self._renderer.render(members)) if members else 0
+        self._chars += chars - self._group_chars.get(group, 0)
+        self._group_chars[group] = chars
+
+
 class ContextManager:
     """Owns ordering, budget checks, compaction and final rendering."""
 
@@ -47,6 +103,9 @@ class ContextManager:
         self._history_compressor = HistoryCompressor(self._llm)
         self._history_candidate: HistorySummaryCandidate | None = None
         self._current_item_cache: dict[int, ContextItem] = {}
+        # Rendered character count per ungrouped item, keyed by id(item); the
+        # item is kept alongside so the id cannot be reused while cached.
+        self._item_chars_cache: dict[int, tuple[ContextItem, int]] = {}
         self._step_local_log: list[CompressionCallRecord] = []
         self.compression_calls_log: list[CompressionCallRecord] = []
         self._last_uncompressed_token_count: int | None = None
@@ -76,6 +135,7 @@ class ContextManager:
     ) -> ManagedRunContext:
         self._history_candidate = None
         self._current_item_cache.clear()
+        self._item_chars_cache.clear()
         source = self._item_source(items)
         if fallback_system_prompt and not any(
             item.type == ContextItemType.SYSTEM for item in source
@@ -198,8 +258,8 @@ class ContextManager:
                 new_summary_coverage=new_coverage, summary_persist_status=persist_status,
                 item_representations=representations,
                 current_action_compact_count=sum(
-                    kind == "compact" and next(item for item in final_items if item.id == item_id).type == ContextItemType.CURRENT_ACTION
-                    for item_id, kind in representations
+                    item.type == ContextItemType.CURRENT_ACTION and kind == "compact"
+                    for item, (_, kind) in zip(final_items, representations)
                 ),
                 representation_cache_hits=hits, representation_cache_misses=misses,
                 compact_exhausted=compact_exhausted, over_hard_budget=over_hard,
@@ -214,7 +274,10 @@ class ContextManager:
 
     def _compact_to_soft_budget(self, items, purpose_stable, purpose_dynamic, tools):
         result = list(items)
-        if self._estimate_items(result, purpose_stable, purpose_dynamic, tools) <= self._soft_input_budget_tokens():
+        soft_budget = self._soft_input_budget_tokens()
+        sizes = _RenderedSizeIndex(self, result, [*purpose_stable, *purpose_dynamic])
+        tools_tokens = self._tools_tokens(tools)
+        if sizes.tokens() + tools_tokens <= soft_budget:
             return result
         keep_recent = max(0, self.config.keep_recent_steps)
         actions = [item for item in result if item.type == ContextItemType.CURRENT_ACTION]
@@ -224,6 +287,7 @@ class ContextManager:
             item for item in result
             if item.type != ContextItemType.CURRENT_ACTION and item.supports_compact
         ]
+        positions = {id(item): index for index, item in enumerate(result)}
         # The stages are intentional: reclaim old current-run execution detail
         # before degrading stable resources or planning/evidence Items. Within a
         # stage, prefer the largest deterministic saving.
@@ -236,9 +300,11 @@ class ContextManager:
                 saving = max(0, item.token_estimate - compact.token_estimate)
                 savings.append((saving, item.layout_key, item, compact))
             for _, _, original, compact in sorted(savings, key=lambda row: (-row[0], row[1])):
-                index = result.index(original)
+                index = positions.pop(id(original))
                 result[index] = compact
-                if self._estimate_items(result, purpose_stable, purpose_dynamic, tools) <= self._soft_input_budget_tokens():
+                positions[id(compact)] = index
+                sizes.replace(original, compact)
+                if sizes.tokens() + tools_tokens <= soft_budget:
                     return result
         return result
 
@@ -306,16 +372,24 @@ class ContextManager:
             return [], []
         if not final_answer_templates:
             raise ValueError("final_answer purpose requires final_answer_templates")
-        from jinja2 import StrictUndefined, Template
+        from jinja2 import StrictUndefined
         template = final_answer_templates["final_answer"]
         return (
             [{"role": "system", "content": [{"type": "text", "text": template["pre_messages"]}]}],
-            [{"role": "user", "content": [{"type": "text", "text": Template(template["post_messages"], undefined=StrictUndefined).render(task=task or "")}]}],
+            [{"role": "user", "content": [{"type": "text", "text": compile_template(template["post_messages"], undefined=StrictUndefined).render(task=task or "")}]}],
         )
 
     def _estimate_items(self, items, stable, dynamic, tools):
         return self._message_tokens([*self.build_context_messages(items), *stable, *dynamic]) + self._tools_tokens(tools)
 
+    def _item_chars(self, item, renderer):
+        cached = self._item_chars_cache.get(id(item))
+        if cached is not None and cached[0] is item:
+            return cached[1]
+        chars = sum(len(extract_message_text(message)) for message in renderer.render([item]))
+        self._item_chars_cache[id(item)] = (item, chars)
+        return chars
+
     def _message_tokens(self, messages):
         return max(0, int(sum(len(extract_message_text(message)) for message in messages) / self.config.chars_per_token))
 
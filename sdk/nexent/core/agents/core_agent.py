@@ -23,7 +23,7 @@ from smolagents.utils import AgentExecutionError, AgentGenerationError, truncate
 from ...monitor import get_monitoring_manager
 
 from ..utils.observer import MessageObserver, ProcessType
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -37,6 +37,7 @@ from .verification import (
     render_guardrail_refusal,
     render_tool_input_refusal,
 )
+from ..utils.template_registry import compile_template
 from ..utils.token_estimation import msg_token_count
 from .plan_repo import PlanRepo
 
@@ -1048,7 +1049,7 @@ You have been provided with these additional arguments, that you can access usin
         """Adds additional prompting for the managed agent, runs it, and wraps the output.
         This method is called only by a managed agent.
         """
-        full_task = Template(self.prompt_templates["managed_agent"]["task"], undefined=StrictUndefined).render({
+        full_task = compile_template(self.prompt_templates["managed_agent"]["task"], undefined=StrictUndefined).render({
             "name": self.name, "task": task, **self.state
         })
         result = self.run(full_task, **kwargs)
@@ -1064,7 +1065,7 @@ You have been provided with these additional arguments, that you can access usin
         except Exception:
             self.observer.add_message(self.name, ProcessType.AGENT_FINISH, "")
 
-        answer = Template(self.prompt_templates["managed_agent"]["report"], undefined=StrictUndefined).render({
+        answer = compile_template(self.prompt_templates["managed_agent"]["report"], undefined=StrictUndefined).render({
             "name": self.name, "final_answer": report
         })
         if self.provide_run_summary:
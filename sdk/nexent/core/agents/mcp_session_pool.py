@@ -0,0 +1,294 @@
+"""Process-wide pool of MCP server sessions shared across agent runs."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("mcp_session_pool")
+
+SessionKey = Tuple[str, str, str]
+
+
+def mcp_session_key(config: Dict[str, Any]) -> SessionKey:
+    """
+    Build the pool key (url, transport, headers hash) for a normalized MCP config.
+
+    The key carries no tenant: runs of different tenants share a session when
+    they reach the same server with the same headers. Servers that scope data
+    per caller must receive a per-tenant credential in the headers, which then
+    gives each tenant its own session.
+    """
+    headers = config.get("headers") or {}
+    headers_hash = hashlib.sha256(
+        json.dumps(headers, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest() if headers else ""
+    return config["url"], config.get("transport", ""), headers_hash
+
+
+@dataclass
+class _PooledSession:
+    """One connected MCP server and the tool snapshot listed at connect time."""
+    key: SessionKey
+    tools: List[Any]
+    close: Callable[[], None]
+    probe: Optional[Callable[[], None]] = None
+    created_at: float = 0.0
+    last_used: float = 0.0
+    in_use: int = 0
+    retired: bool = False
+
+
+class PooledToolCollection:
+    """
+    Tool collection view over one or more pooled MCP sessions.
+
+    Exposes ``tools`` like ``smolagents.ToolCollection`` plus a name index used by
+    ``NexentAgent.create_mcp_tool``. When several servers expose the same tool
+    name, the first server in the run's MCP host list wins, matching a linear
+    search over the merged list.
+    """
+
+    def __init__(self, sessions: List[_PooledSession]):
+        self.tools: List[Any] = [tool for session in sessions for tool in session.tools]
+        self.tools_by_name: Dict[str, Any] = {}
+        for tool in self.tools:
+            self.tools_by_name.setdefault(getattr(tool, "name", None), tool)
+
+
+class MCPSessionPool:
+    """
+    Singleton pool of connected MCP servers keyed by (url, transport, headers hash).
+
+    Each server is connected once, its tools are listed once, and the session is
+    reused by later agent runs. Sessions idle for longer than
+    ``health_check_interval_s`` are pinged before reuse, sessions older than
+    ``max_age_s`` are reconnected, and sessions idle for ``idle_ttl_s`` are closed
+    by a background evictor.
+
+    Thread-safety: shared state is only touched under ``_lock``; connecting to a
+    server happens under a per-key lock so slow servers do not block others.
+
+    Pooled tool objects are shared by concurrent runs and must not be mutated;
+    ``NexentAgent.create_mcp_tool`` hands each run a shallow copy.
+
+    Usage::
+
+        with MCPSessionPool.get_instance().acquire(mcp_client_list) as tool_collection:
+            tool = tool_collection.tools_by_name["search"]
+    """
+
+    _instance: Optional["MCPSessionPool"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        idle_ttl_s: float = 300.0,
+        max_age_s: float = 3600.0,
+        health_check_interval_s: float = 30.0,
+        health_check_timeout_s: float = 5.0,
+    ) -> None:
+        self._sessions: Dict[SessionKey, _PooledSession] = {}
+        self._key_locks: Dict[SessionKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._idle_ttl_s = idle_ttl_s
+        self._max_age_s = max_age_s
+        self._health_check_interval_s = health_check_interval_s
+        self._health_check_timeout_s = health_check_timeout_s
+        self._evict_thread: Optional[threading.Thread] = None
+        self._stop_evict = threading.Event()
+
+    @classmethod
+    def get_instance(cls) -> "MCPSessionPool":
+        """Get or create the global MCPSessionPool singleton."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    cls._instance._start_evictor()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def acquire(self, configs: List[Dict[str, Any]]) -> Iterator[PooledToolCollection]:
+        """
+        Check out sessions for every MCP server of a run.
+
+        Args:
+            configs: Normalized MCP configs with ``url``, ``transport`` and optional ``headers``.
+
+        Yields:
+            PooledToolCollection over the servers' tools, valid until the block exits.
+        """
+        sessions: List[_PooledSession] = []
+        try:
+            for config in configs:
+                sessions.append(self._checkout(config))
+            yield PooledToolCollection(sessions)
+        finally:
+            for session in sessions:
+                self._release(session)
+
+    def invalidate(self, config: Dict[str, Any]) -> None:
+        """Retire a server's session so the next run reconnects."""
+        to_close = None
+        with self._lock:
+            session = self._sessions.pop(mcp_session_key(config), None)
+            if session is not None:
+                session.retired = True
+                if session.in_use == 0:
+                    to_close = session
+        if to_close is not None:
+            self._close(to_close)
+
+    def close_all(self) -> None:
+        """Close every idle session and retire the ones still in use."""
+        self._stop_evict.set()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            to_close = []
+            for session in sessions:
+                session.retired = True
+                if session.in_use == 0:
+                    to_close.append(session)
+        for session in to_close:
+            self._close(session)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _checkout(self, config: Dict[str, Any]) -> _PooledSession:
+        key = mcp_session_key(config)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            session = self._reuse(key)
+            if session is not None:
+                return session
+
+            tools, close, probe = self._open_session(config)
+            now = time.monotonic()
+            session = _PooledSession(
+                key=key, tools=list(tools), close=close, probe=probe,
+                created_at=now, last_used=now, in_use=1,
+            )
+            with self._lock:
+                self._sessions[key] = session
+            logger.info(f"Connected MCP server {key[0]} ({key[1]}) with {len(session.tools)} tools")
+            return session
+
+    def _reuse(self, key: SessionKey) -> Optional[_PooledSession]:
+        """Return a healthy pooled session with its use count taken, or None."""
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                return None
+            if now - session.created_at > self._max_age_s:
+                self._retire_locked(session)
+                return None
+            needs_probe = now - session.last_used > self._health_check_interval_s
+            session.in_use += 1
+            session.last_used = now
+
+        if needs_probe and not self._is_alive(session):
+            logger.warning(f"Pooled MCP session for {key[0]} failed health check, reconnecting")
+            self._release(session, retire=True)
+            return None
+        return session
+
+    def _release(self, session: _PooledSession, retire: bool = False) -> None:
+        to_close = None
+        with self._lock:
+            session.in_use -= 1
+            session.last_used = time.monotonic()
+            if retire:
+                self._retire_locked(session)
+            if session.retired and session.in_use == 0:
+                to_close = session
+        if to_close is not None:
+            self._close(to_close)
+
+    def _retire_locked(self, session: _PooledSession) -> None:
+        """Drop a session from the pool; it is closed once its last user releases it."""
+        if self._sessions.get(session.key) is session:
+            del self._sessions[session.key]
+        session.retired = True
+
+    def _is_alive(self, session: _PooledSession) -> bool:
+        if session.probe is None:
+            return True
+        try:
+            session.probe()
+            return True
+        except Exception as e:
+            logger.debug(f"MCP health check failed for {session.key[0]}: {e}")
+            return False
+
+    def _close(self, session: _PooledSession) -> None:
+        try:
+            session.close()
+        except Exception as e:
+            logger.warning(f"Failed to close MCP session for {session.key[0]}: {e}")
+
+    def _open_session(
+        self, config: Dict[str, Any]
+    ) -> Tuple[List[Any], Callable[[], None], Optional[Callable[[], None]]]:
+        """
+        Connect to one MCP server the way ``ToolCollection.from_mcp`` does.
+
+        Returns:
+            (tools, close, probe) where ``probe`` pings the server and raises on failure.
+        """
+        from mcpadapt.core import MCPAdapt
+        from mcpadapt.smolagents_adapter import SmolAgentsAdapter
+
+        adapter = MCPAdapt(config, SmolAgentsAdapter())
+        tools = adapter.__enter__()
+
+        def close() -> None:
+            adapter.__exit__(None, None, None)
+
+        def probe() -> None:
+            thread = getattr(adapter, "thread", None)
+            if thread is not None and not thread.is_alive():
+                raise ConnectionError("MCP adapter loop has stopped")
+            for client_session in getattr(adapter, "sessions", []):
+                asyncio.run_coroutine_threadsafe(
+                    client_session.send_ping(), adapter.loop
+                ).result(timeout=self._health_check_timeout_s)
+
+        return tools, close, probe
+
+    def _start_evictor(self) -> None:
+        """Launch the background idle-eviction thread."""
+        def _evict_loop() -> None:
+            while not self._stop_evict.wait(timeout=self._idle_ttl_s / 2):
+                self._evict_idle()
+
+        self._evict_thread = threading.Thread(target=_evict_loop, daemon=True, name="MCPSessionPoolEvictor")
+        self._evict_thread.start()
+
+    def _evict_idle(self) -> None:
+        """Close sessions nobody has used for longer than idle_ttl_s."""
+        deadline = time.monotonic() - self._idle_ttl_s
+        to_close = []
+        with self._lock:
+            for session in list(self._sessions.values()):
+                if session.in_use == 0 and session.last_used < deadline:
+                    self._retire_locked(session)
+                    to_close.append(session)
+        for session in to_close:
+            self._close(session)
+            logger.debug(f"Evicted idle MCP session for {session.key[0]}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import functools
 import inspect
 import json
@@ -320,10 +321,18 @@ class NexentAgent:
     def create_mcp_tool(self, class_name):
         if self.mcp_tool_collection is None:
             raise ValueError("MCP tool collection is not initialized")
-        tool_obj = next(
-            (tool for tool in self.mcp_tool_collection.tools if tool.name == class_name),
-            None
-        )
+        tools_by_name = getattr(self.mcp_tool_collection, "tools_by_name", None)
+        if isinstance(tools_by_name, dict):
+            tool_obj = tools_by_name.get(class_name)
+            if tool_obj is not None:
+                # Pooled tools are shared across runs; create_tool and the monitoring
+                # wrapper set attributes per run, so they get a per-run copy
+                tool_obj = copy.copy(tool_obj)
+        else:
+            tool_obj = next(
+                (tool for tool in self.mcp_tool_collection.tools if tool.name == class_name),
+                None
+            )
         if tool_obj is None:
             raise ValueError(f"{class_name} not found in MCP server")
         return tool_obj
@@ -5,13 +5,13 @@ from contextvars import copy_context
 from threading import Thread
 from typing import Any, Dict, Union
 
-from smolagents import ToolCollection
-
 from ...monitor import (
     set_monitoring_capacity_snapshot,
     set_monitoring_safe_input_budget_snapshot,
 )
+from ..utils.observer import ObserverMessageQueue
 from .agent_model import AgentRunInfo
+from .mcp_session_pool import MCPSessionPool
 from .nexent_agent import NexentAgent, ProcessType
 
 
@@ -167,7 +167,8 @@ def agent_run_thread(agent_run_info: AgentRunInfo):
                 "", ProcessType.AGENT_NEW_RUN, "<MCP_START>")
             mcp_client_list = [_normalize_mcp_config(item) for item in mcp_host]
 
-            with ToolCollection.from_mcp(mcp_client_list, trust_remote_code=True) as tool_collection:
+            # Pooled sessions skip the per-run connect, handshake and tool listing
+            with MCPSessionPool.get_instance().acquire(mcp_client_list) as tool_collection:
                 nexent = NexentAgent(
                     observer=agent_run_info.observer,
                     model_config_list=agent_run_info.model_config_list,
@@ -198,21 +199,43 @@ def agent_run_thread(agent_run_info: AgentRunInfo):
         raise ValueError(f"Error in agent_run_thread: {e}")
 
 
-async def agent_run(agent_run_info: AgentRunInfo):
+def _agent_run_thread_with_queue(agent_run_info: AgentRunInfo, message_queue: ObserverMessageQueue):
+    """Thread target: run the agent, then close the queue so the consumer can finish."""
+    try:
+        agent_run_thread(agent_run_info)
+    finally:
+        message_queue.close()
+
+
+async def agent_run(agent_run_info: AgentRunInfo, message_queue_maxsize: int = 0):
+    """
+    Run the agent in a worker thread and yield observer messages as they arrive.
+
+    The observer pushes messages into an ObserverMessageQueue that wakes this
+    coroutine through the event loop, so tokens are forwarded without polling
+    latency and idle runs cost no loop wakeups.
+
+    Args:
+        agent_run_info: Run configuration, including the MessageObserver.
+        message_queue_maxsize: When > 0, the agent thread blocks once this many
+            messages are waiting to be consumed (backpressure for slow clients).
+    """
     observer = agent_run_info.observer
+    message_queue = ObserverMessageQueue(asyncio.get_running_loop(), maxsize=message_queue_maxsize)
+    observer.attach_message_queue(message_queue)
 
     ctx = copy_context()
-    thread_agent = Thread(target=ctx.run, args=(agent_run_thread, agent_run_info))
-    thread_agent.start()
-
-    while thread_agent.is_alive():
-        cached_message = observer.get_cached_message()
-        for message in cached_message:
-            yield message
-            if len(cached_message) < 8:
-                await asyncio.sleep(0.05)
-        await asyncio.sleep(0.1)
-
-    cached_message = observer.get_cached_message()
-    for message in cached_message:
-        yield message
+    thread_agent = Thread(target=ctx.run, args=(_agent_run_thread_with_queue, agent_run_info, message_queue))
+    try:
+        thread_agent.start()
+        while True:
+            messages = await message_queue.get_batch()
+            if not messages:
+                break
+            for message in messages:
+                yield message
+    finally:
+        # Unblock a producer waiting on a bounded queue if the consumer went away;
+        # messages emitted after detaching are cached by the observer again.
+        message_queue.close()
+        observer.detach_message_queue()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional
 
@@ -68,6 +70,39 @@ GuardrailSource = Literal["new_input", "history", "tool_input", "tool_output"]
 
 EffectiveAction = Literal["pass", "mask", "block", "terminate"]
 
+# Characters that make a rule pattern a regex rather than a plain literal.
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_trie_pattern(literals: List[str]) -> str:
+    """Build one regex matching any of ``literals``, factored by common prefix.
+
+    A flat alternation of N literals costs N attempts per text position in
+    ``re``; the trie form branches on one character at a time, so a clean text
+    is rejected in roughly a single pass. Matching stops at the shortest
+    literal, which is enough for a prefilter.
+
+    Args:
+        literals: Non-empty literal strings.
+
+    Returns:
+        A pattern string matching exactly the union of ``literals``.
+    """
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node: Dict[str, Any]) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
 
 class SeverityResolver:
     """Resolve ``(user_severity, source) -> effective_action``.
@@ -154,9 +189,12 @@ class GuardrailDecision:
 class GuardrailEngine:
     """Pattern-matching guardrail engine for LLM input and tool output screening.
 
-    Pre-compiles regex patterns (first match wins). All public methods are
-    fail-open -- engine errors degrade to a pass so the guardrail never
-    becomes an attack surface.
+    Pre-compiles regex patterns (first match wins). Literal rules are also
+    folded into one prefix-trie prefilter so clean text skips them in a single
+    pass, and ``check_input`` caches each message's scan by content
+    fingerprint, so across a run only new or edited messages are rescanned.
+    All public methods are fail-open -- engine errors degrade to a pass so the
+    guardrail never becomes an attack surface.
 
     Args:
         config: Guardrail configuration loaded from AgentVerificationConfig.
@@ -171,7 +209,14 @@ class GuardrailEngine:
         self._breaker_last_sig: Optional[tuple] = None
         self._breaker_repeat: int = 0
         self._breaker_threshold: int = 2
-
+        # Rules the literal prefilter can't rule out; always scanned.
+        self._regex_rules: List[tuple] = []
+        self._literal_prefilter: Optional[re.Pattern] = None
+        # check_input verdicts: content fingerprint -> _scan result, LRU-bounded.
+        self._verdicts: "OrderedDict[bytes, List[tuple]]" = OrderedDict()
+        self._verdict_cache_size: int = 4096
+
+        literals: List[str] = []
         for rule in config.rules:
             try:
                 compiled = re.compile(rule.pattern, re.IGNORECASE)
@@ -179,6 +224,17 @@ class GuardrailEngine:
             except re.error:
                 # Skip invalid patterns so one bad rule can't disable the engine.
                 continue
+            if rule.pattern and not _REGEX_METACHARS.intersection(rule.pattern):
+                literals.append(rule.pattern)
+            else:
+                self._regex_rules.append((compiled, rule))
+        if literals:
+            try:
+                self._literal_prefilter = re.compile(
+                    _literal_trie_pattern(literals), re.IGNORECASE
+                )
+            except re.error:
+                self._regex_rules = list(self._rules)
 
     @property
     def rule_count(self) -> int:
@@ -207,13 +263,8 @@ class GuardrailEngine:
             new_input_idx = self._find_new_input_index(input_messages)
             overall = "pass"
             chosen = None  # (rule, matched_text, source, user_severity)
-            any_mask = False
-            # Shallow-copy each message so we can rewrite content on mask.
-            messages_copy = [
-                (dict(m) if isinstance(m, dict) else m)
-                for m in (input_messages or [])
-            ]
-            for i, msg in enumerate(messages_copy):
+            masked_by_index: Dict[int, str] = {}
+            for i, msg in enumerate(input_messages or []):
                 source = "new_input" if i == new_input_idx else "history"
                 screened = self._screen_message(msg, source)
                 if screened is None:
@@ -223,12 +274,21 @@ class GuardrailEngine:
                     overall = eff
                     chosen = (rule, matched_text, source, user_sev)
                 if masked_content is not None:
-                    any_mask = True
-                    self._set_msg_text(msg, masked_content)
+                    masked_by_index[i] = masked_content
 
             if chosen is None:
                 return self._pass_decision("new_input", "guardrail_input")
 
+            messages_copy = None
+            if masked_by_index:
+                # Shallow-copy each message so we can rewrite content on mask.
+                messages_copy = [
+                    (dict(m) if isinstance(m, dict) else m)
+                    for m in input_messages
+                ]
+                for i, masked_content in masked_by_index.items():
+                    self._set_msg_text(messages_copy[i], masked_content)
+
             rule, matched_text, source, user_sev = chosen
             eff = self._apply_breaker(rule.name, matched_text, source, overall)
             downgraded = SeverityResolver.is_downgraded(user_sev, eff)
@@ -243,7 +303,7 @@ class GuardrailEngine:
                 rule_name=rule.name,
                 matched_texts=[matched_text],
                 verification_result=vr,
-                masked_messages=messages_copy if any_mask else None,
+                masked_messages=messages_copy,
             )
         except Exception:
             # Fail-open: the engine's own bug must never block the agent.
@@ -262,7 +322,7 @@ class GuardrailEngine:
             text when the action is ``mask``, otherwise ``None``.
         """
         content = self._msg_text(msg)
-        matches = self._scan(content)
+        matches = self._scan_cached(content)
         if not matches:
             return None
         first_rule = matches[0][1]
@@ -493,7 +553,10 @@ class GuardrailEngine:
         results: List[tuple] = []
         if not text:
             return results
-        for compiled, rule in self._rules:
+        rules = self._rules
+        if self._literal_prefilter is not None and not self._literal_prefilter.search(text):
+            rules = self._regex_rules
+        for compiled, rule in rules:
             try:
                 texts = [m.group(0) for m in compiled.finditer(text)]
             except Exception:
@@ -502,6 +565,33 @@ class GuardrailEngine:
                 results.append((compiled, rule, texts))
         return results
 
+    def _scan_cached(self, text: str) -> List[tuple]:
+        """``_scan`` memoized by a fingerprint of ``text``.
+
+        The prompt is resent on every step, so history messages repeat; only
+        new or edited content reaches ``_scan``.
+
+        Args:
+            text: Text to scan against every compiled rule.
+
+        Returns:
+            The ``_scan`` result for ``text``; treat it as read-only.
+        """
+        if not text:
+            return []
+        key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cached = self._verdicts.get(key)
+        if cached is not None:
+            self._verdicts.move_to_end(key)
+            return cached
+        matches = self._scan(text)
+        self._verdicts[key] = matches
+        if len(self._verdicts) > self._verdict_cache_size:
+            self._verdicts.popitem(last=False)
+        return matches
+
     def _mask_value(self, value: Any, matches: List[tuple]) -> Any:
         """Redact matched spans in a string arg value; non-strings pass through.
 
@@ -0,0 +1,176 @@
+"""
+Async HTTP helpers shared by the embedding and rerank model clients.
+
+Requests go through pooled ``httpx.AsyncClient`` instances: one keep-alive
+(HTTP/2 when available) pool per provider origin and per running event loop,
+shared by every model instance that talks to that origin from that loop. The
+absolute request URL is passed per call, so the pool is not tied to a single
+API path. An httpx client can only be used on the loop that opened its
+connections, so callers on the API loop, on ``asyncio.run`` based workers and
+on ``BackgroundLoopRunner`` each get their own pool; a pool is released with
+its loop.
+
+``RequestCoalescer`` micro-batches concurrent single-item calls into one
+batched provider request.
+"""
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from ...utils.http_client_manager import _http2_available
+
+logger = logging.getLogger("async_model_client")
+
+# Default pool timeout; each request passes its own timeout.
+POOL_TIMEOUT = 60.0
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Pooled clients by event loop, then by (origin, verify_ssl)
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, bool], httpx.AsyncClient]]" = \
+    weakref.WeakKeyDictionary()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_model_async_client(url: str, verify_ssl: bool = True) -> httpx.AsyncClient:
+    """Pooled async client for the origin of ``url`` on the running event loop."""
+    clients = _loop_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (_origin(url), verify_ssl)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=key[0],
+            timeout=POOL_TIMEOUT,
+            verify=verify_ssl,
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            trust_env=False,
+        )
+        clients[key] = client
+        logger.info(f"Created async model client for {key[0]}")
+    return client
+
+
+async def post_json(
+    url: str,
+    headers: Dict[str, str],
+    data: Dict[str, Any],
+    timeout: Optional[float] = None,
+    verify_ssl: bool = True,
+) -> Dict[str, Any]:
+    """POST ``data`` as JSON over the pooled client and return the decoded response."""
+    client = get_model_async_client(url, verify_ssl)
+    response = await client.post(
+        url, headers=headers, json=data, timeout=timeout if timeout is not None else POOL_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+async def post_json_with_retries(
+    url: str,
+    headers: Dict[str, str],
+    data: Dict[str, Any],
+    timeouts: Sequence[float],
+    verify_ssl: bool = True,
+    service_name: str = "Model API",
+) -> Dict[str, Any]:
+    """
+    POST with one attempt per entry in ``timeouts``, retrying only on timeouts.
+
+    Mirrors the linear timeout back-off of the synchronous clients.
+    """
+    attempts = len(timeouts)
+    for attempt_index, current_timeout in enumerate(timeouts):
+        try:
+            return await post_json(url, headers, data, timeout=current_timeout, verify_ssl=verify_ssl)
+        except httpx.TimeoutException:
+            logger.warning(
+                f"{service_name} timed out in {current_timeout}s ({attempt_index + 1}/{attempts})")
+            if attempt_index == attempts - 1:
+                logger.error(f"{service_name} timed out after all retries.")
+                raise
+    return {}
+
+
+class RequestCoalescer(Generic[T, R]):
+    """
+    Micro-batches concurrent single-item calls into one call of ``batch_fn``.
+
+    Items submitted within ``max_wait_seconds`` of the first pending item (or
+    until ``max_batch_size`` items are pending) are sent together; each caller
+    receives the result at its own position. A failed batch fails every caller
+    in it. Pending batches are tracked per event loop.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.005,
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Tuple[T, asyncio.Future]]]" = \
+            weakref.WeakKeyDictionary()
+        self._timers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle]" = \
+            weakref.WeakKeyDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches_sent = 0
+        self.items_sent = 0
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((item, future))
+        if len(pending) >= self._max_batch_size:
+            self._flush(loop)
+        elif loop not in self._timers:
+            self._timers[loop] = loop.call_later(self._max_wait_seconds, self._flush, loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(loop, [])
+        if not batch:
+            return
+        task = loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        self.batches_sent += 1
+        self.items_sent += len(batch)
+        try:
+            results = await self._batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batched call returned {len(results)} results for {len(batch)} inputs")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
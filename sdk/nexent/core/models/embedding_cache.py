@@ -0,0 +1,193 @@
+"""Content-addressed embedding cache: local LRU + optional Redis tier.
+
+Vectors are keyed by (model name, dimension, sha256(normalized text)), so an
+unchanged chunk that is re-uploaded or re-indexed, or a repeated query, is
+served without another embedding API call.
+
+The cache is disabled unless a process installs one with ``set_embedding_cache``.
+The Redis client is passed in by the caller, not created from environment
+variables.
+"""
+
+import asyncio
+import hashlib
+import logging
+import unicodedata
+from typing import Dict, List, Optional, Union
+
+from ...monitor.monitoring import get_monitoring_manager
+from ..utils.async_runner import BackgroundLoopRunner
+from ..utils.two_tier_cache import TwoTierCache
+from .embedding_model import BaseEmbedding
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache(TwoTierCache):
+    """Two-tier embedding cache with hit/miss and API call accounting."""
+
+    NAME = "Embedding cache"
+    KEY_PREFIX = "emb"
+    DEFAULT_MAX_ENTRIES = 20000
+    DEFAULT_TTL_SECONDS = 7 * 86400  # 7 days
+    EXTRA_STATS = {"api_calls": 0, "saved_api_calls": 0}
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        return unicodedata.normalize("NFC", text).strip()
+
+    @classmethod
+    def make_key(cls, model_name: str, dimension: Optional[int], text: str) -> str:
+        digest = hashlib.sha256(cls.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{cls.KEY_PREFIX}:{model_name}:{dimension or 0}:{digest}"
+
+    def record_api_call(self, saved: bool) -> None:
+        self._add_stat("saved_api_calls" if saved else "api_calls")
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
+    """Install (or with None, remove) the process-wide embedding cache."""
+    global _embedding_cache
+    _embedding_cache = cache
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    return _embedding_cache
+
+
+def _model_identity(embedding_model):
+    model_name = getattr(embedding_model, "model", None) or getattr(
+        embedding_model, "embedding_model_name", "unknown")
+    return model_name, getattr(embedding_model, "embedding_dim", None)
+
+
+def _missing_texts(keys: List[str], texts: List[str], vectors: List[Optional[List[float]]]) -> Dict[str, str]:
+    """Cache misses keyed by cache key, de-duplicated, in input order."""
+    missing: Dict[str, str] = {}
+    for key, text, vector in zip(keys, texts, vectors):
+        if vector is None and key not in missing:
+            missing[key] = text
+    return missing
+
+
+def _merge_fetched(
+    cache: EmbeddingCache,
+    model_name: str,
+    keys: List[str],
+    vectors: List[Optional[List[float]]],
+    missing: Dict[str, str],
+    fetched: List[List[float]],
+) -> List[List[float]]:
+    """Store freshly fetched vectors, record accounting and return one vector per key."""
+    if missing:
+        if len(fetched) != len(missing):
+            raise ValueError(
+                f"Embedding model returned {len(fetched)} vectors for {len(missing)} inputs")
+        new_vectors = dict(zip(missing.keys(), fetched))
+        cache.put_many(new_vectors)
+        vectors = [vector if vector is not None else new_vectors[key]
+                   for key, vector in zip(keys, vectors)]
+    cache.record_api_call(saved=not missing)
+
+    hits = sum(1 for key in keys if key not in missing)
+    monitoring = get_monitoring_manager()
+    attributes = {"model": model_name}
+    monitoring.record_counter(
+        "embedding.cache.hits", hits, attributes, description="Texts served from the embedding cache")
+    monitoring.record_counter(
+        "embedding.cache.misses", len(missing), attributes, description="Texts sent to the embedding model")
+    if not missing:
+        monitoring.record_counter(
+            "embedding.cache.saved_api_calls", 1, attributes,
+            description="Embedding API calls avoided by the cache")
+    return vectors
+
+
+def embed_texts(
+    embedding_model,
+    inputs: Union[str, List[str]],
+    cache: Optional[EmbeddingCache] = None,
+) -> List[List[float]]:
+    """
+    Embed texts through the embedding cache.
+
+    Only texts missing from the cache are sent to the model, de-duplicated, in one call.
+    Falls back to a direct ``get_embeddings`` call when no cache is installed.
+
+    Args:
+        embedding_model: Model providing ``get_embeddings`` and identifying the vector space
+        inputs: A text string or a list of text strings
+        cache: Cache to use instead of the process-wide one
+
+    Returns:
+        One embedding vector per input, in input order
+    """
+    cache = cache or get_embedding_cache()
+    texts = [inputs] if isinstance(inputs, str) else list(inputs)
+    if cache is None or not texts:
+        return embedding_model.get_embeddings(inputs)
+
+    model_name, dimension = _model_identity(embedding_model)
+    keys = [EmbeddingCache.make_key(model_name, dimension, text) for text in texts]
+    vectors = cache.get_many(keys)
+    missing = _missing_texts(keys, texts, vectors)
+    fetched = embedding_model.get_embeddings(list(missing.values())) if missing else []
+    return _merge_fetched(cache, model_name, keys, vectors, missing, fetched)
+
+
+async def aembed_texts(
+    embedding_model,
+    inputs: Union[str, List[str]],
+    cache: Optional[EmbeddingCache] = None,
+) -> List[List[float]]:
+    """
+    Async version of embed_texts using the model's ``aget_embeddings``.
+
+    Cache lookups and writes that touch Redis run in a worker thread; the
+    embedding request itself goes through the model's pooled async client.
+    """
+    cache = cache or get_embedding_cache()
+    texts = [inputs] if isinstance(inputs, str) else list(inputs)
+    if cache is None or not texts:
+        return await embedding_model.aget_embeddings(inputs)
+
+    model_name, dimension = _model_identity(embedding_model)
+    keys = [EmbeddingCache.make_key(model_name, dimension, text) for text in texts]
+    if cache.has_remote_tier:
+        vectors = await asyncio.to_thread(cache.get_many, keys)
+    else:
+        vectors = cache.get_many(keys)
+    missing = _missing_texts(keys, texts, vectors)
+    if not missing:
+        fetched = []
+    elif len(missing) == 1:
+        # A single text lets the model coalesce it with concurrent lookups
+        fetched = await embedding_model.aget_embeddings(next(iter(missing.values())))
+    else:
+        fetched = await embedding_model.aget_embeddings(list(missing.values()))
+    if missing and cache.has_remote_tier:
+        return await asyncio.to_thread(_merge_fetched, cache, model_name, keys, vectors, missing, fetched)
+    return _merge_fetched(cache, model_name, keys, vectors, missing, fetched)
+
+
+def embed_query(
+    embedding_model,
+    text: str,
+    cache: Optional[EmbeddingCache] = None,
+) -> List[float]:
+    """
+    Embed one search query from synchronous code.
+
+    The lookup runs ``aembed_texts`` on the shared ``BackgroundLoopRunner`` loop,
+    so concurrent queries from different threads (parallel knowledge base
+    searches, memory lookups) are coalesced by the model into one provider
+    request over its pooled client. Models that are not a ``BaseEmbedding`` and
+    calls made on the runner's own thread take the synchronous path.
+    """
+    runner = BackgroundLoopRunner.get_instance()
+    if not isinstance(embedding_model, BaseEmbedding) or runner.in_loop_thread():
+        return embed_texts(embedding_model, text, cache)[0]
+    return runner.run(aembed_texts(embedding_model, text, cache))[0]
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 import requests
 
 from ...monitor.monitoring import record_model_call
+from .async_model_client import RequestCoalescer, post_json_with_retries
 
 # Path to test assets directory
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets")
@@ -64,6 +65,63 @@ class BaseEmbedding(ABC):
         """
         pass
 
+    # Concurrent single-text aget_embeddings calls within this window are sent as one request
+    COALESCE_MAX_BATCH_SIZE = 32
+    COALESCE_MAX_WAIT_SECONDS = 0.005
+
+    @property
+    def coalescer(self) -> RequestCoalescer:
+        coalescer = self.__dict__.get("_coalescer")
+        if coalescer is None:
+            coalescer = RequestCoalescer(
+                self._aget_text_embeddings,
+                max_batch_size=self.COALESCE_MAX_BATCH_SIZE,
+                max_wait_seconds=self.COALESCE_MAX_WAIT_SECONDS,
+            )
+            self.__dict__["_coalescer"] = coalescer
+        return coalescer
+
+    async def aget_embeddings(
+        self,
+        inputs: Union[str, List[str]],
+        with_metadata: bool = False,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> Union[List[List[float]], Dict[str, Any]]:
+        """
+        Async version of get_embeddings.
+
+        Concurrent single-text calls with the default timeout and no metadata are
+        coalesced into one provider request.
+
+        Args:
+            inputs: A text string or a list of text strings
+            with_metadata: Whether to return the full response with metadata
+            timeout: Base timeout in seconds for the first attempt. If None, uses retry_timeout_step.
+            retries: Number of retries on timeout (not counting the first attempt)
+            retry_timeout_step: Linear increment in seconds for each retry timeout
+
+        Returns:
+            If with_metadata is False, returns a list of embedding vectors; otherwise, returns a dictionary containing embeddings and metadata
+        """
+        if isinstance(inputs, str) and not with_metadata and timeout is None:
+            return [await self.coalescer.submit(inputs)]
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        return await self._aget_text_embeddings(texts, with_metadata, timeout, retries, retry_timeout_step)
+
+    async def _aget_text_embeddings(
+        self,
+        inputs: List[str],
+        with_metadata: bool = False,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> Union[List[List[float]], Dict[str, Any]]:
+        """Embed a batch of texts; models without a native async client use a worker thread."""
+        return await asyncio.to_thread(
+            self.get_embeddings, inputs, with_metadata, timeout, retries, retry_timeout_step)
+
     @abstractmethod
     async def dimension_check(self, timeout: float = 5.0) -> List[List[float]]:
         """
@@ -164,6 +222,12 @@ class MultimodalEmbedding(BaseEmbedding):
         pass
 
 
+def _retry_timeouts(timeout: Optional[float], retries: int, retry_timeout_step: float) -> List[float]:
+    """Per-attempt timeouts, same linear back-off as the synchronous retry loops."""
+    base_timeout = timeout if timeout is not None else retry_timeout_step
+    return [base_timeout + attempt_index * retry_timeout_step for attempt_index in range(retries + 1)]
+
+
 class JinaEmbedding(MultimodalEmbedding):
     def __init__(
         self,
@@ -313,6 +377,39 @@ class JinaEmbedding(MultimodalEmbedding):
                 raise last_timeout
             return []
 
+    async def _aget_text_embeddings(
+        self,
+        inputs: List[str],
+        with_metadata: bool = False,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> Union[List[List[float]], Dict[str, Any]]:
+        return await self.aget_multimodal_embeddings(
+            [{"text": item} for item in inputs], with_metadata, timeout, retries, retry_timeout_step)
+
+    async def aget_multimodal_embeddings(
+        self,
+        inputs: List[Dict[str, str]],
+        with_metadata: bool = False,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> Union[List[List[float]], Dict[str, Any]]:
+        """Async version of get_multimodal_embeddings using the pooled HTTP client."""
+        with record_model_call("multi_embedding", self.model, display_name=self.model):
+            response = await post_json_with_retries(
+                self.api_url,
+                self.headers,
+                self._prepare_multimodal_input(inputs),
+                _retry_timeouts(timeout, retries, retry_timeout_step),
+                verify_ssl=self.ssl_verify,
+                service_name="JinaEmbedding API",
+            )
+            if with_metadata:
+                return response
+            return [item["embedding"] for item in response["data"]]
+
     async def dimension_check(self, timeout: float = 5.0) -> List[List[float]]:
         try:
             # Create multimodal test input with both text and image
@@ -551,6 +648,27 @@ class OpenAICompatibleEmbedding(TextEmbedding):
                 raise last_timeout
             return []
 
+    async def _aget_text_embeddings(
+        self,
+        inputs: List[str],
+        with_metadata: bool = False,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> Union[List[List[float]], Dict[str, Any]]:
+        with record_model_call("embedding", self.model, display_name=self.model):
+            response = await post_json_with_retries(
+                self.api_url,
+                self.headers,
+                self._prepare_input(inputs),
+                _retry_timeouts(timeout, retries, retry_timeout_step),
+                verify_ssl=self.ssl_verify,
+                service_name="OpenAI API",
+            )
+            if with_metadata:
+                return response
+            return [item["embedding"] for item in response["data"]]
+
     async def dimension_check(self, timeout: float = 5.0) -> List[List[float]]:
         try:
             # Create a simple test input
@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from .async_model_client import post_json_with_retries
+
 
 class BaseRerank(ABC):
     """
@@ -50,6 +52,19 @@ class BaseRerank(ABC):
         """
         pass
 
+    async def arerank(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of rerank.
+
+        Models without a native async client run rerank in a worker thread.
+        """
+        return await asyncio.to_thread(self.rerank, query, documents, top_n)
+
     @abstractmethod
     async def connectivity_check(self, timeout: float = 5.0) -> bool:
         """
@@ -70,6 +85,11 @@ class OpenAICompatibleRerank(BaseRerank):
     Supports any API that follows the OpenAI reranking format.
     """
 
+    # Timeout of the first attempt, increased linearly on each retry
+    BASE_TIMEOUT = 30.0
+    RETRY_TIMEOUT_STEP = 10.0
+    ATTEMPTS = 4
+
     def __init__(
         self,
         model_name: str,
@@ -148,6 +168,28 @@ class OpenAICompatibleRerank(BaseRerank):
         response.raise_for_status()
         return response.json()
 
+    @staticmethod
+    def _parse_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Normalize DashScope and OpenAI-compatible rerank responses."""
+        # DashScope returns results in {"output": {"results": [...]}}
+        # OpenAI-compatible returns {"results": [...]}
+        results = response.get("results") or response.get("output", {}).get("results", [])
+
+        reranked_results = []
+        for r in results:
+            # DashScope returns document as {"text": "..."}, others return string directly
+            doc = r.get("document")
+            if isinstance(doc, dict):
+                doc_text = doc.get("text")
+            else:
+                doc_text = doc
+            reranked_results.append({
+                "index": r.get("index"),
+                "relevance_score": r.get("relevance_score"),
+                "document": doc_text,
+            })
+        return reranked_results
+
     def rerank(
         self,
         query: str,
@@ -170,32 +212,15 @@ class OpenAICompatibleRerank(BaseRerank):
 
         data = self._prepare_request(query, documents, top_n)
 
-        base_timeout = 30.0
-        attempts = 4
+        base_timeout = self.BASE_TIMEOUT
+        attempts = self.ATTEMPTS
         last_exception = None
 
         for attempt_index in range(attempts):
-            current_timeout = base_timeout + attempt_index * 10.0
+            current_timeout = base_timeout + attempt_index * self.RETRY_TIMEOUT_STEP
             try:
                 response = self._make_request(data, timeout=current_timeout)
-                # DashScope returns results in {"output": {"results": [...]}}
-                # OpenAI-compatible returns {"results": [...]}
-                results = response.get("results") or response.get("output", {}).get("results", [])
-
-                reranked_results = []
-                for r in results:
-                    # DashScope returns document as {"text": "..."}, others return string directly
-                    doc = r.get("document")
-                    if isinstance(doc, dict):
-                        doc_text = doc.get("text")
-                    else:
-                        doc_text = doc
-                    reranked_results.append({
-                        "index": r.get("index"),
-                        "relevance_score": r.get("relevance_score"),
-                        "document": doc_text,
-                    })
-                return reranked_results
+                return self._parse_response(response)
 
             except requests.exceptions.Timeout as e:
                 logging.warning(
@@ -215,6 +240,36 @@ class OpenAICompatibleRerank(BaseRerank):
             raise last_exception
         return []
 
+    async def arerank(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of rerank using the pooled HTTP client.
+
+        Args:
+            query: The search query
+            documents: List of document texts to rerank
+            top_n: Number of top results to return
+
+        Returns:
+            List of reranked results with index and relevance_score
+        """
+        if not documents:
+            return []
+
+        response = await post_json_with_retries(
+            self.api_url,
+            self.headers,
+            self._prepare_request(query, documents, top_n),
+            [self.BASE_TIMEOUT + attempt_index * self.RETRY_TIMEOUT_STEP for attempt_index in range(self.ATTEMPTS)],
+            verify_ssl=self.ssl_verify,
+            service_name="Rerank API",
+        )
+        return self._parse_response(response)
+
     async def rerank_async(
         self,
         query: str,
@@ -222,7 +277,7 @@ class OpenAICompatibleRerank(BaseRerank):
         top_n: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Async version of rerank.
+        Async version of rerank, kept for existing callers of this name.
 
         Args:
             query: The search query
@@ -232,7 +287,7 @@ class OpenAICompatibleRerank(BaseRerank):
         Returns:
             List of reranked results
         """
-        return await asyncio.to_thread(self.rerank, query, documents, top_n)
+        return await self.arerank(query, documents, top_n)
 
     async def connectivity_check(self, timeout: float = 5.0) -> bool:
         """
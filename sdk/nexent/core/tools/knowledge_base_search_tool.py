@@ -1,15 +1,18 @@
 import json
 import logging
 import os
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
 from pydantic import Field
 from pydantic.fields import FieldInfo
 from smolagents.tools import Tool
 
 from ...vector_database.base import VectorDatabaseCore
+from ...vector_database.search_result_cache import get_search_result_cache
 from ..models.embedding_model import BaseEmbedding
 from ..models.rerank_model import BaseRerank
+from ..utils.async_runner import BackgroundLoopRunner
 from ..utils.constants import RERANK_OVERSEARCH_MULTIPLIER
 from ..utils.observer import MessageObserver, ProcessType
 from ..utils.tools_common_message import (
@@ -291,26 +294,31 @@ class KnowledgeBaseSearchTool(Tool):
         if len(search_index_names) == 0:
             return json.dumps("No knowledge base selected. No relevant information found.", ensure_ascii=False)
 
-        kb_search_data = self._run_search(
-            query=query,
-            index_names=search_index_names,
-            search_mode=search_mode,
-            top_k=effective_top_k,
+        document_paths = _unwrap_field_info(self._internal_document_paths) or None
+        rerank_model_name = (
+            _unwrap_field_info(self.rerank_model_name) if self.rerank and self.rerank_model else None
         )
-        kb_search_results = kb_search_data["results"]
-
-        # Apply document_paths access control: filter out results not in allowed list
-        kb_search_results = self._filter_by_document_paths(kb_search_results)
-
-        if not kb_search_results:
-            raise Exception("No results found! Try a less restrictive/shorter query.")
 
-        if self.rerank and self.rerank_model and kb_search_results:
-            kb_search_results = self._apply_rerank(
+        # Repeated searches of unchanged indices are served from the shared result cache
+        cache = get_search_result_cache()
+        cache_key = None
+        kb_search_results = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                search_index_names, query, search_mode, effective_top_k, document_paths, rerank_model_name)
+            kb_search_results = cache.get(cache_key)
+
+        if kb_search_results is None:
+            started = time.perf_counter()
+            kb_search_results, cacheable = self._search_and_rerank(
                 query=query,
-                kb_search_results=kb_search_results,
-                top_k=self.top_k,
+                index_names=search_index_names,
+                search_mode=search_mode,
+                top_k=effective_top_k,
+                document_paths=document_paths,
             )
+            if cache is not None and cacheable:
+                cache.put(cache_key, kb_search_results, (time.perf_counter() - started) * 1000)
 
         (
             search_results_json,
@@ -328,6 +336,45 @@ class KnowledgeBaseSearchTool(Tool):
 
         return json.dumps(search_results_return, ensure_ascii=False)
 
+    def _search_and_rerank(
+        self,
+        query: str,
+        index_names: List[str],
+        search_mode: str,
+        top_k: int,
+        document_paths: Optional[List[str]],
+    ) -> Tuple[List[dict], bool]:
+        """Search and rerank; the flag is False when a failed rerank left the raw order."""
+        # document_paths access control is pushed into the VDB query, so top_k (and the
+        # rerank candidates) are drawn from allowed documents only
+        kb_search_data = self._run_search(
+            query=query,
+            index_names=index_names,
+            search_mode=search_mode,
+            top_k=top_k,
+            document_paths=document_paths,
+        )
+        kb_search_results = kb_search_data["results"]
+
+        # Defense in depth: drop anything the VDB returned outside the allowed list
+        kb_search_results = self._filter_by_document_paths(kb_search_results)
+
+        if not kb_search_results:
+            raise Exception("No results found! Try a less restrictive/shorter query.")
+
+        if self.rerank and self.rerank_model and kb_search_results:
+            try:
+                kb_search_results = self._apply_rerank(
+                    query=query,
+                    kb_search_results=kb_search_results,
+                    top_k=self.top_k,
+                )
+            except Exception as e:
+                # Not cached, so the next identical search retries the rerank
+                logger.warning("Reranking failed, using original results: %s", str(e))
+                return kb_search_results, False
+        return kb_search_results, True
+
     def _notify_search_start(self, query: str) -> None:
         if not self.observer:
             return
@@ -336,7 +383,14 @@ class KnowledgeBaseSearchTool(Tool):
             "", ProcessType.CARD, json.dumps(card_content, ensure_ascii=False)
         )
 
-    def _run_search(self, query: str, index_names: List[str], search_mode: str, top_k: int):
+    def _run_search(
+        self,
+        query: str,
+        index_names: List[str],
+        search_mode: str,
+        top_k: int,
+        document_paths: Optional[List[str]] = None,
+    ):
         search_handlers = {
             "hybrid": self.search_hybrid,
             "accurate": self.search_accurate,
@@ -347,7 +401,7 @@ class KnowledgeBaseSearchTool(Tool):
             raise Exception(
                 f"Invalid search mode: {search_mode}, only support: hybrid, accurate, semantic"
             )
-        return handler(query=query, index_names=index_names, top_k=top_k)
+        return handler(query=query, index_names=index_names, top_k=top_k, document_paths=document_paths)
 
     def _apply_rerank(
         self,
@@ -355,41 +409,43 @@ class KnowledgeBaseSearchTool(Tool):
         kb_search_results: List[dict],
         top_k: int,
     ) -> List[dict]:
-        try:
-            documents = [result.get("content", "") for result in kb_search_results]
-            reranked_results = self.rerank_model.rerank(
-                query=query,
-                documents=documents,
-                top_n=len(documents),
+        """Reorder results by rerank score; errors of the rerank model propagate."""
+        documents = [result.get("content", "") for result in kb_search_results]
+        reranked_results = self.rerank_model.rerank(
+            query=query,
+            documents=documents,
+            top_n=len(documents),
+        )
+        if not reranked_results:
+            return kb_search_results
+
+        original_results_map = {
+            i: kb_search_results[i] for i in range(len(kb_search_results))
+        }
+        reranked_top_results = []
+        for reranked_item in reranked_results[:top_k]:
+            orig_idx = reranked_item.get("index")
+            if orig_idx is None or orig_idx not in original_results_map:
+                continue
+            result = original_results_map[orig_idx]
+            result["score"] = reranked_item.get(
+                "relevance_score", result.get("score", 0)
             )
-            if not reranked_results:
-                return kb_search_results
+            reranked_top_results.append(result)
 
-            original_results_map = {
-                i: kb_search_results[i] for i in range(len(kb_search_results))
-            }
-            reranked_top_results = []
-            for reranked_item in reranked_results[:top_k]:
-                orig_idx = reranked_item.get("index")
-                if orig_idx is None or orig_idx not in original_results_map:
-                    continue
-                result = original_results_map[orig_idx]
-                result["score"] = reranked_item.get(
-                    "relevance_score", result.get("score", 0)
-                )
-                reranked_top_results.append(result)
+        if reranked_top_results:
+            logger.info(
+                "Reranking applied: selected top %s from %s candidates",
+                top_k,
+                len(documents),
+            )
+            return reranked_top_results
+        return kb_search_results
 
-            if reranked_top_results:
-                logger.info(
-                    "Reranking applied: selected top %s from %s candidates",
-                    top_k,
-                    len(documents),
-                )
-                return reranked_top_results
-            return kb_search_results
-        except Exception as e:
-            logger.warning("Reranking failed, using original results: %s", str(e))
-            return kb_search_results
+    @staticmethod
+    def _document_paths_kwargs(document_paths: Optional[List[str]]) -> dict:
+        """VDB search kwargs for the document_paths filter; empty when unrestricted."""
+        return {"document_paths": document_paths} if document_paths else {}
 
     @staticmethod
     def _normalize_source_type(source_type: str) -> str:
@@ -474,13 +530,14 @@ class KnowledgeBaseSearchTool(Tool):
                 "", ProcessType.PICTURE_WEB, search_images_list_json
             )
 
-    def search_hybrid(self, query, index_names, top_k):
+    def search_hybrid(self, query, index_names, top_k, document_paths=None):
         try:
             results = self.vdb_core.hybrid_search(
                 index_names=index_names,
                 query_text=query,
                 embedding_model=self.embedding_model,
                 top_k=top_k,
+                **self._document_paths_kwargs(document_paths),
             )
 
             formatted_results = []
@@ -497,12 +554,13 @@ class KnowledgeBaseSearchTool(Tool):
         except Exception as e:
             raise Exception(f"Error during hybrid search: {str(e)}")
 
-    def search_accurate(self, query, index_names, top_k):
+    def search_accurate(self, query, index_names, top_k, document_paths=None):
         try:
             results = self.vdb_core.accurate_search(
                 index_names=index_names,
                 query_text=query,
                 top_k=top_k,
+                **self._document_paths_kwargs(document_paths),
             )
 
             formatted_results = []
@@ -519,13 +577,14 @@ class KnowledgeBaseSearchTool(Tool):
         except Exception as e:
             raise Exception(f"Error during accurate search: {str(e)}")
 
-    def search_semantic(self, query, index_names, top_k):
+    def search_semantic(self, query, index_names, top_k, document_paths=None):
         try:
             results = self.vdb_core.semantic_search(
                 index_names=index_names,
                 query_text=query,
                 embedding_model=self.embedding_model,
                 top_k=top_k,
+                **self._document_paths_kwargs(document_paths),
             )
 
             formatted_results = []
@@ -557,58 +616,54 @@ class KnowledgeBaseSearchTool(Tool):
             positive_prompt = query
             negative_prompt = "logo or banner or background or advertisement or icon or avatar"
 
+            runner = BackgroundLoopRunner.get_instance()
+
             # Define the async function to perform the filtering
             async def process_images():
                 # Maximum number of concurrent requests
                 semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
-
-                # Create a ClientSession
-                connector = aiohttp.TCPConnector(limit=0)
                 timeout = aiohttp.ClientTimeout(total=2)
 
-                async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                    # Create a function to process a single image
-                    async def process_single_image(img_url):
-                        async with semaphore:
-                            try:
-                                api_url = f"{self.data_process_service}/tasks/filter_important_image"
-                                data = {
-                                    'image_url': img_url,
-                                    'positive_prompt': positive_prompt,
-                                    'negative_prompt': negative_prompt
-                                }
-                                async with session.post(api_url, data=data) as response:
-                                    if response.status != 200:
-                                        logger.info(
-                                            f"API error for {img_url}: {response.status}")
-                                        return None
-                                    result = await response.json()
-                                    if result.get("is_important", False):
-                                        logger.info(
-                                            f"Important image: {img_url}")
-                                        return img_url
+                # Keep-alive session shared by every search in this process
+                session = runner.get_client(
+                    ("kb_image_filter", self.data_process_service),
+                    lambda: aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)),
+                )
+
+                # Create a function to process a single image
+                async def process_single_image(img_url):
+                    async with semaphore:
+                        try:
+                            api_url = f"{self.data_process_service}/tasks/filter_important_image"
+                            data = {
+                                'image_url': img_url,
+                                'positive_prompt': positive_prompt,
+                                'negative_prompt': negative_prompt
+                            }
+                            async with session.post(api_url, data=data, timeout=timeout) as response:
+                                if response.status != 200:
+                                    logger.info(
+                                        f"API error for {img_url}: {response.status}")
                                     return None
-                            except Exception as e:
-                                logger.info(
-                                    f"Error processing image {img_url}: {str(e)}")
+                                result = await response.json()
+                                if result.get("is_important", False):
+                                    logger.info(
+                                        f"Important image: {img_url}")
+                                    return img_url
                                 return None
-                    tasks = [process_single_image(url)
-                             for url in images_list_url]
-                    results = await asyncio.gather(*tasks)
-                    filtered_images = [
-                        url for url in results if url is not None]
-
-                    # Return the filtered list from the inner async function
-                    return filtered_images
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                # Capture the return value from the async execution
-                final_filtered_images = loop.run_until_complete(
-                    process_images())
-            finally:
-                loop.close()
+                        except Exception as e:
+                            logger.info(
+                                f"Error processing image {img_url}: {str(e)}")
+                            return None
+                tasks = [process_single_image(url)
+                         for url in images_list_url]
+                results = await asyncio.gather(*tasks)
+
+                # Return the filtered list from the inner async function
+                return [url for url in results if url is not None]
+
+            # Capture the return value from the async execution
+            final_filtered_images = runner.run(process_images())
         except Exception as e:
             logger.info(f"Image filtering error: {str(e)}")
             return []
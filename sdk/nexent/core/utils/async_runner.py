@@ -0,0 +1,174 @@
+"""Process-wide background event loop that synchronous code submits coroutines to."""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+logger = logging.getLogger("async_runner")
+
+T = TypeVar("T")
+
+
+class BackgroundLoopRunner:
+    """
+    Singleton event loop running on a daemon thread.
+
+    Sync tool code calls ``run(coro)`` instead of creating an event loop (and,
+    inside a running loop, an extra thread) per call. Because every coroutine
+    runs on the same loop, loop-bound HTTP clients can be kept in a keyed pool
+    via ``get_client`` and reuse their keep-alive connections across calls.
+
+    The loop is recreated after a fork, so each child process owns its own
+    loop and clients.
+
+    Usage::
+
+        async def fetch():
+            client = BackgroundLoopRunner.get_instance().get_client(key, make_client)
+            return await client.get(url)
+
+        result = BackgroundLoopRunner.get_instance().run(fetch())
+    """
+
+    _instance: Optional["BackgroundLoopRunner"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, name: str = "nexent-async-runner") -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        # Loop-bound clients; only touched from the loop thread
+        self._clients: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def get_instance(cls) -> "BackgroundLoopRunner":
+        """Get or create the global BackgroundLoopRunner singleton."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runner's event loop, started on first access."""
+        return self._ensure_loop()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run.
+            timeout: Optional seconds to wait; the coroutine is cancelled on timeout.
+
+        Returns:
+            The coroutine's result; its exception is re-raised in the caller.
+
+        Raises:
+            RuntimeError: When called from the runner's own loop thread, which
+                would deadlock.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundLoopRunner.run() called from its own loop thread")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller runs on the runner's loop thread, where ``run`` would deadlock."""
+        return threading.current_thread() is self._thread
+
+    def get_client(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the pooled client for ``key``, creating it with ``factory`` on first use.
+
+        Must be called from a coroutine running on this runner's loop, since the
+        clients it hands out are bound to that loop. Closed clients are replaced.
+
+        Args:
+            key: Pool key, e.g. the endpoint origin.
+            factory: Builds a new client (``httpx.AsyncClient``, ``aiohttp.ClientSession``...).
+        """
+        client = self._clients.get(key)
+        if client is None or self._is_closed(client):
+            client = factory()
+            self._clients[key] = client
+            logger.debug(f"Created pooled async client for {key}")
+        return client
+
+    def close(self) -> None:
+        """Close every pooled client and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or loop.is_closed() or self._pid != os.getpid():
+                return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_clients(), loop).result(timeout=10)
+        except Exception as e:
+            logger.warning(f"Failed to close pooled async clients: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=10)
+        with self._lock:
+            if self._loop is loop:
+                self._loop = None
+                self._thread = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name=self._name, daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+                self._pid = os.getpid()
+                # Clients of an inherited loop can't be used from this process
+                self._clients = {}
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    @staticmethod
+    def _is_closed(client: Any) -> bool:
+        # httpx exposes ``is_closed``, aiohttp ``closed``
+        closed = getattr(client, "is_closed", None)
+        if closed is None:
+            closed = getattr(client, "closed", False)
+        return bool(closed)
+
+    async def _close_clients(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                closer = getattr(client, "aclose", None) or getattr(client, "close")
+                result = closer()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Failed to close pooled async client: {e}")
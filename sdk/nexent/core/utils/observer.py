@@ -1,8 +1,10 @@
+import asyncio
 import json
 import re
+import threading
 from collections import deque
 from enum import Enum
-from typing import Any
+from typing import Any, List, Optional
 
 
 class ProcessType(Enum):
@@ -96,6 +98,132 @@ class TokenCountTransformer(MessageTransformer):
         return kwargs.get("content", "")
 
 
+class ObserverMessageQueue:
+    """
+    Thread-safe bridge from the agent thread to an asyncio consumer.
+
+    Producers (the agent thread) call put() and never touch the event loop
+    directly; the consumer awaits get_batch(), which wakes up through
+    loop.call_soon_threadsafe as soon as a message arrives instead of polling.
+    With maxsize > 0, put() blocks the producer thread until the consumer
+    drains the queue (backpressure). Producers running on the loop thread
+    itself are never blocked, to avoid deadlocking the consumer.
+
+    Must be created on the thread that runs ``loop``.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 0):
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._maxsize = max(0, int(maxsize or 0))
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+    def put(self, message: str) -> None:
+        """Enqueue a message, blocking while a bounded queue is full."""
+        with self._condition:
+            if self._maxsize and not self._on_loop_thread():
+                while len(self._items) >= self._maxsize and not self._closed:
+                    self._condition.wait()
+            self._items.append(message)
+            waiter = self._waiter
+            self._waiter = None
+        self._wake(waiter)
+
+    def put_many(self, messages: List[str]) -> None:
+        """Enqueue messages without applying backpressure (used when attaching)."""
+        if not messages:
+            return
+        with self._condition:
+            self._items.extend(messages)
+            waiter = self._waiter
+            self._waiter = None
+        self._wake(waiter)
+
+    def close(self) -> None:
+        """Mark the producer side finished; pending messages can still be drained."""
+        with self._condition:
+            self._closed = True
+            waiter = self._waiter
+            self._waiter = None
+            self._condition.notify_all()
+        self._wake(waiter)
+
+    async def get_batch(self) -> List[str]:
+        """
+        Wait for and return all queued messages.
+
+        Returns an empty list only once the queue is closed and fully drained.
+        """
+        while True:
+            with self._condition:
+                if self._items:
+                    batch = list(self._items)
+                    self._items.clear()
+                    self._condition.notify_all()
+                    return batch
+                if self._closed:
+                    return []
+                waiter = self._loop.create_future()
+                self._waiter = waiter
+            await waiter
+
+    def _on_loop_thread(self) -> bool:
+        return threading.get_ident() == self._loop_thread_id
+
+    def _wake(self, waiter: Optional[asyncio.Future]) -> None:
+        if waiter is None:
+            return
+        if self._on_loop_thread():
+            self._set_waiter(waiter)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._set_waiter, waiter)
+        except RuntimeError:
+            # Event loop already closed; nobody is waiting anymore.
+            pass
+
+    @staticmethod
+    def _set_waiter(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+
+_THINK_START_TAG = "<think>"
+# characters carried over between tokens so a split think tag is still found
+_THINK_TAIL_LEN = len("</think>") - 1
+# longest "label + colon" prefix of the code block marker, i.e. "Code:"
+_CODE_MARKER_LABEL_MAX_LEN = 5
+
+
+def _code_marker_tail(text):
+    """
+    Return the suffix of ``text`` a code marker completed by later content could start in:
+    the trailing whitespace/backtick run plus room for the longest label with its colon.
+    """
+    stripped = text
+    while True:
+        shorter = stripped.rstrip().rstrip('`')
+        if len(shorter) == len(stripped):
+            break
+        stripped = shorter
+    return text[max(0, len(stripped) - _CODE_MARKER_LABEL_MAX_LEN):]
+
+
 class MessageObserver:
     # set the maximum buffer size, can be adjusted according to needs
     MAX_TOKEN_BUFFER_SIZE = 10
@@ -104,6 +232,10 @@ class MessageObserver:
         # unified output to the front end string, changed to queue
         self.message_query = []
 
+        # optional push target; when attached, messages bypass message_query
+        self._message_lock = threading.Lock()
+        self._message_queue: Optional[ObserverMessageQueue] = None
+
         # control output language
         self.lang = lang
 
@@ -124,6 +256,11 @@ class MessageObserver:
         self.in_think_mode = False
         self.think_start_pattern = re.compile(r"<think>")
         self.think_end_pattern = re.compile(r"</think>")
+        # carry-over tails and character counts for incremental tag/marker scanning
+        self._think_tail = ''
+        self._think_chars = 0
+        self._code_tail = ''
+        self._code_chars = 0
 
     def _init_message_transformers(self):
         """initialize the mapping of message type to transformer"""
@@ -155,110 +292,138 @@ class MessageObserver:
     def add_model_new_token(self, new_token):
         """
         Process streaming tokens with real-time think tag detection and content classification
+
+        The buffered text never contains a match for the tag of the current mode
+        (it is searched every time it grows), so only the newly arrived token plus
+        a carry-over tail of ``len(tag) - 1`` buffered characters needs scanning.
         """
-        # Add token to think buffer
+        window = self._think_tail + new_token
         self.think_buffer.append(new_token)
+        self._think_chars += len(new_token)
+        self._think_tail = window[-_THINK_TAIL_LEN:]
 
-        # Check for think tag patterns in the buffer
-        buffer_text = ''.join(self.think_buffer)
+        buffer_text = None
+        end_match = None
 
         # Check for think start tag
         if not self.in_think_mode:
-            start_match = self.think_start_pattern.search(buffer_text)
+            start_match = self.think_start_pattern.search(window)
             if start_match:
+                buffer_text = ''.join(self.think_buffer)
+                start = len(buffer_text) - len(window) + start_match.start()
                 # Found <think> tag, switch to think mode
                 self.in_think_mode = True
                 # Clear buffer and keep only content after <think>
-                self.think_buffer.clear()
-                think_content = buffer_text[start_match.end():]
+                self._clear_think_buffer()
+                think_content = buffer_text[start + len(_THINK_START_TAG):]
                 if think_content:
                     self.think_buffer.append(think_content)
-
+                    self._think_chars = len(think_content)
+                    self._think_tail = think_content[-_THINK_TAIL_LEN:]
+                # The text before <think> was never checked for </think>
+                end_match = self.think_end_pattern.search(buffer_text)
         # Check for think end tag
-        if self.in_think_mode:
-            end_match = self.think_end_pattern.search(buffer_text)
-            if end_match:
-                # Found </think> tag, exit think mode
-                self.in_think_mode = False
-                # Process think content before </think>
-                think_content = buffer_text[:end_match.start()]
-                if think_content:
-                    self.message_query.append(
-                        Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, think_content).to_json())
-
-                # Process content after </think> as normal content
-                after_think = buffer_text[end_match.end():]
-                if after_think:
-                    self._process_normal_content(after_think)
-                self.think_buffer.clear()
-
-        while len(self.think_buffer) > self.MAX_TOKEN_BUFFER_SIZE:
+        elif self.think_end_pattern.search(window):
+            buffer_text = ''.join(self.think_buffer)
+            end_match = self.think_end_pattern.search(buffer_text, len(buffer_text) - len(window))
+
+        if end_match:
+            # Found </think> tag, exit think mode
+            self.in_think_mode = False
+            # Process think content before </think>
+            think_content = buffer_text[:end_match.start()]
+            if think_content:
+                self._emit(
+                    Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, think_content).to_json())
+
+            # Process content after </think> as normal content
+            after_think = buffer_text[end_match.end():]
+            if after_think:
+                self._process_normal_content(after_think)
+            self._clear_think_buffer()
+
+        excess = len(self.think_buffer) - self.MAX_TOKEN_BUFFER_SIZE
+        if excess > 0:
             # Flush ALL tokens that exceed buffer size at once to avoid fragmentation
-            # Each flush is a single message_query.append with multiple tokens concatenated
-            accumulated_content = ''.join(list(self.think_buffer)[:-self.MAX_TOKEN_BUFFER_SIZE])
-            # Remove the flushed tokens from buffer
-            for _ in range(len(self.think_buffer) - self.MAX_TOKEN_BUFFER_SIZE):
-                self.think_buffer.popleft()
+            # Each flush is a single message emit with multiple tokens concatenated
+            accumulated_content = ''.join([self.think_buffer.popleft() for _ in range(excess)])
+            self._think_chars -= len(accumulated_content)
+            if self._think_chars < len(self._think_tail):
+                self._think_tail = self._think_tail[len(self._think_tail) - self._think_chars:]
             # Send accumulated content
             if accumulated_content:
                 if self.in_think_mode:
-                    self.message_query.append(
+                    self._emit(
                         Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, accumulated_content).to_json())
                 else:
                     self._process_normal_content(accumulated_content)
 
-
     def _process_normal_content(self, content):
         """
         Process normal content (non-deep-think content) for code block detection
         """
+        # the buffered text holds no code marker, so a new match must end inside
+        # ``content``; scan it together with the tail that could start the marker
+        window = self._code_tail + content
         self.token_buffer.append(content)
-
-        # concatenate the buffer into text for checking code blocks
-        buffer_text = ''.join(self.token_buffer)
+        self._code_chars += len(content)
 
         # find the code block marker
-        match = self.code_pattern.search(buffer_text)
+        match = self.code_pattern.search(window)
 
         if match:
+            # concatenate the buffer into text only when the marker was found
+            buffer_text = ''.join(self.token_buffer)
             # found the code block marker
-            match_start = match.start()
+            match_start = len(buffer_text) - len(window) + match.start()
 
             # only switch mode when in thinking mode
             if self.current_mode == ProcessType.MODEL_OUTPUT_THINKING:
                 # send the content before the matching position as thinking
                 prefix_text = buffer_text[:match_start]
                 if prefix_text:
-                    self.message_query.append(
+                    self._emit(
                         Message(ProcessType.MODEL_OUTPUT_THINKING, prefix_text).to_json())
 
                 # send the content after the matching part as code
                 code_text = buffer_text[match_start:]
                 if code_text:
-                    self.message_query.append(
+                    self._emit(
                         Message(ProcessType.MODEL_OUTPUT_CODE, code_text).to_json())
 
                 # switch mode
                 self.current_mode = ProcessType.MODEL_OUTPUT_CODE
             else:
                 # already in code mode, send the entire buffer content as code
-                self.message_query.append(
+                self._emit(
                     Message(ProcessType.MODEL_OUTPUT_CODE, buffer_text).to_json())
 
             # clear the buffer
-            self.token_buffer.clear()
-        else:
-            # not found the code block marker, pop the first token from the queue (if the buffer length exceeds a certain size)
-            max_buffer_size = self.MAX_TOKEN_BUFFER_SIZE
-            if len(self.token_buffer) > max_buffer_size:
-                # Flush ALL tokens that exceed buffer size at once to avoid fragmentation
-                accumulated_content = ''.join(list(self.token_buffer)[:-max_buffer_size])
-                # Remove the flushed tokens from buffer
-                for _ in range(len(self.token_buffer) - max_buffer_size):
-                    self.token_buffer.popleft()
-                # Send accumulated content
-                self.message_query.append(
-                    Message(self.current_mode, accumulated_content).to_json())
+            self._clear_token_buffer()
+            return
+
+        self._code_tail = _code_marker_tail(window)
+        # not found the code block marker, pop the first token from the queue (if the buffer length exceeds a certain size)
+        excess = len(self.token_buffer) - self.MAX_TOKEN_BUFFER_SIZE
+        if excess > 0:
+            # Flush ALL tokens that exceed buffer size at once to avoid fragmentation
+            accumulated_content = ''.join([self.token_buffer.popleft() for _ in range(excess)])
+            self._code_chars -= len(accumulated_content)
+            if self._code_chars < len(self._code_tail):
+                self._code_tail = self._code_tail[len(self._code_tail) - self._code_chars:]
+            # Send accumulated content
+            self._emit(
+                Message(self.current_mode, accumulated_content).to_json())
+
+    def _clear_think_buffer(self):
+        self.think_buffer.clear()
+        self._think_chars = 0
+        self._think_tail = ''
+
+    def _clear_token_buffer(self):
+        self.token_buffer.clear()
+        self._code_chars = 0
+        self._code_tail = ''
 
     def flush_remaining_tokens(self):
         """
@@ -271,20 +436,20 @@ class MessageObserver:
                 # Still in think mode, remove any think tags and process as deep thinking
                 think_buffer_text = re.sub(r"<think>|</think>", "", think_buffer_text)
                 if think_buffer_text:
-                    self.message_query.append(
+                    self._emit(
                         Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, think_buffer_text).to_json())
             else:
                 # Not in think mode, process as normal content
                 if think_buffer_text:
                     self._process_normal_content(think_buffer_text)
-            self.think_buffer.clear()
+            self._clear_think_buffer()
 
         # Process remaining normal buffer content
         if self.token_buffer:
             buffer_text = ''.join(self.token_buffer)
-            self.message_query.append(
+            self._emit(
                 Message(self.current_mode, buffer_text).to_json())
-            self.token_buffer.clear()
+            self._clear_token_buffer()
 
     def add_message(self, agent_name, process_type, content, **kwargs):
         """add message to the queue"""
@@ -296,7 +461,7 @@ class MessageObserver:
         tool_name = kwargs.get("tool_name")
         tool_arguments = kwargs.get("tool_arguments")
 
-        self.message_query.append(
+        self._emit(
             Message(process_type, formatted_content, tool_name=tool_name,
                     tool_arguments=tool_arguments).to_json())
 
@@ -305,12 +470,35 @@ class MessageObserver:
         Handle reasoning content from the model with type MODEL_OUTPUT_DEEP_THINKING
         """
         if reasoning_content:
-            self.message_query.append(
+            self._emit(
                 Message(ProcessType.MODEL_OUTPUT_DEEP_THINKING, reasoning_content).to_json())
 
+    def _emit(self, message: str) -> None:
+        """Deliver a formatted message to the attached queue or the cached list."""
+        with self._message_lock:
+            message_queue = self._message_queue
+            if message_queue is None:
+                self.message_query.append(message)
+                return
+        message_queue.put(message)
+
+    def attach_message_queue(self, message_queue: ObserverMessageQueue) -> None:
+        """Push all subsequent messages (and any already cached) into message_queue."""
+        with self._message_lock:
+            pending = self.message_query
+            self.message_query = []
+            self._message_queue = message_queue
+        message_queue.put_many(pending)
+
+    def detach_message_queue(self) -> None:
+        """Stop pushing messages; later messages are cached for get_cached_message."""
+        with self._message_lock:
+            self._message_queue = None
+
     def get_cached_message(self):
-        cached_message = self.message_query
-        self.message_query = []
+        with self._message_lock:
+            cached_message = self.message_query
+            self.message_query = []
         return cached_message
 
     def get_final_answer(self):
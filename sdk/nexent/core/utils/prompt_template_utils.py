@@ -2,7 +2,7 @@ import logging
 import os
 from typing import Dict, Any
 
-import yaml
+from .template_registry import load_yaml_template
 
 LANGUAGE = {
     "ZH": "zh",
@@ -60,6 +60,5 @@ def get_prompt_template(template_type: str, language: str = LANGUAGE["ZH"], **kw
     core_dir = os.path.dirname(current_dir)
     absolute_template_path = os.path.join(core_dir, template_path.replace('core/', ''))
 
-    # Read and return template content
-    with open(absolute_template_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    # Read and return template content (re-parsed only when the file changes)
+    return load_yaml_template(absolute_template_path)
@@ -0,0 +1,137 @@
+"""Process-wide caches for prompt template YAML files and compiled Jinja templates."""
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+import yaml
+
+logger = logging.getLogger("template_registry")
+
+# Compiled templates kept per process; prompt sources are few and long-lived
+COMPILED_TEMPLATE_CACHE_SIZE = 256
+
+
+class TemplateRegistry:
+    """
+    Shared cache of parsed prompt YAML files and compiled Jinja templates.
+
+    YAML files are re-parsed only when their mtime or size changes, and every
+    caller gets its own deep copy, so mutating a loaded template never leaks
+    into the cache. Compiled templates are kept in a bounded LRU keyed by the
+    source hash and the Jinja options, so rendering the same prompt source
+    again skips Jinja's parse and compile step.
+
+    Usage::
+
+        data = TemplateRegistry.get_instance().load_yaml(path)
+        text = TemplateRegistry.get_instance().compile(source, undefined=StrictUndefined).render(**ctx)
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_compiled: int = COMPILED_TEMPLATE_CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._max_compiled = max_compiled
+        # path -> ((mtime_ns, size), parsed data)
+        self._yaml: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._compiled: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._stats = {"yaml_hits": 0, "yaml_misses": 0, "compiled_hits": 0, "compiled_misses": 0}
+
+    @classmethod
+    def get_instance(cls) -> "TemplateRegistry":
+        """Get or create the global TemplateRegistry singleton."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def load_yaml(self, path: str) -> Any:
+        """
+        Load a YAML file, re-parsing it only when it changed on disk.
+
+        Args:
+            path: Absolute path of the YAML file.
+
+        Returns:
+            A deep copy of the parsed content.
+        """
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._yaml.get(path)
+            if cached is not None and cached[0] == stamp:
+                self._stats["yaml_hits"] += 1
+                return copy.deepcopy(cached[1])
+            self._stats["yaml_misses"] += 1
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        with self._lock:
+            self._yaml[path] = (stamp, data)
+        return copy.deepcopy(data)
+
+    def compile(self, source: str, **options: Any):
+        """
+        Return the compiled ``jinja2.Template`` for ``source``.
+
+        Args:
+            source: Template source.
+            **options: Keyword arguments of ``jinja2.Template``, e.g. ``undefined``.
+
+        Returns:
+            A shared template; rendering it is thread-safe.
+        """
+        import jinja2
+
+        key = (hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+               tuple(sorted(options.items())))
+        with self._lock:
+            template = self._compiled.get(key)
+            if template is not None:
+                self._compiled.move_to_end(key)
+                self._stats["compiled_hits"] += 1
+                return template
+            self._stats["compiled_misses"] += 1
+
+        template = jinja2.Template(source, **options)
+        with self._lock:
+            self._compiled[key] = template
+            self._compiled.move_to_end(key)
+            while len(self._compiled) > self._max_compiled:
+                self._compiled.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Drop every cached YAML file and compiled template."""
+        with self._lock:
+            self._yaml.clear()
+            self._compiled.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current cache sizes."""
+        with self._lock:
+            return {**self._stats, "yaml_entries": len(self._yaml), "compiled_entries": len(self._compiled)}
+
+
+def load_yaml_template(path: str) -> Any:
+    """Load a prompt template YAML file through the shared registry."""
+    return TemplateRegistry.get_instance().load_yaml(path)
+
+
+def compile_template(source: str, **options: Any):
+    """Return the shared compiled ``jinja2.Template`` for ``source``."""
+    return TemplateRegistry.get_instance().compile(source, **options)
+
+
+def clear_template_caches() -> None:
+    """Drop the shared registry's cached YAML files and compiled templates."""
+    TemplateRegistry.get_instance().clear()
@@ -1,14 +1,24 @@
 """Token estimation utilities.
 
-Provides tiktoken-accurate estimation when available, with a CJK-aware
-heuristic fallback. Extracted from agent_context for reuse across core.
+Provides a CJK-aware heuristic estimate (~4 chars/token for non-CJK, ~1.1 for
+CJK) counted with a compiled regex, memoized per text, and an optional exact
+backend backed by a local tiktoken encoding or HuggingFace tokenizer file.
+Extracted from agent_context for reuse across core.
 """
 
-from typing import Any, List, Optional, Union
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Union
 
 from smolagents.memory import ActionStep, AgentMemory, MemoryStep
 from smolagents.models import ChatMessage
 
+logger = logging.getLogger("token_estimation")
+
 _tiktoken_available = False
 _encoders: dict = {}
 
@@ -19,21 +29,34 @@ try:
 except ImportError:
     pass
 
-
-def _is_cjk(char: str) -> bool:
-    """Check if a character is CJK."""
-    cp = ord(char)
-    return (
-        (0x4E00 <= cp <= 0x9FFF)
-        or (0x3400 <= cp <= 0x4DBF)
-        or (0x20000 <= cp <= 0x2A6DF)
-        or (0x2A700 <= cp <= 0x2B73F)
-        or (0x2B740 <= cp <= 0x2B81F)
-        or (0x2B820 <= cp <= 0x2CEAF)
-        or (0xF900 <= cp <= 0xFAFF)
-        or (0x2F800 <= cp <= 0x2FA1F)
-        or (0x3000 <= cp <= 0x303F)  # CJK punctuation
-    )
+# Exact tokenizer backend, e.g. "tiktoken:cl100k_base" or a path to a
+# HuggingFace tokenizer.json; unset keeps the heuristic estimate
+TOKENIZER_ENV = "NEXENT_TOKENIZER"
+
+# Texts shorter than this are counted directly; hashing them costs as much as counting
+MEMO_MIN_CHARS = 256
+MEMO_SIZE = 4096
+
+_CJK_RANGES = (
+    "\u4e00-\u9fff"
+    "\u3400-\u4dbf"
+    "\U00020000-\U0002a6df"
+    "\U0002a700-\U0002b73f"
+    "\U0002b740-\U0002b81f"
+    "\U0002b820-\U0002ceaf"
+    "\uf900-\ufaff"
+    "\U0002f800-\U0002fa1f"
+    "\u3000-\u303f"  # CJK punctuation
+)
+# Deleting every non-CJK run leaves exactly the CJK characters, in C
+_NON_CJK_RE = re.compile(f"[^{_CJK_RANGES}]+")
+
+
+def _count_cjk(text: str) -> int:
+    """Count CJK characters in ``text``."""
+    if text.isascii():
+        return 0
+    return len(_NON_CJK_RE.sub("", text))
 
 
 def _count_tiktoken(text: str, encoding_name: str = "cl100k_base") -> int:
@@ -45,20 +68,151 @@ def _count_tiktoken(text: str, encoding_name: str = "cl100k_base") -> int:
     return len(_encoders[encoding_name].encode(text))
 
 
+class _CountMemo:
+    """Bounded LRU of per-text counts keyed by (counter, length, content hash)."""
+
+    def __init__(self, max_entries: int = MEMO_SIZE):
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, int]" = OrderedDict()
+
+    def count(self, namespace: str, text: str, counter: Callable[[str], int]) -> int:
+        if len(text) < MEMO_MIN_CHARS:
+            return counter(text)
+        key = (namespace, len(text), hash(text))
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        value = counter(text)
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_memo = _CountMemo()
+
+
+class TokenCounter(ABC):
+    """Exact token counter backend; ``name`` namespaces its memoized counts."""
+
+    name: str = "exact"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``."""
+
+
+class TiktokenCounter(TokenCounter):
+    """Counts tokens with a tiktoken encoding (set TIKTOKEN_CACHE_DIR to load it offline)."""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        if not _tiktoken_available:
+            raise ImportError("tiktoken is not installed")
+        self.name = f"tiktoken:{encoding_name}"
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class HuggingFaceTokenizerCounter(TokenCounter):
+    """Counts tokens with a local HuggingFace ``tokenizer.json`` file."""
+
+    def __init__(self, tokenizer_file: str):
+        from tokenizers import Tokenizer
+
+        self.name = f"hf:{os.path.abspath(tokenizer_file)}"
+        self._tokenizer = Tokenizer.from_file(tokenizer_file)
+
+    def count(self, text: str) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def load_token_counter(spec: str) -> Optional[TokenCounter]:
+    """Build an exact counter from ``"tiktoken:<encoding>"`` or a tokenizer.json path.
+
+    Returns None (heuristic estimation) when the backend cannot be loaded.
+    """
+    try:
+        if spec.startswith("tiktoken:"):
+            return TiktokenCounter(spec.split(":", 1)[1] or "cl100k_base")
+        return HuggingFaceTokenizerCounter(spec)
+    except Exception as e:
+        logger.warning(f"Token counter '{spec}' unavailable, using heuristic estimation: {e}")
+        return None
+
+
+_counter: Optional[TokenCounter] = None
+_counter_loaded = False
+_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> Optional[TokenCounter]:
+    """Return the exact counter in use, loading it from ``NEXENT_TOKENIZER`` on first call."""
+    global _counter, _counter_loaded
+    if not _counter_loaded:
+        with _counter_lock:
+            if not _counter_loaded:
+                spec = os.getenv(TOKENIZER_ENV, "").strip()
+                _counter = load_token_counter(spec) if spec else None
+                _counter_loaded = True
+    return _counter
+
+
+def set_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Use ``counter`` for exact counts, or None for the heuristic estimate."""
+    global _counter, _counter_loaded
+    with _counter_lock:
+        _counter = counter
+        _counter_loaded = True
+
+
+def clear_token_count_cache() -> None:
+    """Drop memoized per-text counts."""
+    _memo.clear()
+
+
+def _heuristic_tokens(cjk_count: int, char_count: int) -> int:
+    non_cjk_count = char_count - cjk_count
+    return max(1, int((non_cjk_count // 4.0) + (cjk_count // 1.1)))
+
+
+def _estimate_tokens_texts(texts: List[str]) -> int:
+    """Estimate tokens of the concatenation of ``texts`` from per-text memoized counts.
+
+    CJK and character counts are additive, so the heuristic matches
+    ``estimate_tokens_text("".join(texts))`` while unchanged history messages
+    hit the memo on every step.
+    """
+    counter = get_token_counter()
+    if counter is not None:
+        return sum(_memo.count(counter.name, t, counter.count) for t in texts if t)
+    char_count = sum(len(t) for t in texts)
+    if not char_count:
+        return 0
+    return _heuristic_tokens(sum(_memo.count("cjk", t, _count_cjk) for t in texts if t), char_count)
+
+
 def estimate_tokens_text(text: str) -> int:
     """Estimate token count for a plain text string.
 
-    Uses tiktoken cl100k_base if available, otherwise falls back to
-    a CJK-aware heuristic (~4 chars/token for non-CJK, ~2 for CJK).
+    Uses the exact counter when one is configured, otherwise a CJK-aware
+    heuristic (~4 chars/token for non-CJK, ~1.1 for CJK).
     """
     if not text:
         return 0
-    # tiktoken is based on openai tokenizer
-    # if _tiktoken_available:
-    #     return _count_tiktoken(text, "cl100k_base")
-    cjk_count = sum(1 for c in text if _is_cjk(c))
-    non_cjk_count = len(text) - cjk_count
-    return max(1, int((non_cjk_count // 4.0) + (cjk_count // 1.1)))
+    return _estimate_tokens_texts([text])
 
 
 def _extract_text_from_chat_message(msg: Union[ChatMessage, dict, Any]) -> Optional[str]:
@@ -82,14 +236,14 @@ def _extract_text_from_chat_message(msg: Union[ChatMessage, dict, Any]) -> Optio
     return None
 
 
-def _extract_text_from_messages(msgs: List[ChatMessage]) -> Optional[str]:
-    """Extract plain text from a list of ChatMessages."""
-    parts = []
+def _extract_texts_from_messages(msgs: List[ChatMessage]) -> Optional[List[str]]:
+    """Extract plain text of each ChatMessage that has any; None if none do."""
+    texts = []
     for msg in msgs:
         t = _extract_text_from_chat_message(msg)
         if t is not None:
-            parts.append(t)
-    return "".join(parts) if parts else None
+            texts.append(t)
+    return texts if texts else None
 
 
 def msg_char_count(msg: Union[ChatMessage, List[ChatMessage]]) -> int:
@@ -111,21 +265,21 @@ def msg_token_count(
 ) -> int:
     """Estimate token count for single or multiple ChatMessages.
 
-    Prefers tiktoken-based (or CJK-heuristic) estimation when text can be
+    Prefers exact (or CJK-heuristic) estimation when text can be
     extracted; falls back to ``chars / chars_per_token`` otherwise.
     """
     if msg is None:
         return 0
     if isinstance(msg, list):
-        text = ""
+        texts = []
         fallback_chars = 0
         for single_msg in msg:
             t = _extract_text_from_chat_message(single_msg)
             if t is not None:
-                text += t
+                texts.append(t)
             else:
                 fallback_chars += msg_char_count(single_msg)
-        tokens = estimate_tokens_text(text) if text else 0
+        tokens = _estimate_tokens_texts(texts)
         if fallback_chars:
             tokens += int(fallback_chars / chars_per_token)
         return tokens
@@ -151,7 +305,7 @@ def estimate_tokens(
     """Estimate total token count in an AgentMemory.
 
     Collects ALL messages (system prompt + all steps) into one flat list,
-    then calls estimate_tokens_text exactly once. This eliminates per-step
+    then estimates their combined text exactly once. This eliminates per-step
     int() truncation drift and keeps the result consistent with
     msg_token_count(flat_list).
     """
@@ -161,9 +315,9 @@ def estimate_tokens(
     for step in memory.steps:
         all_msgs.extend(step.to_messages())
 
-    text = _extract_text_from_messages(all_msgs)
-    if text is not None:
-        return estimate_tokens_text(text)
+    texts = _extract_texts_from_messages(all_msgs)
+    if texts is not None:
+        return _estimate_tokens_texts(texts)
     return int(msg_char_count(all_msgs) / chars_per_token)
 
 def estimate_tokens_for_system_prompt(
@@ -174,10 +328,10 @@ def estimate_tokens_for_system_prompt(
         return 0
 
     sys_msgs = memory.system_prompt.to_messages()
-    text = _extract_text_from_messages(sys_msgs)
+    texts = _extract_texts_from_messages(sys_msgs)
 
-    if text is not None:
-        return estimate_tokens_text(text)
+    if texts is not None:
+        return _estimate_tokens_texts(texts)
     else:
         # Fallback to character-based estimation
         char_count = msg_char_count(sys_msgs)
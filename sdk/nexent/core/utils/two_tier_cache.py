@@ -0,0 +1,140 @@
+"""Two-tier TTL cache: in-process LRU + optional shared Redis tier.
+
+Values are stored JSON-encoded in Redis, so they must be JSON-serializable.
+Redis failures are logged and the cache keeps working on its local tier.
+Subclasses add the key scheme and the domain-specific accounting on top of
+``get_many`` / ``put_many``.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("two_tier_cache")
+
+
+class TwoTierCache:
+    """Local LRU in front of an optional Redis tier, with hit/miss accounting."""
+
+    # Used in log messages
+    NAME = "Cache"
+    DEFAULT_MAX_ENTRIES = 1000
+    DEFAULT_TTL_SECONDS = 300
+    # Counters kept next to local_hits/redis_hits/misses, with their initial values
+    EXTRA_STATS: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        redis_client=None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Args:
+            max_entries: Capacity of the in-process LRU tier.
+            redis_client: redis.Redis instance. If None, uses the local tier only.
+            ttl_seconds: How long a value stays valid in either tier.
+        """
+        self._max_entries = max(1, self.DEFAULT_MAX_ENTRIES if max_entries is None else max_entries)
+        self._redis = redis_client
+        self._ttl = self.DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        # key -> (expires_at, value)
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {}
+        self._reset_stats()
+
+    @property
+    def has_remote_tier(self) -> bool:
+        return self._redis is not None
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Look up keys in the local tier, then Redis; Redis hits are promoted locally."""
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing: List[int] = []
+        now = time.monotonic()
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._local.get(key)
+                if entry is not None and entry[0] <= now:
+                    del self._local[key]
+                    entry = None
+                if entry is None:
+                    missing.append(i)
+                else:
+                    self._local.move_to_end(key)
+                    results[i] = entry[1]
+            self._stats["local_hits"] += len(keys) - len(missing)
+
+        if missing and self._redis is not None:
+            try:
+                raw_values = self._redis.mget([keys[i] for i in missing])
+            except Exception as e:
+                logger.warning(f"{self.NAME} Redis lookup failed, using local tier only: {e}")
+                raw_values = [None] * len(missing)
+            promoted = {}
+            still_missing = []
+            for i, raw in zip(missing, raw_values):
+                if raw is None:
+                    still_missing.append(i)
+                    continue
+                value = json.loads(raw)
+                results[i] = value
+                promoted[keys[i]] = value
+            if promoted:
+                self._put_local(promoted)
+            with self._lock:
+                self._stats["redis_hits"] += len(promoted)
+            missing = still_missing
+
+        with self._lock:
+            self._stats["misses"] += len(missing)
+        return results
+
+    def put_many(self, values: Dict[str, Any]) -> None:
+        """Store values in both tiers."""
+        if not values:
+            return
+        self._put_local(values)
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for key, value in values.items():
+                    pipe.setex(key, self._ttl, json.dumps(value, ensure_ascii=False))
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"{self.NAME} Redis write failed: {e}")
+
+    def _put_local(self, values: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            for key, value in values.items():
+                self._local[key] = (expires_at, value)
+                self._local.move_to_end(key)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
+
+    def _add_stat(self, name: str, amount: Any = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _reset_stats(self) -> None:
+        self._stats.update(local_hits=0, redis_hits=0, misses=0, **self.EXTRA_STATS)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters, used to size the cache."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._local)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Drop the local tier and reset counters (the Redis tier expires by TTL)."""
+        with self._lock:
+            self._local.clear()
+            self._reset_stats()
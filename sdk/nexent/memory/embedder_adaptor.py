@@ -1,5 +1,6 @@
 from typing import Literal, Optional, Union
 from mem0.embeddings.base import EmbeddingBase
+from nexent.core.models.embedding_cache import embed_query, embed_texts
 from nexent.core.models.embedding_model import OpenAICompatibleEmbedding
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 
@@ -45,11 +46,11 @@ class EmbedderAdaptor(EmbeddingBase):
         if isinstance(text, str):
             # follow mem0 logic
             cleaned_text = text.replace("\n", " ")
-            vectors = self._embedder.get_embeddings(cleaned_text)
-            return vectors[0]
+            # Single texts of concurrent memory operations share one provider request
+            return embed_query(self._embedder, cleaned_text)
         elif isinstance(text, list):
             # follow mem0 logic
             cleaned_batch = [t.replace("\n", " ") for t in text]
-            vectors = self._embedder.get_embeddings(cleaned_batch)
+            vectors = embed_texts(self._embedder, cleaned_batch)
             return vectors
 
@@ -532,6 +532,10 @@ class MonitoringManager:
         self._agent_step_count: Optional[Any] = None
         self._agent_error_count: Optional[Any] = None
 
+        # Ad-hoc component metrics created lazily by record_counter/record_histogram
+        self._component_instruments: Dict[str, Any] = {}
+        self._component_instruments_lock = threading.Lock()
+
         self._initialized = True
         logger.info("MonitoringManager singleton created")
 
@@ -1633,6 +1637,58 @@ class MonitoringManager:
         elif metric_type == "tokens_completion" and self._llm_token_count_completion:
             self._llm_token_count_completion.add(value, attributes)
 
+    def _get_component_instrument(self, kind: str, name: str, description: str, unit: str) -> Optional[Any]:
+        """Return a lazily created counter/histogram, or None when metrics are unavailable."""
+        if not self.is_enabled or not OPENTELEMETRY_AVAILABLE or self._meter is None:
+            return None
+
+        key = f"{kind}:{name}"
+        instrument = self._component_instruments.get(key)
+        if instrument is not None:
+            return instrument
+
+        with self._component_instruments_lock:
+            instrument = self._component_instruments.get(key)
+            if instrument is None:
+                if kind == "histogram":
+                    instrument = self._meter.create_histogram(name=name, description=description, unit=unit)
+                else:
+                    instrument = self._meter.create_counter(name=name, description=description, unit=unit)
+                self._component_instruments[key] = instrument
+        return instrument
+
+    def record_counter(
+        self,
+        name: str,
+        value: float = 1,
+        attributes: Optional[Dict[str, Any]] = None,
+        description: str = "",
+        unit: str = "1",
+    ) -> None:
+        """Add ``value`` to a named counter used by backend/SDK components (buffers, caches, pools)."""
+        try:
+            instrument = self._get_component_instrument("counter", name, description, unit)
+            if instrument is not None:
+                instrument.add(value, attributes or {})
+        except Exception as e:
+            logger.debug(f"Failed to record counter {name}: {e}")
+
+    def record_histogram(
+        self,
+        name: str,
+        value: float,
+        attributes: Optional[Dict[str, Any]] = None,
+        description: str = "",
+        unit: str = "1",
+    ) -> None:
+        """Record ``value`` on a named histogram used by backend/SDK components."""
+        try:
+            instrument = self._get_component_instrument("histogram", name, description, unit)
+            if instrument is not None:
+                instrument.record(value, attributes or {})
+        except Exception as e:
+            logger.debug(f"Failed to record histogram {name}: {e}")
+
     def monitor_endpoint(
         self,
         operation_name: Optional[str] = None,
@@ -2482,12 +2538,20 @@ class MonitoringRecordBuffer:
     """Thread-safe buffer that batches LLM monitoring records and flushes to PostgreSQL.
 
     Uses collections.deque for non-blocking, lock-free appends. A daemon background
-    thread periodically flushes records to the database in batches.
+    thread flushes records to the database in batches: on the flush interval, as soon
+    as a full batch is buffered, and back to back while a backlog remains.
+
+    Each batch is validated up front and written as one multi-row INSERT on the
+    isolated monitoring engine; invalid records are dropped without aborting the batch.
 
     Degradation: after 3 consecutive DB write failures, stops writing and logs only.
     Automatically retries after 30 seconds.
     """
 
+    # Per-row errors that do not indicate an unavailable database; on these the
+    # batch is retried row by row so only the offending rows are dropped.
+    _ROW_ERROR_NAMES = ("IntegrityError", "DataError")
+
     def __init__(self):
         self._buffer: deque = deque(maxlen=5000)
         self._enabled: bool = os.getenv(
@@ -2503,6 +2567,13 @@ class MonitoringRecordBuffer:
         self._running: bool = False
         self._flush_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._db_handles: Optional[tuple] = None
+        self._valid_columns: Optional[tuple] = None
+        self._dropped_records: int = 0
+        self._exported_dropped_records: int = 0
+        self._invalid_records: int = 0
+        self._written_records: int = 0
 
         if self._enabled:
             self._start_flush_thread()
@@ -2523,10 +2594,16 @@ class MonitoringRecordBuffer:
     def add_record(self, record: dict) -> None:
         if not self._enabled:
             return
+        if len(self._buffer) == self._buffer.maxlen:
+            # deque(maxlen) silently evicts the oldest record
+            self._dropped_records += 1
         self._buffer.append(record)
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
 
     def _flush_loop(self) -> None:
         while self._running:
+            backlog = False
             try:
                 now = time.time()
                 buffer_size = len(self._buffer)
@@ -2535,22 +2612,25 @@ class MonitoringRecordBuffer:
                         now - self._last_flush_time) >= self._flush_interval
                 )
                 if should_flush:
-                    self._flush_to_db()
+                    written = self._flush_to_db()
                     self._last_flush_time = now
+                    backlog = bool(written) and len(self._buffer) >= self._batch_size
+                self._export_buffer_stats()
             except Exception as e:
                 logger.error(f"Error in monitoring flush loop: {e}")
 
-            for _ in range(10):
-                if not self._running:
-                    return
-                time.sleep(self._flush_interval / 10)
+            if backlog:
+                continue
+            self._wakeup.wait(self._flush_interval / 10)
+            self._wakeup.clear()
 
-    def _flush_to_db(self) -> None:
+    def _flush_to_db(self) -> int:
+        """Write one batch; returns the number of records taken off the buffer."""
         now = time.time()
 
         if self._consecutive_failures >= self._max_failures:
             if now < self._degraded_until:
-                return
+                return 0
             logger.info(
                 "Monitoring buffer: retrying after degradation cooldown")
 
@@ -2559,50 +2639,145 @@ class MonitoringRecordBuffer:
             batch.append(self._buffer.popleft())
 
         if not batch:
-            return
+            return 0
 
         try:
             self._write_batch(batch)
             self._consecutive_failures = 0
             logger.debug(
                 f"Monitoring buffer: flushed {len(batch)} records to DB")
+            return len(batch)
         except Exception as e:
             self._consecutive_failures += 1
             logger.error(
                 f"Monitoring buffer: DB write failed (attempt {self._consecutive_failures}): {e}")
             for record in reversed(batch):
+                if len(self._buffer) == self._buffer.maxlen:
+                    # appendleft on a full deque evicts the newest record
+                    self._dropped_records += 1
                 self._buffer.appendleft(record)
 
             if self._consecutive_failures >= self._max_failures:
                 self._degraded_until = now + 30
                 logger.warning(
                     f"Monitoring buffer: degraded mode for 30s after {self._max_failures} failures")
+            return 0
+
+    def _get_db_handles(self) -> tuple:
+        """Resolve the backend session factory and ORM model once per buffer."""
+        if self._db_handles is None:
+            try:
+                import sys
+
+                backend_path = os.path.join(os.getcwd(), "backend")
+                if os.path.exists(backend_path) and backend_path not in sys.path:
+                    sys.path.insert(0, backend_path)
+
+                from database.client import get_monitoring_db_session
+                from database.db_models import ModelMonitoringRecord
+            except ImportError as e:
+                logger.debug(
+                    f"Monitoring buffer: backend database not available: {e}")
+                raise RuntimeError("Backend database module not available")
+            self._db_handles = (get_monitoring_db_session, ModelMonitoringRecord)
+        return self._db_handles
+
+    def _get_valid_columns(self, model) -> tuple:
+        """(column names, required names, names with defaults, max string lengths) of the monitoring table."""
+        if self._valid_columns is None:
+            columns = list(model.__table__.columns)
+            names = frozenset(column.name for column in columns)
+            defaulted = frozenset(
+                column.name for column in columns
+                if column.primary_key or column.default is not None or column.server_default is not None
+            )
+            required = tuple(
+                column.name for column in columns
+                if not column.nullable and column.name not in defaulted
+            )
+            lengths = {
+                column.name: column.type.length for column in columns
+                if isinstance(getattr(column.type, "length", None), int)
+            }
+            self._valid_columns = (names, required, defaulted, lengths)
+        return self._valid_columns
+
+    def _validate_records(self, batch: List[dict], model) -> List[dict]:
+        """Drop records that would fail the INSERT, so they cannot abort the whole batch."""
+        names, required, defaulted, lengths = self._get_valid_columns(model)
+        valid = []
+        for record in batch:
+            problem = None
+            unknown = record.keys() - names
+            if unknown:
+                problem = f"unknown fields {sorted(unknown)}"
+            else:
+                missing = [name for name in required if record.get(name) is None]
+                if missing:
+                    problem = f"missing required fields {missing}"
+                else:
+                    too_long = [
+                        name for name, length in lengths.items()
+                        if isinstance(record.get(name), str) and len(record[name]) > length
+                    ]
+                    if too_long:
+                        problem = f"values too long for {too_long}"
+            if problem is None:
+                valid.append(record)
+                continue
+            logger.warning(
+                "Monitoring buffer: skipping record due to error: %s | record=%s",
+                problem,
+                {k: v for k, v in record.items() if k in (
+                    "model_name", "tenant_id", "model_type")},
+            )
+        # Give every row the same keys so the batch is one executemany statement;
+        # columns with defaults are left out rather than overwritten with NULL.
+        fill = set().union(*valid) - defaulted if valid else set()
+        return [
+            {**dict.fromkeys(fill - record.keys()), **record} if fill - record.keys() else record
+            for record in valid
+        ]
 
     def _write_batch(self, batch: List[dict]) -> None:
-        try:
-            import sys
-            import os
+        get_monitoring_db_session, ModelMonitoringRecord = self._get_db_handles()
+        from sqlalchemy import insert
+
+        rows = self._validate_records(batch, ModelMonitoringRecord)
+        invalid = len(batch) - len(rows)
+        self._invalid_records += invalid
+        if invalid:
+            get_monitoring_manager().record_counter(
+                "monitoring.buffer.invalid_records", invalid,
+                description="Monitoring records dropped by validation before insert")
+        if not rows:
+            return
 
-            backend_path = os.path.join(os.getcwd(), "backend")
-            if os.path.exists(backend_path) and backend_path not in sys.path:
-                sys.path.insert(0, backend_path)
+        try:
+            # One multi-row INSERT (executemany / insertmanyvalues) in one transaction.
+            with get_monitoring_db_session() as session:
+                session.execute(insert(ModelMonitoringRecord), rows)
+            written = len(rows)
+        except Exception as e:
+            if type(e).__name__ not in self._ROW_ERROR_NAMES:
+                raise
+            logger.warning(
+                "Monitoring buffer: batch insert rejected (%s), retrying %d records individually",
+                type(e).__name__, len(rows))
+            written = self._write_rows_individually(rows, get_monitoring_db_session, ModelMonitoringRecord)
 
-            from database.client import get_monitoring_db_session
-            from database.db_models import ModelMonitoringRecord
-        except ImportError as e:
-            logger.debug(
-                f"Monitoring buffer: backend database not available: {e}")
-            raise RuntimeError("Backend database module not available")
+        self._written_records += written
+        get_monitoring_manager().record_counter(
+            "monitoring.buffer.written_records", written,
+            description="Monitoring records written to the database")
 
-        # Write records individually so that one bad record (e.g. missing
-        # tenant_id) does not abort the entire batch.
+    def _write_rows_individually(self, rows: List[dict], get_session, model) -> int:
         succeeded = 0
         failed = 0
-        for record in batch:
+        for record in rows:
             try:
-                with get_monitoring_db_session() as session:
-                    row = ModelMonitoringRecord(**record)
-                    session.add(row)
+                with get_session() as session:
+                    session.add(model(**record))
                     session.flush()
                 succeeded += 1
             except Exception as rec_err:
@@ -2615,14 +2790,41 @@ class MonitoringRecordBuffer:
                 )
 
         if failed > 0:
+            self._invalid_records += failed
             logger.warning(
                 "Monitoring buffer: batch write completed with %d succeeded, %d failed",
                 succeeded,
                 failed,
             )
+        return succeeded
+
+    def _export_buffer_stats(self) -> None:
+        monitoring = get_monitoring_manager()
+        monitoring.record_histogram(
+            "monitoring.buffer.depth", len(self._buffer),
+            description="Monitoring records waiting to be flushed")
+        dropped = self._dropped_records - self._exported_dropped_records
+        if dropped:
+            self._exported_dropped_records += dropped
+            monitoring.record_counter(
+                "monitoring.buffer.dropped_records", dropped,
+                description="Monitoring records evicted because the buffer was full")
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer depth and lifetime record counters."""
+        return {
+            "depth": len(self._buffer),
+            "capacity": self._buffer.maxlen,
+            "dropped_records": self._dropped_records,
+            "invalid_records": self._invalid_records,
+            "written_records": self._written_records,
+            "degraded": self._consecutive_failures >= self._max_failures
+            and time.time() < self._degraded_until,
+        }
 
     def stop(self) -> None:
         self._running = False
+        self._wakeup.set()
         if self._flush_thread and self._flush_thread.is_alive():
             self._flush_thread.join(timeout=5)
         logger.info("Monitoring buffer flush thread stopped")
@@ -45,6 +45,21 @@ from httpx import Limits
 
 logger = logging.getLogger("http_client_manager")
 
+_http2_supported: Optional[bool] = None
+
+
+def _http2_available() -> bool:
+    """Whether the optional ``h2`` package needed by httpx for HTTP/2 is installed."""
+    global _http2_supported
+    if _http2_supported is None:
+        try:
+            import h2  # noqa: F401
+            _http2_supported = True
+        except ImportError:
+            logger.warning("Package 'h2' is not installed, async clients fall back to HTTP/1.1")
+            _http2_supported = False
+    return _http2_supported
+
 
 @dataclass
 class ClientConfig:
@@ -52,6 +67,7 @@ class ClientConfig:
     base_url: str
     timeout: float = 30.0
     verify_ssl: bool = True
+    http2: bool = False
     limits: Limits = field(default_factory=lambda: Limits(
         max_connections=100,
         max_keepalive_connections=20
@@ -127,14 +143,15 @@ class HttpClientManager:
         """
         self.shutdown()
 
-    def _get_client_key(self, base_url: str, timeout: float, verify_ssl: bool) -> str:
+    def _get_client_key(self, base_url: str, timeout: float, verify_ssl: bool, http2: bool = False) -> str:
         """
-        Generate a unique key for client registry based on URL, timeout, and SSL setting.
+        Generate a unique key for client registry based on URL, timeout, SSL and HTTP/2 settings.
 
-        Different configurations (timeout, verify_ssl) for the same base_url
+        Different configurations (timeout, verify_ssl, http2) for the same base_url
         will create separate client instances to ensure correct behavior.
         """
-        return f"{base_url}|{timeout}|{verify_ssl}"
+        key = f"{base_url}|{timeout}|{verify_ssl}"
+        return f"{key}|h2" if http2 else key
 
     def get_sync_client(self, base_url: str, timeout: float = 30.0,
                         verify_ssl: bool = True) -> httpx.Client:
@@ -178,36 +195,42 @@ class HttpClientManager:
             return self._clients[key]
 
     def get_async_client(self, base_url: str, timeout: float = 30.0,
-                         verify_ssl: bool = True) -> httpx.AsyncClient:
+                         verify_ssl: bool = True, http2: bool = False) -> httpx.AsyncClient:
         """
         Get or create an asynchronous HTTP client for the given configuration.
 
-        Different timeout or verify_ssl settings for the same base_url will
+        Different timeout, verify_ssl or http2 settings for the same base_url will
         create separate client instances.
 
         Args:
             base_url: Base URL for the HTTP client
             timeout: Request timeout in seconds (default: 30.0)
             verify_ssl: Whether to verify SSL certificates (default: True)
+            http2: Negotiate HTTP/2 when the server supports it (default: False).
+                Falls back to HTTP/1.1 if the optional ``h2`` package is not installed.
 
         Returns:
             httpx.AsyncClient instance configured for the given parameters
         """
-        key = self._get_client_key(base_url, timeout, verify_ssl)
+        http2 = http2 and _http2_available()
+        key = self._get_client_key(base_url, timeout, verify_ssl, http2)
 
         with self._lock:
             if key not in self._async_clients:
                 logger.info(
-                    f"Creating async HTTP client for: {base_url} (timeout={timeout}, verify_ssl={verify_ssl})")
+                    f"Creating async HTTP client for: {base_url} "
+                    f"(timeout={timeout}, verify_ssl={verify_ssl}, http2={http2})")
                 self._configs[key] = ClientConfig(
                     base_url=base_url,
                     timeout=timeout,
-                    verify_ssl=verify_ssl
+                    verify_ssl=verify_ssl,
+                    http2=http2
                 )
                 self._async_clients[key] = httpx.AsyncClient(
                     base_url=base_url,
                     timeout=timeout,
                     verify=verify_ssl,
+                    http2=http2,
                     limits=Limits(
                         max_connections=100,
                         max_keepalive_connections=20
@@ -252,7 +275,7 @@ class HttpClientManager:
             return False
 
     async def close_async_client(self, base_url: str, timeout: float = 30.0,
-                                 verify_ssl: bool = True) -> bool:
+                                 verify_ssl: bool = True, http2: bool = False) -> bool:
         """
         Close and remove a specific async HTTP client.
 
@@ -260,11 +283,12 @@ class HttpClientManager:
             base_url: Base URL of the client to close
             timeout: Timeout setting of the client
             verify_ssl: SSL verification setting of the client
+            http2: HTTP/2 setting the client was requested with
 
         Returns:
             True if client was found and closed, False otherwise
         """
-        key = self._get_client_key(base_url, timeout, verify_ssl)
+        key = self._get_client_key(base_url, timeout, verify_ssl, http2 and _http2_available())
 
         with self._lock:
             if key in self._async_clients:
@@ -361,6 +385,7 @@ class HttpClientManager:
                         "base_url": config.base_url,
                         "verify_ssl": config.verify_ssl,
                         "timeout": config.timeout,
+                        "http2": config.http2,
                         "is_async": key in self._async_clients
                     }
                     for key, config in self._configs.items()
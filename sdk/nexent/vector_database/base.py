@@ -82,6 +82,7 @@ class VectorDatabaseCore(ABC):
         embedding_batch_size: int = 10,
         large_mode: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        skip_refresh: bool = False,
     ) -> int:
         """
         Index documents with embeddings.
@@ -92,12 +93,26 @@ class VectorDatabaseCore(ABC):
             documents: List of document dictionaries
             batch_size: Number of documents to process at once
             content_field: Field to use for generating embeddings
+            skip_refresh: Leave the documents unrefreshed; the caller calls refresh_index later
 
         Returns:
             int: Number of documents successfully indexed
         """
         pass
 
+    @abstractmethod
+    def refresh_index(self, index_name: str) -> bool:
+        """
+        Make every document written to an index so far searchable.
+
+        Args:
+            index_name: Name of the index to refresh
+
+        Returns:
+            bool: True if the refresh succeeded
+        """
+        pass
+
     @abstractmethod
     def delete_documents(self, index_name: str, path_or_url: str) -> int:
         """
@@ -221,7 +236,9 @@ class VectorDatabaseCore(ABC):
     # ---- SEARCH OPERATIONS ----
 
     @abstractmethod
-    def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def accurate_search(
+        self, index_names: List[str], query_text: str, top_k: int = 5, document_paths: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Search for documents using fuzzy text matching across multiple indices.
 
@@ -229,6 +246,7 @@ class VectorDatabaseCore(ABC):
             index_names: List of index names to search in
             query_text: The text query to search for
             top_k: Number of results to return
+            document_paths: Optional allow-list of path_or_url values to restrict the search to
 
         Returns:
             List of search results with scores and document content
@@ -237,7 +255,12 @@ class VectorDatabaseCore(ABC):
 
     @abstractmethod
     def semantic_search(
-        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents using vector similarity across multiple indices.
@@ -247,6 +270,7 @@ class VectorDatabaseCore(ABC):
             query_text: The text query to search for
             embedding_model: The embedding model to use
             top_k: Number of results to return
+            document_paths: Optional allow-list of path_or_url values to restrict the search to
 
         Returns:
             List of search results with scores and document content
@@ -261,6 +285,7 @@ class VectorDatabaseCore(ABC):
         embedding_model: BaseEmbedding,
         top_k: int = 5,
         weight_accurate: float = 0.3,
+        document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search method, combining accurate matching and semantic search results across multiple indices.
@@ -272,6 +297,7 @@ class VectorDatabaseCore(ABC):
             top_k: Number of results to return
             weight_accurate: The weight of the accurate matching score (0-1),
                            the semantic search weight is 1-weight_accurate
+            document_paths: Optional allow-list of path_or_url values to restrict the search to
 
         Returns:
             List of search results sorted by combined score
@@ -93,6 +93,7 @@ class DataMateCore(VectorDatabaseCore):
             embedding_batch_size: int = 10,
             large_mode: bool = False,
             progress_callback: Optional[Callable[[int, int], None]] = None,
+            skip_refresh: bool = False,
     ) -> int:
         _ = (
             index_name,
@@ -103,10 +104,16 @@ class DataMateCore(VectorDatabaseCore):
             embedding_batch_size,
             large_mode,
             progress_callback,
+            skip_refresh,
         )
         raise NotImplementedError(
             "DataMate SDK does not support direct document ingestion.")
 
+    def refresh_index(self, index_name: str) -> bool:
+        _ = index_name
+        raise NotImplementedError(
+            "DataMate SDK does not support refreshing indices.")
+
     def delete_documents(self, index_name: str, path_or_url: str) -> int:
         _ = (index_name, path_or_url)
         raise NotImplementedError(
@@ -158,15 +165,22 @@ class DataMateCore(VectorDatabaseCore):
         raise NotImplementedError(
             "DataMate SDK does not support multi search API.")
 
-    def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
-        _ = (index_names, query_text, top_k)
+    def accurate_search(
+            self, index_names: List[str], query_text: str, top_k: int = 5, document_paths: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        _ = (index_names, query_text, top_k, document_paths)
         raise NotImplementedError(
             "DataMate SDK does not support accurate search API.")
 
     def semantic_search(
-            self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+            self,
+            index_names: List[str],
+            query_text: str,
+            embedding_model: BaseEmbedding,
+            top_k: int = 5,
+            document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        _ = (index_names, query_text, embedding_model, top_k)
+        _ = (index_names, query_text, embedding_model, top_k, document_paths)
         raise NotImplementedError(
             "DataMate SDK does not support semantic search API.")
 
@@ -178,6 +192,7 @@ class DataMateCore(VectorDatabaseCore):
             embedding_model: Optional[BaseEmbedding] = None,
             top_k: int = 10,
             weight_accurate: float = 0.2,
+            document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve content in DataMate knowledge bases.
@@ -188,14 +203,19 @@ class DataMateCore(VectorDatabaseCore):
             embedding_model: Optional embedding model
             top_k: Maximum number of results to return (default: 10)
             weight_accurate: Similarity threshold (default: 0.2)
+            document_paths: Not supported by DataMate retrieval; must be empty
 
         Returns:
             List of retrieve result dictionaries
 
         Raises:
             RuntimeError: If the API request fails
+            NotImplementedError: If document_paths is given
         """
         _ = embedding_model  # Explicitly ignored
+        if document_paths:
+            raise NotImplementedError(
+                "DataMate SDK does not support document_paths filtering.")
         retrieve_knowledge = self.client.retrieve_knowledge_base(
             query_text, index_names, top_k, weight_accurate)
         return retrieve_knowledge
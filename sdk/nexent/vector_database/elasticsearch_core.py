@@ -1,9 +1,12 @@
 import base64
+import contextvars
 import json
 import logging
 import os
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -11,9 +14,11 @@ from typing import Any, Callable, Dict, List, Optional
 
 from elasticsearch import Elasticsearch, exceptions
 
+from ..core.models.embedding_cache import embed_query, embed_texts
 from ..core.models.embedding_model import BaseEmbedding
 from ..core.nlp.tokenizer import calculate_term_weights
 from .base import VectorDatabaseCore
+from .search_result_cache import bump_index_generation
 from .utils import build_weighted_query, format_size
 
 
@@ -32,6 +37,16 @@ class BulkOperation:
 
 SCROLL_TTL = "2m"
 DEFAULT_SCROLL_SIZE = 1000
+# Values per ``terms`` clause of a document_paths filter; ES rejects larger clauses
+# once they pass index.max_terms_count (65536 by default)
+TERMS_FILTER_CHUNK_SIZE = 4096
+# Embedding sub-batches and bulk requests in flight during large inserts; embedding
+# providers rate-limit per key, and each bulk request holds an ES write thread
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_BULK_CONCURRENCY = 2
+
+# Shared workers that fetch query embeddings while hybrid search prepares its text query
+_QUERY_EMBEDDING_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="es-query-embedding")
 
 
 class ElasticSearchCore(VectorDatabaseCore):
@@ -52,6 +67,8 @@ class ElasticSearchCore(VectorDatabaseCore):
         api_key: Optional[str],
         verify_certs: bool = False,
         ssl_show_warn: bool = False,
+        embedding_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+        bulk_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ):
         """
         Initialize ElasticSearchCore with Elasticsearch client and JinaEmbedding model.
@@ -61,6 +78,8 @@ class ElasticSearchCore(VectorDatabaseCore):
             api_key: Elasticsearch API key (defaults to env variable)
             verify_certs: Whether to verify SSL certificates
             ssl_show_warn: Whether to show SSL warnings
+            embedding_concurrency: Embedding sub-batches in flight during large inserts
+            bulk_concurrency: Bulk requests in flight during large inserts
         """
         # Get credentials from environment if not provided
         self.host = host
@@ -88,6 +107,8 @@ class ElasticSearchCore(VectorDatabaseCore):
         self.max_tokens_per_text = 8192
         self.max_total_tokens = 100000
         self.max_retries = 3  # Number of retries for failed embedding batches
+        self.embedding_concurrency = embedding_concurrency
+        self.bulk_concurrency = bulk_concurrency
 
     # ---- INDEX MANAGEMENT ----
 
@@ -192,6 +213,10 @@ class ElasticSearchCore(VectorDatabaseCore):
                 return False
         return False
 
+    def refresh_index(self, index_name: str) -> bool:
+        """Make every document written so far searchable."""
+        return self._force_refresh_with_retry(index_name)
+
     def _ensure_index_ready(self, index_name: str, timeout: int = 10) -> bool:
         """
         Ensure index is ready, avoid 503 error - synchronous version
@@ -293,6 +318,7 @@ class ElasticSearchCore(VectorDatabaseCore):
         """
         try:
             self.client.indices.delete(index=index_name)
+            bump_index_generation(index_name)
             logger.info(f"Successfully deleted the index: {index_name}")
             return True
         except exceptions.NotFoundError:
@@ -344,6 +370,7 @@ class ElasticSearchCore(VectorDatabaseCore):
         embedding_batch_size: int = 10,
         large_mode: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        skip_refresh: bool = False,
     ) -> int:
         """
         Smart batch insertion - automatically selecting strategy based on data size
@@ -355,6 +382,8 @@ class ElasticSearchCore(VectorDatabaseCore):
             batch_size: Number of documents to process at once
             content_field: Field to use for generating embeddings
             embedding_batch_size: Number of documents to send to embedding API at once (default: 10)
+            skip_refresh: Insert through the large path without touching index settings or
+                refreshing; the caller refreshes once with refresh_index after its last batch
 
         Returns:
             int: Number of documents successfully indexed
@@ -367,10 +396,9 @@ class ElasticSearchCore(VectorDatabaseCore):
 
         # Smart strategy selection
         total_docs = len(documents)
-        if total_docs >= 64 or large_mode:
-            # Large path: use context manager for index setting optimization.
-            estimated_duration = max(60, total_docs // 100)
-            with self.bulk_operation_context(index_name, estimated_duration):
+        try:
+            if skip_refresh:
+                # One batch of a multi-batch upload: leave settings and refresh to the caller
                 return self._large_batch_insert(
                     index_name=index_name,
                     documents=documents,
@@ -379,16 +407,33 @@ class ElasticSearchCore(VectorDatabaseCore):
                     embedding_model=embedding_model,
                     embedding_batch_size=embedding_batch_size,
                     progress_callback=progress_callback,
+                    refresh=False,
                 )
-        else:
-            # Small data: direct insertion, using wait_for refresh
-            return self._small_batch_insert(
-                index_name=index_name,
-                documents=documents,
-                content_field=content_field,
-                embedding_model=embedding_model,
-                progress_callback=progress_callback,
-            )
+            if total_docs >= 64 or large_mode:
+                # Large path: use context manager for index setting optimization.
+                estimated_duration = max(60, total_docs // 100)
+                with self.bulk_operation_context(index_name, estimated_duration):
+                    return self._large_batch_insert(
+                        index_name=index_name,
+                        documents=documents,
+                        batch_size=batch_size,
+                        content_field=content_field,
+                        embedding_model=embedding_model,
+                        embedding_batch_size=embedding_batch_size,
+                        progress_callback=progress_callback,
+                    )
+            else:
+                # Small data: direct insertion, using wait_for refresh
+                return self._small_batch_insert(
+                    index_name=index_name,
+                    documents=documents,
+                    content_field=content_field,
+                    embedding_model=embedding_model,
+                    progress_callback=progress_callback,
+                )
+        finally:
+            # New chunks change search results, even when the insert failed part way
+            bump_index_generation(index_name)
 
     def _small_batch_insert(
         self,
@@ -470,7 +515,7 @@ class ElasticSearchCore(VectorDatabaseCore):
                 if doc.get("process_source") != "UniversalImageExtractor"
             ]
             inputs = [doc[content_field] for doc in filtered_docs]
-            embeddings = embedding_model.get_embeddings(inputs)
+            embeddings = embed_texts(embedding_model, inputs)
             return filtered_docs, embeddings
 
     @staticmethod
@@ -503,14 +548,22 @@ class ElasticSearchCore(VectorDatabaseCore):
         embedding_model: BaseEmbedding,
         embedding_batch_size: int = 10,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        refresh: bool = True,
     ) -> int:
         """
-        Large batch insertion with sub-batching for embedding API.
-        Splits large document batches into smaller chunks to respect embedding API limits before bulk inserting into Elasticsearch.
+        Large batch insertion as an embedding -> bulk pipeline.
+
+        Embedding sub-batches of ``embedding_batch_size`` run on a worker pool with at most
+        ``self.embedding_concurrency`` requests in flight. Their results are consumed in order
+        and sliced into Elasticsearch batches of ``batch_size`` documents, which are written by
+        a second pool (at most ``self.bulk_concurrency`` bulk requests in flight) while later
+        sub-batches are still embedding. Only the in-flight windows hold vectors, so memory no
+        longer grows with the number of chunks.
+
+        A sub-batch that keeps failing still fails the whole insert; documents that were
+        already written are deleted first so the upper-layer retry does not index them twice.
         """
         try:
-            sub_batch_max_retries = self.max_retries
-
             processed_docs = self._preprocess_documents(
                 documents, content_field)
             if embedding_model.model_type != "multimodal":
@@ -518,128 +571,236 @@ class ElasticSearchCore(VectorDatabaseCore):
                     doc for doc in processed_docs
                     if doc.get("process_source") != "UniversalImageExtractor"
                 ]
-            total_indexed = 0
-            total_vectorized = 0
             total_docs = len(processed_docs)
-            es_total_batches = 1
+            batch_size = max(1, batch_size)
+            embedding_batch_size = max(1, embedding_batch_size)
+            embedding_concurrency = max(1, self.embedding_concurrency)
+            bulk_concurrency = max(1, self.bulk_concurrency)
+            es_total_batches = max(1, -(-total_docs // batch_size))
             start_time = time.time()
 
             logger.info(
-                f"=== [INDEXING START] Total chunks: {total_docs}, ES batch size: {batch_size}, Total ES batches: {es_total_batches} ==="
+                f"=== [INDEXING START] Total chunks: {total_docs}, ES batch size: {batch_size}, Total ES batches: {es_total_batches}, "
+                f"embedding concurrency: {embedding_concurrency}, bulk concurrency: {bulk_concurrency} ==="
             )
 
-            es_batch = processed_docs
-            es_batch_num = 1
-            es_batch_start_time = time.time()
-
-            # Store documents and their embeddings for this Elasticsearch batch
-            doc_embedding_pairs = []
-
-            # Sub-batch for embedding API
-            # Use the provided embedding_batch_size (default 10) to reduce provider pressure
-            for j in range(0, len(es_batch), embedding_batch_size):
-                embedding_sub_batch = es_batch[j: j + embedding_batch_size]
-                # Retry logic for embedding API call.
-                # Important: do not silently skip failed sub-batches, otherwise upper layer sees
-                # partial indexing and reports false-negative "failed then ready".
-                for retry_attempt in range(sub_batch_max_retries):
-                    try:
-                        if embedding_model.model_type == "multimodal":
-                            inputs = []
-                            docs_for_embeddings = []
-                            for doc in embedding_sub_batch:
-                                if doc.get("process_source") == "UniversalImageExtractor":
-                                    img_bytes = doc.pop("image_bytes", "")
-                                    if len(img_bytes) > 0:
-                                        image_base64_str = base64.b64encode(
-                                            img_bytes).decode('utf-8')
-                                        data = f"data:image/jpeg;base64,{image_base64_str}"
-                                        inputs.append({"image": data})
-                                        docs_for_embeddings.append(doc)
-                                else:
-                                    inputs.append({"text": doc[content_field]})
-                                    docs_for_embeddings.append(doc)
-                            embeddings = embedding_model.get_multimodal_embeddings(inputs)
-                            for doc, embedding in zip(docs_for_embeddings, embeddings):
-                                doc_embedding_pairs.append((doc, embedding))
-                        else:
-                            inputs = [doc[content_field]
-                                        for doc in embedding_sub_batch]
-                            embeddings = embedding_model.get_embeddings(inputs)
-                            for doc, embedding in zip(embedding_sub_batch, embeddings):
-                                doc_embedding_pairs.append((doc, embedding))
-                        
-                        total_vectorized += len(embedding_sub_batch)
-                        if progress_callback:
-                            try:
-                                progress_callback(
-                                    total_vectorized, total_docs)
-                                logger.debug(
-                                    f"[VECTORIZE] Progress callback (embedding) {total_vectorized}/{total_docs} (ES batch {es_batch_num}/{es_total_batches}, sub-batch start {j})")
-                            except Exception as callback_err:
-                                logger.warning(
-                                    f"[VECTORIZE] Progress callback failed during embedding: {callback_err}")
-                        break  # Success, exit retry loop
-
-                    except Exception as e:
-                        retry_delay = min(1.0 * (2 ** retry_attempt), 30.0)
-                        if retry_attempt < sub_batch_max_retries - 1:
-                            logger.warning(
-                                f"Embedding API error (attempt {retry_attempt + 1}/{sub_batch_max_retries}): "
-                                f"{e}, ES batch num: {es_batch_num}, sub-batch start: {j}, "
-                                f"size: {len(embedding_sub_batch)}. Retrying in {retry_delay}s..."
-                            )
-                            time.sleep(retry_delay)
-                        else:
-                            logger.error(
-                                f"Embedding API error after {sub_batch_max_retries} attempts: {e}, "
-                                f"ES batch num: {es_batch_num}, sub-batch start: {j}, "
-                                f"size: {len(embedding_sub_batch)}"
-                            )
-                            # Escalate to upper layer retry instead of returning partial success.
-                            raise
-
-            # Perform a single bulk insert for the entire Elasticsearch batch
-            if not doc_embedding_pairs:
-                logger.warning(
-                    f"No documents with embeddings to index for ES batch {es_batch_num}")
-                return 0
-
-            operations = []
-            for doc, embedding in doc_embedding_pairs:
-                operations.append({"index": {"_index": index_name}})
-                doc["multi_embedding" if doc["process_source"]
-                        == "UniversalImageExtractor" else "embedding"] = embedding
-                if "embedding_model_name" not in doc:
-                    doc["embedding_model_name"] = getattr(
-                        embedding_model, "embedding_model_name", "unknown")
-                operations.append(doc)
-
-            try:
-                response = self.client.bulk(
-                    index=index_name, operations=operations, refresh=False)
-                self._handle_bulk_errors(response)
-                total_indexed += len(doc_embedding_pairs)
-                es_batch_elapsed = time.time() - es_batch_start_time
+            timings = {"embedding": 0.0, "embedding_wait": 0.0, "bulk": 0.0, "bulk_wait": 0.0}
+            written_ids: List[str] = []
+            total_indexed = 0
+            total_vectorized = 0
+            es_batch_num = 0
+            pending_pairs: List[tuple] = []
+            embedding_futures: deque = deque()
+            bulk_futures: deque = deque()
+            sub_batch_starts = iter(range(0, total_docs, embedding_batch_size))
+
+            embedding_pool = ThreadPoolExecutor(
+                max_workers=embedding_concurrency, thread_name_prefix="es-embedding")
+            bulk_pool = ThreadPoolExecutor(
+                max_workers=bulk_concurrency, thread_name_prefix="es-bulk")
+
+            def submit_next_embedding() -> None:
+                start = next(sub_batch_starts, None)
+                if start is None:
+                    return
+                sub_batch = processed_docs[start: start + embedding_batch_size]
+                embedding_futures.append((start, len(sub_batch), embedding_pool.submit(
+                    self._embed_sub_batch, sub_batch, start, content_field, embedding_model)))
+
+            def collect_bulk_result() -> None:
+                nonlocal total_indexed
+                wait_start = time.time()
+                batch_num, ids, indexed, elapsed = bulk_futures.popleft().result()
+                timings["bulk_wait"] += time.time() - wait_start
+                timings["bulk"] += elapsed
+                written_ids.extend(ids)
+                total_indexed += indexed
                 logger.info(
-                    f"[ES BATCH {es_batch_num}/{es_total_batches}] Indexed {len(doc_embedding_pairs)} documents in {es_batch_elapsed:.2f}s. Total progress: {total_indexed}/{total_docs}"
+                    f"[ES BATCH {batch_num}/{es_total_batches}] Indexed {indexed} documents in {elapsed:.2f}s. Total progress: {total_indexed}/{total_docs}"
                 )
 
-            except Exception as e:
-                logger.error(
-                    f"Bulk insert error: {e}, ES batch num: {es_batch_num}")
+            def submit_bulk(pairs: List[tuple]) -> None:
+                nonlocal es_batch_num
+                # Bounded hand-off: wait for the oldest write before exceeding the in-flight limit
+                while len(bulk_futures) >= bulk_concurrency:
+                    collect_bulk_result()
+                es_batch_num += 1
+                bulk_futures.append(bulk_pool.submit(
+                    self._bulk_index_batch, index_name, pairs, embedding_model, es_batch_num))
+
+            try:
+                for _ in range(embedding_concurrency):
+                    submit_next_embedding()
+
+                while embedding_futures:
+                    sub_batch_start, sub_batch_len, future = embedding_futures.popleft()
+                    wait_start = time.time()
+                    pairs, elapsed = future.result()
+                    timings["embedding_wait"] += time.time() - wait_start
+                    timings["embedding"] += elapsed
+                    submit_next_embedding()
+
+                    total_vectorized += sub_batch_len
+                    if progress_callback:
+                        try:
+                            progress_callback(total_vectorized, total_docs)
+                            logger.debug(
+                                f"[VECTORIZE] Progress callback (embedding) {total_vectorized}/{total_docs} (sub-batch start {sub_batch_start})")
+                        except Exception as callback_err:
+                            logger.warning(
+                                f"[VECTORIZE] Progress callback failed during embedding: {callback_err}")
+
+                    pending_pairs.extend(pairs)
+                    while len(pending_pairs) >= batch_size:
+                        submit_bulk(pending_pairs[:batch_size])
+                        pending_pairs = pending_pairs[batch_size:]
+
+                if pending_pairs:
+                    submit_bulk(pending_pairs)
+                    pending_pairs = []
+                while bulk_futures:
+                    collect_bulk_result()
+            except Exception:
+                embedding_pool.shutdown(wait=True, cancel_futures=True)
+                bulk_pool.shutdown(wait=True)
+                for future in bulk_futures:
+                    if not future.cancelled() and future.exception() is None:
+                        written_ids.extend(future.result()[1])
+                self._rollback_partial_insert(index_name, written_ids)
                 raise
+            finally:
+                embedding_pool.shutdown(wait=True)
+                bulk_pool.shutdown(wait=True)
 
-            self._force_refresh_with_retry(index_name)
+            if total_indexed == 0:
+                logger.warning(
+                    f"No documents with embeddings to index for {index_name}")
+                return 0
+
+            if refresh:
+                self._force_refresh_with_retry(index_name)
             total_elapsed = time.time() - start_time
             logger.info(
-                f"=== [INDEXING COMPLETE] Successfully indexed {total_indexed}/{total_docs} chunks in {total_elapsed:.2f}s (avg: {total_elapsed / es_total_batches:.2f}s/batch) ==="
+                f"=== [INDEXING COMPLETE] Successfully indexed {total_indexed}/{total_docs} chunks in {total_elapsed:.2f}s "
+                f"(avg: {total_elapsed / es_total_batches:.2f}s/batch; embedding {timings['embedding']:.2f}s, "
+                f"bulk {timings['bulk']:.2f}s, waited on embedding {timings['embedding_wait']:.2f}s, "
+                f"waited on bulk {timings['bulk_wait']:.2f}s) ==="
             )
             return total_indexed
         except Exception as e:
             logger.error(f"Large batch insert failed: {e}")
             raise
 
+    def _embed_sub_batch(
+        self,
+        sub_batch: List[Dict[str, Any]],
+        sub_batch_start: int,
+        content_field: str,
+        embedding_model: BaseEmbedding,
+    ):
+        """
+        Embed one sub-batch with retries, returning its (doc, embedding) pairs and elapsed time.
+
+        Important: do not silently skip failed sub-batches, otherwise upper layer sees
+        partial indexing and reports false-negative "failed then ready".
+        """
+        sub_batch_max_retries = self.max_retries
+        start_time = time.time()
+        for retry_attempt in range(sub_batch_max_retries):
+            try:
+                if embedding_model.model_type == "multimodal":
+                    inputs = []
+                    docs_for_embeddings = []
+                    for doc in sub_batch:
+                        if doc.get("process_source") == "UniversalImageExtractor":
+                            img_bytes = doc.pop("image_bytes", "")
+                            if len(img_bytes) > 0:
+                                image_base64_str = base64.b64encode(
+                                    img_bytes).decode('utf-8')
+                                data = f"data:image/jpeg;base64,{image_base64_str}"
+                                inputs.append({"image": data})
+                                docs_for_embeddings.append(doc)
+                        else:
+                            inputs.append({"text": doc[content_field]})
+                            docs_for_embeddings.append(doc)
+                    embeddings = embedding_model.get_multimodal_embeddings(inputs)
+                else:
+                    docs_for_embeddings = sub_batch
+                    embeddings = embed_texts(
+                        embedding_model, [doc[content_field] for doc in sub_batch])
+                return list(zip(docs_for_embeddings, embeddings)), time.time() - start_time
+
+            except Exception as e:
+                retry_delay = min(1.0 * (2 ** retry_attempt), 30.0)
+                if retry_attempt < sub_batch_max_retries - 1:
+                    logger.warning(
+                        f"Embedding API error (attempt {retry_attempt + 1}/{sub_batch_max_retries}): "
+                        f"{e}, sub-batch start: {sub_batch_start}, "
+                        f"size: {len(sub_batch)}. Retrying in {retry_delay}s..."
+                    )
+                    time.sleep(retry_delay)
+                else:
+                    logger.error(
+                        f"Embedding API error after {sub_batch_max_retries} attempts: {e}, "
+                        f"sub-batch start: {sub_batch_start}, size: {len(sub_batch)}"
+                    )
+                    # Escalate to upper layer retry instead of returning partial success.
+                    raise
+        return [], time.time() - start_time
+
+    def _bulk_index_batch(
+        self,
+        index_name: str,
+        doc_embedding_pairs: List[tuple],
+        embedding_model: BaseEmbedding,
+        es_batch_num: int,
+    ):
+        """Write one Elasticsearch batch, returning (batch number, written ids, count, elapsed time)"""
+        start_time = time.time()
+        operations = []
+        for doc, embedding in doc_embedding_pairs:
+            operations.append({"index": {"_index": index_name}})
+            # Attach the vector to a shallow copy so it is released with this batch
+            doc = dict(doc)
+            doc["multi_embedding" if doc["process_source"]
+                == "UniversalImageExtractor" else "embedding"] = embedding
+            if "embedding_model_name" not in doc:
+                doc["embedding_model_name"] = getattr(
+                    embedding_model, "embedding_model_name", "unknown")
+            operations.append(doc)
+
+        try:
+            response = self.client.bulk(
+                index=index_name, operations=operations, refresh=False)
+            self._handle_bulk_errors(response)
+        except Exception as e:
+            logger.error(
+                f"Bulk insert error: {e}, ES batch num: {es_batch_num}")
+            raise
+
+        written_ids = [
+            item["index"]["_id"]
+            for item in response.get("items", [])
+            if isinstance(item, dict) and "_id" in item.get("index", {})
+        ]
+        return es_batch_num, written_ids, len(doc_embedding_pairs), time.time() - start_time
+
+    def _rollback_partial_insert(self, index_name: str, written_ids: List[str]) -> None:
+        """Best-effort removal of documents written before a large batch insert failed"""
+        if not written_ids:
+            return
+        try:
+            self.client.bulk(
+                index=index_name,
+                operations=[{"delete": {"_index": index_name, "_id": doc_id}} for doc_id in written_ids],
+                refresh=False,
+            )
+            logger.warning(
+                f"Rolled back {len(written_ids)} partially indexed documents in {index_name}")
+        except Exception as e:
+            logger.error(
+                f"Failed to roll back {len(written_ids)} partially indexed documents in {index_name}: {e}")
+
     def _preprocess_documents(self, documents: List[Dict[str, Any]], content_field: str) -> List[Dict[str, Any]]:
         """Ensure all documents have the required fields and set default values"""
         current_time = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
@@ -730,10 +891,14 @@ class ElasticSearchCore(VectorDatabaseCore):
             int: Number of documents deleted
         """
         try:
+            # Refresh before bumping the generation, or a search in between re-caches
+            # the deleted chunks until the 5s refresh interval makes the delete visible
             result = self.client.delete_by_query(
                 index=index_name, body={
-                    "query": {"term": {"path_or_url": path_or_url}}}
+                    "query": {"term": {"path_or_url": path_or_url}}},
+                refresh=True,
             )
+            bump_index_generation(index_name)
             logger.info(
                 f"Successfully deleted {result['deleted']} documents with path_or_url: {path_or_url} from index: {index_name}"
             )
@@ -893,6 +1058,7 @@ class ElasticSearchCore(VectorDatabaseCore):
                 document=payload,
                 refresh="wait_for",
             )
+            bump_index_generation(index_name)
             logger.info(
                 "Created chunk %s in index %s", response.get("_id"), index_name
             )
@@ -920,6 +1086,7 @@ class ElasticSearchCore(VectorDatabaseCore):
                 refresh="wait_for",
                 retry_on_conflict=3,
             )
+            bump_index_generation(index_name)
             logger.info(
                 "Updated chunk %s in index %s", document_id, index_name
             )
@@ -949,6 +1116,7 @@ class ElasticSearchCore(VectorDatabaseCore):
                 id=document_id,
                 refresh="wait_for",
             )
+            bump_index_generation(index_name)
             logger.info(
                 "Deleted chunk %s in index %s", document_id, index_name
             )
@@ -996,7 +1164,9 @@ class ElasticSearchCore(VectorDatabaseCore):
 
     # ---- SEARCH OPERATIONS ----
 
-    def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def accurate_search(
+        self, index_names: List[str], query_text: str, top_k: int = 5, document_paths: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Search for documents using fuzzy text matching across multiple indices.
 
@@ -1004,6 +1174,7 @@ class ElasticSearchCore(VectorDatabaseCore):
             index_names: Name of the index to search in
             query_text: The text query to search for
             top_k: Number of results to return
+            document_paths: Optional allow-list of path_or_url values; only their chunks are scored
 
         Returns:
             List of search results with scores and document content
@@ -1014,10 +1185,8 @@ class ElasticSearchCore(VectorDatabaseCore):
         weights = calculate_term_weights(query_text)
 
         # Prepare the search query using match query for fuzzy matching
-        search_query = build_weighted_query(query_text, weights) | {
-            "size": top_k,
-            "_source": {"excludes": ["embedding"]},
-        }
+        search_query = self._build_accurate_query(
+            query_text, weights, top_k, self._build_document_paths_filter(document_paths))
 
         # Execute the search across multiple indices
         raw_results = self.exec_query(index_pattern, search_query)
@@ -1026,7 +1195,11 @@ class ElasticSearchCore(VectorDatabaseCore):
 
     def exec_query(self, index_pattern, search_query):
         response = self.client.search(index=index_pattern, body=search_query)
-        # Process and return results
+        return self._parse_search_hits(response)
+
+    @staticmethod
+    def _parse_search_hits(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert a search response into result dicts with score, document and source index"""
         results = []
         for hit in response["hits"]["hits"]:
             results.append(
@@ -1038,8 +1211,60 @@ class ElasticSearchCore(VectorDatabaseCore):
             )
         return results
 
+    @staticmethod
+    def _build_document_paths_filter(document_paths: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Filter clause restricting hits to the given path_or_url values, or None when there is no allow-list"""
+        if not document_paths:
+            return None
+        paths = list(dict.fromkeys(document_paths))
+        clauses = [
+            {"terms": {"path_or_url": paths[start:start + TERMS_FILTER_CHUNK_SIZE]}}
+            for start in range(0, len(paths), TERMS_FILTER_CHUNK_SIZE)
+        ]
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"bool": {"should": clauses, "minimum_should_match": 1}}
+
+    @staticmethod
+    def _build_accurate_query(
+        query_text: str, weights: Dict[str, float], top_k: int, path_filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        search_query = build_weighted_query(query_text, weights) | {
+            "size": top_k,
+            "_source": {"excludes": ["embedding"]},
+        }
+        if path_filter:
+            # Filter context: disallowed chunks are skipped before scoring and don't affect scores
+            search_query["query"] = {"bool": {"must": search_query["query"], "filter": path_filter}}
+        return search_query
+
+    @staticmethod
+    def _build_knn_queries(
+        query_embedding: List[float], top_k: int, is_multimodal: bool, path_filter: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """kNN queries over text embeddings, plus image embeddings for multimodal models"""
+        fields = ["embedding", "multi_embedding"] if is_multimodal else ["embedding"]
+        queries = []
+        for field in fields:
+            knn = {
+                "field": field,
+                "query_vector": query_embedding,
+                "k": top_k,
+                "num_candidates": top_k * 2,
+            }
+            if path_filter:
+                # Pre-filter: the k nearest neighbours are taken among allowed chunks only
+                knn["filter"] = path_filter
+            queries.append({"knn": knn, "size": top_k, "_source": {"excludes": [field]}})
+        return queries
+
     def semantic_search(
-        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents using vector similarity across multiple indices.
@@ -1049,6 +1274,7 @@ class ElasticSearchCore(VectorDatabaseCore):
             query_text: The text query to search for
             embedding_model: The embedding model to use
             top_k: Number of results to return
+            document_paths: Optional allow-list of path_or_url values; only their chunks are scored
 
         Returns:
             List of search results with scores and document content
@@ -1056,45 +1282,16 @@ class ElasticSearchCore(VectorDatabaseCore):
         # Join index names for multi-index search
         index_pattern = ",".join(index_names)
 
-        # Get query embedding
-        query_embedding = embedding_model.get_embeddings(query_text)[0]
+        # Get query embedding; concurrent searches share one provider request
+        query_embedding = embed_query(embedding_model, query_text)
+
+        # Text embeddings first, then image embeddings for multimodal models
+        raw_results = []
+        for search_query in self._build_knn_queries(
+                query_embedding, top_k, embedding_model.model_type == "multimodal",
+                self._build_document_paths_filter(document_paths)):
+            raw_results += self.exec_query(index_pattern, search_query)
 
-        # Prepare the search query
-        if embedding_model.model_type == "multimodal":
-            search_text_query = {
-                "knn": {
-                    "field": "embedding",
-                    "query_vector": query_embedding,
-                    "k": top_k,
-                    "num_candidates": top_k * 2,
-                },
-                "size": top_k,
-                "_source": {"excludes": ["embedding"]},
-            }
-            search_image_query = {
-                "knn": {
-                        "field": "multi_embedding",
-                        "query_vector": query_embedding,
-                        "k": top_k,
-                        "num_candidates": top_k * 2,
-                    },
-                "size": top_k,
-                "_source": {"excludes": ["multi_embedding"]},
-            }
-            raw_results = self.exec_query(index_pattern, search_text_query) + self.exec_query(index_pattern, search_image_query)
-        else:
-            search_query = {
-                "knn": {
-                    "field": "embedding",
-                    "query_vector": query_embedding,
-                    "k": top_k,
-                    "num_candidates": top_k * 2,
-                },
-                "size": top_k,
-                "_source": {"excludes": ["embedding"]},
-            }
-            raw_results = self.exec_query(index_pattern, search_query)
- 
         return raw_results
 
     def hybrid_search(
@@ -1104,6 +1301,7 @@ class ElasticSearchCore(VectorDatabaseCore):
         embedding_model: BaseEmbedding,
         top_k: int = 5,
         weight_accurate: float = 0.3,
+        document_paths: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search method, combining accurate matching and semantic search results across multiple indices.
@@ -1114,16 +1312,64 @@ class ElasticSearchCore(VectorDatabaseCore):
             embedding_model: The embedding model to use
             top_k: Number of results to return
             weight_accurate: The weight of the accurate matching score (0-1), the semantic search weight is 1-weight_accurate
+            document_paths: Optional allow-list of path_or_url values; only their chunks are scored
 
         Returns:
             List of search results sorted by combined score
         """
-        # Get results from both searches
-        accurate_results = self.accurate_search(
-            index_names, query_text, top_k=top_k)
-        semantic_results = self.semantic_search(
-            index_names, query_text, embedding_model=embedding_model, top_k=top_k)
+        is_multimodal = embedding_model.model_type == "multimodal"
+        accurate_results, semantic_results = self._run_hybrid_queries(
+            ",".join(index_names), query_text, embedding_model, top_k, is_multimodal,
+            self._build_document_paths_filter(document_paths))
+        return self._fuse_hybrid_results(
+            accurate_results, semantic_results, is_multimodal, top_k, weight_accurate)
+
+    def _run_hybrid_queries(
+        self,
+        index_pattern: str,
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int,
+        is_multimodal: bool,
+        path_filter: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Run the accurate and kNN queries of a hybrid search in a single msearch round trip.
+
+        The query embedding is requested on a worker thread while the term weights are
+        computed, so neither waits on the other.
 
+        Returns:
+            (accurate_results, semantic_results) in the same shape as accurate_search/semantic_search
+        """
+        embedding_future = _QUERY_EMBEDDING_EXECUTOR.submit(
+            contextvars.copy_context().run, embed_query, embedding_model, query_text)
+        weights = calculate_term_weights(query_text)
+        query_embedding = embedding_future.result()
+
+        searches = [self._build_accurate_query(query_text, weights, top_k, path_filter)]
+        searches += self._build_knn_queries(query_embedding, top_k, is_multimodal, path_filter)
+        body = []
+        for search_query in searches:
+            body += [{"index": index_pattern}, search_query]
+
+        responses = self.client.msearch(body=body)["responses"]
+        results = []
+        for response in responses:
+            if "error" in response:
+                raise Exception(f"Hybrid search query failed: {response['error']}")
+            results.append(self._parse_search_hits(response))
+        return results[0], [hit for hits in results[1:] for hit in hits]
+
+    @staticmethod
+    def _fuse_hybrid_results(
+        accurate_results: List[Dict[str, Any]],
+        semantic_results: List[Dict[str, Any]],
+        is_multimodal: bool,
+        top_k: int,
+        weight_accurate: float,
+    ) -> List[Dict[str, Any]]:
+        """Normalize accurate and semantic scores per query and combine them linearly"""
         # Create a mapping from document ID to results
         combined_results = {}
 
@@ -1166,7 +1412,6 @@ class ElasticSearchCore(VectorDatabaseCore):
                            for r in accurate_results]) if accurate_results else 1
         max_semantic = max([r.get("score", 0)
                            for r in semantic_results]) if semantic_results else 1
-        is_multimodal = embedding_model.model_type == "multimodal"
         image_semantic_scores = [
             r.get("score", 0)
             for r in semantic_results
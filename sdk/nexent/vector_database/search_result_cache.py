@@ -0,0 +1,157 @@
+"""TTL cache of knowledge-base search results: local LRU + optional Redis tier.
+
+Results are keyed by (index set with generations, normalized query, search
+mode, top_k, document filter, rerank model), so a repeated query within a
+conversation, or from another user of the same knowledge base, skips the query
+embedding, the search and the rerank call.
+
+Every index has a generation counter that writes bump (vectorize, delete,
+chunk edits). The generation is part of the key, so a write makes every cached
+result of that index unreachable at once. With a Redis client the counters
+live in Redis and invalidate across processes; without one they are
+per-process and the TTL bounds staleness caused by other processes' writes.
+
+The cache is disabled unless a process installs one with
+``set_search_result_cache``.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..core.utils.two_tier_cache import TwoTierCache
+from ..monitor.monitoring import get_monitoring_manager
+
+logger = logging.getLogger("search_result_cache")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _record_lookup(hit: bool, saved_ms: float = 0.0) -> None:
+    """Export a cache lookup as monitoring counters."""
+    monitoring = get_monitoring_manager()
+    if hit:
+        monitoring.record_counter(
+            "kb_search.cache.hits", 1, description="Searches served from the result cache")
+        monitoring.record_counter(
+            "kb_search.cache.saved_ms", saved_ms,
+            description="Search and rerank latency avoided by the result cache")
+    else:
+        monitoring.record_counter(
+            "kb_search.cache.misses", 1, description="Searches sent to the vector database")
+
+
+class SearchResultCache(TwoTierCache):
+    """Two-tier search result cache with hit/miss and latency-saved accounting."""
+
+    NAME = "Search cache"
+    KEY_PREFIX = "kbsearch"
+    GENERATION_PREFIX = "kbgen"
+    DEFAULT_MAX_ENTRIES = 2000
+    DEFAULT_TTL_SECONDS = 300
+    EXTRA_STATS = {"saved_ms": 0.0}
+
+    def __init__(self, max_entries: Optional[int] = None, redis_client=None, ttl_seconds: Optional[int] = None):
+        super().__init__(max_entries, redis_client, ttl_seconds)
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", query)).strip()
+
+    # ---- INDEX GENERATIONS ----
+
+    def _generation_key(self, index_name: str) -> str:
+        return f"{self.GENERATION_PREFIX}:{index_name}"
+
+    def get_generations(self, index_names: Sequence[str]) -> List[int]:
+        """Current generation of each index, 0 for indices never written."""
+        if self._redis is not None:
+            try:
+                raw_values = self._redis.mget([self._generation_key(name) for name in index_names])
+                return [int(raw) if raw is not None else 0 for raw in raw_values]
+            except Exception as e:
+                logger.warning(f"Search cache Redis generation lookup failed, using local counters: {e}")
+        with self._lock:
+            return [self._generations.get(name, 0) for name in index_names]
+
+    def bump_generation(self, index_name: str) -> None:
+        """Invalidate every cached result that searched ``index_name``."""
+        with self._lock:
+            self._generations[index_name] = self._generations.get(index_name, 0) + 1
+        if self._redis is not None:
+            try:
+                self._redis.incr(self._generation_key(index_name))
+            except Exception as e:
+                logger.warning(f"Search cache Redis generation bump failed for {index_name}: {e}")
+
+    # ---- RESULTS ----
+
+    def make_key(
+        self,
+        index_names: Sequence[str],
+        query: str,
+        search_mode: str,
+        top_k: int,
+        document_paths: Optional[Sequence[str]] = None,
+        rerank_model: Optional[str] = None,
+    ) -> str:
+        """Cache key of a search; includes the current generation of every searched index."""
+        names = sorted(set(index_names))
+        payload = json.dumps(
+            [
+                list(zip(names, self.get_generations(names))),
+                self.normalize_query(query),
+                search_mode,
+                top_k,
+                sorted(set(document_paths)) if document_paths else None,
+                rerank_model or None,
+            ],
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached results, or None."""
+        entry = self.get_many([key])[0]
+        if entry is None:
+            _record_lookup(hit=False)
+            return None
+        self._add_stat("saved_ms", entry["cost_ms"])
+        _record_lookup(hit=True, saved_ms=entry["cost_ms"])
+        return copy.deepcopy(entry["results"])
+
+    def put(self, key: str, results: List[Dict[str, Any]], cost_ms: float) -> None:
+        """Store results in both tiers; ``cost_ms`` is what a later hit saves."""
+        self.put_many({key: {"results": copy.deepcopy(results), "cost_ms": cost_ms}})
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters and the search latency saved by hits."""
+        stats = super().stats()
+        stats["saved_ms"] = round(stats["saved_ms"], 1)
+        return stats
+
+
+_search_result_cache: Optional[SearchResultCache] = None
+
+
+def set_search_result_cache(cache: Optional[SearchResultCache]) -> None:
+    """Install (or with None, remove) the process-wide search result cache."""
+    global _search_result_cache
+    _search_result_cache = cache
+
+
+def get_search_result_cache() -> Optional[SearchResultCache]:
+    return _search_result_cache
+
+
+def bump_index_generation(index_name: str) -> None:
+    """Invalidate cached results of ``index_name``; no-op without an installed cache."""
+    cache = get_search_result_cache()
+    if cache is not None:
+        cache.bump_generation(index_name)
@@ -4,10 +4,12 @@ Unit tests for app_factory module.
 Tests the create_app function and register_exception_handlers function
 for FastAPI application factory with common configurations and exception handlers.
 """
+import gzip
+import json
 import sys
 import os
 
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, Body, FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
 # Add the backend directory to path so we can import modules
@@ -18,7 +20,8 @@ sys.path.insert(0, backend_path)
 # Import AppException from consts.exceptions where it is defined
 from consts.error_code import ErrorCode
 from consts.exceptions import AppException
-from backend.apps.app_factory import create_app, register_exception_handlers
+from backend.apps import app_factory
+from backend.apps.app_factory import GZipRequestRoute, create_app, register_exception_handlers
 
 class TestCreateApp:
     """Test class for create_app function."""
@@ -415,6 +418,85 @@ class TestCORSConfiguration:
         assert app is not None
 
 
+class TestGZipRequestRoute:
+    """Test class for gzip-encoded request bodies on GZipRequestRoute routers."""
+
+    def _echo_app(self):
+        app = create_app(enable_monitoring=False)
+        router = APIRouter(route_class=GZipRequestRoute)
+
+        @router.post("/echo")
+        def echo(data: list = Body(...)):
+            return {"count": len(data)}
+
+        @app.post("/plain")
+        def plain(data: list = Body(...)):
+            return {"count": len(data)}
+
+        app.include_router(router)
+        return app
+
+    def test_gzip_body_is_decompressed(self):
+        """Test a gzip-encoded JSON body reaches the route decompressed."""
+        client = TestClient(self._echo_app())
+        payload = gzip.compress(json.dumps([{"content": "a"}, {"content": "b"}]).encode())
+
+        response = client.post("/echo", content=payload, headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.json() == {"count": 2}
+
+    def test_plain_body_passes_through(self):
+        """Test requests without Content-Encoding are untouched."""
+        client = TestClient(self._echo_app())
+
+        response = client.post("/echo", json=[{"content": "a"}])
+
+        assert response.json() == {"count": 1}
+
+    def test_invalid_gzip_body_returns_400(self):
+        """Test a corrupt gzip body is rejected."""
+        client = TestClient(self._echo_app())
+
+        response = client.post("/echo", content=b"not-gzip", headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        assert response.status_code == 400
+
+    def test_truncated_gzip_body_returns_400(self):
+        """Test a gzip stream cut short is rejected."""
+        client = TestClient(self._echo_app())
+        payload = gzip.compress(json.dumps([{"content": "a"}] * 100).encode())[:-12]
+
+        response = client.post("/echo", content=payload, headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        assert response.status_code == 400
+
+    def test_oversized_gzip_body_returns_413(self, monkeypatch):
+        """Test a body inflating past the cap is rejected without inflating it whole."""
+        monkeypatch.setattr(app_factory, "GZIP_REQUEST_MAX_BYTES", 1024)
+        client = TestClient(self._echo_app())
+        # 10 MB of zeros compresses to about 10 KB
+        payload = gzip.compress(b"[" + b" " * 10_000_000 + b"]")
+
+        response = client.post("/echo", content=payload, headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        assert response.status_code == 413
+
+    def test_routes_without_gzip_route_class_do_not_decompress(self):
+        """Test create_app does not decompress bodies for ordinary routes."""
+        client = TestClient(self._echo_app())
+        payload = gzip.compress(json.dumps([{"content": "a"}]).encode())
+
+        response = client.post("/plain", content=payload, headers={
+            "Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        assert response.status_code != 200
+
+
 class TestAppExceptionResponseFormat:
     """Test class for AppException response format."""
 
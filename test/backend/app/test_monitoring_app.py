@@ -260,3 +260,22 @@ class TestMonitoringStatus:
         body = response.json()
         assert body["code"] == 0
         assert body["data"]["dashboard_url"] == "http://localhost:6006"
+
+
+class TestRecordBufferStats:
+    """Verify the monitoring record buffer stats endpoint."""
+
+    def test_record_buffer_endpoint_returns_stats(self, monkeypatch):
+        from apps.monitoring_app import router
+
+        buffer = MagicMock()
+        buffer.stats.return_value = {"depth": 3, "dropped_records": 1}
+        monkeypatch.setattr("apps.monitoring_app.get_monitoring_buffer", lambda: buffer)
+
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).get("/monitoring/record_buffer")
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"depth": 3, "dropped_records": 1}
+
@@ -736,6 +736,56 @@ async def test_create_index_documents_success(vdb_core_mock, auth_data):
     mock_index.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_index_documents_passes_skip_refresh(vdb_core_mock, auth_data):
+    """skip_refresh query flag reaches the indexing service."""
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.get_knowledge_record", return_value={"is_multimodal": "N"}), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.index_documents") as mock_index, \
+            patch("backend.apps.vectordatabase_app.get_embedding_model_by_id", return_value=MagicMock()):
+        mock_index.return_value = IndexingResponse(
+            success=True, message="ok", total_indexed=1, total_submitted=1)
+
+        response = client.post(
+            f"/indices/{auth_data['index_name']}/documents", json=[{"id": 1, "text": "test doc"}],
+            params={"large_mode": "true", "skip_refresh": "true"}, headers=auth_data["auth_header"])
+
+    assert response.status_code == 200
+    assert mock_index.call_args.kwargs["skip_refresh"] is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_index_success(vdb_core_mock, auth_data):
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.require_knowledge_base_edit_permission") as mock_require_permission, \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.refresh_index",
+                  return_value={"status": "success"}) as mock_refresh:
+        response = client.post(
+            f"/indices/{auth_data['index_name']}/refresh", headers=auth_data["auth_header"])
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "success"}
+    mock_require_permission.assert_called_once_with(
+        auth_data["index_name"], auth_data["user_id"], auth_data["tenant_id"])
+    mock_refresh.assert_called_once_with(auth_data["index_name"], ANY)
+
+
+@pytest.mark.asyncio
+async def test_refresh_index_failure(vdb_core_mock, auth_data):
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.require_knowledge_base_edit_permission"), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.refresh_index",
+                  side_effect=Exception("Failed to refresh index")):
+        response = client.post(
+            f"/indices/{auth_data['index_name']}/refresh", headers=auth_data["auth_header"])
+
+    assert response.status_code == 500
+    assert "Error refreshing index" in response.json()["detail"]
+
+
 @pytest.mark.asyncio
 async def test_create_index_documents_forbidden_for_read_only(vdb_core_mock, auth_data):
     """Read-only users must not be able to index documents."""
@@ -137,6 +137,7 @@ def import_tasks_with_fake_ray(monkeypatch, initialized=False):
         const_mod.FORWARD_REDIS_RETRY_MAX = 1
         const_mod.DP_REDIS_CHUNKS_WAIT_TIMEOUT_S = 30
         const_mod.DP_REDIS_CHUNKS_POLL_INTERVAL_MS = 200
+        const_mod.DP_PIPELINED_FORWARD_ENABLED = False
         const_mod.PER_WAVE_TIMEOUT = 30
         const_mod.MAX_TIMEOUT = 1800
         const_mod.RAY_GLOBAL_ACTOR_POOL_SIZE = 3
@@ -503,6 +504,12 @@ def test_get_ray_actor_returns_actor(monkeypatch):
     assert actor is actor_obj
 
 
+class _FakeTraceConfig:
+    def __init__(self):
+        self.on_connection_create_end = []
+        self.on_connection_reuseconn = []
+
+
 class FakeSelf:
     def __init__(self, task_id="tid-1"):
         self.request = types.SimpleNamespace(id=task_id, retries=0)
@@ -748,7 +755,7 @@ def test_forward_skips_empty_chunk_without_preprocess(monkeypatch):
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
     monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
     # Ensure API success without calling real aiohttp
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})
 
     self = FakeSelf("f9")
@@ -778,7 +785,7 @@ def test_forward_vectorize_documents_client_connector_error(monkeypatch):
         pass
 
     class TCPConnector:
-        def __init__(self, verify_ssl=False):
+        def __init__(self, **kwargs):
             pass
 
     class ClientTimeout:
@@ -801,6 +808,7 @@ def test_forward_vectorize_documents_client_connector_error(monkeypatch):
             self.status = status
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientConnectorError=ClientConnectorError,
         ClientResponseError=DummyClientResponseError,
         TCPConnector=TCPConnector,
@@ -831,7 +839,7 @@ def test_forward_vectorize_documents_client_response_503(monkeypatch):
             self.status = status
 
     class TCPConnector:
-        def __init__(self, verify_ssl=False):
+        def __init__(self, **kwargs):
             pass
 
     class ClientTimeout:
@@ -861,6 +869,7 @@ def test_forward_vectorize_documents_client_response_503(monkeypatch):
         pass
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientResponseError=ClientResponseError,
         ClientConnectorError=DummyClientConnectorError,
         TCPConnector=TCPConnector,
@@ -885,7 +894,7 @@ def test_forward_api_returns_error_and_unexpected_format(monkeypatch):
 
     self = FakeSelf("api_err")
     # success False branch
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": False, "message": "bad"})
     with pytest.raises(Exception) as ei1:
         tasks.forward(self, processed_data={"chunks": [
@@ -893,7 +902,7 @@ def test_forward_api_returns_error_and_unexpected_format(monkeypatch):
     json.loads(str(ei1.value))
 
     # unexpected format branch
-    monkeypatch.setattr(tasks, "run_async", lambda coro: [1, 2, 3])
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: [1, 2, 3])
     with pytest.raises(Exception) as ei2:
         tasks.forward(self, processed_data={"chunks": [
                       {"content": "x", "metadata": {}}]}, index_name="idx", source="/a.txt")
@@ -912,7 +921,7 @@ def test_forward_vectorize_documents_timeout_error(monkeypatch):
         pass
 
     class TCPConnector:
-        def __init__(self, verify_ssl=False):
+        def __init__(self, **kwargs):
             pass
 
     class ClientTimeout:
@@ -939,6 +948,7 @@ def test_forward_vectorize_documents_timeout_error(monkeypatch):
         pass
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientResponseError=DummyClientResponseError,
         ClientConnectorError=DummyClientConnectorError,
         TCPConnector=TCPConnector,
@@ -967,7 +977,7 @@ def test_forward_vectorize_documents_unexpected_error(monkeypatch):
     monkeypatch.setattr(tasks.asyncio, "sleep", no_sleep)
 
     class TCPConnector:
-        def __init__(self, verify_ssl=False):
+        def __init__(self, **kwargs):
             pass
 
     class ClientTimeout:
@@ -993,6 +1003,7 @@ def test_forward_vectorize_documents_unexpected_error(monkeypatch):
         pass
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientResponseError=DummyClientResponseError,
         ClientConnectorError=DummyClientConnectorError,
         TCPConnector=TCPConnector,
@@ -1052,8 +1063,8 @@ def test_forward_with_chunks_success(monkeypatch):
     # Avoid calling real util
     monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 123)
 
-    # run_async should return a successful response matching formatted chunk count (1)
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    # the pool run should return a successful response matching formatted chunk count (1)
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})
 
     self = FakeSelf("f1")
@@ -1070,7 +1081,7 @@ def test_forward_partial_success_raises(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
     monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": True, "total_indexed": 0, "total_submitted": 1, "message": "partial"})
     self = FakeSelf("f2")
     with pytest.raises(Exception) as ei:
@@ -1126,8 +1137,8 @@ def test_forward_loads_chunks_from_redis(monkeypatch):
         from_url=lambda url, decode_responses=True: FakeRedisClient()))
     monkeypatch.setitem(sys.modules, "redis", fake_redis_mod)
 
-    # run_async returns success for 1 chunk
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    # the pool run returns success for 1 chunk
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})
 
     self = FakeSelf("f6")
@@ -1354,10 +1365,10 @@ def test_forward_cancel_check_warning_then_continue(monkeypatch):
     monkeypatch.setattr(tasks, "get_redis_service", lambda: (
         _ for _ in ()).throw(RuntimeError("boom")))
 
-    # run index_documents normally via stubbed run_async returning success
+    # run index_documents normally via stubbed pool run returning success
     monkeypatch.setattr(
-        tasks,
-        "run_async",
+        tasks._forward_http_pool,
+        "run",
         lambda coro: {"success": True, "total_indexed": 1,
                       "total_submitted": 1, "message": "ok"},
     )
@@ -1412,14 +1423,15 @@ def test_forward_index_documents_error_code_from_detail(monkeypatch):
             return FakeResponse()
 
     fake_aiohttp = types.SimpleNamespace(
-        TCPConnector=lambda verify_ssl=False: None,
+        TraceConfig=_FakeTraceConfig,
+        TCPConnector=lambda **k: None,
         ClientTimeout=lambda total=None: None,
         ClientSession=FakeSession,
         ClientConnectorError=Exception,
         ClientResponseError=Exception,
     )
     monkeypatch.setattr(tasks, "aiohttp", fake_aiohttp)
-    monkeypatch.setattr(tasks, "run_async", _run_coro)
+    monkeypatch.setattr(tasks._forward_http_pool, "run", _run_coro)
 
     self = FakeSelf("detail-err")
     with pytest.raises(Exception) as exc:
@@ -1433,6 +1445,55 @@ def test_forward_index_documents_error_code_from_detail(monkeypatch):
     assert "detail_err" in str(exc.value)
 
 
+def test_forward_http_pool_reuses_loop_and_session(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    created = []
+
+    class FakeSession:
+        closed = False
+
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    monkeypatch.setattr(tasks, "aiohttp", types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
+        TCPConnector=lambda **k: k,
+        ClientTimeout=lambda total=None: total,
+        ClientSession=FakeSession,
+    ))
+    pool = tasks._ForwardHttpPool()
+
+    async def _use_session():
+        return await pool.get_session(), asyncio.get_running_loop()
+
+    session1, loop1 = pool.run(_use_session())
+    session2, loop2 = pool.run(_use_session())
+
+    assert session1 is session2 and loop1 is loop2
+    assert len(created) == 1
+    assert created[0]["connector"]["limit"] == tasks.FORWARD_HTTP_POOL_LIMIT
+    trace_config = created[0]["trace_configs"][0]
+    pool.run(trace_config.on_connection_create_end[0](None, None, None))
+    pool.run(trace_config.on_connection_reuseconn[0](None, None, None))
+    pool.record_request(10, 40)
+    assert pool.get_stats() == {"requests": 1, "connections_created": 1, "connections_reused": 1,
+                                "bytes_sent": 10, "bytes_uncompressed": 40}
+
+
+def test_encode_forward_body_compresses_large_payloads(monkeypatch):
+    import gzip
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    small = [{"content": "x"}]
+    body, headers, raw_size = tasks._encode_forward_body(small)
+    assert headers == {} and json.loads(body) == small and raw_size == len(body)
+
+    large = [{"content": "y" * 1024} for _ in range(100)]
+    body, headers, raw_size = tasks._encode_forward_body(large)
+    assert headers == {"Content-Encoding": "gzip"}
+    assert len(body) < raw_size
+    assert json.loads(gzip.decompress(body)) == large
+
+
 def test_forward_index_documents_regex_error_code(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
@@ -1465,14 +1526,15 @@ def test_forward_index_documents_regex_error_code(monkeypatch):
             return FakeResponse()
 
     fake_aiohttp = types.SimpleNamespace(
-        TCPConnector=lambda verify_ssl=False: None,
+        TraceConfig=_FakeTraceConfig,
+        TCPConnector=lambda **k: None,
         ClientTimeout=lambda total=None: None,
         ClientSession=FakeSession,
         ClientConnectorError=Exception,
         ClientResponseError=Exception,
     )
     monkeypatch.setattr(tasks, "aiohttp", fake_aiohttp)
-    monkeypatch.setattr(tasks, "run_async", _run_coro)
+    monkeypatch.setattr(tasks._forward_http_pool, "run", _run_coro)
 
     self = FakeSelf("regex-err")
     with pytest.raises(Exception) as exc:
@@ -1503,14 +1565,15 @@ def test_forward_index_documents_client_connector_error(monkeypatch):
             raise tasks.aiohttp.ClientConnectorError("down")
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientConnectorError=Exception,
-        TCPConnector=lambda verify_ssl=False: None,
+        TCPConnector=lambda **k: None,
         ClientTimeout=lambda total=None: None,
         ClientSession=FakeSession,
         ClientResponseError=Exception,
     )
     monkeypatch.setattr(tasks, "aiohttp", fake_aiohttp)
-    monkeypatch.setattr(tasks, "run_async", _run_coro)
+    monkeypatch.setattr(tasks._forward_http_pool, "run", _run_coro)
 
     self = FakeSelf("conn-err")
     with pytest.raises(Exception) as exc:
@@ -1541,14 +1604,15 @@ def test_forward_index_documents_timeout(monkeypatch):
             raise asyncio.TimeoutError("t/o")
 
     fake_aiohttp = types.SimpleNamespace(
+        TraceConfig=_FakeTraceConfig,
         ClientConnectorError=Exception,
         ClientResponseError=Exception,
-        TCPConnector=lambda verify_ssl=False: None,
+        TCPConnector=lambda **k: None,
         ClientTimeout=lambda total=None: None,
         ClientSession=FakeSession,
     )
     monkeypatch.setattr(tasks, "aiohttp", fake_aiohttp)
-    monkeypatch.setattr(tasks, "run_async", _run_coro)
+    monkeypatch.setattr(tasks._forward_http_pool, "run", _run_coro)
 
     self = FakeSelf("timeout-err")
     with pytest.raises(Exception) as exc:
@@ -1570,7 +1634,7 @@ def test_forward_truncates_reason_when_no_error_code(monkeypatch):
 
     long_msg = json.dumps({"message": "m" * 250})
     monkeypatch.setattr(
-        tasks, "run_async", lambda coro: (
+        tasks._forward_http_pool, "run", lambda coro: (
             _ for _ in ()).throw(Exception(long_msg))
     )
 
@@ -1603,7 +1667,7 @@ def test_forward_fallback_truncates_on_non_json_error(monkeypatch):
     monkeypatch.setattr(tasks, "extract_error_code", lambda *a, **k: None)
 
     monkeypatch.setattr(
-        tasks, "run_async", lambda coro: (
+        tasks._forward_http_pool, "run", lambda coro: (
             _ for _ in ()).throw(Exception("n" * 250))
     )
 
@@ -1634,7 +1698,7 @@ def test_forward_error_truncates_reason_and_uses_save(monkeypatch):
     long_message = "m" * 250
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
     monkeypatch.setattr(
-        tasks, "run_async", lambda coro: (_ for _ in ()).throw(
+        tasks._forward_http_pool, "run", lambda coro: (_ for _ in ()).throw(
             Exception(json.dumps({"message": long_message})))
     )
     captured = {}
@@ -1659,7 +1723,7 @@ def test_forward_error_fallback_when_json_loads_fails(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
     monkeypatch.setattr(
-        tasks, "run_async", lambda coro: (
+        tasks._forward_http_pool, "run", lambda coro: (
             _ for _ in ()).throw(Exception("not-json-error"))
     )
     captured = {}
@@ -1865,7 +1929,7 @@ def test_forward_uses_overridden_metadata_from_payload(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
     monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
                         "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})
 
     self = FakeSelf("f7")
@@ -2005,7 +2069,7 @@ def test_forward_large_chunks_batch_success(monkeypatch):
                      "metadata": {"page": i}} for i in range(150)]
 
     # Mock successful indexing of all chunks
-    monkeypatch.setattr(tasks, "run_async", lambda coro: {
+    monkeypatch.setattr(tasks._forward_http_pool, "run", lambda coro: {
         "success": True,
         "total_indexed": 150,
         "total_submitted": 150,
@@ -2237,7 +2301,8 @@ def test_process_part_success_and_failure(monkeypatch):
         source="s", source_type="local"
     )
     assert out["chunks_count"] == 1
-    assert "k1" in store
+    assert out["image_metadata_chunk_count"] == 0
+    assert json.loads(store["k1"]) == [{"content": "x"}]
 
     monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "")
     out2 = tasks.process_part(
@@ -2253,15 +2318,11 @@ def test_aggregate_store_chunks_paths(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     self = types.SimpleNamespace(request=types.SimpleNamespace(id="agg1"))
     monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://x")
-    kv = {
-        "part1": '[{"a":1}]',
-        "part2": "bad-json",
-    }
     written = {}
 
     class Client:
         def get(self, k):
-            return kv.get(k)
+            raise AssertionError("part payloads should not be read back")
 
         def set(self, k, v):
             written[k] = v
@@ -2269,22 +2330,199 @@ def test_aggregate_store_chunks_paths(monkeypatch):
         def expire(self, *a, **k):
             return True
 
-        def delete(self, k):
-            kv.pop(k, None)
-
     monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(
         Redis=types.SimpleNamespace(from_url=lambda *a, **k: Client())))
     res = tasks.aggregate_store_chunks(
         self,
-        parts_results=[{"part_redis_key": "part1"},
-                       {"part_redis_key": "part2"}],
+        parts_results=[{"part_redis_key": "part1", "chunks_count": 2, "image_metadata_chunk_count": 1},
+                       {"part_redis_key": "part2", "chunks_count": 0},
+                       {"part_redis_key": "part3", "chunks_count": 3}],
         redis_key="maink",
         source="s",
         index_name="idx",
         original_filename="a.txt",
     )
     assert res["redis_key"] == "maink"
-    assert "maink" in written and "maink:ready" in written
+    assert res["chunks_count"] == 5
+    assert "maink" not in written and "maink:ready" in written
+    manifest = json.loads(written["maink:parts"])
+    assert [part["key"] for part in manifest["parts"]] == ["part1", "part3"]
+    assert manifest["count"] == 5
+    assert manifest["image_metadata"] == 1
+
+
+def test_forward_streams_chunks_from_part_manifest(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 1)
+    kv = {
+        "dp:rid:chunks:ready": "1",
+        "dp:rid:chunks:parts": json.dumps({
+            "parts": [{"key": "dp:rid:part:0", "count": 2}, {"key": "dp:rid:part:1", "count": 1}],
+            "count": 3,
+        }),
+        "dp:rid:part:0": tasks._encode_chunks(
+            [{"content": "a", "metadata": {}}, {"content": "b", "metadata": {}}]).decode("utf-8"),
+        "dp:rid:part:1": tasks._encode_chunks([{"content": "c", "metadata": {}}]).decode("utf-8"),
+    }
+
+    class FakeRedisClient:
+        def get(self, k):
+            assert k != "dp:rid:chunks", "merged payload key should not be read"
+            return kv.get(k)
+
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=True: FakeRedisClient())))
+    sent = {}
+
+    def _send(**kwargs):
+        sent["chunks"] = kwargs["chunks"]
+        return {"success": True, "total_indexed": 3, "total_submitted": 3}
+
+    monkeypatch.setattr(tasks, "_send_chunks_to_es", _send)
+
+    self = FakeSelf("f-stream")
+    result = tasks.forward(self, processed_data={
+                           "redis_key": "dp:rid:chunks", "split_async": True}, index_name="idx", source="/a.txt")
+
+    assert result["chunks_stored"] == 3
+    assert [(c["content"], c["index"]) for c in sent["chunks"]] == [("a", 0), ("b", 1), ("c", 2)]
+
+
+def test_iter_pipelined_parts_yields_in_order_then_manifest_tail(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks.time, "sleep", lambda *_: None)
+    kv = {"dp:t:part:0": tasks._encode_chunks([{"content": "a"}]).decode("utf-8")}
+    polls = {"n": 0}
+
+    def _get(key):
+        if key == "dp:t:part:1":
+            polls["n"] += 1
+            if polls["n"] == 2:
+                # part 1 failed; the later part 2 and the ready flag land together
+                kv["dp:t:part:2"] = tasks._encode_chunks([{"content": "c"}]).decode("utf-8")
+                kv["dp:t:chunks:ready"] = "1"
+                kv["dp:t:chunks:parts"] = json.dumps({
+                    "parts": [{"key": "dp:t:part:0", "count": 1}, {"key": "dp:t:part:2", "count": 1}],
+                    "count": 2,
+                })
+        return kv.get(key)
+
+    parts = list(tasks._iter_pipelined_parts(
+        types.SimpleNamespace(get=_get, exists=lambda k: k in kv), "t", "dp:t:chunks",
+        idle_timeout_s=5, poll_interval_ms=1))
+
+    assert parts == [[{"content": "a"}], [{"content": "c"}]]
+
+
+def test_iter_pipelined_parts_times_out_without_progress(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks.time, "sleep", lambda *_: None)
+    clock = iter([0, 0, 10])
+    monkeypatch.setattr(tasks.time, "time", lambda: next(clock))
+
+    with pytest.raises(TimeoutError):
+        list(tasks._iter_pipelined_parts(
+            types.SimpleNamespace(get=lambda k: None, exists=lambda k: False), "t", "dp:t:chunks",
+            idle_timeout_s=5, poll_interval_ms=1))
+
+
+def test_iter_pipelined_parts_waits_for_slow_first_part_while_later_parts_land(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(tasks, "_estimate_parallel_parts", lambda: 2)
+    now = {"t": 0}
+    monkeypatch.setattr(tasks.time, "time", lambda: now["t"])
+    kv = {}
+    # Parts 1..5 land one every 4s, part 0 after all of them: 24s in total, well
+    # past the 5s idle timeout, but never 5s without a part landing
+    schedule = {4 * i: i for i in range(1, 6)}
+    schedule[24] = 0
+
+    def _get(key):
+        now["t"] += 1
+        landed = schedule.pop(now["t"], None)
+        if landed is not None:
+            kv[f"dp:t:part:{landed}"] = tasks._encode_chunks([{"content": str(landed)}]).decode("utf-8")
+            if landed == 0:
+                kv["dp:t:chunks:ready"] = "1"
+                kv["dp:t:chunks:parts"] = json.dumps({
+                    "parts": [{"key": f"dp:t:part:{i}", "count": 1} for i in range(6)], "count": 6})
+        return kv.get(key)
+
+    parts = list(tasks._iter_pipelined_parts(
+        types.SimpleNamespace(get=_get, exists=lambda k: k in kv), "t", "dp:t:chunks",
+        idle_timeout_s=5, poll_interval_ms=1))
+
+    assert parts == [[{"content": str(i)}] for i in range(6)]
+
+
+def test_forward_pipelined_indexes_parts_as_they_land(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 1)
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=True: object())))
+    monkeypatch.setattr(tasks, "_iter_pipelined_parts", lambda *a, **k: iter([
+        [{"content": "a", "metadata": {}}, {"content": " ", "metadata": {}}],
+        [{"content": "c", "metadata": {}}],
+    ]))
+    progress = {"total": 0}
+
+    class _Svc:
+        def is_task_cancelled(self, _tid):
+            return False
+
+        def save_progress_info(self, *a, **k):
+            return True
+
+        def extend_progress_total(self, task_id, delta_total):
+            progress["total"] += delta_total
+            return True
+
+    monkeypatch.setattr(tasks, "get_redis_service", lambda: _Svc())
+    dispatched = []
+
+    def _sig(**kwargs):
+        dispatched.append(kwargs)
+        result = {"success": True, "total_indexed": len(kwargs["chunks"]),
+                  "total_submitted": len(kwargs["chunks"])}
+        return types.SimpleNamespace(set=lambda **kw: types.SimpleNamespace(
+            apply_async=lambda: types.SimpleNamespace(get=lambda: result)))
+
+    monkeypatch.setattr(tasks, "forward_part", types.SimpleNamespace(s=_sig))
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    refreshes = []
+
+    def _post(url, headers=None, timeout=None):
+        refreshes.append((url, len(dispatched)))
+        return types.SimpleNamespace(status_code=200, text="")
+
+    monkeypatch.setattr(tasks.requests, "post", _post, raising=False)
+
+    self = FakeSelf("f-pipe")
+    result = tasks.forward(self, processed_data={
+        "redis_key": "dp:p1:chunks", "task_id": "p1", "split_async": True, "split_pipelined": True,
+    }, index_name="idx", source="/a.txt")
+
+    assert [[(c["content"], c["index"]) for c in d["chunks"]] for d in dispatched] == [[("a", 0)], [("c", 2)]]
+    assert all(d["parent_total_chunks"] is None for d in dispatched)
+    assert all(d["skip_refresh"] is True for d in dispatched)
+    assert refreshes == [("http://api/indices/idx/refresh", 2)]
+    assert progress["total"] == 3
+    assert result["chunks_stored"] == 3
+    assert result["es_result"]["total_indexed"] == 2
+
+
+def test_wait_for_split_ready_reads_manifest_count(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://x")
+    kv = {"dp:k:ready": "1", "dp:k:parts": json.dumps({"parts": [], "count": 7})}
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(
+        Redis=types.SimpleNamespace(from_url=lambda *a, **k: types.SimpleNamespace(get=kv.get))))
+
+    assert tasks._wait_for_split_ready("dp:k", timeout_s=1, poll_interval_ms=1) == 7
 
 
 def test_forward_part_success_and_progress(monkeypatch):
@@ -2427,6 +2665,24 @@ def test_run_processing_for_parts_single_and_multi(monkeypatch):
     assert split_chunk_count2 == 6
     assert len(captured["group"]) == 3
 
+    monkeypatch.setattr(tasks, "DP_PIPELINED_FORWARD_ENABLED", True)
+    monkeypatch.setattr(tasks, "_wait_for_split_ready", lambda **kwargs: pytest.fail(
+        "pipelined mode should not wait for split aggregation"))
+    assert tasks._run_processing_for_parts(
+        request_id="r3",
+        source="/b.txt",
+        source_type="local",
+        task_id="t3",
+        chunking_strategy="basic",
+        filename_for_processing="b.txt",
+        parts=[b"a", b"b"],
+        index_name="idx",
+        original_filename="b.txt",
+        embedding_model_id=1,
+        tenant_id="tenant",
+        params={},
+    ) == (True, None, None)
+
 
 def test_process_split_async_redis_image_metadata_count(monkeypatch, tmp_path):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
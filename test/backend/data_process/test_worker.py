@@ -3,6 +3,7 @@ import types
 import importlib
 import pytest
 import os
+from unittest.mock import MagicMock
 
 
 class FakeRay:
@@ -66,6 +67,7 @@ def setup_mocks_for_worker(mocker, initialized=False):
         const_mod.ROOT_DIR = "/mock/root"
         const_mod.DP_REDIS_CHUNKS_WAIT_TIMEOUT_S = 30
         const_mod.DP_REDIS_CHUNKS_POLL_INTERVAL_MS = 100
+        const_mod.DP_PIPELINED_FORWARD_ENABLED = False
         const_mod.RAY_ACTOR_NUM_CPUS = 1
         const_mod.RAY_NUM_CPUS = 4
         const_mod.PER_WAVE_TIMEOUT = 300
@@ -706,6 +708,34 @@ def test_task_prerun_handler(mocker):
     worker_module.task_prerun_handler(task=fake_task, task_id="task-123")
 
 
+def test_task_prerun_handler_registers_index_task(mocker):
+    """Knowledge base tasks are added to the per-index registry"""
+    worker_module, _ = setup_mocks_for_worker(mocker)
+    fake_utils = types.ModuleType("backend.data_process.utils")
+    fake_utils.REGISTERED_TASK_NAMES = frozenset({"process", "forward"})
+    fake_utils.register_index_task = MagicMock()
+    mocker.patch.dict(sys.modules, {"backend.data_process.utils": fake_utils})
+    backend_client = object()
+    mocker.patch.object(worker_module, "app", types.SimpleNamespace(
+        backend=types.SimpleNamespace(client=backend_client)))
+
+    worker_module.task_prerun_handler(
+        task=types.SimpleNamespace(name="data_process.tasks.process"),
+        task_id="task-1", kwargs={"index_name": "kb1"})
+    worker_module.task_prerun_handler(
+        task=types.SimpleNamespace(name="data_process.tasks.cleanup_source"),
+        task_id="task-2", kwargs={"index_name": "kb1"})
+
+    fake_utils.register_index_task.assert_called_once_with(
+        backend_client, "kb1", "task-1")
+
+    # Registry failures never propagate into the task
+    fake_utils.register_index_task.side_effect = RuntimeError("redis down")
+    worker_module.task_prerun_handler(
+        task=types.SimpleNamespace(name="data_process.tasks.forward"),
+        task_id="task-3", kwargs={"index_name": "kb1"})
+
+
 def test_task_postrun_handler_success(mocker):
     """Test task_postrun_handler with SUCCESS state"""
     worker_module, _ = setup_mocks_for_worker(mocker)
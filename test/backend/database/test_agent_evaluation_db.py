@@ -529,6 +529,44 @@ class TestUpdateAgentEvaluationCaseResult:
         assert "label" not in updates
 
 
+class TestUpdateAgentEvaluationCaseResults:
+    def test_writes_all_results_in_one_session(self, session_factory):
+        from backend.database import agent_evaluation_db
+
+        session, get_db_session_mock = session_factory
+        q = MagicMock(name="q")
+        q.filter.return_value = q
+        session.query.return_value = q
+
+        agent_evaluation_db.update_agent_evaluation_case_results(
+            tenant_id="t1",
+            results=[
+                {"agent_evaluation_case_id": 1, "status": "COMPLETED", "predict": {"answer": "x"},
+                 "score": 1, "pass_status": "pass", "reason": "ok", "updated_by": "u1"},
+                {"agent_evaluation_case_id": 2, "status": "FAILED", "pass_status": "fail",
+                 "error_message": "boom", "updated_by": "u1"},
+            ],
+        )
+
+        get_db_session_mock.assert_called_once()
+        assert q.update.call_count == 2
+        passed, failed = (c[0][0] for c in q.update.call_args_list)
+        # Same storage policy as the single-case update
+        assert passed["predict"] is None
+        assert passed["label"] == {"answer": ""}
+        assert failed["error_message"] == "boom"
+        assert "label" not in failed
+
+    def test_empty_results_skip_the_session(self, session_factory):
+        from backend.database import agent_evaluation_db
+
+        _, get_db_session_mock = session_factory
+
+        agent_evaluation_db.update_agent_evaluation_case_results(tenant_id="t1", results=[])
+
+        get_db_session_mock.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # list_agent_evaluation_cases / get_agent_evaluation_case
 # ---------------------------------------------------------------------------
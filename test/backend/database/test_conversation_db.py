@@ -183,6 +183,7 @@ sys.modules["backend.database.utils"] = utils_mod
 
 # Import module under test after stubbing
 from backend.database.conversation_db import (
+    append_message_unit_content,
     HistorySummaryPersistenceError,
     _parse_history_summary_content,
     create_conversation,
@@ -822,6 +823,31 @@ def test_update_message_unit_content(monkeypatch):
     assert _captured_update_values["updated_by"] == "editor"
 
 
+def test_append_message_unit_content(monkeypatch):
+    """append_message_unit_content concatenates only the delta in SQL."""
+    session = MagicMock()
+    ctx = MagicMock()
+    ctx.__enter__.return_value = session
+    ctx.__exit__.return_value = None
+    monkeypatch.setattr("backend.database.conversation_db.get_db_session", lambda: ctx)
+
+    append_message_unit_content(42, " more", user_id="editor")
+
+    session.execute.assert_called_once()
+    assert "unit_content" in _captured_update_values
+    assert _captured_update_values["updated_by"] == "editor"
+
+
+def test_append_message_unit_content_skips_empty_delta(monkeypatch):
+    """append_message_unit_content does not open a session for an empty delta."""
+    get_session = MagicMock()
+    monkeypatch.setattr("backend.database.conversation_db.get_db_session", get_session)
+
+    append_message_unit_content(42, "", user_id="editor")
+
+    get_session.assert_not_called()
+
+
 def test_update_message_opinion(monkeypatch):
     """update_message_opinion runs an UPDATE with new opinion_flag."""
     session = MagicMock()
@@ -34,6 +34,7 @@ utils_mock.auth_utils.get_current_user_id = MagicMock(return_value=("test_user_i
 # Register mocked utils module in sys.modules
 sys.modules['utils'] = utils_mock
 sys.modules['utils.auth_utils'] = utils_mock.auth_utils
+sys.modules['utils.config_version_utils'] = utils_mock.config_version_utils
 
 # Provide a stub for the `boto3` module so that it can be imported safely even
 # if the testing environment does not have it available.
@@ -152,6 +153,31 @@ def test_get_model_by_model_id_fills_default_chunk_sizes(monkeypatch):
     assert out["maximum_chunk_size"] == 1536
 
 
+
+def test_get_models_by_model_ids_single_query(monkeypatch):
+    """get_models_by_model_ids resolves several IDs with one query and fills chunk defaults"""
+    records = [
+        SimpleNamespace(model_id=1, model_type="llm", tenant_id="t1", delete_flag="N"),
+        SimpleNamespace(model_id=2, model_type="embedding", tenant_id="t1", delete_flag="N",
+                        expected_chunk_size=None, maximum_chunk_size=None),
+    ]
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = records
+
+    mock_ctx = MagicMock()
+    mock_ctx.__enter__.return_value = session
+    mock_ctx.__exit__.return_value = None
+    monkeypatch.setattr(
+        "backend.database.model_management_db.get_db_session", lambda: mock_ctx)
+
+    out = model_mgmt_db.get_models_by_model_ids([1, 2, 3], tenant_id="t1")
+
+    session.scalars.assert_called_once()
+    assert set(out) == {1, 2}
+    assert out[2]["expected_chunk_size"] == 1024
+    assert model_mgmt_db.get_models_by_model_ids([]) == {}
+
+
 def test_create_model_record(monkeypatch):
     """Test create_model_record function (covers lines 23-42)"""
     mock_result = MagicMock()
@@ -239,10 +265,14 @@ def test_delete_model_record(monkeypatch):
     monkeypatch.setattr("backend.database.model_management_db.add_update_tracking", lambda x, uid: x)
     monkeypatch.setattr("backend.database.model_management_db.func.current_timestamp", MagicMock())
     
+    mock_bump = MagicMock()
+    monkeypatch.setattr("backend.database.model_management_db.bump_model_records_version", mock_bump)
+
     result = model_mgmt_db.delete_model_record(1, user_id="u1", tenant_id="t1")
     
     assert result is True
     session.execute.assert_called_once()
+    mock_bump.assert_called_once()
 
 
 def test_get_model_records_with_tenant_id(monkeypatch):
@@ -34,6 +34,7 @@ utils_mock.auth_utils.get_current_user_id_from_token = MagicMock(return_value="t
 # Add the mocked utils module to sys.modules
 sys.modules['utils'] = utils_mock
 sys.modules['utils.auth_utils'] = utils_mock.auth_utils
+sys.modules['utils.config_version_utils'] = utils_mock.config_version_utils
 
 # Mock the entire client module
 client_mock = MagicMock()
@@ -261,11 +262,15 @@ def test_insert_config_success(monkeypatch, mock_session):
         "config_value": "test_value"
     }
 
+    mock_bump = MagicMock()
+    monkeypatch.setattr("backend.database.tenant_config_db.bump_tenant_config_version", mock_bump)
+
     result = insert_config(insert_data)
 
     assert result is True
     session.add.assert_called_once()
     session.commit.assert_called_once()
+    mock_bump.assert_called_once_with("test_tenant")
 
 
 def test_insert_config_failure(monkeypatch, mock_session):
@@ -124,6 +124,15 @@ if _services_pkg is None or not hasattr(_services_pkg, "__path__"):
     _services_pkg.__path__ = [str(_BACKEND_DIR / "services")]
     sys.modules["services"] = _services_pkg
 
+# agents.agent_run_manager pulls in the runtime state service; a sibling test
+# may already have loaded the real module.
+if "agents.agent_run_manager" not in sys.modules:
+    _agents_pkg = _register_package("agents")
+    _agent_run_manager_module = types.ModuleType("agents.agent_run_manager")
+    _agent_run_manager_module.agent_run_manager = MagicMock()
+    sys.modules["agents.agent_run_manager"] = _agent_run_manager_module
+    _agents_pkg.agent_run_manager = _agent_run_manager_module
+
 _agent_service_module = types.ModuleType("services.agent_service")
 _agent_service_module.prepare_agent_run = MagicMock()
 sys.modules["services.agent_service"] = _agent_service_module
@@ -168,6 +177,22 @@ _consts_model_module = types.ModuleType("consts.model")
 _consts_model_module.AgentRequest = MagicMock()
 sys.modules["consts.model"] = _consts_model_module
 _consts_pkg.model = _consts_model_module
+# Runner settings are pinned per test by the ``service_module`` fixture; a
+# sibling test may already have registered its own ``consts.const`` stub.
+_EVAL_RUNNER_SETTINGS = {
+    "AGENT_EVAL_CASE_CONCURRENCY": 4,
+    "AGENT_EVAL_JUDGE_CONCURRENCY": 4,
+    "AGENT_EVAL_TENANT_MAX_CONCURRENCY": 8,
+    "AGENT_EVAL_TENANT_RATE_PER_MINUTE": 0,
+    "AGENT_EVAL_STATUS_FLUSH_SIZE": 20,
+    "AGENT_EVAL_STATUS_FLUSH_INTERVAL_S": 5.0,
+}
+if "consts.const" not in sys.modules:
+    _consts_const_module = types.ModuleType("consts.const")
+    for _name, _value in _EVAL_RUNNER_SETTINGS.items():
+        setattr(_consts_const_module, _name, _value)
+    sys.modules["consts.const"] = _consts_const_module
+    _consts_pkg.const = _consts_const_module
 
 # adapters (Jiuwen SDK) stubs
 _adapters_pkg = _register_package("adapters")
@@ -306,6 +331,8 @@ def service_module(monkeypatch):
     # through to a ModuleNotFoundError on the parent package.
     _services_pkg.agent_evaluation_service = agent_evaluation_service
     agent_evaluation_service.openpyxl = openpyxl_mock
+    for name, value in _EVAL_RUNNER_SETTINGS.items():
+        monkeypatch.setattr(agent_evaluation_service, name, value)
     # ``services.agent_evaluation_service`` does ``from openpyxl import Workbook``
     # at module load, so the bound name must be patched here too — otherwise
     # a sibling fixture that swaps ``sys.modules["openpyxl"]`` for a real
@@ -452,7 +479,7 @@ def _wire_full_db_module(service_module):
     service_module.create_agent_evaluation = create_mock
     service_module.create_agent_evaluation_cases = MagicMock(return_value=3)
     service_module.list_agent_evaluations_by_agent = MagicMock(return_value=[{"id": 1}])
-    service_module.update_agent_evaluation_case_result = MagicMock()
+    service_module.update_agent_evaluation_case_results = MagicMock()
     service_module.update_agent_evaluation_status = MagicMock()
     service_module.get_evaluation_set_cases_all = MagicMock(return_value=[
         {"evaluation_set_case_id": 1, "inputs": {"query": "q1"}, "label": {"answer": "a1"}},
@@ -681,7 +708,7 @@ def test_run_agent_to_final_answer_extracts_final_answer_chunks(service_module):
     sys.modules["nexent.core.agents.run_agent"].agent_run = _fake_agent_run
 
     result = asyncio.run(service_module._run_agent_to_final_answer(
-        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1,
+        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-1,
     ))
     assert result == "hello world"
 
@@ -708,7 +735,7 @@ def test_run_agent_to_final_answer_skips_non_final_answer_chunks(service_module)
     sys.modules["nexent.core.agents.run_agent"].agent_run = _fake_agent_run
 
     result = asyncio.run(service_module._run_agent_to_final_answer(
-        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1,
+        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-1,
     ))
     assert result == "only this"
 
@@ -735,7 +762,7 @@ def test_run_agent_to_final_answer_skips_non_string_and_invalid_json_chunks(serv
     sys.modules["nexent.core.agents.run_agent"].agent_run = _fake_agent_run
 
     result = asyncio.run(service_module._run_agent_to_final_answer(
-        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1,
+        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-1,
     ))
     assert result == "kept"
 
@@ -755,11 +782,44 @@ def test_run_agent_to_final_answer_handles_no_final_answer_chunks(service_module
     sys.modules["nexent.core.agents.run_agent"].agent_run = _fake_agent_run
 
     result = asyncio.run(service_module._run_agent_to_final_answer(
-        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1,
+        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-1,
     ))
     assert result == ""
 
 
+def test_run_agent_to_final_answer_registers_under_run_id_and_unregisters(service_module, monkeypatch):
+    """The run uses ``run_id`` as its conversation id and is unregistered once finished."""
+    import asyncio
+
+    manager = MagicMock()
+    monkeypatch.setattr(service_module, "agent_run_manager", manager)
+    service_module.AgentRequest = MagicMock()
+    service_module.prepare_agent_run = AsyncMock(
+        return_value=(MagicMock(name="run_info"), MagicMock(name="memory_ctx"))
+    )
+
+    async def _fake_agent_run(_run_info):
+        yield json.dumps({"type": "final_answer", "content": "ok"})
+
+    async def _failing_agent_run(_run_info):
+        raise RuntimeError("boom")
+        yield  # pragma: no cover
+
+    sys.modules["nexent.core.agents.run_agent"].agent_run = _fake_agent_run
+    asyncio.run(service_module._run_agent_to_final_answer(
+        agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-7,
+    ))
+    assert service_module.AgentRequest.call_args.kwargs["conversation_id"] == -7
+    manager.unregister_agent_run.assert_called_once_with(-7, "u1", status="completed")
+
+    sys.modules["nexent.core.agents.run_agent"].agent_run = _failing_agent_run
+    with pytest.raises(RuntimeError):
+        asyncio.run(service_module._run_agent_to_final_answer(
+            agent_id=1, tenant_id="t1", user_id="u1", query="q", version_no=1, run_id=-8,
+        ))
+    manager.unregister_agent_run.assert_called_with(-8, "u1", status="failed")
+
+
 def test_make_background_done_callback_failure_marks_run_failed(service_module):
     """When the future raised, the callback should mark the run FAILED."""
     captured = {}
@@ -927,6 +987,15 @@ def _make_exec_case(case_id, query="q", expected="a"):
     }
 
 
+def _written_case_results(service_module):
+    """Flatten every batch passed to ``update_agent_evaluation_case_results``."""
+    return [
+        result
+        for c in service_module.update_agent_evaluation_case_results.call_args_list
+        for result in c.kwargs["results"]
+    ]
+
+
 def test_execute_agent_evaluation_run_completes_with_overall_score(service_module):
     cases = [_make_exec_case(1), _make_exec_case(2)]
     adapter = _wire_executor_dependencies(service_module, cases)
@@ -964,12 +1033,153 @@ def test_execute_agent_evaluation_run_case_exception_marks_failed(service_module
 
     # Both cases should have a FAILED update written.
     failed_updates = [
-        c for c in service_module.update_agent_evaluation_case_result.call_args_list
-        if c.kwargs.get("status") == "FAILED"
+        r for r in _written_case_results(service_module)
+        if r["status"] == "FAILED"
     ]
     assert len(failed_updates) == 2
 
 
+def test_execute_agent_evaluation_run_resumes_after_finished_cases(service_module):
+    """Finished cases are skipped on re-execution but still count towards the score."""
+    cases = [
+        {**_make_exec_case(1), "status": "COMPLETED", "score": 0},
+        {**_make_exec_case(2), "status": "FAILED", "score": None},
+        {**_make_exec_case(3), "status": "RUNNING"},
+        {**_make_exec_case(4), "status": "PENDING"},
+    ]
+    adapter = _wire_executor_dependencies(service_module, cases)
+
+    service_module.execute_agent_evaluation_run("t1", "u1", 50, judge_model_id=99)
+
+    assert adapter.evaluate_semantic_consistency.call_count == 2
+    written = {r["agent_evaluation_case_id"] for r in _written_case_results(service_module)}
+    assert written == {3, 4}
+    final = service_module.update_agent_evaluation_status.call_args_list[-1]
+    assert final.kwargs["status"] == "COMPLETED"
+    assert final.kwargs["progress_done"] == 4
+    # Mean of the resumed case (0) and the two newly judged cases (1, 1)
+    assert final.kwargs["score_overall"] == pytest.approx(2 / 3)
+
+
+def test_execute_agent_evaluation_run_batches_case_updates(service_module, monkeypatch):
+    cases = [_make_exec_case(i) for i in range(1, 8)]
+    _wire_executor_dependencies(service_module, cases)
+    monkeypatch.setattr(service_module, "AGENT_EVAL_STATUS_FLUSH_SIZE", 3)
+    monkeypatch.setattr(service_module, "AGENT_EVAL_STATUS_FLUSH_INTERVAL_S", 3600)
+
+    service_module.execute_agent_evaluation_run("t1", "u1", 50, judge_model_id=99)
+
+    batches = service_module.update_agent_evaluation_case_results.call_args_list
+    assert len(batches) < len(cases)
+    assert all(c.kwargs["tenant_id"] == "t1" for c in batches)
+    # The last write of every case is its final result, written once
+    completed = [r for r in _written_case_results(service_module) if r["status"] == "COMPLETED"]
+    assert sorted(r["agent_evaluation_case_id"] for r in completed) == list(range(1, 8))
+    assert all(r["pass_status"] == "pass" and r["predict"] == {"answer": "agent-said-X"} for r in completed)
+    progress = [
+        c.kwargs["progress_done"]
+        for c in service_module.update_agent_evaluation_status.call_args_list
+        if c.kwargs.get("status") == "RUNNING" and "progress_done" in c.kwargs
+    ]
+    assert progress == sorted(progress) and progress[-1] == 7
+
+
+def test_execute_agent_evaluation_run_bounds_agent_concurrency(service_module, monkeypatch):
+    import asyncio
+
+    cases = [_make_exec_case(i) for i in range(1, 11)]
+    _wire_executor_dependencies(service_module, cases)
+    monkeypatch.setattr(service_module, "AGENT_EVAL_CASE_CONCURRENCY", 3)
+    state = {"active": 0, "peak": 0}
+
+    async def _slow_run(**_):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return "agent-said-X"
+
+    service_module._run_agent_to_final_answer = _slow_run
+
+    service_module.execute_agent_evaluation_run("t1", "u1", 50, judge_model_id=99)
+
+    assert state["peak"] == 3
+    final = service_module.update_agent_evaluation_status.call_args_list[-1]
+    assert final.kwargs["status"] == "COMPLETED"
+    assert final.kwargs["score_overall"] == 1.0
+
+
+def test_execute_agent_evaluation_run_gives_each_case_its_own_run_id(service_module):
+    cases = [_make_exec_case(i) for i in (3, 5, 9)]
+    _wire_executor_dependencies(service_module, cases)
+    run_ids = []
+
+    async def _run(run_id, **_):
+        run_ids.append(run_id)
+        return "agent-said-X"
+
+    service_module._run_agent_to_final_answer = _run
+
+    service_module.execute_agent_evaluation_run("t1", "u1", 50, judge_model_id=99)
+
+    assert sorted(run_ids) == [-9, -5, -3]
+
+
+def test_execute_agent_evaluation_run_pipelines_judge_with_agent_runs(service_module, monkeypatch):
+    """Agent runs continue while earlier cases are being judged."""
+    import threading
+
+    cases = [_make_exec_case(1), _make_exec_case(2)]
+    adapter = _wire_executor_dependencies(service_module, cases)
+    monkeypatch.setattr(service_module, "AGENT_EVAL_CASE_CONCURRENCY", 1)
+    second_agent_ran = threading.Event()
+
+    async def _run(query, **_):
+        if query == "second":
+            second_agent_ran.set()
+        return query
+
+    def _judge(question, **_):
+        # The first judge call only returns once the second agent run happened
+        if question == "first":
+            assert second_agent_ran.wait(timeout=5)
+        return 1, "ok"
+
+    cases[0]["inputs"]["query"] = "first"
+    cases[1]["inputs"]["query"] = "second"
+    service_module._run_agent_to_final_answer = _run
+    adapter.evaluate_semantic_consistency.side_effect = _judge
+
+    service_module.execute_agent_evaluation_run("t1", "u1", 50, judge_model_id=99)
+
+    assert second_agent_ran.is_set()
+    assert service_module.update_agent_evaluation_status.call_args_list[-1].kwargs["status"] == "COMPLETED"
+
+
+def test_tenant_evaluation_limiter_caps_concurrency_and_start_rate(service_module):
+    import asyncio
+
+    limiter = service_module._TenantEvaluationLimiter(max_concurrency=2, rate_per_minute=0)
+    assert limiter._try_acquire() == 0.0
+    assert limiter._try_acquire() == 0.0
+    assert limiter._try_acquire() > 0
+    limiter._release()
+    assert limiter._try_acquire() == 0.0
+
+    rated = service_module._TenantEvaluationLimiter(max_concurrency=10, rate_per_minute=600)
+    assert rated._try_acquire() == 0.0
+    assert 0 < rated._try_acquire() <= 0.1
+
+    async def _use():
+        async with rated.slot():
+            return rated._active
+
+    assert asyncio.run(_use()) == 2
+    assert rated._active == 1
+    assert service_module._TenantEvaluationLimiter.for_tenant("t1") is \
+        service_module._TenantEvaluationLimiter.for_tenant("t1")
+
+
 def test_execute_agent_evaluation_run_top_level_error_marks_run_failed(service_module):
     """An exception raised before the loop starts must transition the run FAILED."""
     _wire_full_db_module(service_module)
@@ -323,6 +323,16 @@ sys.modules['nexent.monitor'].monitoring_manager = monitoring_manager_mock
 sys.modules['utils.monitoring'].monitoring_manager = monitoring_manager_mock
 sys.modules['utils.monitoring'].setup_fastapi_app = MagicMock(return_value=True)
 
+# Load real message_unit_buffer (agent_service streams unit content through it)
+_unit_buffer_path = Path(__file__).resolve().parents[3] / "backend" / "services" / "message_unit_buffer.py"
+_unit_buffer_spec = importlib.util.spec_from_file_location(
+    "services.message_unit_buffer", _unit_buffer_path
+)
+_unit_buffer_mod = importlib.util.module_from_spec(_unit_buffer_spec)
+_unit_buffer_spec.loader.exec_module(_unit_buffer_mod)
+sys.modules["services.message_unit_buffer"] = _unit_buffer_mod
+setattr(services_module, "message_unit_buffer", _unit_buffer_mod)
+
 # Mock storage config validate
 sys.modules['nexent.storage.minio_config'].MinIOStorageConfig = type('MinIOStorageConfig', (), {'validate': lambda self: None})
 
@@ -7166,7 +7176,7 @@ def test_render_prompt_template_success(monkeypatch):
             return self.template_str.format(**context)
 
     monkeypatch.setattr(
-        agent_service, "Template", FakeTemplate, raising=False
+        agent_service, "compile_template", FakeTemplate, raising=False
     )
 
     tpl = "Hello {name}"
@@ -7185,7 +7195,7 @@ def test_render_prompt_template_on_error_returns_original(monkeypatch):
             raise ValueError("render failed")
 
     monkeypatch.setattr(
-        agent_service, "Template", FailingTemplate, raising=False
+        agent_service, "compile_template", FailingTemplate, raising=False
     )
 
     tpl = "Broken {template"
@@ -12947,7 +12957,7 @@ async def test_stream_agent_chunks_logs_streaming_unit_persistence_failure(monke
 
 @pytest.mark.asyncio
 async def test_stream_agent_chunks_update_unit_content_exception(monkeypatch):
-    """_stream_agent_chunks should handle update_unit_content exceptions in finally block."""
+    """_stream_agent_chunks should handle buffered content flush exceptions in finally block."""
     from backend.services import agent_service
 
     agent_request = MagicMock()
@@ -12961,6 +12971,7 @@ async def test_stream_agent_chunks_update_unit_content_exception(monkeypatch):
     # Mock agent_run to yield chunks that will be persisted
     async def fake_agent_run(*_, **__):
         yield json.dumps({"type": "model_output_code", "content": "code"})
+        yield json.dumps({"type": "model_output_code", "content": " more"})
         yield json.dumps({"type": "final_answer", "content": "done"})
 
     monkeypatch.setattr(
@@ -12976,16 +12987,26 @@ async def test_stream_agent_chunks_update_unit_content_exception(monkeypatch):
         raising=False,
     )
 
-    # Make update_unit_content fail in finally block
-    update_unit_content_calls = []
+    class _FakeFuture:
+        def result(self):
+            return 77
 
-    def fake_update_unit_content(unit_id, content, user_id):
-        update_unit_content_calls.append((unit_id, content, user_id))
-        raise Exception("DB error on update_unit_content")
+    monkeypatch.setattr(
+        "backend.services.agent_service.submit",
+        lambda fn, *a, **kw: _FakeFuture(),
+        raising=False,
+    )
+
+    # Make the buffered content append fail when the unit is flushed
+    append_unit_content_calls = []
+
+    def fake_append_unit_content(unit_id, delta, user_id):
+        append_unit_content_calls.append((unit_id, delta, user_id))
+        raise Exception("DB error on append_unit_content")
 
     monkeypatch.setattr(
-        "backend.services.agent_service.update_unit_content",
-        fake_update_unit_content,
+        "backend.services.agent_service.append_unit_content",
+        fake_append_unit_content,
         raising=False,
     )
 
@@ -13018,7 +13039,7 @@ async def test_stream_agent_chunks_update_unit_content_exception(monkeypatch):
         raising=False,
     )
 
-    # Collect chunks - should still complete despite update_unit_content failure
+    # Collect chunks - should still complete despite append_unit_content failure
     collected = []
     async for out in agent_service._stream_agent_chunks(
         agent_request, "u", "t", MagicMock(), MagicMock()
@@ -13026,8 +13047,10 @@ async def test_stream_agent_chunks_update_unit_content_exception(monkeypatch):
         collected.append(out)
 
     # Should have chunks and unregister should be called
-    assert len(collected) >= 2
+    assert len(collected) >= 3
     assert unregister_called.get("conv_id") == 999
+    assert append_unit_content_calls
+    assert append_unit_content_calls[0] == (77, " more", "u")
 
 
 @pytest.mark.asyncio
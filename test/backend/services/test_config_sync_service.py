@@ -43,6 +43,7 @@ database_package = sys.modules.get('database') or importlib.import_module('datab
 setattr(database_package, 'client', database_client_module)
 database_model_management_module = types.ModuleType('database.model_management_db')
 database_model_management_module.get_model_by_model_id = MagicMock()
+database_model_management_module.get_models_by_model_ids = MagicMock(return_value={})
 database_model_management_module.get_model_id_by_display_name = MagicMock()
 database_model_management_module.get_model_records = MagicMock(return_value=[])
 sys.modules['database.model_management_db'] = database_model_management_module
@@ -6,7 +6,7 @@ import base64
 import asyncio
 import time
 import types
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, call
 import warnings
 from PIL import Image
 import pytest
@@ -685,55 +685,109 @@ class TestDataProcessService(unittest.TestCase):
         # Verify that Redis was called and failed
         mock_get_redis_task_ids.assert_called_once()
 
-    @patch('backend.services.data_process_service.DataProcessService.get_all_tasks')
+    @patch('backend.services.data_process_service.remove_index_tasks')
+    @patch('backend.services.data_process_service.get_tasks_info_batch')
+    @patch('backend.services.data_process_service.get_index_task_ids_from_redis')
+    @patch('backend.services.data_process_service.DataProcessService._collect_runtime_tasks')
     @pytest.mark.asyncio
-    async def async_test_get_index_tasks(self, mock_get_all_tasks):
+    async def async_test_get_index_tasks(self, mock_runtime, mock_registered, mock_batch, mock_remove):
         """
         Async implementation of get_index_tasks testing.
 
         This test verifies that the service correctly retrieves tasks for a specific index.
         It ensures that:
-        1. All tasks are retrieved first
-        2. Tasks are filtered based on the index_name property
-        3. Only tasks matching the specified index are returned
-        """
-        # Setup mock
-        mock_get_all_tasks.return_value = [
-            {'id': 'task1', 'index_name': 'index1', 'task_name': 'task_name1'},
-            {'id': 'task2', 'index_name': 'index2', 'task_name': 'task_name2'},
-            {'id': 'task3', 'index_name': 'index1', 'task_name': 'task_name3'},
-        ]
+        1. Only registered tasks and matching runtime tasks are read
+        2. Status is read in one batch and runtime info is backfilled
+        3. Stale registry entries are pruned
+        """
+        now = time.time()
+        mock_runtime.return_value = {
+            'task3': {'task_name': 'process', 'index_name': 'index1',
+                      'path_or_url': 's3://b/c.pdf', 'original_filename': 'c.pdf'},
+            'task4': {'task_name': 'process', 'index_name': 'index2',
+                      'path_or_url': '', 'original_filename': ''},
+        }
+        mock_registered.return_value = {
+            'task1': now - 10,
+            'task2': now - 3600,
+        }
+        mock_batch.return_value = {
+            'task1': {'id': 'task1', 'index_name': 'index1', 'task_name': 'forward', 'status': 'SUCCESS'},
+            'task2': None,
+            'task3': None,
+        }
 
-        # Get tasks for index1
         result = await self.service.get_index_tasks('index1')
 
-        # Verify result
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]['id'], 'task1')
-        self.assertEqual(result[1]['id'], 'task3')
-
-        # Get tasks for index2
-        result = await self.service.get_index_tasks('index2')
-
-        # Verify result
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]['id'], 'task2')
-
-        # Get tasks for non-existent index
-        result = await self.service.get_index_tasks('index3')
-
-        # Verify result
-        self.assertEqual(len(result), 0)
+        mock_registered.assert_called_once_with(self.service.redis_client, 'index1')
+        mock_batch.assert_called_once_with(
+            self.service.redis_client, ['task1', 'task2', 'task3'])
+        mock_remove.assert_called_once_with(
+            self.service.redis_client, 'index1', ['task2'])
+        self.assertEqual([t['id'] for t in result], ['task1', 'task3'])
+        self.assertEqual(result[1]['status'], states.PENDING)
+        self.assertEqual(result[1]['original_filename'], 'c.pdf')
 
     def test_get_index_tasks(self):
         """
         Test retrieval of tasks for a specific index.
 
         This test serves as a wrapper to run the async test for get_index_tasks.
-        It verifies that the service can filter tasks based on their associated index.
+        It verifies that the service reads tasks from the per-index registry.
         """
         asyncio.run(self.async_test_get_index_tasks())
 
+    @patch('backend.services.data_process_service.register_index_task')
+    @patch('backend.services.data_process_service.get_all_task_ids_from_redis')
+    @patch('backend.services.data_process_service.remove_index_tasks')
+    @patch('backend.services.data_process_service.get_tasks_info_batch')
+    @patch('backend.services.data_process_service.get_index_task_ids_from_redis')
+    @patch('backend.services.data_process_service.DataProcessService._collect_runtime_tasks')
+    def test_get_index_tasks_migrates_registry_once(self, mock_runtime, mock_registered, mock_batch,
+                                                    mock_remove, mock_all_ids, mock_register):
+        """An empty registry triggers a one-time migration of every pre-registry task."""
+        self.service.redis_client = MagicMock()
+        self.service.redis_client.exists.return_value = 0
+        mock_runtime.return_value = {}
+        mock_registered.side_effect = [{}, {'old1': 100.0}]
+        mock_all_ids.return_value = ['old1', 'old2', 'other']
+        infos = {
+            'old1': {'id': 'old1', 'index_name': 'index1', 'task_name': 'process', 'status': 'SUCCESS'},
+            'old2': None,
+            'other': {'id': 'other', 'index_name': 'index2', 'task_name': 'forward', 'status': 'SUCCESS'},
+        }
+        mock_batch.side_effect = lambda client, task_ids: {task_id: infos[task_id] for task_id in task_ids}
+
+        result = asyncio.run(self.service.get_index_tasks('index1'))
+
+        self.assertEqual(mock_register.call_args_list, [
+            call(self.service.redis_client, 'index1', 'old1'),
+            call(self.service.redis_client, 'index2', 'other'),
+        ])
+        self.service.redis_client.set.assert_called_once()
+        self.assertEqual(self.service.redis_client.set.call_args.args[0], 'dp:index_task_registry:migrated')
+        self.assertEqual([t['id'] for t in result], ['old1'])
+
+    @patch('backend.services.data_process_service.get_all_task_ids_from_redis')
+    @patch('backend.services.data_process_service.remove_index_tasks')
+    @patch('backend.services.data_process_service.get_tasks_info_batch')
+    @patch('backend.services.data_process_service.get_index_task_ids_from_redis')
+    @patch('backend.services.data_process_service.DataProcessService._collect_runtime_tasks')
+    def test_get_index_tasks_skips_scan_after_migration(self, mock_runtime, mock_registered, mock_batch,
+                                                        mock_remove, mock_all_ids):
+        """An idle index with an empty registry does not scan the backend once migrated."""
+        self.service.redis_client = MagicMock()
+        self.service.redis_client.exists.return_value = 1
+        mock_runtime.return_value = {}
+        mock_registered.return_value = {}
+        mock_batch.return_value = {}
+
+        result = asyncio.run(self.service.get_index_tasks('idle_index'))
+
+        self.assertEqual(result, [])
+        mock_all_ids.assert_not_called()
+        mock_batch.assert_called_once_with(self.service.redis_client, [])
+
     @patch('aiohttp.ClientSession')
     @pytest.mark.asyncio
     async def async_test_load_image_from_url(self, mock_session):
@@ -0,0 +1,207 @@
+"""
+Unit tests for the write-behind message unit buffer.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.message_unit_buffer import (
+    FLUSH_REASON_FINAL,
+    MessageUnitWriteBuffer,
+)
+
+
+class _Recorder:
+    """Records persistence calls in the order they are issued."""
+
+    def __init__(self, fail_appends: int = 0):
+        self.calls = []
+        self.fail_appends = fail_appends
+
+    def append(self, unit_id, delta, user_id):
+        if self.fail_appends:
+            self.fail_appends -= 1
+            raise RuntimeError("db down")
+        self.calls.append(("append", unit_id, delta, user_id))
+
+    def status(self, unit_id, status, user_id):
+        self.calls.append(("status", unit_id, status, user_id))
+
+
+def _make_buffer(recorder, **kwargs):
+    kwargs.setdefault("flush_interval_seconds", 3600)
+    kwargs.setdefault("flush_bytes", 1024)
+    return MessageUnitWriteBuffer(
+        user_id="u1",
+        append_content=recorder.append,
+        update_status=recorder.status,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_appends_are_coalesced_until_unit_closes():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder)
+    buffer.start_unit(7)
+
+    for token in ["a", "b", "c"]:
+        await buffer.append(token)
+
+    assert recorder.calls == []
+    assert buffer.pending_bytes == 3
+
+    await buffer.close_unit("completed")
+
+    assert recorder.calls == [
+        ("append", 7, "abc", "u1"),
+        ("status", 7, "completed", "u1"),
+    ]
+    assert buffer.flush_count == 1
+    assert buffer.flushed_bytes == 3
+    assert buffer.unit_id is None
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_triggers_flush():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder, flush_bytes=4)
+    buffer.start_unit(1)
+
+    await buffer.append("ab")
+    await buffer.append("cd")
+    await buffer.append("e")
+
+    assert recorder.calls == [("append", 1, "abcd", "u1")]
+    assert buffer.pending_bytes == 1
+
+
+@pytest.mark.asyncio
+async def test_interval_threshold_triggers_flush():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder, flush_interval_seconds=0)
+    buffer.start_unit(1)
+
+    await buffer.append("x")
+
+    assert recorder.calls == [("append", 1, "x", "u1")]
+
+
+@pytest.mark.asyncio
+async def test_pending_bytes_counts_utf8():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder)
+    buffer.start_unit(1)
+
+    await buffer.append("思考")
+
+    assert buffer.pending_bytes == 6
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_delta_in_order():
+    recorder = _Recorder(fail_appends=1)
+    buffer = _make_buffer(recorder, flush_bytes=2)
+    buffer.start_unit(3)
+
+    await buffer.append("ab")
+    assert recorder.calls == []
+    assert buffer.pending_bytes == 2
+
+    await buffer.append("cd")
+    assert recorder.calls == [("append", 3, "abcd", "u1")]
+
+
+@pytest.mark.asyncio
+async def test_close_unit_without_active_unit_is_noop():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder)
+
+    await buffer.append("ignored")
+    await buffer.close_unit("completed", reason=FLUSH_REASON_FINAL)
+
+    assert recorder.calls == []
+
+
+@pytest.mark.asyncio
+async def test_status_failure_is_swallowed():
+    recorder = _Recorder()
+
+    def failing_status(*_):
+        raise RuntimeError("status failed")
+
+    buffer = MessageUnitWriteBuffer(
+        user_id="u1",
+        append_content=recorder.append,
+        update_status=failing_status,
+        flush_interval_seconds=3600,
+        flush_bytes=1024,
+    )
+    buffer.start_unit(5)
+    await buffer.append("tail")
+
+    await buffer.close_unit("completed")
+
+    assert recorder.calls == [("append", 5, "tail", "u1")]
+    assert buffer.unit_id is None
+
+
+@pytest.mark.asyncio
+async def test_interval_flush_fires_without_further_appends():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder, flush_interval_seconds=0.05)
+    buffer.start_unit(1)
+
+    await buffer.append("x")
+    assert recorder.calls == []
+
+    await asyncio.sleep(0.2)
+
+    assert recorder.calls == [("append", 1, "x", "u1")]
+    assert buffer.pending_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_cancelled_when_unit_closes():
+    recorder = _Recorder()
+    buffer = _make_buffer(recorder, flush_interval_seconds=0.05)
+    buffer.start_unit(1)
+
+    await buffer.append("x")
+    await buffer.close_unit("completed")
+    await asyncio.sleep(0.1)
+
+    assert recorder.calls == [
+        ("append", 1, "x", "u1"),
+        ("status", 1, "completed", "u1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_close_unit_retries_failed_flush_once():
+    recorder = _Recorder(fail_appends=1)
+    buffer = _make_buffer(recorder)
+    buffer.start_unit(2)
+    await buffer.append("tail")
+
+    await buffer.close_unit("completed")
+
+    assert recorder.calls == [
+        ("append", 2, "tail", "u1"),
+        ("status", 2, "completed", "u1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_close_unit_drops_tail_after_failed_retry():
+    recorder = _Recorder(fail_appends=2)
+    buffer = _make_buffer(recorder)
+    buffer.start_unit(2)
+    await buffer.append("tail")
+
+    await buffer.close_unit("completed")
+
+    assert recorder.calls == [("status", 2, "completed", "u1")]
+    assert buffer.pending_bytes == 0
+    assert buffer.unit_id is None
@@ -314,6 +314,7 @@ def _get_model_by_model_id(model_id: int, tenant_id: str):
 
 
 db_mm_mod.get_model_by_model_id = _get_model_by_model_id
+db_mm_mod.get_models_by_model_ids = lambda model_ids, tenant_id=None: {}
 db_mm_mod.update_model_record = _noop
 sys.modules["database"] = database_mod
 sys.modules["database.model_management_db"] = db_mm_mod
@@ -242,7 +242,7 @@ class TestPromptService(unittest.TestCase):
             ErrorCode.COMMON_MISSING_REQUIRED_FIELD
         )
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_optimize_prompt_section(self, mock_template):
         mock_template_instance = MagicMock()
         mock_template.return_value = mock_template_instance
@@ -991,7 +991,7 @@ class TestPromptService(unittest.TestCase):
         # Assert - exception message should be present
         self.assertIn("LLM error", str(context.exception))
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_generate_system_prompt(self, mock_template):
         # Setup
         mock_prompt_for_generate = {"user_prompt": "Test User Prompt"}
@@ -1411,7 +1411,7 @@ class TestPromptService(unittest.TestCase):
         self.assertEqual(result, [])
         mock_search_agent.assert_not_called()
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_generate_system_prompt_english(self, mock_template):
         """Test join_info_for_generate_system_prompt with English language"""
         # Setup
@@ -1441,7 +1441,7 @@ class TestPromptService(unittest.TestCase):
         call_args = mock_template_instance.render.call_args[0][0]
         self.assertEqual(call_args["task_description"], mock_task_description)
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_generate_system_prompt_empty_tools_and_agents(self, mock_template):
         """Test join_info_for_generate_system_prompt with empty tools and sub-agents"""
         # Setup
@@ -1462,7 +1462,7 @@ class TestPromptService(unittest.TestCase):
         # Assert
         self.assertEqual(result, "Rendered content")
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_generate_system_prompt_with_knowledge_base_names(self, mock_template):
         """Test join_info_for_generate_system_prompt with knowledge_base_display_names"""
         # Setup
@@ -1491,7 +1491,7 @@ class TestPromptService(unittest.TestCase):
         self.assertIn("knowledge_base_names", template_vars)
         self.assertEqual(template_vars["knowledge_base_names"], '"redis", "kafka"')
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_generate_system_prompt_without_knowledge_base_names(self, mock_template):
         """Test join_info_for_generate_system_prompt without knowledge_base_display_names"""
         # Setup
@@ -1874,7 +1874,7 @@ class TestPromptService(unittest.TestCase):
                     )
                     self.assertEqual(result["section_title"], "智能体角色")
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_optimize_prompt_section_english(self, mock_template):
         """Test join_info_for_optimize_prompt_section with English language"""
         mock_instance = MagicMock()
@@ -1899,7 +1899,7 @@ class TestPromptService(unittest.TestCase):
         self.assertEqual(render_args["section_type"], "constraint")
         self.assertEqual(render_args["knowledge_base_names"], '"kb1"')
 
-    @patch('backend.services.prompt_service.Template')
+    @patch('backend.services.prompt_service.compile_template')
     def test_join_info_for_optimize_prompt_section_without_kb(self, mock_template):
         """Test join_info_for_optimize_prompt_section without knowledge base"""
         mock_instance = MagicMock()
@@ -1,3 +1,5 @@
+import sys
+import types
 import unittest
 from unittest.mock import patch, MagicMock, call
 import json
@@ -15,6 +17,13 @@ class TestRedisService(unittest.TestCase):
             'REDIS_BACKEND_URL': 'redis://localhost:6379/1'
         })
         self.env_patcher.start()
+
+        # Task cleanup reads the registry key prefix from data_process.utils, whose
+        # package import builds the Celery app; stub it with the real prefix
+        self.modules_patcher = patch.dict(sys.modules, {
+            'data_process.utils': types.SimpleNamespace(TASK_REGISTRY_KEY_PREFIX='dp:index_tasks:')
+        })
+        self.modules_patcher.start()
         
         # Create a fresh instance for each test
         self.redis_service = RedisService()
@@ -24,6 +33,7 @@ class TestRedisService(unittest.TestCase):
         self.mock_backend_client = MagicMock()
     
     def tearDown(self):
+        self.modules_patcher.stop()
         self.env_patcher.stop()
     
     @patch('redis.from_url')
@@ -299,6 +309,8 @@ class TestRedisService(unittest.TestCase):
 
         # Return value should match deleted tasks count
         self.assertEqual(result, mock_recursive_delete.call_count)
+        # The per-index task registry is dropped with the tasks
+        self.mock_backend_client.delete.assert_any_call('dp:index_tasks:test_index')
 
     def test_cleanup_celery_tasks_get_exception_and_cancel_failure(self):
         """First-pass get failure and cancel failure are both handled."""
@@ -1420,6 +1432,19 @@ class TestRedisService(unittest.TestCase):
         self.assertFalse(ok)
         self.assertEqual(pipe.reset.call_count, 5)
 
+    def test_extend_progress_total_keeps_processed_count(self):
+        """extend_progress_total grows the total without touching processed chunks."""
+        self.redis_service._client = self.mock_redis_client
+        pipe = MagicMock()
+        pipe.get.return_value = json.dumps({"processed_chunks": 4, "total_chunks": 10})
+        self.mock_redis_client.pipeline.return_value = pipe
+
+        self.assertTrue(self.redis_service.extend_progress_total("task-1", 6))
+        payload = json.loads(pipe.setex.call_args[0][2])
+        self.assertEqual(payload, {"processed_chunks": 4, "total_chunks": 16})
+        self.assertTrue(self.redis_service.extend_progress_total("task-1", 0))
+        self.assertFalse(self.redis_service.extend_progress_total("", 3))
+
     def test_parse_progress_and_extract_metadata_fallbacks(self):
         """Cover tolerant parsing fallback branches."""
         p, t = self.redis_service._parse_progress("not-json", total_chunks=5)
@@ -72,6 +72,7 @@ nexent_container.ContainerConnectionError = Exception
 # Pre-mock services.tool_configuration_service so patches resolve correctly
 tool_config_mod = types.ModuleType("services.tool_configuration_service")
 tool_config_mod.get_tool_from_remote_mcp_server = AsyncMock()
+tool_config_mod.invalidate_mcp_tool_cache = MagicMock()
 tool_config_mod.__spec__ = importlib.machinery.ModuleSpec("services.tool_configuration_service", loader=None)
 sys.modules['services.tool_configuration_service'] = tool_config_mod
 
@@ -1835,11 +1836,13 @@ class TestRefreshMcpServiceToolCount(unittest.IsolatedAsyncioTestCase):
         }
         mock_health.return_value = ["tool1", "tool2"]
 
+        tool_config_mod.invalidate_mcp_tool_cache.reset_mock()
         result = await refresh_mcp_service_tool_count(
             tenant_id="tid", user_id="uid", mcp_id=1,
         )
 
         self.assertEqual(result, ["tool1", "tool2"])
+        tool_config_mod.invalidate_mcp_tool_cache.assert_called_once_with("https://srv/mcp")
         mock_update.assert_called_once_with(
             mcp_id=1, tenant_id="tid", user_id="uid",
             registry_json={"_toolNames": ["tool1", "tool2"]},
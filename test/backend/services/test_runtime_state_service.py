@@ -1,4 +1,5 @@
 import asyncio
+import gc
 
 import pytest
 
@@ -21,6 +22,7 @@ class FakeRedisClient:
         self.stream_events = []
         self.fail_next = set()
         self.pipeline_result = (1, True)
+        self.pipelines = []
 
     def _maybe_fail(self, method):
         if method in self.fail_next:
@@ -89,7 +91,7 @@ class FakeRedisClient:
         self.values[key] = value
         return True
 
-    def pipeline(self):
+    def pipeline(self, transaction=True):
         return FakePipeline(self)
 
 
@@ -106,15 +108,37 @@ class FakePipeline:
         self.operations.append(("expire", key, ttl))
         return self
 
+    def xadd(self, key, values, maxlen=None, approximate=False):
+        self.operations.append(("xadd", key, values, maxlen, approximate))
+        return self
+
     def execute(self):
         self.client._maybe_fail("pipeline")
+        if any(op[0] == "xadd" for op in self.operations):
+            self.client.pipelines.append(list(self.operations))
+            return [f"{index + 1}-0" for index, op in enumerate(self.operations) if op[0] == "xadd"] + [True]
         return self.client.pipeline_result
 
 
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return super().execute()
+
+
+class FakeAsyncRedisClient(FakeRedisClient):
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self)
+
+
 class TestRuntimeStateService(RuntimeStateService):
-    def __init__(self, client):
+    def __init__(self, client, async_client=None):
         super().__init__()
         self._fake_client = client
+        self._fake_async_client = async_client
+
+    @property
+    def async_client(self):
+        return self._fake_async_client
 
     @property
     def enabled(self):
@@ -442,3 +466,141 @@ def test_async_wrappers_delegate_to_sync_methods(monkeypatch):
         assert await service.consume_rate_limit_async("tenant-1", 2) == 1
 
     asyncio.run(run_checks())
+
+
+def test_append_stream_events_pipelines_xadds_with_single_expire(monkeypatch):
+    monkeypatch.setattr(runtime_state_module, "RUNTIME_STREAM_MAX_LEN", 10)
+    monkeypatch.setattr(runtime_state_module, "RUNTIME_STREAM_TTL_SECONDS", 20)
+    client = FakeRedisClient()
+    service = TestRuntimeStateService(client)
+
+    event_ids = service.append_stream_events("user-1", 42, ["a", "b", "c"])
+
+    assert event_ids == ["1-0", "2-0", "3-0"]
+    operations = client.pipelines[0]
+    assert [op[2]["chunk"] for op in operations if op[0] == "xadd"] == ["a", "b", "c"]
+    assert [op for op in operations if op[0] == "expire"] == [("expire", "runtime:stream:user-1:42", 20)]
+    assert service.append_stream_events("user-1", 42, []) == []
+
+
+def test_append_stream_events_swallows_redis_errors(caplog):
+    client = FakeRedisClient()
+    client.fail_next.add("pipeline")
+    service = TestRuntimeStateService(client)
+
+    assert service.append_stream_events("user-1", 42, ["a"]) == []
+    assert "Failed to append runtime stream events" in caplog.text
+
+
+def test_append_stream_events_async_uses_native_client():
+    client = FakeRedisClient()
+    async_client = FakeAsyncRedisClient()
+    service = TestRuntimeStateService(client, async_client=async_client)
+
+    event_ids = asyncio.run(service.append_stream_events_async("user-1", 42, ["a", "b"]))
+
+    assert event_ids == ["1-0", "2-0"]
+    assert len(async_client.pipelines) == 1
+    assert client.pipelines == []
+
+
+def test_async_client_is_reused_per_event_loop(monkeypatch):
+    created = []
+
+    def _from_url(url, **kwargs):
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(runtime_state_module, "RUNTIME_STATE_REDIS_URL", "redis://runtime")
+    monkeypatch.setattr(runtime_state_module, "redis_asyncio", type("_Redis", (), {
+        "from_url": staticmethod(_from_url)}))
+    service = RuntimeStateService()
+
+    async def _clients():
+        return service.async_client, service.async_client
+
+    first_a, first_b = asyncio.run(_clients())
+    second_a, _ = asyncio.run(_clients())
+
+    assert first_a is first_b
+    assert second_a is not first_a
+    assert len(created) == 2
+    # A finished loop no longer keeps its client alive
+    gc.collect()
+    assert len(service._async_clients) == 0
+
+
+def test_append_stream_events_async_falls_back_to_sync_client(caplog):
+    client = FakeRedisClient()
+    async_client = FakeAsyncRedisClient()
+    async_client.fail_next.add("pipeline")
+    service = TestRuntimeStateService(client, async_client=async_client)
+
+    event_ids = asyncio.run(service.append_stream_events_async("user-1", 42, ["a"]))
+
+    assert event_ids == ["1-0"]
+    assert len(client.pipelines) == 1
+    assert "falling back to sync client" in caplog.text
+
+
+def test_stream_event_batcher_coalesces_chunks_in_order():
+    client = FakeRedisClient()
+    async_client = FakeAsyncRedisClient()
+    service = TestRuntimeStateService(client, async_client=async_client)
+
+    async def run():
+        batcher = runtime_state_module.StreamEventBatcher(
+            service, "user-1", 42, window_seconds=60, max_batch_size=100,
+        )
+        for chunk in ["a", "b", "c"]:
+            batcher.enqueue(chunk)
+        await batcher.flush()
+        return batcher
+
+    batcher = asyncio.run(run())
+
+    assert batcher.batches_written == 1
+    assert batcher.events_written == 3
+    assert batcher.pending_count == 0
+    chunks = [op[2]["chunk"] for op in async_client.pipelines[0] if op[0] == "xadd"]
+    assert chunks == ["a", "b", "c"]
+
+
+def test_stream_event_batcher_splits_on_max_batch_size():
+    client = FakeRedisClient()
+    async_client = FakeAsyncRedisClient()
+    service = TestRuntimeStateService(client, async_client=async_client)
+
+    async def run():
+        batcher = runtime_state_module.StreamEventBatcher(
+            service, "user-1", 42, window_seconds=60, max_batch_size=2,
+        )
+        for chunk in ["a", "b", "c", "d", "e"]:
+            batcher.enqueue(chunk)
+        await batcher.flush()
+
+    asyncio.run(run())
+
+    batches = [
+        [op[2]["chunk"] for op in pipeline if op[0] == "xadd"]
+        for pipeline in async_client.pipelines
+    ]
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_stream_event_batcher_writes_after_window_without_flush():
+    client = FakeRedisClient()
+    async_client = FakeAsyncRedisClient()
+    service = TestRuntimeStateService(client, async_client=async_client)
+
+    async def run():
+        batcher = runtime_state_module.StreamEventBatcher(
+            service, "user-1", 42, window_seconds=0.01, max_batch_size=100,
+        )
+        batcher.enqueue("a")
+        await asyncio.sleep(0.1)
+        return batcher
+
+    batcher = asyncio.run(run())
+
+    assert batcher.events_written == 1
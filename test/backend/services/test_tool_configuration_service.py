@@ -1166,6 +1166,13 @@ def sample_tool_request():
 class TestGetAllMcpTools:
     """Test get_all_mcp_tools function"""
 
+    @pytest.fixture(autouse=True)
+    def _clear_mcp_tool_cache(self):
+        from backend.services.tool_configuration_service import invalidate_mcp_tool_cache
+        invalidate_mcp_tool_cache()
+        yield
+        invalidate_mcp_tool_cache()
+
     @patch('backend.services.tool_configuration_service.get_mcp_records_by_tenant')
     @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
     @patch('backend.services.tool_configuration_service.LOCAL_MCP_SERVER', "http://default-server.com")
@@ -1335,6 +1342,100 @@ class TestGetAllMcpTools:
         assert calls[0].kwargs.get("custom_headers") is None
 
 
+class TestGetCachedMcpTools:
+    """Test the MCP tool discovery cache"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_mcp_tool_cache(self):
+        from backend.services.tool_configuration_service import invalidate_mcp_tool_cache
+        invalidate_mcp_tool_cache()
+        yield
+        invalidate_mcp_tool_cache()
+
+    @staticmethod
+    def _tools(name):
+        return [ToolInfo(name=name, description="Tool", params=[], source=ToolSourceEnum.MCP.value,
+                         inputs="{}", output_type="string", class_name=name, usage="server1")]
+
+    @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
+    async def test_fresh_entry_is_served_from_cache(self, mock_get_tools):
+        """A second lookup within the TTL does not reconnect and returns copies"""
+        from backend.services.tool_configuration_service import get_cached_mcp_tools
+        mock_get_tools.return_value = self._tools("tool1")
+
+        first = await get_cached_mcp_tools("server1", "http://server1.com", "tenant", "Bearer a")
+        first[0].name = "mutated"
+        second = await get_cached_mcp_tools("server1", "http://server1.com", "tenant", "Bearer a")
+
+        assert mock_get_tools.call_count == 1
+        assert second[0].name == "tool1"
+
+    @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
+    async def test_credentials_are_part_of_the_key(self, mock_get_tools):
+        """Different tokens for the same URL never share a cached list"""
+        from backend.services.tool_configuration_service import get_cached_mcp_tools
+        mock_get_tools.side_effect = [self._tools("tool_a"), self._tools("tool_b")]
+
+        a = await get_cached_mcp_tools("server1", "http://server1.com", "tenant", "Bearer a")
+        b = await get_cached_mcp_tools("server1", "http://server1.com", "tenant", "Bearer b")
+
+        assert (a[0].name, b[0].name) == ("tool_a", "tool_b")
+
+    @patch('backend.services.tool_configuration_service.MCP_TOOL_CACHE_TTL_S', 0)
+    @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
+    async def test_stale_entry_is_served_while_revalidating(self, mock_get_tools):
+        """Past the TTL the stale list is returned and refreshed in the background"""
+        import backend.services.tool_configuration_service as svc
+        mock_get_tools.side_effect = [self._tools("old"), self._tools("new")]
+
+        await svc.get_cached_mcp_tools("server1", "http://server1.com")
+        stale = await svc.get_cached_mcp_tools("server1", "http://server1.com")
+        assert stale[0].name == "old"
+
+        await asyncio.gather(*svc._mcp_tool_refreshes.values())
+        key = svc._mcp_tool_cache_key("server1", "http://server1.com", None, None, None)
+        assert svc._mcp_tool_cache[key][1][0].name == "new"
+        assert not svc._mcp_tool_refreshes
+
+    @patch('backend.services.tool_configuration_service.MCP_TOOL_DISCOVERY_TIMEOUT_S', 0.01)
+    @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
+    async def test_slow_server_times_out(self, mock_get_tools):
+        """A server slower than the per-server timeout fails instead of stalling the scan"""
+        from backend.services.tool_configuration_service import get_cached_mcp_tools
+
+        async def _slow(**_kwargs):
+            await asyncio.sleep(1)
+
+        mock_get_tools.side_effect = _slow
+        with pytest.raises((MCPConnectionError, asyncio.TimeoutError)):
+            await get_cached_mcp_tools("server1", "http://server1.com")
+
+    @patch('backend.services.tool_configuration_service.get_mcp_records_by_tenant')
+    @patch('backend.services.tool_configuration_service.get_tool_from_remote_mcp_server')
+    @patch('backend.services.tool_configuration_service.LOCAL_MCP_SERVER', "http://default-server.com")
+    async def test_get_all_mcp_tools_queries_servers_concurrently(self, mock_get_tools, mock_get_records):
+        """Server latencies overlap instead of adding up"""
+        from backend.services.tool_configuration_service import get_all_mcp_tools
+        mock_get_records.return_value = [
+            {"mcp_name": f"server{i}", "mcp_server": f"http://server{i}.com", "enabled": True, "status": True}
+            for i in range(4)
+        ]
+        in_flight = {"now": 0, "max": 0}
+
+        async def _list(**kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return self._tools(kwargs["mcp_server_name"])
+
+        mock_get_tools.side_effect = _list
+        result = await get_all_mcp_tools("tenant")
+
+        assert [tool.name for tool in result] == ["server0", "server1", "server2", "server3", "outer-apis"]
+        assert in_flight["max"] > 1
+
+
 class TestGetToolFromRemoteMcpServer:
     """Test get_tool_from_remote_mcp_server function"""
 
@@ -2238,6 +2238,17 @@ class TestElasticSearchService(unittest.TestCase):
         self.assertEqual(len(result["files"][0]["chunks"]), 0)
         self.assertEqual(result["files"][0]["chunk_count"], 1)
 
+    def test_refresh_index(self):
+        """refresh_index reports success and raises when the refresh failed."""
+        self.mock_vdb_core.refresh_index.return_value = True
+        self.assertEqual(
+            ElasticSearchService.refresh_index("test_index", self.mock_vdb_core), {"status": "success"})
+        self.mock_vdb_core.refresh_index.assert_called_once_with("test_index")
+
+        self.mock_vdb_core.refresh_index.return_value = False
+        with self.assertRaises(Exception):
+            ElasticSearchService.refresh_index("test_index", self.mock_vdb_core)
+
     @patch('backend.services.vectordatabase_service.update_last_doc_update_time')
     @patch('backend.services.vectordatabase_service.delete_file')
     def test_delete_documents(self, mock_delete_file, mock_update_last_doc):
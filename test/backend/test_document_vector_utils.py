@@ -167,6 +167,41 @@ class TestAutoDetermineK:
         
         assert k >= 5
 
+    def test_auto_determine_k_finds_separated_clusters(self):
+        """Test that well separated blobs give their true K"""
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(4, 16)) * 20
+        embeddings = np.vstack([center + rng.normal(size=(60, 16)) for center in centers])
+
+        assert auto_determine_k(embeddings, min_k=3, max_k=15) == 4
+
+    def test_auto_determine_k_stops_early(self):
+        """Test that the K sweep stops after PATIENCE values without improvement"""
+        embeddings = np.random.rand(300, 8)
+        scores = iter([0.5, 0.4, 0.3, 0.2, 0.1, 0.9, 0.9])
+
+        with patch('backend.utils.document_vector_utils.silhouette_score', side_effect=lambda *a, **kw: next(scores)), \
+                patch('backend.utils.document_vector_utils.KMeans') as mock_kmeans:
+            mock_kmeans.return_value.fit_predict.return_value = np.zeros(300, dtype=int)
+            k = auto_determine_k(embeddings, min_k=3, max_k=15)
+
+        assert k == 3
+        # K=3 is best, K=4..6 do not improve, so the sweep stops at K=6
+        assert mock_kmeans.call_count == 4
+
+    def test_auto_determine_k_samples_large_dataset(self):
+        """Test that the K sweep fits on a sample of large datasets"""
+        embeddings = np.random.rand(500, 8)
+
+        with patch('backend.utils.document_vector_utils.K_SELECTION_SAMPLE_SIZE', 100), \
+                patch('backend.utils.document_vector_utils.KMeans') as mock_kmeans, \
+                patch('backend.utils.document_vector_utils.silhouette_score', return_value=0.5):
+            mock_kmeans.return_value.fit_predict.return_value = np.zeros(100, dtype=int)
+            auto_determine_k(embeddings, min_k=3, max_k=15)
+
+        fitted = mock_kmeans.return_value.fit_predict.call_args[0][0]
+        assert fitted.shape == (100, 8)
+
 
 class TestKMeansClustering:
     """Test K-means clustering"""
@@ -437,22 +472,9 @@ class TestGetDocumentsFromEs:
     """Test ES document retrieval"""
 
     def test_get_documents_from_es_mock(self):
-        """Test ES document retrieval with mocked VectorDatabaseCore search"""
+        """Test ES document retrieval with mocked VectorDatabaseCore search and msearch"""
         mock_vdb_core = MagicMock()
         mock_vdb_core.search.return_value = {
-            'hits': {
-                'hits': [
-                    {
-                        '_source': {
-                            'path_or_url': '/path/doc1.pdf',
-                            'filename': 'doc1.pdf',
-                            'content': 'Content 1',
-                            'embedding': [1.0, 2.0, 3.0],
-                            'create_time': '2024-01-01T00:00:00'
-                        }
-                    }
-                ]
-            },
             'aggregations': {
                 'unique_documents': {
                     'buckets': [
@@ -464,6 +486,25 @@ class TestGetDocumentsFromEs:
                 }
             }
         }
+        mock_vdb_core.multi_search.return_value = {
+            'responses': [
+                {
+                    'hits': {
+                        'hits': [
+                            {
+                                '_source': {
+                                    'path_or_url': '/path/doc1.pdf',
+                                    'filename': 'doc1.pdf',
+                                    'content': 'Content 1',
+                                    'embedding': [1.0, 2.0, 3.0],
+                                    'create_time': '2024-01-01T00:00:00'
+                                }
+                            }
+                        ]
+                    }
+                }
+            ]
+        }
 
         result = get_documents_from_es(
             'test_index', mock_vdb_core, sample_doc_count=10)
@@ -474,15 +515,71 @@ class TestGetDocumentsFromEs:
         first_doc = list(result.values())[0]
         assert 'chunks' in first_doc
         
-        # Verify that sort parameter is included in the query
-        call_args = mock_vdb_core.search.call_args
-        if call_args:
-            query_body = call_args[1].get('body') or call_args[0][1] if len(call_args[0]) > 1 else None
-            if query_body and 'sort' in query_body:
-                sort_config = query_body['sort']
-                assert isinstance(sort_config, list)
-                # Should have create_time sort
-                assert any('create_time' in str(sort_item) for sort_item in sort_config)
+        # Verify that the chunk query is sorted by create_time
+        msearch_body = mock_vdb_core.multi_search.call_args.kwargs['body']
+        assert msearch_body[0] == {'index': 'test_index'}
+        query_body = msearch_body[1]
+        assert query_body['query'] == {'term': {'path_or_url': '/path/doc1.pdf'}}
+        sort_config = query_body['sort']
+        assert isinstance(sort_config, list)
+        assert any('create_time' in str(sort_item) for sort_item in sort_config)
+
+    def test_get_documents_from_es_batches_chunk_queries(self):
+        """Test that chunk queries are sent in msearch batches, keeping document order"""
+        buckets = [{'key': f'/path/doc{i}.pdf', 'doc_count': 2} for i in range(5)]
+        mock_vdb_core = MagicMock()
+        mock_vdb_core.search.return_value = {
+            'aggregations': {'unique_documents': {'buckets': buckets}}
+        }
+
+        def multi_search(body, index_name):
+            queries = body[1::2]
+            return {'responses': [
+                {'hits': {'hits': [
+                    {'_source': {'filename': query['query']['term']['path_or_url'], 'content': 'c'}}
+                ] * query['size']}}
+                for query in queries
+            ]}
+
+        mock_vdb_core.multi_search.side_effect = multi_search
+
+        with patch('backend.utils.document_vector_utils.CHUNK_FETCH_BATCH_SIZE', 2), \
+                patch('backend.utils.document_vector_utils.random.sample', side_effect=lambda docs, n: docs[:n]):
+            result = get_documents_from_es('test_index', mock_vdb_core, sample_doc_count=5)
+
+        # One aggregation query, then ceil(5 / 2) msearch requests instead of 5 searches
+        assert mock_vdb_core.search.call_count == 1
+        assert mock_vdb_core.multi_search.call_count == 3
+        assert list(result) == ['doc_0000', 'doc_0001', 'doc_0002', 'doc_0003', 'doc_0004']
+        for i, doc in enumerate(result.values()):
+            assert doc['path_or_url'] == f'/path/doc{i}.pdf'
+            assert doc['filename'] == f'/path/doc{i}.pdf'
+            assert doc['chunk_count'] == 2
+            assert len(doc['chunks']) == 2
+
+    def test_get_documents_from_es_chunk_budget_splits_batches(self):
+        """Test that a batch is closed before it exceeds the chunk budget"""
+        from backend.utils.document_vector_utils import _batch_document_buckets
+
+        buckets = [{'key': 'a', 'doc_count': 3}, {'key': 'b', 'doc_count': 3},
+                   {'key': 'c', 'doc_count': 10}, {'key': 'd', 'doc_count': 1}]
+        with patch('backend.utils.document_vector_utils.CHUNK_FETCH_MAX_CHUNKS_PER_BATCH', 6):
+            batches = _batch_document_buckets(buckets)
+
+        assert [[bucket['key'] for bucket in batch] for batch in batches] == [['a', 'b'], ['c'], ['d']]
+
+    def test_get_documents_from_es_msearch_error(self):
+        """Test that an error response inside msearch fails the retrieval"""
+        mock_vdb_core = MagicMock()
+        mock_vdb_core.search.return_value = {
+            'aggregations': {'unique_documents': {'buckets': [{'key': '/path/doc1.pdf', 'doc_count': 1}]}}
+        }
+        mock_vdb_core.multi_search.return_value = {
+            'responses': [{'error': {'type': 'search_phase_execution_exception'}}]
+        }
+
+        with pytest.raises(Exception, match="Failed to retrieve documents from Elasticsearch"):
+            get_documents_from_es('test_index', mock_vdb_core)
 
 
 class TestProcessDocumentsForClustering:
@@ -618,6 +715,41 @@ class TestMergeDuplicateDocumentsInClusters:
         # Should return clusters (possibly unchanged due to high threshold)
         assert isinstance(result, dict)
 
+    def test_merge_duplicate_documents_matches_pairwise_comparison(self):
+        """Test that blocked duplicate detection finds exactly the pairwise duplicates"""
+        from backend.utils.document_vector_utils import _find_duplicate_pairs
+
+        rng = np.random.default_rng(1)
+        base = rng.normal(size=(40, 32))
+        # Near copies of a few documents, plus a scaled copy (same direction, far apart)
+        copies = base[[0, 3, 3, 7]] + rng.normal(scale=1e-4, size=(4, 32))
+        vectors = np.vstack([base, copies, base[[6]] * 3, np.zeros((1, 32))])
+        doc_embeddings = {f'doc{i}': vector for i, vector in enumerate(vectors)}
+        doc_to_cluster = {doc_id: i % 5 for i, doc_id in enumerate(doc_embeddings)}
+        doc_to_cluster.pop('doc41')  # document outside every cluster
+
+        expected = []
+        doc_ids = list(doc_embeddings)
+        for i, doc_id1 in enumerate(doc_ids):
+            for doc_id2 in doc_ids[i + 1:]:
+                e1, e2 = doc_embeddings[doc_id1], doc_embeddings[doc_id2]
+                n1, n2 = np.linalg.norm(e1), np.linalg.norm(e2)
+                if n1 == 0 or n2 == 0 or np.dot(e1, e2) / (n1 * n2) < 0.98:
+                    continue
+                c1, c2 = doc_to_cluster.get(doc_id1), doc_to_cluster.get(doc_id2)
+                if c1 is None or c2 is None or c1 == c2:
+                    continue
+                if np.linalg.norm(e1 - e2) <= 0.01 * (n1 + n2) / 2:
+                    expected.append((doc_id1, doc_id2))
+
+        with patch('backend.utils.document_vector_utils.DUPLICATE_BLOCK_ELEMENTS', 100):
+            pairs = _find_duplicate_pairs(doc_to_cluster, doc_embeddings, 0.98)
+
+        assert [(doc_id1, doc_id2) for doc_id1, doc_id2, _, _, _ in pairs] == expected
+        # doc0/doc40 share a cluster, doc41 is unclustered, doc44 is doc6 scaled
+        assert expected == [('doc3', 'doc42'), ('doc7', 'doc43')]
+        assert all(similarity >= 0.98 for _, _, _, _, similarity in pairs)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -100,24 +100,32 @@ class TestGetDocumentsFromES:
                         {'key': '/path/doc2.pdf', 'doc_count': 2}
                     ]
                 }
-            },
-            'hits': {
-                'hits': [
-                    {
-                        '_source': {
-                            'filename': 'doc1.pdf',
-                            'content': 'test content',
-                            'embedding': [0.1, 0.2, 0.3],
-                            'file_size': 1000
-                        }
-                    }
-                ]
             }
         }
+        mock_vdb_core.multi_search.return_value = {
+            'responses': [
+                {
+                    'hits': {
+                        'hits': [
+                            {
+                                '_source': {
+                                    'filename': 'doc1.pdf',
+                                    'content': 'test content',
+                                    'embedding': [0.1, 0.2, 0.3],
+                                    'file_size': 1000
+                                }
+                            }
+                        ]
+                    }
+                }
+            ] * 2
+        }
         
         result = get_documents_from_es('test_index', mock_vdb_core, sample_doc_count=10)
         assert isinstance(result, dict)
-        assert mock_vdb_core.search.called
+        assert len(result) == 2
+        assert mock_vdb_core.search.call_count == 1
+        assert mock_vdb_core.multi_search.call_count == 1
     
     def test_get_documents_from_es_empty(self):
         """Test ES retrieval with no documents"""
@@ -472,20 +480,26 @@ class TestAdditionalCoverage:
                         {'key': '/path/doc1.pdf', 'doc_count': 1}
                     ]
                 }
-            },
-            'hits': {
-                'hits': [
-                    {
-                        '_source': {
-                            'filename': 'doc1.pdf',
-                            'content': 'test content',
-                            'embedding': [0.1, 0.2, 0.3],
-                            'file_size': 1000
-                        }
-                    }
-                ]
             }
         }
+        mock_vdb_core.multi_search.return_value = {
+            'responses': [
+                {
+                    'hits': {
+                        'hits': [
+                            {
+                                '_source': {
+                                    'filename': 'doc1.pdf',
+                                    'content': 'test content',
+                                    'embedding': [0.1, 0.2, 0.3],
+                                    'file_size': 1000
+                                }
+                            }
+                        ]
+                    }
+                }
+            ]
+        }
         
         # Mock calculate_document_embedding to return None
         with patch('backend.utils.document_vector_utils.calculate_document_embedding') as mock_calc:
@@ -36,6 +36,7 @@ if "database" not in sys.modules:
 if "database.model_management_db" not in sys.modules:
     model_mgmt_db_mod = types.ModuleType("database.model_management_db")
     model_mgmt_db_mod.get_model_by_model_id = MagicMock(return_value=None)
+    model_mgmt_db_mod.get_models_by_model_ids = MagicMock(return_value={})
     sys.modules["database.model_management_db"] = model_mgmt_db_mod
     setattr(sys.modules["database"], "model_management_db", model_mgmt_db_mod)
 
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from nexent.core.models.embedding_cache import EmbeddingCache, get_embedding_cache, set_embedding_cache
+from nexent.vector_database.search_result_cache import (
+    SearchResultCache,
+    get_search_result_cache,
+    set_search_result_cache,
+)
+
+from backend.utils import cache_utils
+
+
+@pytest.fixture(autouse=True)
+def reset_global_caches():
+    set_embedding_cache(None)
+    set_search_result_cache(None)
+    yield
+    set_embedding_cache(None)
+    set_search_result_cache(None)
+
+
+def test_init_installs_shared_caches_with_redis_tier_once():
+    redis_client = MagicMock()
+    with patch.object(cache_utils, "get_redis_client", return_value=redis_client) as mock_get:
+        first = cache_utils.init_caches()
+        second = cache_utils.init_caches()
+
+    assert first == second
+    assert first["embedding"] is get_embedding_cache()
+    assert first["search_result"] is get_search_result_cache()
+    assert isinstance(first["embedding"], EmbeddingCache)
+    assert isinstance(first["search_result"], SearchResultCache)
+    assert first["embedding"]._redis is redis_client
+    assert first["search_result"]._redis is redis_client
+    assert mock_get.call_count == 2
+
+
+def test_init_skips_redis_when_disabled():
+    with patch.object(cache_utils, "EMBEDDING_CACHE_REDIS_ENABLED", False), \
+         patch.object(cache_utils, "SEARCH_RESULT_CACHE_REDIS_ENABLED", False), \
+         patch.object(cache_utils, "get_redis_client") as mock_get:
+        caches = cache_utils.init_caches()
+
+    assert caches["embedding"]._redis is None
+    assert caches["search_result"]._redis is None
+    mock_get.assert_not_called()
+
+
+def test_init_uses_configured_capacity_and_ttl():
+    with patch.object(cache_utils, "SEARCH_RESULT_CACHE_MAX_ENTRIES", 7), \
+         patch.object(cache_utils, "SEARCH_RESULT_CACHE_TTL_SECONDS", 42), \
+         patch.object(cache_utils, "get_redis_client", return_value=None):
+        cache = cache_utils.init_caches()["search_result"]
+
+    assert cache._max_entries == 7
+    assert cache._ttl == 42
+
+
+def test_cache_disabled_by_zero_entries():
+    with patch.object(cache_utils, "EMBEDDING_CACHE_MAX_ENTRIES", 0), \
+         patch.object(cache_utils, "get_redis_client", return_value=None):
+        caches = cache_utils.init_caches()
+
+    assert caches["embedding"] is None
+    assert get_embedding_cache() is None
+    assert caches["search_result"] is get_search_result_cache()
+    assert cache_utils.get_cache_stats()["embedding"] == {"enabled": False}
+
+
+def test_stats_report_hit_ratio_per_cache():
+    with patch.object(cache_utils, "get_redis_client", return_value=None):
+        caches = cache_utils.init_caches()
+    caches["embedding"].get_many(["missing"])
+    caches["search_result"].put("k", [{"content": "c"}], cost_ms=50.0)
+    caches["search_result"].get("k")
+
+    stats = cache_utils.get_cache_stats()
+
+    assert stats["embedding"]["misses"] == 1
+    assert stats["embedding"]["hit_ratio"] == 0.0
+    assert stats["search_result"]["hit_ratio"] == 1.0
+    assert stats["search_result"]["saved_ms"] == 50.0
@@ -95,6 +95,12 @@ class TestGetModelNameFromConfig:
 class TestTenantConfigManager:
     """Test TenantConfigManager class"""
 
+    @pytest.fixture(autouse=True)
+    def no_config_versions(self):
+        """Run without Redis version stamps, so every call reads the database"""
+        with patch('backend.utils.config_utils.get_config_versions', return_value=None) as mock_versions:
+            yield mock_versions
+
     @pytest.fixture
     def config_manager(self):
         """Create config manager instance"""
@@ -157,7 +163,7 @@ class TestTenantConfigManager:
 
     @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
     def test_load_config_cache_hit(self, mock_get_configs, config_manager, mock_configs):
-        """Test cache hit"""
+        """Test that nothing is cached without version stamps"""
         mock_get_configs.return_value = mock_configs
 
         # First load
@@ -348,3 +354,104 @@ class TestTenantConfigManager:
         """Test clearing all cache"""
         # clear_cache removed with cache removal: method should not exist
         assert not hasattr(config_manager, "clear_cache")
+
+
+class TestTenantConfigManagerVersionedCache:
+    """Test the version-stamped snapshot cache of TenantConfigManager"""
+
+    @pytest.fixture
+    def versions(self):
+        state = {"value": ("1", "0", "0")}
+        with patch('backend.utils.config_utils.get_config_versions',
+                   side_effect=lambda tenant_id: state["value"]):
+            yield state
+
+    @pytest.fixture
+    def clock(self):
+        now = {"t": 1000.0}
+        with patch('backend.utils.config_utils.time.monotonic', side_effect=lambda: now["t"]):
+            yield now
+
+    @pytest.fixture
+    def config_manager(self, versions, clock):
+        return TenantConfigManager()
+
+    @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
+    def test_load_config_cache_hit(self, mock_get_configs, config_manager, clock):
+        """Test that unchanged versions serve the cached snapshot"""
+        mock_get_configs.return_value = [{"config_key": "app_setting", "config_value": "v1"}]
+
+        config_manager.load_config("tenant1")
+        clock["t"] += 5
+        result = config_manager.load_config("tenant1")
+
+        assert mock_get_configs.call_count == 1
+        assert result == {"app_setting": "v1"}
+        stats = config_manager.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["tenants"] == 1
+
+    @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
+    def test_version_bump_reloads(self, mock_get_configs, config_manager, versions, clock):
+        """Test that a version bump from another replica reloads the snapshot"""
+        mock_get_configs.return_value = [{"config_key": "app_setting", "config_value": "v1"}]
+        config_manager.load_config("tenant1")
+
+        mock_get_configs.return_value = [{"config_key": "app_setting", "config_value": "v2"}]
+        versions["value"] = ("2", "0", "0")
+        clock["t"] += 2
+        result = config_manager.load_config("tenant1")
+
+        assert mock_get_configs.call_count == 2
+        assert result == {"app_setting": "v2"}
+
+    @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
+    def test_returned_config_is_a_copy(self, mock_get_configs, config_manager):
+        """Test that callers cannot mutate the cached snapshot"""
+        mock_get_configs.return_value = [{"config_key": "app_setting", "config_value": "v1"}]
+
+        config_manager.load_config("tenant1")["app_setting"] = "changed"
+
+        assert config_manager.load_config("tenant1") == {"app_setting": "v1"}
+
+    @patch('backend.utils.config_utils.get_model_by_model_id')
+    @patch('backend.utils.config_utils.get_models_by_model_ids')
+    @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
+    def test_model_records_are_batch_loaded(self, mock_get_configs, mock_get_models, mock_get_model,
+                                            config_manager):
+        """Test that referenced models are resolved in one query and then cached"""
+        mock_get_configs.return_value = [
+            {"config_key": "LLM_ID", "config_value": "1"},
+            {"config_key": "EMBEDDING_ID", "config_value": "2"},
+            {"config_key": "app_setting", "config_value": "text"},
+        ]
+        mock_get_models.return_value = {
+            1: {"model_id": 1, "model_name": "llm"},
+            2: {"model_id": 2, "model_name": "embedding"},
+        }
+
+        llm = config_manager.get_model_config("LLM_ID", {}, "tenant1")
+        embedding = config_manager.get_model_config("EMBEDDING_ID", {}, "tenant1")
+
+        assert llm == {"model_id": 1, "model_name": "llm"}
+        assert embedding == {"model_id": 2, "model_name": "embedding"}
+        mock_get_models.assert_called_once()
+        assert sorted(mock_get_models.call_args.args[0]) == [1, 2]
+        mock_get_model.assert_not_called()
+        stats = config_manager.get_cache_stats()
+        assert stats["model_misses"] == 1
+        assert stats["model_hits"] == 1
+
+    @patch('backend.utils.config_utils.insert_config')
+    @patch('backend.utils.config_utils.get_all_configs_by_tenant_id')
+    def test_set_single_config_invalidates(self, mock_get_configs, mock_insert, config_manager):
+        """Test that a local write drops the tenant's snapshot"""
+        mock_get_configs.return_value = [{"config_key": "app_setting", "config_value": "v1"}]
+        config_manager.load_config("tenant1")
+
+        config_manager.set_single_config("user1", "tenant1", "new_key", "new_value")
+        config_manager.load_config("tenant1")
+
+        mock_insert.assert_called_once()
+        assert mock_get_configs.call_count == 2
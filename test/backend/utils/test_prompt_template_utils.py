@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import mock_open
 
+from nexent.core.utils.template_registry import clear_template_caches
 from utils.prompt_template_utils import (
     get_agent_prompt_template,
     get_prompt_generate_prompt_template,
@@ -13,6 +14,14 @@ from utils.prompt_template_utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_template_registry():
+    """Make every test read through the (mocked) file instead of the shared cache."""
+    clear_template_caches()
+    yield
+    clear_template_caches()
+
+
 class TestPromptTemplateUtils:
     """Test cases for prompt_template_utils module"""
 
@@ -77,6 +77,7 @@ def bootstrap_test_env() -> Dict[str, Any]:
     
     mock_model_management_db = types.ModuleType("database.model_management_db")
     mock_model_management_db.get_model_by_model_id = MagicMock(return_value=None)
+    mock_model_management_db.get_models_by_model_ids = MagicMock(return_value={})
     sys.modules["database.model_management_db"] = mock_model_management_db
 
     return {
@@ -220,6 +220,13 @@ def _load_a2a_agent_proxy_module():
     sys.modules["sdk.nexent.core"] = ModuleType("sdk.nexent.core")
     sys.modules["sdk.nexent.core.agents"] = ModuleType("sdk.nexent.core.agents")
 
+    # The proxy's only sibling dependency is the stdlib-only background loop runner
+    runner_path = os.path.join(project_root, "sdk", "nexent", "core", "utils", "async_runner.py")
+    runner_spec = importlib.util.spec_from_file_location("sdk.nexent.core.utils.async_runner", runner_path)
+    runner_module = importlib.util.module_from_spec(runner_spec)
+    sys.modules["sdk.nexent.core.utils.async_runner"] = runner_module
+    runner_spec.loader.exec_module(runner_module)
+
     spec = importlib.util.spec_from_file_location("sdk.nexent.core.agents.a2a_agent_proxy", module_path)
     module = importlib.util.module_from_spec(spec)
     module.__package__ = "sdk.nexent.core.agents"
@@ -241,6 +248,14 @@ ExternalA2AAgentWrapper = a2a_agent_proxy.ExternalA2AAgentWrapper
 PROTOCOL_JSONRPC = a2a_agent_proxy.PROTOCOL_JSONRPC
 PROTOCOL_HTTP_JSON = a2a_agent_proxy.PROTOCOL_HTTP_JSON
 PROTOCOL_GRPC = a2a_agent_proxy.PROTOCOL_GRPC
+BackgroundLoopRunner = a2a_agent_proxy.BackgroundLoopRunner
+
+
+@pytest.fixture(autouse=True)
+def _reset_pooled_clients():
+    """Drop clients pooled by sync calls so each test sees its own httpx mock."""
+    yield
+    BackgroundLoopRunner.get_instance().close()
 
 
 # ---------------------------------------------------------------------------
@@ -1166,6 +1181,47 @@ class TestExternalA2AAgentProxy:
             with pytest.raises(RuntimeError, match="network error"):
                 proxy.sync_call("hello")
 
+    def test_sync_call_reuses_pooled_client(self):
+        """Test repeated sync_call() calls share one client per endpoint on the runner loop."""
+        info = self._make_info(agent_id="pooled-agent", url="https://pooled.example.com/a2a")
+        response_data = {"result": {"message": {"role": "ROLE_AGENT", "parts": [{"text": "pooled"}]}}}
+        mock_response = MagicMock(status_code=200, headers={}, json=MagicMock(return_value=response_data))
+        mock_response.raise_for_status = MagicMock()
+
+        with patch.object(_mock_httpx, "AsyncClient") as MockClient:
+            instance = MagicMock()
+            instance.is_closed = False
+            instance.post = AsyncMock(return_value=mock_response)
+            instance.aclose = AsyncMock()
+            MockClient.return_value = instance
+
+            assert ExternalA2AAgentProxy(info).sync_call("one") == "pooled"
+            assert ExternalA2AAgentProxy(info).sync_call("two") == "pooled"
+
+        assert MockClient.call_count == 1
+        assert instance.post.await_count == 2
+        instance.aclose.assert_not_awaited()
+
+    def test_pooled_clients_are_keyed_by_timeout(self):
+        """Agents on one endpoint with different timeouts do not share a pooled client."""
+        response_data = {"result": {"message": {"role": "ROLE_AGENT", "parts": [{"text": "pooled"}]}}}
+        mock_response = MagicMock(status_code=200, headers={}, json=MagicMock(return_value=response_data))
+        mock_response.raise_for_status = MagicMock()
+
+        with patch.object(_mock_httpx, "AsyncClient") as MockClient:
+            instance = MagicMock()
+            instance.is_closed = False
+            instance.post = AsyncMock(return_value=mock_response)
+            instance.aclose = AsyncMock()
+            MockClient.return_value = instance
+
+            for timeout in (30.0, 600.0, 30.0):
+                info = self._make_info(url="https://timeouts.example.com/a2a", timeout=timeout)
+                assert ExternalA2AAgentProxy(info).sync_call("hi") == "pooled"
+
+        assert MockClient.call_count == 2
+        assert [c.kwargs["timeout"].value for c in MockClient.call_args_list] == [30.0, 600.0]
+
     @pytest.mark.asyncio
     async def test_extract_text_from_events_artifact_update(self):
         """Test extract_text_from_events yields text from artifactUpdate events."""
@@ -12,6 +12,8 @@ diff stays above the coverage target:
 - Message helpers: ``_msg_role`` / ``_msg_text`` / ``_set_msg_text`` / ``_find_new_input_index``.
 """
 
+import re
+
 import pytest
 
 from nexent.core.agents.agent_model import GuardrailConfig, GuardrailRule
@@ -21,6 +23,7 @@ from nexent.core.agents.verification import (
     SeverityResolver,
     VerificationResult,
     _guardrail_locale,
+    _literal_trie_pattern,
     latest_user_message_text,
     render_guardrail_refusal,
     render_tool_input_refusal,
@@ -157,6 +160,32 @@ class TestCheckInput:
         # history -> mask, new_input -> terminate; overall highest rank is terminate
         assert decision.effective_action == "terminate"
 
+    def test_repeated_history_is_scanned_once(self, monkeypatch):
+        engine = _engine([_rule(severity="block")])
+        scanned = []
+        real_scan = engine._scan
+        monkeypatch.setattr(engine, "_scan", lambda text: scanned.append(text) or real_scan(text))
+        messages = [_msg("system", "sys"), _msg("user", f"记住{KEYWORD}")]
+        for step in range(3):
+            messages = messages + [_msg("assistant", f"step {step}"), _msg("user", f"continue {step}")]
+            decision = engine.check_input(input_messages=messages)
+            assert decision.effective_action == "mask"  # cached verdict, re-resolved as history
+        assert len(scanned) == len(set(scanned)) == len(messages)
+
+    def test_cached_verdict_resolves_per_source(self):
+        engine = _engine([_rule(severity="block")])
+        first = engine.check_input(input_messages=[_msg("user", f"分析{KEYWORD}")])
+        assert first.effective_action == "terminate"
+        later = engine.check_input(input_messages=[_msg("user", f"分析{KEYWORD}"), _msg("user", "换个问题")])
+        assert later.effective_action == "mask"
+        assert KEYWORD not in later.masked_messages[0]["content"]
+
+    def test_unmasked_input_is_not_copied(self):
+        engine = _engine([_rule(severity="block")])
+        messages = [_msg("user", f"分析{KEYWORD}")]
+        engine.check_input(input_messages=messages)
+        assert messages[0]["content"] == f"分析{KEYWORD}"
+
     def test_no_match_returns_pass(self):
         engine = _engine([_rule(severity="block")])
         messages = [_msg("user", "今天天气不错")]
@@ -377,6 +406,26 @@ class TestScanMaskRank:
         assert engine._mask_value(123, matches) == 123  # non-string passthrough
         assert engine._mask_value(None, matches) is None
 
+    def test_literal_prefilter_keeps_rule_order_and_case(self):
+        engine = _engine([
+            _rule("block", name="kw"),
+            _rule("mask", name="phone", pattern="1[3-9]\\d{9}"),
+            _rule("mask", name="secret", pattern="Top Secret"),
+        ])
+        assert engine._literal_prefilter is not None
+        assert [r.name for _c, r in engine._regex_rules] == ["phone"]
+        matches = engine._scan(f"top SECRET {KEYWORD}")
+        assert [m[1].name for m in matches] == ["kw", "secret"]
+        # Clean text only runs the regex rules
+        assert [m[1].name for m in engine._scan("call 13912345678")] == ["phone"]
+
+    def test_literal_trie_matches_union_of_literals(self):
+        pattern = re.compile(_literal_trie_pattern(["ab", "abc", "abd", "机密", "x.y"]), re.IGNORECASE)
+        for text in ("AB", "zabdz", "含机密", "x.y"):
+            assert pattern.search(text), text
+        for text in ("a", "ad", "机", "xzy"):
+            assert pattern.search(text) is None, text
+
     @pytest.mark.parametrize("action,rank", [
         ("pass", 0), ("mask", 2), ("block", 3), ("terminate", 4), ("bogus", 0),
     ])
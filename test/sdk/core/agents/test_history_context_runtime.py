@@ -282,15 +282,15 @@ def test_compact_stages_old_actions_before_other_items(monkeypatch):
         id="kb:large", type="knowledge_base",
         content={"text": "knowledge " * 3000},
     )])
-    original_estimator = manager._estimate_items
-
-    def stage_observer(items, stable, dynamic, tools):
-        states = {item.id: item.metadata.get("representation", "raw") for item in items}
-        if states.get("current_action:0") == "compact":
-            return 1
-        return max(51, original_estimator(items, stable, dynamic, tools))
+    items = sorted([*run.items, *manager._project_current_run(memory, 0)], key=lambda item: item.layout_key)
+    by_id = {item.id: item for item in items}
+    action, kb = by_id["current_action:0"], by_id["kb:large"]
+    assert kb.token_estimate - kb.compact().token_estimate > action.token_estimate - action.compact().token_estimate
+    # Compacting only the old action is exactly enough to fit the soft budget.
+    manager.config.soft_input_budget_tokens = manager._estimate_items(
+        [item.compact() if item is action else item for item in items], [], [], [],
+    )
 
-    monkeypatch.setattr(manager, "_estimate_items", stage_observer)
     result = manager.assemble_final_context(
         model=_SummaryModel(), memory=memory, current_run_start_idx=0,
         run_context=run,
@@ -401,3 +401,37 @@ def test_context_evidence_log_is_pretty_printed(caplog):
     assert "Agent loop context evidence:\n{" in caplog.text
     assert '\n  "final_token_estimate": 80,' in caplog.text
     assert '\n  "processing_mode": "adaptive_compact",' in caplog.text
+
+
+def test_incremental_budget_matches_full_estimate_with_render_groups(monkeypatch):
+    monkeypatch.setattr("smolagents.memory.SystemPromptStep", _SystemPrompt)
+    actions = [ActionStep(
+        step_number=index + 1, timing=Timing(start_time=0), tool_calls=[],
+        observations=f"observation {index} " * 200, action_output=f"result {index}",
+        model_output=f"reasoning {index} " * 200,
+    ) for index in range(40)]
+    memory = _Memory([TaskStep(task="task"), *actions])
+    tools = [ContextItemInput(
+        id=f"tool:{name}", type="tool",
+        content={"name": name, "description": f"{name} description " * 50, "inputs": {}, "output_type": "string"},
+        metadata={"render_group": "tools", "language": "en"},
+    ) for name in ("search", "fetch")]
+    manager = ContextManager(ContextManagerConfig(
+        soft_input_budget_tokens=100, hard_input_budget_tokens=10 ** 6, keep_recent_steps=2,
+        policy_layers={"request": {"processing_mode": "adaptive_compact"}},
+    ))
+    run = manager.prepare_run_context(memory, "system", tools)
+    items = sorted([*run.items, *manager._project_current_run(memory, 0)], key=lambda item: item.layout_key)
+    estimates = []
+    original_estimator = manager._estimate_items
+    monkeypatch.setattr(manager, "_estimate_items", lambda *args: estimates.append(args) or original_estimator(*args))
+
+    compacted = manager._compact_to_soft_budget(items, [], [], [])
+
+    assert estimates == []
+    assert [item.id for item in compacted] == [item.id for item in items]
+    states = {item.id: item.metadata.get("representation", "raw") for item in compacted}
+    assert states["tool:search"] == states["tool:fetch"] == "compact"
+    assert states["current_action:39"] == "compact"
+    from nexent.core.agents.context.manager import _RenderedSizeIndex
+    assert _RenderedSizeIndex(manager, compacted, []).tokens() == original_estimator(compacted, [], [], [])
@@ -0,0 +1,191 @@
+"""Unit tests for sdk.nexent.core.agents.mcp_session_pool.
+
+MCPSessionPool is a pure stdlib module; connecting to a server goes through
+``_open_session``, which the tests replace with a fake that records connects,
+closes and health probes.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _pkg(name, path):
+    mod = types.ModuleType(name)
+    mod.__path__ = [str(path)]
+    sys.modules.setdefault(name, mod)
+    return mod
+
+
+sdk_pkg = _pkg("sdk", REPO_ROOT / "sdk")
+nexent_pkg = _pkg("sdk.nexent", REPO_ROOT / "sdk" / "nexent")
+core_pkg = _pkg("sdk.nexent.core", REPO_ROOT / "sdk" / "nexent" / "core")
+agents_pkg = _pkg("sdk.nexent.core.agents", REPO_ROOT / "sdk" / "nexent" / "core" / "agents")
+
+
+MODULE_PATH = REPO_ROOT / "sdk" / "nexent" / "core" / "agents" / "mcp_session_pool.py"
+MODULE_NAME = "sdk.nexent.core.agents.mcp_session_pool"
+spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+pool_module = importlib.util.module_from_spec(spec)
+sys.modules[MODULE_NAME] = pool_module
+assert spec and spec.loader
+spec.loader.exec_module(pool_module)
+
+MCPSessionPool = pool_module.MCPSessionPool
+mcp_session_key = pool_module.mcp_session_key
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeServers:
+    """Stand-in for _open_session that counts connects and closes per URL."""
+
+    def __init__(self):
+        self.connects = []
+        self.closes = []
+        self.healthy = True
+
+    def __call__(self, config):
+        url = config["url"]
+        self.connects.append(url)
+
+        def probe():
+            if not self.healthy:
+                raise ConnectionError("ping failed")
+
+        tools = [SimpleNamespace(name=f"{url}-tool"), SimpleNamespace(name="shared")]
+        return tools, lambda: self.closes.append(url), probe
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr(pool_module.time, "monotonic", lambda: now["t"])
+    return now
+
+
+@pytest.fixture
+def servers():
+    return _FakeServers()
+
+
+@pytest.fixture
+def pool(monkeypatch, servers, clock):
+    pool_ = MCPSessionPool(idle_ttl_s=300, max_age_s=3600, health_check_interval_s=30)
+    monkeypatch.setattr(pool_, "_open_session", servers)
+    return pool_
+
+
+A = {"url": "http://a/mcp", "transport": "streamable-http"}
+B = {"url": "http://b/sse", "transport": "sse", "headers": {"Authorization": "Bearer x"}}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_session_key_hashes_headers():
+    assert mcp_session_key(A) == ("http://a/mcp", "streamable-http", "")
+    key_b = mcp_session_key(B)
+    assert key_b[:2] == ("http://b/sse", "sse")
+    assert "Bearer" not in key_b[2]
+    assert key_b != mcp_session_key({**B, "headers": {"Authorization": "Bearer y"}})
+
+
+def test_sessions_are_reused_across_runs(pool, servers):
+    with pool.acquire([A, B]) as collection:
+        assert [t.name for t in collection.tools] == [
+            "http://a/mcp-tool", "shared", "http://b/sse-tool", "shared"]
+        # First server wins for duplicate names, like a linear search
+        assert collection.tools_by_name["shared"] is collection.tools[1]
+
+    with pool.acquire([A]) as collection:
+        assert collection.tools_by_name["http://a/mcp-tool"].name == "http://a/mcp-tool"
+
+    assert servers.connects == ["http://a/mcp", "http://b/sse"]
+    assert servers.closes == []
+
+
+def test_unhealthy_session_is_reconnected(pool, servers, clock):
+    with pool.acquire([A]):
+        pass
+    servers.healthy = False
+    clock["t"] += 60  # past the health check interval
+    with pool.acquire([A]):
+        pass
+
+    assert servers.connects == ["http://a/mcp", "http://a/mcp"]
+    assert servers.closes == ["http://a/mcp"]
+
+
+def test_recently_used_session_skips_health_check(pool, servers, clock):
+    with pool.acquire([A]):
+        pass
+    servers.healthy = False
+    clock["t"] += 5
+    with pool.acquire([A]):
+        pass
+    assert servers.connects == ["http://a/mcp"]
+
+
+def test_idle_sessions_are_evicted_but_in_use_ones_stay(pool, servers, clock):
+    with pool.acquire([A]):
+        pass
+    with pool.acquire([B]):
+        clock["t"] += 301
+        pool._evict_idle()
+        assert servers.closes == ["http://a/mcp"]
+    clock["t"] += 301
+    pool._evict_idle()
+    assert servers.closes == ["http://a/mcp", "http://b/sse"]
+
+
+def test_expired_session_is_closed_after_last_user(pool, servers, clock):
+    with pool.acquire([A]):
+        clock["t"] += 3601
+        with pool.acquire([A]):
+            # The old session is retired but still held by the outer run
+            assert servers.closes == []
+        assert len(servers.connects) == 2
+    assert servers.closes.count("http://a/mcp") == 1
+
+
+def test_new_session_timestamps_come_from_the_current_clock(pool, clock):
+    clock["t"] = 5.0
+    with pool.acquire([A]):
+        session = pool._sessions[mcp_session_key(A)]
+        assert session.created_at == 5.0
+        assert session.last_used == 5.0
+
+
+def test_failed_connect_releases_earlier_sessions(pool, servers):
+    def fail_on_b(config):
+        if config["url"] == B["url"]:
+            raise ConnectionError("Couldn't connect to the MCP server")
+        return servers(config)
+
+    pool._open_session = fail_on_b
+    with pytest.raises(ConnectionError):
+        with pool.acquire([A, B]):
+            pass
+
+    session = pool._sessions[mcp_session_key(A)]
+    assert session.in_use == 0
+
+
+def test_invalidate_forces_reconnect(pool, servers):
+    with pool.acquire([A]):
+        pass
+    pool.invalidate(A)
+    assert servers.closes == ["http://a/mcp"]
+    with pool.acquire([A]):
+        pass
+    assert servers.connects == ["http://a/mcp", "http://a/mcp"]
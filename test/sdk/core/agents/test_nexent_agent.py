@@ -2174,6 +2174,15 @@ def test_create_local_tool_datamate_search_tool_with_none_defaults(nexent_agent_
     assert mock_datamate_tool_instance.observer == nexent_agent_instance.observer
 
 
+class _PooledMcpTool:
+    """Minimal stand-in for an MCP tool object held by the session pool."""
+
+    name = "pooled_tool"
+
+    def forward(self, query):
+        return f"{self.name}:{query}"
+
+
 class TestCreateMcpTool:
     """Tests for create_mcp_tool method."""
 
@@ -2189,6 +2198,38 @@ class TestCreateMcpTool:
         result = nexent_agent_instance.create_mcp_tool("test_mcp_tool")
         assert result == mock_tool
 
+    def test_create_mcp_tool_uses_pooled_name_index(self, nexent_agent_instance):
+        """Pooled collections resolve tools from their name index and hand out per-run copies."""
+        pooled_tool = _PooledMcpTool()
+        pooled_collection = types.SimpleNamespace(tools=[], tools_by_name={"pooled_tool": pooled_tool})
+        nexent_agent_instance.mcp_tool_collection = pooled_collection
+
+        result = nexent_agent_instance.create_mcp_tool("pooled_tool")
+        assert result is not pooled_tool
+        assert result.name == "pooled_tool"
+        assert result.forward(query="q") == "pooled_tool:q"
+        with pytest.raises(ValueError, match="missing_tool not found in MCP server"):
+            nexent_agent_instance.create_mcp_tool("missing_tool")
+
+    def test_pooled_mcp_tool_spans_use_each_runs_agent(self, nexent_agent_instance):
+        """Wrapping a pooled tool for one run must not bind its agent name for later runs."""
+        pooled_tool = _PooledMcpTool()
+        nexent_agent_instance.mcp_tool_collection = types.SimpleNamespace(
+            tools=[], tools_by_name={"pooled_tool": pooled_tool})
+        monitoring_manager = MagicMock()
+        tool_config = ToolConfig(class_name="pooled_tool", name="pooled_tool", description="d",
+                                 inputs="{}", output_type="string", params={}, source="mcp")
+
+        with patch.object(nexent_agent, "get_monitoring_manager", return_value=monitoring_manager):
+            for agent_name in ("agent_a", "agent_b"):
+                tool = _wrap_tool_with_monitoring(nexent_agent_instance.create_tool(tool_config), agent_name)
+                assert tool.forward(query="q") == "pooled_tool:q"
+
+        assert [c.args[1] for c in monitoring_manager.trace_tool_call.call_args_list] == ["agent_a", "agent_b"]
+        assert "forward" not in vars(pooled_tool)
+        assert not hasattr(pooled_tool, "_nexent_monitoring_wrapped")
+        assert not hasattr(pooled_tool, "_nexent_execute_on_host")
+
     def test_create_mcp_tool_collection_not_initialized(self, nexent_agent_instance):
         """Test create_mcp_tool raises error when collection is None."""
         nexent_agent_instance.mcp_tool_collection = None
@@ -4263,6 +4304,15 @@ class TestSetAgent:
 # ----------------------------------------------------------------------------
 
 
+class _PooledMcpTool:
+    """Minimal stand-in for an MCP tool object held by the session pool."""
+
+    name = "pooled_tool"
+
+    def forward(self, query):
+        return f"{self.name}:{query}"
+
+
 class TestCreateMcpTool:
     """Tests for create_mcp_tool method."""
 
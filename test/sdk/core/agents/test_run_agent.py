@@ -1,3 +1,4 @@
+import asyncio
 import types
 import json
 import importlib.machinery
@@ -354,10 +355,12 @@ def test_agent_run_thread_mcp_flow(basic_agent_run_info, mock_memory_context, mo
     # Give the AgentRunInfo an MCP host list (string format, auto-detect transport)
     basic_agent_run_info.mcp_host = ["http://mcp.server/mcp"]
 
-    # Prepare ToolCollection.from_mcp to return a context manager
+    # Prepare the MCP session pool to hand out a tool collection context manager
     mock_tool_collection = MagicMock(name="ToolCollectionInstance")
     mock_context_manager = MagicMock(__enter__=MagicMock(return_value=mock_tool_collection), __exit__=MagicMock(return_value=None))
-    monkeypatch.setattr(run_agent.ToolCollection, "from_mcp", MagicMock(return_value=mock_context_manager))
+    mock_pool = MagicMock(name="MCPSessionPool")
+    mock_pool.acquire.return_value = mock_context_manager
+    monkeypatch.setattr(run_agent.MCPSessionPool, "get_instance", MagicMock(return_value=mock_pool))
 
     # Patch NexentAgent
     mock_nexent_instance = MagicMock(name="NexentAgentInstance")
@@ -369,9 +372,9 @@ def test_agent_run_thread_mcp_flow(basic_agent_run_info, mock_memory_context, mo
     # Observer should receive <MCP_START> signal
     basic_agent_run_info.observer.add_message.assert_any_call("", ProcessType.AGENT_NEW_RUN, "<MCP_START>")
 
-    # ToolCollection.from_mcp should be called with the expected client list and trust_remote_code=True
+    # Sessions should be acquired from the pool with the expected client list
     expected_client_list = [{"url": "http://mcp.server/mcp", "transport": "streamable-http"}]
-    run_agent.ToolCollection.from_mcp.assert_called_once_with(expected_client_list, trust_remote_code=True)
+    mock_pool.acquire.assert_called_once_with(expected_client_list)
 
     # NexentAgent should be instantiated with mcp_tool_collection
     run_agent.NexentAgent.assert_called_once_with(
@@ -399,10 +402,12 @@ def test_agent_run_thread_mcp_flow_with_explicit_transport(basic_agent_run_info,
     # Give the AgentRunInfo an MCP host list with explicit transport
     basic_agent_run_info.mcp_host = [{"url": "http://mcp.server", "transport": "sse"}]
 
-    # Prepare ToolCollection.from_mcp to return a context manager
+    # Prepare the MCP session pool to hand out a tool collection context manager
     mock_tool_collection = MagicMock(name="ToolCollectionInstance")
     mock_context_manager = MagicMock(__enter__=MagicMock(return_value=mock_tool_collection), __exit__=MagicMock(return_value=None))
-    monkeypatch.setattr(run_agent.ToolCollection, "from_mcp", MagicMock(return_value=mock_context_manager))
+    mock_pool = MagicMock(name="MCPSessionPool")
+    mock_pool.acquire.return_value = mock_context_manager
+    monkeypatch.setattr(run_agent.MCPSessionPool, "get_instance", MagicMock(return_value=mock_pool))
 
     # Patch NexentAgent
     mock_nexent_instance = MagicMock(name="NexentAgentInstance")
@@ -411,9 +416,9 @@ def test_agent_run_thread_mcp_flow_with_explicit_transport(basic_agent_run_info,
     # Execute
     run_agent.agent_run_thread(basic_agent_run_info)
 
-    # ToolCollection.from_mcp should be called with the expected client list
+    # Sessions should be acquired from the pool with the expected client list
     expected_client_list = [{"url": "http://mcp.server", "transport": "sse"}]
-    run_agent.ToolCollection.from_mcp.assert_called_once_with(expected_client_list, trust_remote_code=True)
+    mock_pool.acquire.assert_called_once_with(expected_client_list)
 
 
 def test_agent_run_thread_mcp_flow_mixed_formats(basic_agent_run_info, mock_memory_context, monkeypatch):
@@ -425,10 +430,12 @@ def test_agent_run_thread_mcp_flow_mixed_formats(basic_agent_run_info, mock_memo
         {"url": "http://mcp3.server/mcp", "transport": "streamable-http"},  # Explicit: streamable-http
     ]
 
-    # Prepare ToolCollection.from_mcp to return a context manager
+    # Prepare the MCP session pool to hand out a tool collection context manager
     mock_tool_collection = MagicMock(name="ToolCollectionInstance")
     mock_context_manager = MagicMock(__enter__=MagicMock(return_value=mock_tool_collection), __exit__=MagicMock(return_value=None))
-    monkeypatch.setattr(run_agent.ToolCollection, "from_mcp", MagicMock(return_value=mock_context_manager))
+    mock_pool = MagicMock(name="MCPSessionPool")
+    mock_pool.acquire.return_value = mock_context_manager
+    monkeypatch.setattr(run_agent.MCPSessionPool, "get_instance", MagicMock(return_value=mock_pool))
 
     # Patch NexentAgent
     mock_nexent_instance = MagicMock(name="NexentAgentInstance")
@@ -437,13 +444,13 @@ def test_agent_run_thread_mcp_flow_mixed_formats(basic_agent_run_info, mock_memo
     # Execute
     run_agent.agent_run_thread(basic_agent_run_info)
 
-    # ToolCollection.from_mcp should be called with normalized client list
+    # Sessions should be acquired from the pool with the normalized client list
     expected_client_list = [
         {"url": "http://mcp1.server/mcp", "transport": "streamable-http"},
         {"url": "http://mcp2.server/sse", "transport": "sse"},
         {"url": "http://mcp3.server/mcp", "transport": "streamable-http"},
     ]
-    run_agent.ToolCollection.from_mcp.assert_called_once_with(expected_client_list, trust_remote_code=True)
+    mock_pool.acquire.assert_called_once_with(expected_client_list)
 
 
 def test_detect_transport():
@@ -617,79 +624,83 @@ def test_agent_run_thread_handles_internal_exception(basic_agent_run_info, mock_
     assert "Error in agent_run_thread: Boom" in str(exc_info.value)
 
 
+def _emit_other(observer, *contents):
+    for content in contents:
+        observer.add_message("", ProcessType.OTHER, content)
+
+
 @pytest.mark.asyncio
-async def test_agent_run_streams_messages_while_thread_alive(basic_agent_run_info, monkeypatch):
-    """agent_run should yield messages while the thread is alive, then final cache."""
-    # Arrange observer cached messages: one streaming batch, then final flush
-    basic_agent_run_info.observer.get_cached_message.side_effect = [
-        ["m1", "m2"],  # during loop
-        ["final1", "final2"],  # after loop
-    ]
+async def test_agent_run_streams_messages_pushed_by_thread(basic_agent_run_info, monkeypatch):
+    """agent_run should yield messages pushed by the agent thread, in order."""
+    observer = MessageObserver(lang="en")
+    basic_agent_run_info.observer = observer
 
-    # Fast asyncio.sleep to avoid delays and to assert both sleeps are awaited
-    sleep_calls = []
+    def fake_thread_body(agent_run_info):
+        _emit_other(agent_run_info.observer, "m1", "m2", "final1", "final2")
 
-    async def fast_sleep(duration):  # pylint: disable=unused-argument
-        sleep_calls.append(duration)
+    monkeypatch.setattr(run_agent, "agent_run_thread", fake_thread_body)
 
-    monkeypatch.setattr(run_agent.asyncio, "sleep", fast_sleep)
+    received = []
+    async for item in run_agent.agent_run(basic_agent_run_info):
+        received.append(json.loads(item)["content"])
 
-    # Fake Thread that is alive once, then stops
-    class FakeThread:
-        def __init__(self, target=None, args=None):  # pylint: disable=unused-argument
-            self._alive_checks = 0
-            self.started = False
+    assert received == ["m1", "m2", "final1", "final2"]
+    # The observer falls back to its cache once the run is over
+    assert observer.get_cached_message() == []
+    _emit_other(observer, "late")
+    assert len(observer.get_cached_message()) == 1
 
-        def start(self):
-            self.started = True
 
-        def is_alive(self):
-            self._alive_checks += 1
-            return self._alive_checks == 1
+@pytest.mark.asyncio
+async def test_agent_run_delivers_messages_cached_before_start(basic_agent_run_info, monkeypatch):
+    """Messages cached on the observer before the run starts are delivered first."""
+    observer = MessageObserver(lang="en")
+    basic_agent_run_info.observer = observer
+    _emit_other(observer, "early")
+
+    def fake_thread_body(agent_run_info):
+        _emit_other(agent_run_info.observer, "from_thread")
 
-    monkeypatch.setattr(run_agent, "Thread", FakeThread)
+    monkeypatch.setattr(run_agent, "agent_run_thread", fake_thread_body)
 
-    # Act
     received = []
     async for item in run_agent.agent_run(basic_agent_run_info):
-        received.append(item)
+        received.append(json.loads(item)["content"])
 
-    # Assert: streamed + final messages
-    assert received == ["m1", "m2", "final1", "final2"]
-    # Ensure thread was started and sleeps were awaited (both inner and outer occur)
-    assert any(d in (0.05, 0.1) for d in sleep_calls)
+    assert received == ["early", "from_thread"]
 
 
 @pytest.mark.asyncio
-async def test_agent_run_skips_loop_when_thread_not_alive(basic_agent_run_info, monkeypatch):
-    """If the thread is not alive initially, only the final cache is yielded."""
-    # Only final cache should be yielded
-    basic_agent_run_info.observer.get_cached_message.side_effect = [
-        ["final_only"],
-    ]
+async def test_agent_run_does_not_poll(basic_agent_run_info, monkeypatch):
+    """agent_run waits on the queue instead of sleeping between polls."""
+    observer = MessageObserver(lang="en")
+    basic_agent_run_info.observer = observer
+    release = Event()
 
-    async def fast_sleep(duration):  # pylint: disable=unused-argument
-        return None
+    def fake_thread_body(agent_run_info):
+        release.wait(timeout=5)
+        _emit_other(agent_run_info.observer, "after_wait")
 
-    monkeypatch.setattr(run_agent.asyncio, "sleep", fast_sleep)
+    monkeypatch.setattr(run_agent, "agent_run_thread", fake_thread_body)
 
-    class FakeThread:
-        def __init__(self, target=None, args=None):  # pylint: disable=unused-argument
-            pass
+    sleep_calls = []
 
-        def start(self):
-            pass
+    async def tracking_sleep(duration):
+        sleep_calls.append(duration)
 
-        def is_alive(self):
-            return False
+    monkeypatch.setattr(run_agent.asyncio, "sleep", tracking_sleep)
 
-    monkeypatch.setattr(run_agent, "Thread", FakeThread)
+    async def consume():
+        return [item async for item in run_agent.agent_run(basic_agent_run_info)]
 
-    received = []
-    async for item in run_agent.agent_run(basic_agent_run_info):
-        received.append(item)
+    consumer = asyncio.create_task(consume())
+    # Let the consumer start and park on the queue (asyncio.sleep is patched)
+    await asyncio.get_running_loop().run_in_executor(None, lambda: None)
+    release.set()
+    received = await asyncio.wait_for(consumer, timeout=5)
 
-    assert received == ["final_only"]
+    assert [json.loads(item)["content"] for item in received] == ["after_wait"]
+    assert sleep_calls == []
 
 
 # ----------------------------------------------------------------------------
@@ -702,7 +713,9 @@ def test_agent_run_thread_mcp_connection_error(basic_agent_run_info, monkeypatch
 
     mock_tool_collection = MagicMock(name="ToolCollectionInstance")
     mock_context_manager = MagicMock(__enter__=MagicMock(return_value=mock_tool_collection), __exit__=MagicMock(return_value=None))
-    monkeypatch.setattr(run_agent.ToolCollection, "from_mcp", MagicMock(return_value=mock_context_manager))
+    mock_pool = MagicMock(name="MCPSessionPool")
+    mock_pool.acquire.return_value = mock_context_manager
+    monkeypatch.setattr(run_agent.MCPSessionPool, "get_instance", MagicMock(return_value=mock_pool))
 
     mock_nexent_instance = MagicMock(name="NexentAgentInstance")
     mock_nexent_instance.create_single_agent.side_effect = Exception("Couldn't connect to the MCP server")
@@ -721,7 +734,9 @@ def test_agent_run_thread_chinese_lang(basic_agent_run_info, monkeypatch):
 
     mock_tool_collection = MagicMock(name="ToolCollectionInstance")
     mock_context_manager = MagicMock(__enter__=MagicMock(return_value=mock_tool_collection), __exit__=MagicMock(return_value=None))
-    monkeypatch.setattr(run_agent.ToolCollection, "from_mcp", MagicMock(return_value=mock_context_manager))
+    mock_pool = MagicMock(name="MCPSessionPool")
+    mock_pool.acquire.return_value = mock_context_manager
+    monkeypatch.setattr(run_agent.MCPSessionPool, "get_instance", MagicMock(return_value=mock_pool))
 
     mock_nexent_instance = MagicMock(name="NexentAgentInstance")
     mock_nexent_instance.create_single_agent.side_effect = Exception("Couldn't connect to the MCP server")
@@ -736,27 +751,10 @@ def test_agent_run_thread_chinese_lang(basic_agent_run_info, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_agent_run_empty_cached_messages(basic_agent_run_info, monkeypatch):
-    """Test agent_run yields nothing when cached messages are empty."""
-    basic_agent_run_info.observer.get_cached_message.return_value = []
-
-    async def fast_sleep(duration):
-        return None
-
-    monkeypatch.setattr(run_agent.asyncio, "sleep", fast_sleep)
-
-    class FakeThread:
-        def __init__(self, target=None, args=None):
-            self._alive_checks = 0
-
-        def start(self):
-            pass
-
-        def is_alive(self):
-            self._alive_checks += 1
-            return self._alive_checks == 1
-
-    monkeypatch.setattr(run_agent, "Thread", FakeThread)
+async def test_agent_run_empty_run_yields_nothing(basic_agent_run_info, monkeypatch):
+    """agent_run finishes without output when the agent thread emits nothing."""
+    basic_agent_run_info.observer = MessageObserver(lang="en")
+    monkeypatch.setattr(run_agent, "agent_run_thread", lambda agent_run_info: None)
 
     received = []
     async for item in run_agent.agent_run(basic_agent_run_info):
@@ -766,38 +764,26 @@ async def test_agent_run_empty_cached_messages(basic_agent_run_info, monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_agent_run_cached_messages_multiple_batches(basic_agent_run_info, monkeypatch):
-    """Test agent_run with multiple batches of cached messages."""
-    basic_agent_run_info.observer.get_cached_message.side_effect = [
-        ["msg1", "msg2"],
-        ["msg3", "msg4"],
-        ["msg5"],
-        ["msg6"],  # Final call after thread ends
-    ]
-
-    async def fast_sleep(duration):
-        return None
+async def test_agent_run_bounded_queue_applies_backpressure(basic_agent_run_info, monkeypatch):
+    """With a bounded queue the producer never gets ahead of the consumer by more than maxsize."""
+    observer = MessageObserver(lang="en")
+    basic_agent_run_info.observer = observer
+    max_depth = {"value": 0}
 
-    monkeypatch.setattr(run_agent.asyncio, "sleep", fast_sleep)
+    def fake_thread_body(agent_run_info):
+        for index in range(6):
+            _emit_other(agent_run_info.observer, f"msg{index}")
+            max_depth["value"] = max(max_depth["value"], observer._message_queue.qsize())
 
-    class FakeThread:
-        def __init__(self, target=None, args=None):
-            self._alive_checks = 0
-
-        def start(self):
-            pass
-
-        def is_alive(self):
-            self._alive_checks += 1
-            return self._alive_checks <= 3
-
-    monkeypatch.setattr(run_agent, "Thread", FakeThread)
+    monkeypatch.setattr(run_agent, "agent_run_thread", fake_thread_body)
 
     received = []
-    async for item in run_agent.agent_run(basic_agent_run_info):
-        received.append(item)
+    async for item in run_agent.agent_run(basic_agent_run_info, message_queue_maxsize=2):
+        received.append(json.loads(item)["content"])
+        await asyncio.sleep(0)
 
-    assert received == ["msg1", "msg2", "msg3", "msg4", "msg5", "msg6"]
+    assert received == [f"msg{index}" for index in range(6)]
+    assert max_depth["value"] <= 2
 
 
 def test_detect_transport_edge_cases():
@@ -868,12 +854,8 @@ def test_authorized_history_keeps_direct_sdk_compatibility(basic_agent_run_info)
 @pytest.mark.asyncio
 async def test_agent_run_uses_copy_context(basic_agent_run_info, monkeypatch):
     """agent_run passes ctx.run as Thread target, preserving contextvars."""
-    basic_agent_run_info.observer.get_cached_message.side_effect = [[]]
-
-    async def fast_sleep(duration):
-        ...
-
-    monkeypatch.setattr(run_agent.asyncio, "sleep", fast_sleep)
+    basic_agent_run_info.observer = MessageObserver(lang="en")
+    monkeypatch.setattr(run_agent, "agent_run_thread", lambda agent_run_info: None)
 
     captured_target = {}
 
@@ -883,10 +865,8 @@ async def test_agent_run_uses_copy_context(basic_agent_run_info, monkeypatch):
             captured_target["args"] = args
 
         def start(self):
-            ...
-
-        def is_alive(self):
-            return False
+            # Run synchronously so the queue is closed and agent_run completes
+            captured_target["target"](*captured_target["args"])
 
     monkeypatch.setattr(run_agent, "Thread", CapturingThread)
 
@@ -895,6 +875,7 @@ async def test_agent_run_uses_copy_context(basic_agent_run_info, monkeypatch):
 
     assert captured_target["target"] is not None
     assert callable(captured_target["target"])
+    assert captured_target["args"][0] is run_agent._agent_run_thread_with_queue
 
 
 def test_agent_run_thread_preserves_context_var(basic_agent_run_info, monkeypatch):
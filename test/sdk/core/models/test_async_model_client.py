@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from nexent.core.models.async_model_client import (
+    RequestCoalescer,
+    _origin,
+    get_model_async_client,
+    post_json_with_retries,
+)
+
+
+def test_origin_strips_path():
+    assert _origin("https://api.example.com/v1/embeddings") == "https://api.example.com"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch():
+    calls = []
+
+    async def batch_fn(items):
+        calls.append(list(items))
+        return [item.upper() for item in items]
+
+    coalescer = RequestCoalescer(batch_fn, max_batch_size=10, max_wait_seconds=0.01)
+    results = await asyncio.gather(*(coalescer.submit(text) for text in ["a", "b", "c"]))
+
+    assert results == ["A", "B", "C"]
+    assert calls == [["a", "b", "c"]]
+    assert coalescer.batches_sent == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches():
+    calls = []
+
+    async def batch_fn(items):
+        calls.append(list(items))
+        return items
+
+    coalescer = RequestCoalescer(batch_fn, max_batch_size=2, max_wait_seconds=0.01)
+    results = await asyncio.gather(*(coalescer.submit(i) for i in range(3)))
+
+    assert results == [0, 1, 2]
+    assert calls[0] == [0, 1]
+    assert sorted(sum(calls, [])) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    async def batch_fn(items):
+        raise RuntimeError("provider down")
+
+    coalescer = RequestCoalescer(batch_fn, max_wait_seconds=0)
+    results = await asyncio.gather(coalescer.submit("a"), coalescer.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_is_an_error():
+    async def batch_fn(items):
+        return []
+
+    coalescer = RequestCoalescer(batch_fn, max_wait_seconds=0)
+    with pytest.raises(ValueError):
+        await coalescer.submit("a")
+
+
+@pytest.mark.asyncio
+async def test_post_json_with_retries_retries_only_timeouts():
+    with patch("nexent.core.models.async_model_client.post_json", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = [httpx.ReadTimeout("slow"), {"ok": True}]
+
+        result = await post_json_with_retries("https://x/y", {}, {}, [1.0, 2.0])
+
+    assert result == {"ok": True}
+    assert [call.kwargs["timeout"] for call in mock_post.call_args_list] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_post_json_with_retries_raises_after_last_attempt():
+    with patch("nexent.core.models.async_model_client.post_json", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = httpx.ReadTimeout("slow")
+
+        with pytest.raises(httpx.TimeoutException):
+            await post_json_with_retries("https://x/y", {}, {}, [1.0, 2.0])
+
+    assert mock_post.await_count == 2
+
+
+def test_clients_are_pooled_per_event_loop():
+    async def clients():
+        return (get_model_async_client("https://api.example.com/v1/embeddings"),
+                get_model_async_client("https://api.example.com/v1/rerank"),
+                get_model_async_client("https://other.example.com/v1/rerank"))
+
+    first_loop = asyncio.run(clients())
+    second_loop = asyncio.run(clients())
+
+    # One pool per origin on a loop; a new loop never reuses another loop's client
+    assert first_loop[0] is first_loop[1]
+    assert first_loop[0] is not first_loop[2]
+    assert not {id(client) for client in first_loop} & {id(client) for client in second_loop}
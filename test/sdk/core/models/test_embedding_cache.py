@@ -0,0 +1,202 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from nexent.core.models.embedding_cache import (
+    EmbeddingCache,
+    embed_query,
+    embed_texts,
+    get_embedding_cache,
+    set_embedding_cache,
+)
+from nexent.core.models.embedding_model import BaseEmbedding
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipe:
+            def setex(self, key, ttl, value):
+                redis.store[key] = value
+
+            def execute(self):
+                return []
+
+        return Pipe()
+
+
+def _model(name="m", dim=3):
+    model = MagicMock()
+    model.model = name
+    model.embedding_dim = dim
+    model.get_embeddings.side_effect = lambda texts: [[float(len(t)), 0.0, 1.0] for t in texts]
+    return model
+
+
+@pytest.fixture(autouse=True)
+def reset_global_cache():
+    set_embedding_cache(None)
+    yield
+    set_embedding_cache(None)
+
+
+def test_without_cache_calls_model_directly():
+    model = _model()
+    model.get_embeddings.side_effect = None
+    model.get_embeddings.return_value = [[0.5]]
+
+    assert embed_texts(model, "abc") == [[0.5]]
+    model.get_embeddings.assert_called_once_with("abc")
+
+
+def test_only_missing_texts_are_embedded_once():
+    model = _model()
+    cache = EmbeddingCache(max_entries=10)
+
+    first = embed_texts(model, ["a", "bb"], cache=cache)
+    second = embed_texts(model, ["bb", "ccc", "ccc", "a"], cache=cache)
+
+    assert first == [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0]]
+    assert second == [[2.0, 0.0, 1.0], [3.0, 0.0, 1.0], [3.0, 0.0, 1.0], [1.0, 0.0, 1.0]]
+    assert model.get_embeddings.call_args_list[1].args == (["ccc"],)
+
+
+def test_full_hit_saves_api_call_and_reports_stats():
+    model = _model()
+    cache = EmbeddingCache(max_entries=10)
+    set_embedding_cache(cache)
+
+    embed_texts(model, "query")
+    embed_texts(model, " query ")
+
+    assert model.get_embeddings.call_count == 1
+    stats = cache.stats()
+    assert stats["saved_api_calls"] == 1
+    assert stats["api_calls"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert get_embedding_cache() is cache
+
+
+def test_key_separates_models_and_dimensions():
+    cache = EmbeddingCache(max_entries=10)
+
+    embed_texts(_model("m", 3), "x", cache=cache)
+    other_dim = _model("m", 4)
+    embed_texts(other_dim, "x", cache=cache)
+
+    other_dim.get_embeddings.assert_called_once()
+
+
+def test_lru_evicts_oldest_entries():
+    model = _model()
+    cache = EmbeddingCache(max_entries=2)
+
+    embed_texts(model, ["a", "b", "c"], cache=cache)
+
+    assert cache.stats()["entries"] == 2
+    embed_texts(model, ["a"], cache=cache)
+    assert model.get_embeddings.call_args_list[-1].args == (["a"],)
+
+
+def test_redis_tier_is_shared_and_promoted():
+    redis = FakeRedis()
+    model = _model()
+    embed_texts(model, ["a", "bb"], cache=EmbeddingCache(redis_client=redis))
+
+    fresh = EmbeddingCache(redis_client=redis)
+    other_model = _model()
+    vectors = embed_texts(other_model, ["bb"], cache=fresh)
+
+    assert vectors == [[2.0, 0.0, 1.0]]
+    other_model.get_embeddings.assert_not_called()
+    assert fresh.stats()["redis_hits"] == 1
+    assert all(json.loads(value) for value in redis.store.values())
+
+
+def test_redis_failure_falls_back_to_model():
+    redis = MagicMock()
+    redis.mget.side_effect = RuntimeError("down")
+    redis.pipeline.side_effect = RuntimeError("down")
+    model = _model()
+
+    assert embed_texts(model, ["a"], cache=EmbeddingCache(redis_client=redis)) == [[1.0, 0.0, 1.0]]
+
+
+def test_mismatched_vector_count_is_not_cached():
+    model = _model()
+    model.get_embeddings.side_effect = lambda texts: [[0.0]]
+    cache = EmbeddingCache()
+
+    with pytest.raises(ValueError):
+        embed_texts(model, ["a", "b"], cache=cache)
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_aembed_texts_uses_async_model_for_misses_only():
+    from unittest.mock import AsyncMock
+    from nexent.core.models.embedding_cache import aembed_texts
+
+    model = _model()
+    model.aget_embeddings = AsyncMock(side_effect=lambda texts: [[float(len(t)), 0.0, 1.0] for t in texts])
+    cache = EmbeddingCache(max_entries=10)
+    embed_texts(model, ["a"], cache=cache)
+
+    vectors = await aembed_texts(model, ["a", "bb", "cc"], cache=cache)
+
+    assert vectors == [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0], [2.0, 0.0, 1.0]]
+    model.aget_embeddings.assert_awaited_once_with(["bb", "cc"])
+
+
+class _CountingEmbedding(BaseEmbedding):
+    """BaseEmbedding whose batched async call records every batch it receives."""
+
+    COALESCE_MAX_WAIT_SECONDS = 0.2
+
+    def __init__(self):
+        self.model = "counting"
+        self.embedding_dim = 3
+        self.batches = []
+
+    def get_embeddings(self, inputs, with_metadata=False, timeout=None, retries=3, retry_timeout_step=5.0):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.batches.append(texts)
+        return [[float(len(t)), 0.0, 1.0] for t in texts]
+
+    async def dimension_check(self, timeout: float = 5.0):
+        return []
+
+
+def test_embed_query_coalesces_concurrent_threads():
+    model = _CountingEmbedding()
+    barrier = threading.Barrier(3)
+
+    def search(text):
+        barrier.wait()
+        return embed_query(model, text)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        vectors = list(pool.map(search, ["a", "bb", "ccc"]))
+
+    assert vectors == [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0], [3.0, 0.0, 1.0]]
+    assert len(model.batches) == 1
+    assert sorted(model.batches[0]) == ["a", "bb", "ccc"]
+
+
+def test_embed_query_uses_cache_and_sync_path_for_other_models():
+    model = _model()
+    cache = EmbeddingCache(max_entries=10)
+
+    assert embed_query(model, "abc", cache=cache) == [3.0, 0.0, 1.0]
+    assert embed_query(model, "abc", cache=cache) == [3.0, 0.0, 1.0]
+    model.get_embeddings.assert_called_once_with(["abc"])
@@ -1197,3 +1197,61 @@ def test_dashscope_get_multimodal_embeddings_timeout_exhausts_raises(dashscope_e
         timeouts = [call.kwargs.get("timeout")
                     for call in dashscope_embedding_instance._make_request.call_args_list]
         assert timeouts == [1, 2, 3]
+
+
+# ---------------------------------------------------------------------------
+# Native async embeddings
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_openai_aget_embeddings_coalesces_concurrent_single_texts(openai_embedding_instance):
+    import asyncio
+
+    async def fake_post(url, headers, data, timeouts, verify_ssl=True, service_name=""):
+        return {"data": [{"embedding": [float(len(text))]} for text in data["input"]]}
+
+    with patch("nexent.core.models.embedding_model.post_json_with_retries",
+               new=AsyncMock(side_effect=fake_post)) as mock_post:
+        results = await asyncio.gather(
+            openai_embedding_instance.aget_embeddings("a"),
+            openai_embedding_instance.aget_embeddings("bb"),
+            openai_embedding_instance.aget_embeddings("ccc"),
+        )
+
+    assert results == [[[1.0]], [[2.0]], [[3.0]]]
+    mock_post.assert_awaited_once()
+    args = mock_post.call_args.args
+    assert args[0] == "https://api.example.com"
+    assert args[2] == {"model": "dummy-model", "input": ["a", "bb", "ccc"]}
+    assert args[3] == [5.0, 10.0, 15.0, 20.0]
+
+
+@pytest.mark.asyncio
+async def test_openai_aget_embeddings_batch_with_timeout_is_sent_directly(openai_embedding_instance):
+    with patch("nexent.core.models.embedding_model.post_json_with_retries",
+               new=AsyncMock(return_value={"data": [{"embedding": [0.1]}, {"embedding": [0.2]}]})) as mock_post:
+        result = await openai_embedding_instance.aget_embeddings(["a", "b"], timeout=2.0, retries=1)
+
+    assert result == [[0.1], [0.2]]
+    assert mock_post.call_args.args[3] == [2.0, 7.0]
+
+
+@pytest.mark.asyncio
+async def test_jina_aget_embeddings_wraps_text_inputs(jina_embedding_instance):
+    with patch("nexent.core.models.embedding_model.post_json_with_retries",
+               new=AsyncMock(return_value={"data": [{"embedding": [0.5]}]})) as mock_post:
+        result = await jina_embedding_instance.aget_embeddings(["hello"])
+
+    assert result == [[0.5]]
+    assert mock_post.call_args.args[2]["input"] == [{"text": "hello"}]
+
+
+@pytest.mark.asyncio
+async def test_aget_embeddings_falls_back_to_thread_without_native_client():
+    emb = DashScopeMultimodalEmbedding(api_key="k", base_url="https://dashscope.example.com", model_name="m")
+    with patch.object(emb, "get_embeddings", return_value=[[1.0]]) as mock_get:
+        result = await emb.aget_embeddings(["x"])
+
+    assert result == [[1.0]]
+    mock_get.assert_called_once_with(["x"], False, None, 3, 5.0)
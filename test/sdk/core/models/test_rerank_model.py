@@ -2,7 +2,7 @@ import asyncio
 import pytest
 import sys
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add SDK to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -303,13 +303,10 @@ class TestOpenAICompatibleRerank:
         assert result is False
 
     @pytest.mark.asyncio
-    @patch('nexent.core.models.rerank_model.requests.post')
+    @patch('nexent.core.models.rerank_model.post_json_with_retries', new_callable=AsyncMock)
     async def test_rerank_async(self, mock_post):
-        """Test async rerank method."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"results": [{"index": 0, "relevance_score": 0.9, "document": "test"}]}
-        mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        """Test async rerank method goes through the pooled async client."""
+        mock_post.return_value = {"results": [{"index": 0, "relevance_score": 0.9, "document": "test"}]}
 
         from nexent.core.models.rerank_model import OpenAICompatibleRerank
 
@@ -326,6 +323,21 @@ class TestOpenAICompatibleRerank:
 
         assert len(results) == 1
         assert results[0]["index"] == 0
+        args, kwargs = mock_post.call_args
+        assert args[0] == "https://api.example.com"
+        assert args[3] == [30.0, 40.0, 50.0, 60.0]
+        assert kwargs["verify_ssl"] is True
+
+    @pytest.mark.asyncio
+    @patch('nexent.core.models.rerank_model.post_json_with_retries', new_callable=AsyncMock)
+    async def test_arerank_empty_documents_skips_request(self, mock_post):
+        """arerank returns an empty list without calling the API."""
+        from nexent.core.models.rerank_model import OpenAICompatibleRerank
+
+        rerank = OpenAICompatibleRerank(model_name="m", base_url="https://api.example.com", api_key="k")
+
+        assert await rerank.arerank("q", []) == []
+        mock_post.assert_not_called()
 
 
 class TestJinaRerank:
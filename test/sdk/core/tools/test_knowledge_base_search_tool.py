@@ -209,6 +209,7 @@ _set_module(MODULE_NAME, knowledge_base_search_tool_module)
 assert spec and spec.loader
 spec.loader.exec_module(knowledge_base_search_tool_module)
 KnowledgeBaseSearchTool = knowledge_base_search_tool_module.KnowledgeBaseSearchTool
+SearchResultCache = sys.modules[knowledge_base_search_tool_module.get_search_result_cache.__module__].SearchResultCache
 _restore_modules()
 
 
@@ -1025,8 +1026,6 @@ class TestKnowledgeBaseSearchToolMissingBranches:
             tool.search_semantic("query", ["kb1"], top_k=1)
 
     def test_filter_images_success_and_event_loop_failure(self, mock_observer, mock_vdb_core, mock_embedding_model, monkeypatch, mocker):
-        import asyncio
-
         tool = KnowledgeBaseSearchTool(
             index_names=["kb1"],
             search_mode="hybrid",
@@ -1062,28 +1061,38 @@ class TestKnowledgeBaseSearchToolMissingBranches:
                 return False
 
         class FakeSession:
+            closed = False
+
             def __init__(self, *args, **kwargs):
-                pass
+                sessions.append(self)
 
-            async def __aenter__(self):
-                return self
+            async def close(self):
+                self.closed = True
 
-            async def __aexit__(self, exc_type, exc, tb):
-                return False
-
-            def post(self, api_url, data):
+            def post(self, api_url, data, timeout=None):
                 return FakePostContext(data["image_url"])
 
+        sessions = []
+
         fake_aiohttp = types.ModuleType("aiohttp")
         fake_aiohttp.TCPConnector = lambda limit=0: object()
         fake_aiohttp.ClientTimeout = lambda total=0: object()
         fake_aiohttp.ClientSession = FakeSession
         monkeypatch.setitem(sys.modules, "aiohttp", fake_aiohttp)
 
-        assert tool._filter_images(["keep", "skip", "bad", "raise"], "query") == ["keep"]
+        runner_cls = knowledge_base_search_tool_module.BackgroundLoopRunner
+        runner = runner_cls(name="test-kb-runner")
+        mocker.patch.object(runner_cls, "get_instance", return_value=runner)
+        try:
+            assert tool._filter_images(["keep", "skip", "bad", "raise"], "query") == ["keep"]
+            # The session is pooled across calls
+            assert tool._filter_images(["keep"], "query") == ["keep"]
+            assert len(sessions) == 1
 
-        mocker.patch("asyncio.new_event_loop", side_effect=RuntimeError("loop boom"))
-        assert tool._filter_images(["keep"], "query") == []
+            mocker.patch.object(runner, "run", side_effect=RuntimeError("loop boom"))
+            assert tool._filter_images(["keep"], "query") == []
+        finally:
+            runner.close()
 
     def test_source_type_minio_converted_to_file(self, knowledge_base_search_tool, mock_vdb_core):
         """Test that source_type 'minio' is converted to 'file'."""
@@ -1782,6 +1791,91 @@ class TestDocumentPathsAccessControl:
 
         assert "No results found" in str(excinfo.value)
 
+    def test_forward_pushes_document_paths_into_vdb_search(self, mock_vdb_core, mock_embedding_model, mock_observer):
+        """The allow-list is sent to the VDB query instead of only filtering its top_k."""
+        tool = KnowledgeBaseSearchTool(
+            index_names=["kb1"],
+            search_mode="semantic",
+            vdb_core=mock_vdb_core,
+            embedding_model=mock_embedding_model,
+            observer=mock_observer,
+            document_paths=["s3://bucket/doc1.txt"],
+            top_k=5,
+        )
+        mock_vdb_core.semantic_search.return_value = self._create_mock_vdb_results_with_paths(["s3://bucket/doc1.txt"])
+
+        tool.forward("test query")
+
+        call_kwargs = mock_vdb_core.semantic_search.call_args[1]
+        assert call_kwargs["document_paths"] == ["s3://bucket/doc1.txt"]
+        assert call_kwargs["top_k"] == 5
+
+    def test_forward_without_document_paths_does_not_send_filter(self, mock_vdb_core, mock_embedding_model, mock_observer):
+        tool = KnowledgeBaseSearchTool(
+            index_names=["kb1"],
+            search_mode="accurate",
+            vdb_core=mock_vdb_core,
+            embedding_model=mock_embedding_model,
+            observer=mock_observer,
+            document_paths=[],
+            top_k=5,
+        )
+        mock_vdb_core.accurate_search.return_value = create_mock_search_result(1)
+
+        tool.forward("test query")
+
+        assert "document_paths" not in mock_vdb_core.accurate_search.call_args[1]
+
+    def test_document_paths_pushdown_matches_full_scan_with_fewer_scored_candidates(
+            self, mock_embedding_model, mock_observer):
+        """Filtering in the query returns what a full scan + filter would, scoring only allowed chunks."""
+        allowed = [f"s3://bucket/doc{i}.txt" for i in (7, 42, 93)]
+
+        class _ScoringVdb:
+            """Scores every candidate chunk it is allowed to look at, like ES does."""
+
+            def __init__(self):
+                self.scored = 0
+                self.chunks = [
+                    {"path_or_url": f"s3://bucket/doc{i}.txt", "content": f"chunk {i}", "title": f"Doc {i}"}
+                    for i in range(100)
+                ]
+
+            def accurate_search(self, index_names, query_text, top_k, document_paths=None):
+                candidates = [c for c in self.chunks if not document_paths or c["path_or_url"] in document_paths]
+                self.scored += len(candidates)
+                ranked = sorted(candidates, key=lambda c: c["path_or_url"])
+                return [{"document": dict(c), "score": 1.0, "index": "kb1"} for c in ranked[:top_k]]
+
+        def run(push_down):
+            vdb = _ScoringVdb()
+            tool = KnowledgeBaseSearchTool(
+                index_names=["kb1"],
+                search_mode="accurate",
+                vdb_core=vdb,
+                embedding_model=mock_embedding_model,
+                observer=mock_observer,
+                document_paths=allowed,
+                top_k=3,
+            )
+            if not push_down:
+                # Previous behaviour: rank the whole index, then filter in Python
+                tool.search_accurate = lambda query, index_names, top_k, document_paths=None: {
+                    "results": [
+                        dict(r["document"], score=r["score"], index=r["index"])
+                        for r in vdb.accurate_search(index_names, query, top_k=len(vdb.chunks))
+                    ]
+                }
+            results = [r["url"] for r in json.loads(tool.forward("chunk"))]
+            return results, vdb.scored
+
+        pushed_results, pushed_scored = run(push_down=True)
+        scan_results, scan_scored = run(push_down=False)
+
+        assert pushed_results == scan_results == sorted(allowed)
+        assert pushed_scored == 3
+        assert scan_scored == 100
+
     def test_filter_by_document_paths_unwraps_fieldinfo_default(self, mock_vdb_core, mock_embedding_model):
         """Filter should tolerate a FieldInfo default instead of a concrete list.
 
@@ -2020,3 +2114,87 @@ class TestAllowedIndexNamesWhitelist:
         call_kwargs = mock_vdb_core.hybrid_search.call_args[1]
         # Order should be preserved from the original index_names list
         assert call_kwargs["index_names"] == ["kb_c", "kb_a", "kb_d"]
+
+
+class TestSearchResultCache:
+    """Repeated searches are served from the shared result cache until the index changes."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = SearchResultCache()
+        with patch.object(knowledge_base_search_tool_module, "get_search_result_cache", return_value=cache):
+            yield cache
+
+    def test_repeated_query_skips_search_and_rerank(self, cache, mock_observer, mock_vdb_core, mock_embedding_model):
+        rerank_model = MagicMock()
+        rerank_model.rerank.return_value = [{"index": 1, "relevance_score": 0.9}, {"index": 0, "relevance_score": 0.5}]
+        mock_vdb_core.hybrid_search.return_value = create_mock_search_result(2)
+        tool = KnowledgeBaseSearchTool(
+            top_k=2,
+            index_names=["kb1"],
+            observer=mock_observer,
+            embedding_model=mock_embedding_model,
+            vdb_core=mock_vdb_core,
+            search_mode="hybrid",
+            rerank=True,
+            rerank_model_name="rerank-v1",
+            rerank_model=rerank_model,
+        )
+
+        first = json.loads(tool.forward("what is   RAG"))
+        second = json.loads(tool.forward("what is RAG"))
+
+        mock_vdb_core.hybrid_search.assert_called_once()
+        rerank_model.rerank.assert_called_once()
+        assert [r["title"] for r in second] == [r["title"] for r in first] == ["Test Document 1", "Test Document 0"]
+        # Citation indices keep counting across cached calls
+        assert second[0]["cite_index"] == first[-1]["cite_index"] + 1
+        stats = cache.stats()
+        assert stats["local_hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_index_write_invalidates_cached_results(self, cache, knowledge_base_search_tool, mock_vdb_core):
+        mock_vdb_core.hybrid_search.return_value = create_mock_search_result(1)
+
+        knowledge_base_search_tool.forward("test query")
+        cache.bump_generation("test_index2")
+        knowledge_base_search_tool.forward("test query")
+
+        assert mock_vdb_core.hybrid_search.call_count == 2
+
+    def test_failed_rerank_is_not_cached(self, cache, mock_observer, mock_vdb_core, mock_embedding_model):
+        rerank_model = MagicMock()
+        rerank_model.rerank.side_effect = [
+            Exception("Rerank API error"),
+            [{"index": 1, "relevance_score": 0.9}, {"index": 0, "relevance_score": 0.5}],
+        ]
+        mock_vdb_core.hybrid_search.return_value = create_mock_search_result(2)
+        tool = KnowledgeBaseSearchTool(
+            top_k=2,
+            index_names=["kb1"],
+            observer=mock_observer,
+            embedding_model=mock_embedding_model,
+            vdb_core=mock_vdb_core,
+            search_mode="hybrid",
+            rerank=True,
+            rerank_model_name="rerank-v1",
+            rerank_model=rerank_model,
+        )
+
+        first = json.loads(tool.forward("what is RAG"))
+        second = json.loads(tool.forward("what is RAG"))
+
+        assert [r["title"] for r in first] == ["Test Document 0", "Test Document 1"]
+        assert [r["title"] for r in second] == ["Test Document 1", "Test Document 0"]
+        assert rerank_model.rerank.call_count == 2
+        assert cache.stats()["entries"] == 1
+
+    def test_empty_results_are_not_cached(self, cache, knowledge_base_search_tool, mock_vdb_core):
+        mock_vdb_core.hybrid_search.return_value = []
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="No results found"):
+                knowledge_base_search_tool.forward("test query")
+
+        assert mock_vdb_core.hybrid_search.call_count == 2
+        assert cache.stats()["entries"] == 0
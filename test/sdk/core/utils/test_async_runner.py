@@ -0,0 +1,101 @@
+import asyncio
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+MODULE_NAME = "async_runner_under_test"
+MODULE_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "sdk"
+    / "nexent"
+    / "core"
+    / "utils"
+    / "async_runner.py"
+)
+spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+async_runner = importlib.util.module_from_spec(spec)
+sys.modules[MODULE_NAME] = async_runner
+assert spec and spec.loader
+spec.loader.exec_module(async_runner)
+
+BackgroundLoopRunner = async_runner.BackgroundLoopRunner
+
+
+class _FakeClient:
+    def __init__(self):
+        self.is_closed = False
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def runner():
+    runner_ = BackgroundLoopRunner(name="test-async-runner")
+    yield runner_
+    runner_.close()
+
+
+def test_run_uses_one_background_loop(runner):
+    async def current():
+        return asyncio.get_running_loop(), threading.current_thread()
+
+    first_loop, first_thread = runner.run(current())
+    second_loop, second_thread = runner.run(current())
+
+    assert first_loop is second_loop is runner.loop
+    assert first_thread is second_thread
+    assert first_thread is not threading.current_thread()
+
+
+def test_run_propagates_exceptions(runner):
+    async def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        runner.run(boom())
+
+
+def test_run_from_inside_a_running_loop(runner):
+    async def caller():
+        # Sync tool code invoked from async code must not need a new thread or loop
+        return runner.run(asyncio.sleep(0, result="done"))
+
+    assert asyncio.run(caller()) == "done"
+
+
+def test_run_times_out(runner):
+    with pytest.raises(TimeoutError):
+        runner.run(asyncio.sleep(5), timeout=0.05)
+
+
+def test_clients_are_pooled_per_key_and_closed(runner):
+    created = []
+
+    def factory():
+        created.append(_FakeClient())
+        return created[-1]
+
+    async def get(key):
+        return runner.get_client(key, factory)
+
+    assert runner.run(get("a")) is runner.run(get("a"))
+    assert runner.run(get("b")) is not runner.run(get("a"))
+    assert len(created) == 2
+
+    created[0].is_closed = True
+    assert runner.run(get("a")) is created[2]
+
+    runner.close()
+    assert all(client.is_closed for client in created[1:])
+
+
+def test_in_loop_thread_is_true_only_on_the_runner_thread(runner):
+    async def check():
+        return runner.in_loop_thread()
+
+    assert runner.run(check()) is True
+    assert runner.in_loop_thread() is False
@@ -1,10 +1,12 @@
+import asyncio
 import json
+import threading
 
 import pytest
 
 # Import the modules under test
 from sdk.nexent.core.utils.observer import (
-    MessageObserver, Message, ProcessType,
+    MessageObserver, Message, ObserverMessageQueue, ProcessType,
     DefaultTransformer, StepCountTransformer,
     ParseTransformer, ExecutionLogsTransformer, FinalAnswerTransformer,
     TokenCountTransformer
@@ -782,6 +784,48 @@ class TestObserverProcessNormalContentBufferOverflow:
         assert len(messages) >= 1
 
 
+class TestObserverIncrementalScanning:
+    """Test that tags and markers split across tokens are found by the carry-over window"""
+
+    @staticmethod
+    def _messages(tokens):
+        observer = MessageObserver()
+        for token in tokens:
+            observer.add_model_new_token(token)
+        observer.flush_remaining_tokens()
+        return [(json.loads(m)["type"], json.loads(m)["content"]) for m in observer.get_cached_message()]
+
+    def test_end_tag_split_after_buffer_flush(self):
+        """The closing tag is found even when its first characters arrived tokens ago"""
+        tokens = ["<think>"] + [f"t{i}" for i in range(12)] + ["<", "/th", "ink", ">", "done"]
+
+        messages = self._messages(tokens)
+
+        deep = "".join(c for t, c in messages if t == ProcessType.MODEL_OUTPUT_DEEP_THINKING.value)
+        normal = "".join(c for t, c in messages if t == ProcessType.MODEL_OUTPUT_THINKING.value)
+        assert deep == "".join(f"t{i}" for i in range(12))
+        assert normal == "done"
+
+    def test_code_marker_split_across_whitespace_tokens(self):
+        """A code marker whose colon and backticks are separated by many whitespace tokens"""
+        tokens = ["Some text ", "Code", ":"] + [" "] * 6 + ["`", "``", "py\nx = 1"]
+
+        messages = self._messages(tokens)
+
+        assert messages[0] == (ProcessType.MODEL_OUTPUT_THINKING.value, "Some text ")
+        assert messages[1][0] == ProcessType.MODEL_OUTPUT_CODE.value
+        assert messages[1][1].startswith("Code:      ```")
+
+    def test_flushed_text_does_not_complete_a_tag(self):
+        """Characters already flushed out of the buffer must not combine with new tokens"""
+        tokens = ["<", "th"] + ["i"] + [""] * 10 + ["nk>", "tail"]
+
+        messages = self._messages(tokens)
+
+        assert all(t != ProcessType.MODEL_OUTPUT_DEEP_THINKING.value for t, _ in messages)
+        assert "".join(c for _, c in messages) == "<think>tail"
+
+
 class TestObserverThinkTagFragmentation:
     """Test think tag fragmentation scenarios"""
 
@@ -1128,5 +1172,115 @@ class TestMessageObserverCodeBlockVariants:
         assert observer.current_mode == ProcessType.MODEL_OUTPUT_THINKING
 
 
+class TestObserverMessageQueue:
+    """Test the push-based bridge between the observer and asyncio consumers"""
+
+    @pytest.mark.asyncio
+    async def test_attached_queue_receives_messages_instead_of_cache(self):
+        observer = MessageObserver(lang="en")
+        queue = ObserverMessageQueue(asyncio.get_running_loop())
+        observer.attach_message_queue(queue)
+
+        observer.add_message("", ProcessType.OTHER, "hello")
+        queue.close()
+
+        batch = await queue.get_batch()
+        assert [json.loads(item)["content"] for item in batch] == ["hello"]
+        assert observer.get_cached_message() == []
+        assert await queue.get_batch() == []
+
+    @pytest.mark.asyncio
+    async def test_attach_moves_cached_messages_into_queue(self):
+        observer = MessageObserver(lang="en")
+        observer.add_message("", ProcessType.OTHER, "cached")
+        queue = ObserverMessageQueue(asyncio.get_running_loop())
+
+        observer.attach_message_queue(queue)
+
+        assert queue.qsize() == 1
+        assert observer.message_query == []
+
+    @pytest.mark.asyncio
+    async def test_detach_restores_cached_delivery(self):
+        observer = MessageObserver(lang="en")
+        queue = ObserverMessageQueue(asyncio.get_running_loop())
+        observer.attach_message_queue(queue)
+        observer.detach_message_queue()
+
+        observer.add_message("", ProcessType.OTHER, "after")
+
+        assert queue.qsize() == 0
+        assert len(observer.get_cached_message()) == 1
+
+    @pytest.mark.asyncio
+    async def test_consumer_wakes_up_on_cross_thread_put(self):
+        queue = ObserverMessageQueue(asyncio.get_running_loop())
+
+        def producer():
+            queue.put("a")
+            queue.close()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        batch = await asyncio.wait_for(queue.get_batch(), timeout=5)
+        thread.join()
+
+        assert batch == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_blocks_producer_until_drained(self):
+        queue = ObserverMessageQueue(asyncio.get_running_loop(), maxsize=1)
+        second_put_done = threading.Event()
+
+        def producer():
+            queue.put("first")
+            queue.put("second")
+            second_put_done.set()
+            queue.close()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+
+        first = await asyncio.wait_for(queue.get_batch(), timeout=5)
+        rest = []
+        while True:
+            batch = await asyncio.wait_for(queue.get_batch(), timeout=5)
+            if not batch:
+                break
+            rest.extend(batch)
+        thread.join()
+
+        assert first + rest == ["first", "second"]
+        assert second_put_done.is_set()
+
+    @pytest.mark.asyncio
+    async def test_put_on_loop_thread_never_blocks(self):
+        queue = ObserverMessageQueue(asyncio.get_running_loop(), maxsize=1)
+
+        queue.put("a")
+        queue.put("b")
+
+        assert queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_close_releases_blocked_producer(self):
+        queue = ObserverMessageQueue(asyncio.get_running_loop(), maxsize=1)
+        queue.put("fill")
+        done = threading.Event()
+
+        def producer():
+            queue.put("blocked")
+            done.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        assert not done.wait(timeout=0.05)
+
+        queue.close()
+        thread.join(timeout=5)
+
+        assert done.is_set()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
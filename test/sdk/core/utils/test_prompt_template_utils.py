@@ -16,6 +16,15 @@ from unittest.mock import patch, mock_open, MagicMock
 
 # Import target module
 from sdk.nexent.core.utils.prompt_template_utils import get_prompt_template
+from sdk.nexent.core.utils.template_registry import clear_template_caches
+
+
+@pytest.fixture(autouse=True)
+def _fresh_template_registry():
+    """Make every test read through the (mocked) file instead of the shared cache."""
+    clear_template_caches()
+    yield
+    clear_template_caches()
 
 
 class TestGetPromptTemplate:
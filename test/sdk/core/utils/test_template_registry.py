@@ -0,0 +1,139 @@
+import importlib.util
+import os
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+MODULE_NAME = "template_registry_under_test"
+MODULE_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "sdk"
+    / "nexent"
+    / "core"
+    / "utils"
+    / "template_registry.py"
+)
+spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+template_registry = importlib.util.module_from_spec(spec)
+sys.modules[MODULE_NAME] = template_registry
+assert spec and spec.loader
+spec.loader.exec_module(template_registry)
+
+TemplateRegistry = template_registry.TemplateRegistry
+
+
+@pytest.fixture(autouse=True)
+def jinja2(monkeypatch):
+    """Real jinja2, even when sibling test modules left a stub in ``sys.modules``."""
+    for name in [n for n in sys.modules if n == "jinja2" or n.startswith("jinja2.")]:
+        monkeypatch.delitem(sys.modules, name)
+    module = importlib.import_module("jinja2")
+    yield module
+    for name in [n for n in sys.modules if n == "jinja2" or n.startswith("jinja2.")]:
+        monkeypatch.delitem(sys.modules, name)
+
+
+@pytest.fixture
+def registry():
+    return TemplateRegistry(max_compiled=2)
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    path = tmp_path / "prompt.yaml"
+    path.write_text("system_prompt: first\nmanaged_agent:\n  task: '{{ task }}'\n", encoding="utf-8")
+    return path
+
+
+def test_load_yaml_parses_once_until_file_changes(registry, template_file):
+    with patch.object(template_registry.yaml, "safe_load", wraps=template_registry.yaml.safe_load) as safe_load:
+        first = registry.load_yaml(str(template_file))
+        second = registry.load_yaml(str(template_file))
+        assert safe_load.call_count == 1
+        assert first == second == {"system_prompt": "first", "managed_agent": {"task": "{{ task }}"}}
+
+        template_file.write_text("system_prompt: second, and longer\n", encoding="utf-8")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert registry.load_yaml(str(template_file)) == {"system_prompt": "second, and longer"}
+        assert safe_load.call_count == 2
+
+
+def test_load_yaml_returns_independent_copies(registry, template_file):
+    loaded = registry.load_yaml(str(template_file))
+    loaded["system_prompt"] = ""
+    loaded["managed_agent"]["task"] = "changed"
+
+    assert registry.load_yaml(str(template_file))["managed_agent"]["task"] == "{{ task }}"
+
+
+def test_load_yaml_missing_file_raises(registry, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        registry.load_yaml(str(tmp_path / "missing.yaml"))
+
+
+def test_compile_reuses_templates_per_source_and_options(registry, jinja2):
+    StrictUndefined = jinja2.StrictUndefined
+    template = registry.compile("Hello {{ name }}")
+
+    assert registry.compile("Hello {{ name }}") is template
+    assert registry.compile("Hello {{ name }}", undefined=StrictUndefined) is not template
+    assert template.render(name="World") == "Hello World"
+    with pytest.raises(jinja2.UndefinedError):
+        registry.compile("Hello {{ name }}", undefined=StrictUndefined).render()
+    stats = registry.get_stats()
+    assert stats["compiled_hits"] == 2
+    assert stats["compiled_misses"] == 2
+
+
+def test_compile_evicts_least_recently_used(registry):
+    a = registry.compile("a")
+    registry.compile("b")
+    registry.compile("a")
+    registry.compile("c")
+
+    assert registry.compile("a") is a
+    assert registry.get_stats()["compiled_entries"] == 2
+    misses = registry.get_stats()["compiled_misses"]
+    registry.compile("b")
+    assert registry.get_stats()["compiled_misses"] == misses + 1
+
+
+def test_compile_errors_are_not_cached(registry):
+    with pytest.raises(Exception):
+        registry.compile("{% if %}")
+    assert registry.get_stats()["compiled_entries"] == 0
+
+
+def test_compiled_template_renders_concurrently(registry, jinja2):
+    StrictUndefined = jinja2.StrictUndefined
+    template = registry.compile("{{ value }}", undefined=StrictUndefined)
+    results = {}
+
+    def render(i):
+        results[i] = registry.compile("{{ value }}", undefined=StrictUndefined).render(value=i)
+
+    threads = [threading.Thread(target=render, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: str(i) for i in range(8)}
+    assert registry.compile("{{ value }}", undefined=StrictUndefined) is template
+
+
+def test_clear_drops_everything(registry, template_file):
+    registry.load_yaml(str(template_file))
+    registry.compile("x")
+
+    registry.clear()
+
+    assert registry.get_stats() == {
+        "yaml_hits": 0, "yaml_misses": 0, "compiled_hits": 0, "compiled_misses": 0,
+        "yaml_entries": 0, "compiled_entries": 0,
+    }
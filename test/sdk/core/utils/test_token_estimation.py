@@ -0,0 +1,151 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+MODULE_NAME = "token_estimation_under_test"
+MODULE_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "sdk"
+    / "nexent"
+    / "core"
+    / "utils"
+    / "token_estimation.py"
+)
+spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+token_estimation = importlib.util.module_from_spec(spec)
+sys.modules[MODULE_NAME] = token_estimation
+assert spec and spec.loader
+spec.loader.exec_module(token_estimation)
+
+MIXED_TEXTS = [
+    "",
+    "plain ascii text only",
+    "检索增强生成（RAG）把外部知识注入到大模型的上下文中。",
+    "Mixed 中英文 text with CJK punctuation。、「」 and emoji 🚀",
+    "𠀀𪜀𫝀𫠠丽 extension planes",
+    "豈 compatibility ideographs and ㄅ bopomofo, ｶ halfwidth katakana",
+]
+
+
+class _CountingCounter(token_estimation.TokenCounter):
+    name = "words"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    token_estimation.clear_token_count_cache()
+    monkeypatch.setattr(token_estimation, "_counter", None)
+    monkeypatch.setattr(token_estimation, "_counter_loaded", False)
+    monkeypatch.delenv(token_estimation.TOKENIZER_ENV, raising=False)
+    yield
+    token_estimation.clear_token_count_cache()
+
+
+def _is_cjk(char: str) -> bool:
+    """Reference per-character CJK check."""
+    cp = ord(char)
+    return (
+        (0x4E00 <= cp <= 0x9FFF)
+        or (0x3400 <= cp <= 0x4DBF)
+        or (0x20000 <= cp <= 0x2A6DF)
+        or (0x2A700 <= cp <= 0x2B73F)
+        or (0x2B740 <= cp <= 0x2B81F)
+        or (0x2B820 <= cp <= 0x2CEAF)
+        or (0xF900 <= cp <= 0xFAFF)
+        or (0x2F800 <= cp <= 0x2FA1F)
+        or (0x3000 <= cp <= 0x303F)  # CJK punctuation
+    )
+
+
+def _loop_estimate(text):
+    """Reference per-character implementation."""
+    if not text:
+        return 0
+    cjk_count = sum(1 for c in text if _is_cjk(c))
+    return max(1, int(((len(text) - cjk_count) // 4.0) + (cjk_count // 1.1)))
+
+
+@pytest.mark.parametrize("text", MIXED_TEXTS)
+def test_count_cjk_matches_per_character_check(text):
+    assert token_estimation._count_cjk(text) == sum(1 for c in text if _is_cjk(c))
+
+
+@pytest.mark.parametrize("text", MIXED_TEXTS + ["长文本" * 500 + "long text " * 200])
+def test_estimate_matches_per_character_heuristic(text):
+    assert token_estimation.estimate_tokens_text(text) == _loop_estimate(text)
+    # Memoized second call agrees
+    assert token_estimation.estimate_tokens_text(text) == _loop_estimate(text)
+
+
+def test_message_list_estimate_matches_concatenated_text():
+    msgs = [{"role": "user", "content": t} for t in MIXED_TEXTS]
+    msgs.append({"role": "assistant", "content": [{"type": "text", "text": "图片说明"}, {"type": "image"}]})
+    msgs.append(SimpleNamespace(content=None))
+
+    joined = "".join(MIXED_TEXTS) + "图片说明"
+    assert token_estimation.msg_token_count(msgs) == token_estimation.estimate_tokens_text(joined)
+
+
+def test_long_texts_are_memoized_by_content(monkeypatch):
+    calls = []
+    count_cjk = token_estimation._count_cjk
+    monkeypatch.setattr(token_estimation, "_count_cjk", lambda text: calls.append(text) or count_cjk(text))
+    history = "历史消息 history " * 100
+    short = "short"
+
+    for _ in range(3):
+        token_estimation.estimate_tokens_text(history)
+        token_estimation.estimate_tokens_text(short)
+        # An equal but distinct string object hits the same entry
+        token_estimation.estimate_tokens_text("".join(list(history)))
+
+    assert calls.count(history) == 1
+    assert calls.count(short) == 3
+
+
+def test_exact_counter_replaces_heuristic_and_is_memoized():
+    counter = _CountingCounter()
+    token_estimation.set_token_counter(counter)
+    text = "one two three " * 100
+
+    assert token_estimation.estimate_tokens_text(text) == 300
+    assert token_estimation.estimate_tokens_text(text) == 300
+    assert counter.calls == 1
+    assert token_estimation.msg_token_count([{"content": "a b"}, {"content": "c"}]) == 3
+
+    token_estimation.set_token_counter(None)
+    assert token_estimation.estimate_tokens_text(text) == _loop_estimate(text)
+
+
+def test_counter_loaded_from_environment(monkeypatch):
+    monkeypatch.setenv(token_estimation.TOKENIZER_ENV, "tiktoken:cl100k_base")
+    loaded = _CountingCounter()
+    monkeypatch.setattr(token_estimation, "TiktokenCounter", lambda encoding_name: loaded)
+
+    assert token_estimation.get_token_counter() is loaded
+    assert token_estimation.estimate_tokens_text("a b c") == 3
+
+
+def test_unavailable_counter_falls_back_to_heuristic(monkeypatch, tmp_path):
+    monkeypatch.setenv(token_estimation.TOKENIZER_ENV, str(tmp_path / "missing-tokenizer.json"))
+
+    assert token_estimation.get_token_counter() is None
+    assert token_estimation.estimate_tokens_text("中文 text") == _loop_estimate("中文 text")
+
+
+def test_token_counter_requires_count():
+    class _NoCount(token_estimation.TokenCounter):
+        pass
+
+    with pytest.raises(TypeError):
+        _NoCount()
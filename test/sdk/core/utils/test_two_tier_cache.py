@@ -0,0 +1,58 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from nexent.core.utils import two_tier_cache
+from nexent.core.utils.two_tier_cache import TwoTierCache
+
+
+class CountingCache(TwoTierCache):
+    EXTRA_STATS = {"writes": 0}
+
+
+def test_local_entries_expire_and_count_as_misses():
+    cache = TwoTierCache(ttl_seconds=10)
+    with patch.object(two_tier_cache.time, "monotonic", return_value=100.0):
+        cache.put_many({"a": [1, 2]})
+    with patch.object(two_tier_cache.time, "monotonic", return_value=109.0):
+        assert cache.get_many(["a", "b"]) == [[1, 2], None]
+    with patch.object(two_tier_cache.time, "monotonic", return_value=111.0):
+        assert cache.get_many(["a"]) == [None]
+
+    stats = cache.stats()
+    assert (stats["local_hits"], stats["misses"], stats["entries"]) == (1, 2, 0)
+    assert stats["hit_ratio"] == 0.3333
+
+
+def test_redis_hits_are_promoted_to_the_local_tier():
+    redis = MagicMock()
+    redis.mget.return_value = [json.dumps({"v": 1}), None]
+    cache = TwoTierCache(redis_client=redis)
+
+    assert cache.get_many(["a", "b"]) == [{"v": 1}, None]
+    assert cache.get_many(["a"]) == [{"v": 1}]
+    redis.mget.assert_called_once_with(["a", "b"])
+    assert cache.stats()["redis_hits"] == 1
+    assert cache.stats()["local_hits"] == 1
+
+
+def test_redis_errors_keep_the_local_tier_working():
+    redis = MagicMock()
+    redis.mget.side_effect = ConnectionError("down")
+    redis.pipeline.side_effect = ConnectionError("down")
+    cache = TwoTierCache(redis_client=redis)
+
+    cache.put_many({"a": 1})
+    assert cache.get_many(["a", "b"]) == [1, None]
+
+
+def test_extra_stats_are_reset_by_clear():
+    cache = CountingCache(max_entries=1)
+    cache.put_many({"a": 1, "b": 2})
+    cache._add_stat("writes", 2)
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["writes"] == 2
+
+    cache.clear()
+
+    assert cache.stats() == {
+        "local_hits": 0, "redis_hits": 0, "misses": 0, "writes": 0, "entries": 0, "hit_ratio": 0.0}
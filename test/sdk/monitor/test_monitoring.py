@@ -58,6 +58,7 @@ import json
 import time
 import sys
 import threading
+from collections import deque
 from unittest.mock import Mock, MagicMock, patch, call
 
 
@@ -1220,6 +1221,8 @@ class TestErrorHandling:
         manager.record_agent_step_metrics({"step_number": 1})
         manager.set_agent_context_metrics([{"memory_state": {"estimated_input_tokens": 1}}])
         manager.record_llm_metrics("ttft", 0.5, {})
+        manager.record_counter("component.events", 1, {"reason": "test"})
+        manager.record_histogram("component.latency", 0.1)
 
         with manager.trace_llm_request("test", "model") as span:
             assert span is None
@@ -1227,6 +1230,25 @@ class TestErrorHandling:
         with manager.trace_tool_call("tool", "agent", {"input": "data"}) as span:
             assert span is None
 
+    def test_component_instruments_created_once_and_reused(self):
+        """record_counter/record_histogram lazily create one instrument per name."""
+        manager = MonitoringManager()
+        manager._config = MonitoringConfig(enable_telemetry=False)
+        manager._config.enable_telemetry = True
+        manager._meter = MagicMock()
+
+        with patch('sdk.nexent.monitor.monitoring.OPENTELEMETRY_AVAILABLE', True):
+            manager.record_counter("component.events", 2, {"reason": "size"})
+            manager.record_counter("component.events", 3)
+            manager.record_histogram("component.latency", 0.25)
+
+        manager._meter.create_counter.assert_called_once()
+        manager._meter.create_histogram.assert_called_once()
+        counter = manager._meter.create_counter.return_value
+        counter.add.assert_any_call(2, {"reason": "size"})
+        counter.add.assert_any_call(3, {})
+        manager._meter.create_histogram.return_value.record.assert_called_once_with(0.25, {})
+
     def test_decorators_propagate_exceptions(self):
         """Test decorators properly propagate exceptions."""
         manager = MonitoringManager()
@@ -1327,7 +1349,7 @@ class TestDetectModelType:
 # TestWriteBatchIsolation  (Tasks 2.1 + 2.2)
 # =========================================================================
 class TestWriteBatchIsolation:
-    """Verify _write_batch isolates individual record failures."""
+    """Verify _write_batch validates up front and bulk-inserts the remaining records."""
 
     def _make_buffer(self):
         """Create a MonitoringRecordBuffer with flush thread disabled."""
@@ -1336,108 +1358,191 @@ class TestWriteBatchIsolation:
         buf._enabled = True
         return buf
 
+    @staticmethod
+    def _record_model():
+        from sqlalchemy import Column, Integer, JSON, String, func, TIMESTAMP
+        from sqlalchemy.orm import DeclarativeBase
+
+        class _Base(DeclarativeBase):
+            pass
+
+        class ModelMonitoringRecord(_Base):
+            __tablename__ = "model_monitoring_record_t"
+            monitoring_id = Column(Integer, primary_key=True)
+            model_name = Column(String(100), nullable=False)
+            tenant_id = Column(String(100), nullable=False)
+            model_type = Column(String(20), default="llm")
+            context_window_tokens = Column(Integer)
+            unknown_capabilities = Column(JSON)
+            create_time = Column(TIMESTAMP, server_default=func.now())
+
+        return ModelMonitoringRecord
+
     def _setup_db_mocks(self):
         """Inject mock database modules into sys.modules for lazy imports."""
         mock_db_models = MagicMock()
         mock_db_client = MagicMock()
+        mock_db_models.ModelMonitoringRecord = self._record_model()
         sys.modules["database"] = MagicMock()
         sys.modules["database.db_models"] = mock_db_models
         sys.modules["database.client"] = mock_db_client
-        return (
-            mock_db_client.get_monitoring_db_session,
-            mock_db_models.ModelMonitoringRecord,
-        )
-
-    def test_mixed_valid_and_invalid_records(self):
-        """Valid records succeed; invalid ones are skipped silently."""
-        mock_session_fn, _ = self._setup_db_mocks()
-        call_count = {"n": 0}
+        mock_session = MagicMock()
+        mock_db_client.get_monitoring_db_session.return_value.__enter__ = Mock(return_value=mock_session)
+        mock_db_client.get_monitoring_db_session.return_value.__exit__ = Mock(return_value=None)
+        return mock_db_client.get_monitoring_db_session, mock_session
 
-        def _session_ctx():
-            class _Ctx:
-                def __enter__(self_inner):
-                    call_count["n"] += 1
-                    if call_count["n"] == 2:
-                        raise RuntimeError("DB error on second record")
-                    return MagicMock()
+    def test_all_valid_records_use_one_insert(self):
+        """A batch of valid records is written with a single bulk INSERT in one session."""
+        mock_session_fn, mock_session = self._setup_db_mocks()
+        buf = self._make_buffer()
 
-                def __exit__(self_inner, *args):
-                    pass  # Intentionally empty: no cleanup needed for mock context
+        batch = [{"model_name": f"m{i}", "tenant_id": "t1"} for i in range(3)]
+        buf._write_batch(batch)
 
-            return _Ctx()
+        mock_session_fn.assert_called_once()
+        mock_session.execute.assert_called_once()
+        statement, rows = mock_session.execute.call_args.args
+        assert statement.is_insert
+        assert rows == batch
+        assert buf.stats()["written_records"] == 3
 
-        mock_session_fn.side_effect = _session_ctx
+    def test_invalid_records_dropped_without_aborting_batch(self):
+        """Records failing validation are skipped; the rest are still inserted."""
+        _, mock_session = self._setup_db_mocks()
         buf = self._make_buffer()
 
         batch = [
             {"model_name": "m1", "tenant_id": "t1"},
-            {"model_name": "m2", "tenant_id": "t2"},
-            {"model_name": "m3", "tenant_id": "t3"},
+            {"model_name": "m2"},  # missing tenant_id
+            {"model_name": "m3", "tenant_id": "t3", "not_a_column": 1},
+            {"model_name": "x" * 101, "tenant_id": "t4"},
+            {"model_name": "m5", "tenant_id": "t5"},
         ]
         buf._write_batch(batch)
 
-    def test_all_valid_records(self):
-        """All valid records are written successfully."""
-        mock_session_fn, _ = self._setup_db_mocks()
-        mock_session = MagicMock()
-        mock_session_fn.return_value.__enter__ = Mock(
-            return_value=mock_session)
-        mock_session_fn.return_value.__exit__ = Mock(return_value=None)
+        _, rows = mock_session.execute.call_args.args
+        assert [row["model_name"] for row in rows] == ["m1", "m5"]
+        assert buf.stats()["invalid_records"] == 3
 
+    def test_rows_are_aligned_to_one_key_set(self):
+        """Optional columns are filled with None, columns with defaults are left out."""
+        _, mock_session = self._setup_db_mocks()
         buf = self._make_buffer()
-        batch = [{"model_name": f"m{i}"} for i in range(3)]
-        buf._write_batch(batch)
 
-        assert mock_session.add.call_count == 3
+        buf._write_batch([
+            {"model_name": "m1", "tenant_id": "t1", "context_window_tokens": 128000, "model_type": "llm"},
+            {"model_name": "m2", "tenant_id": "t2"},
+        ])
 
-    def test_capacity_snapshot_fields_pass_to_model_monitoring_record(self):
-        """Capacity snapshot fields are persisted through the ORM row payload."""
-        mock_session_fn, mock_model_monitoring_record = self._setup_db_mocks()
-        mock_session = MagicMock()
-        mock_session_fn.return_value.__enter__ = Mock(return_value=mock_session)
-        mock_session_fn.return_value.__exit__ = Mock(return_value=None)
+        _, rows = mock_session.execute.call_args.args
+        assert rows[1] == {"model_name": "m2", "tenant_id": "t2", "context_window_tokens": None}
 
+    def test_capacity_snapshot_fields_pass_to_insert(self):
+        """Capacity snapshot fields are persisted through the bulk insert payload."""
+        _, mock_session = self._setup_db_mocks()
         buf = self._make_buffer()
         record = {
             "model_name": "m1",
             "tenant_id": "t1",
             "context_window_tokens": 128000,
-            "default_output_reserve_tokens": 1024,
-            "capability_profile_version": "openai/gpt-4o@1",
-            "capacity_source": "profile",
-            "requested_output_tokens": 1024,
-            "provider_input_limit_tokens": 126976,
-            "tokenizer_family": "o200k_base",
-            "counting_mode": "exact",
             "unknown_capabilities": ["prompt_cache"],
-            "capacity_fingerprint": "abc123",
-            "budget_fingerprint": "w2abc",
-            "budget_w1_fingerprint": "abc123",
-            "budget_requested_output_tokens": 1024,
-            "budget_output_reserve_source": "model_default",
-            "budget_provider_input_limit_tokens": 126976,
-            "budget_uncertainty_reserve_tokens": 0,
-            "budget_uncertainty_reserve_basis": "none",
-            "budget_soft_limit_ratio": 0.8,
-            "budget_soft_input_budget_tokens": 101580,
-            "budget_hard_input_budget_tokens": 126976,
-            "budget_warnings": [],
         }
         buf._write_batch([record])
 
-        mock_model_monitoring_record.assert_called_once_with(**record)
+        _, rows = mock_session.execute.call_args.args
+        assert rows == [record]
+
+    def test_row_level_db_error_falls_back_to_single_inserts(self):
+        """A constraint error on the bulk insert retries records one by one."""
+        mock_session_fn, mock_session = self._setup_db_mocks()
+
+        class IntegrityError(Exception):
+            pass
+
+        mock_session.execute.side_effect = IntegrityError("duplicate")
+        mock_session.flush.side_effect = [None, RuntimeError("bad row"), None]
+        buf = self._make_buffer()
+
+        buf._write_batch([{"model_name": f"m{i}", "tenant_id": "t"} for i in range(3)])
 
-    def test_all_invalid_records(self):
-        """When every record fails, _write_batch still does not raise."""
+        assert mock_session.add.call_count == 3
+        assert buf.stats()["written_records"] == 2
+        assert buf.stats()["invalid_records"] == 1
+
+    def test_unavailable_database_is_raised_for_retry(self):
+        """Connection failures propagate so _flush_to_db requeues the batch."""
         mock_session_fn, _ = self._setup_db_mocks()
-        mock_session_fn.return_value.__enter__ = Mock(
-            side_effect=RuntimeError("DB down")
-        )
-        mock_session_fn.return_value.__exit__ = Mock(return_value=None)
+        mock_session_fn.return_value.__enter__ = Mock(side_effect=RuntimeError("DB down"))
+        buf = self._make_buffer()
+        buf._buffer.extend({"model_name": f"m{i}", "tenant_id": "t"} for i in range(3))
+
+        assert buf._flush_to_db() == 0
 
+        assert buf.buffer_size == 3
+        assert buf._consecutive_failures == 1
+
+    def test_backend_modules_resolved_once(self):
+        """The backend import path is resolved on the first write only."""
+        mock_session_fn, _ = self._setup_db_mocks()
         buf = self._make_buffer()
-        batch = [{"model_name": f"m{i}"} for i in range(3)]
-        buf._write_batch(batch)
+        buf._write_batch([{"model_name": "m1", "tenant_id": "t"}])
+        sys.modules["database.client"] = MagicMock()
+
+        buf._write_batch([{"model_name": "m2", "tenant_id": "t"}])
+
+        assert mock_session_fn.call_count == 2
+
+
+class TestBufferFlushTriggers:
+    """Verify drop accounting and flush wake-ups."""
+
+    def _make_buffer(self):
+        with patch.dict("os.environ", {"ENABLE_MODEL_MONITORING": "false"}):
+            buf = MonitoringRecordBuffer()
+        buf._enabled = True
+        return buf
+
+    def test_full_buffer_counts_dropped_records(self):
+        buf = self._make_buffer()
+        buf._buffer = deque(maxlen=2)
+
+        for i in range(5):
+            buf.add_record({"model_name": f"m{i}"})
+
+        assert buf.stats()["dropped_records"] == 3
+        assert buf.stats()["depth"] == 2
+
+    def test_full_batch_wakes_flush_thread(self):
+        buf = self._make_buffer()
+        buf._batch_size = 2
+
+        buf.add_record({"model_name": "m1"})
+        assert not buf._wakeup.is_set()
+        buf.add_record({"model_name": "m2"})
+        assert buf._wakeup.is_set()
+
+    def test_flush_returns_number_of_written_records(self):
+        buf = self._make_buffer()
+        buf._batch_size = 2
+        buf._buffer.extend({"model_name": f"m{i}"} for i in range(3))
+
+        with patch.object(buf, "_write_batch"):
+            assert buf._flush_to_db() == 2
+            assert buf._flush_to_db() == 1
+
+    def test_exported_drop_counter_reports_deltas(self):
+        buf = self._make_buffer()
+        buf._dropped_records = 4
+        manager = MagicMock()
+
+        with patch("sdk.nexent.monitor.monitoring.get_monitoring_manager", return_value=manager):
+            buf._export_buffer_stats()
+            buf._export_buffer_stats()
+
+        dropped_calls = [c for c in manager.record_counter.call_args_list
+                         if c.args[0] == "monitoring.buffer.dropped_records"]
+        assert [c.args[1] for c in dropped_calls] == [4]
+        assert manager.record_histogram.call_count == 2
 
 
 # =========================================================================
@@ -225,6 +225,32 @@ class TestHttpClientManagerAsyncClient:
         assert http_client_manager.get_stats()["async_clients_count"] == 1
 
 
+    def test_get_async_client_http2_is_separate_client(self):
+        """Test that HTTP/2 clients are cached separately from HTTP/1.1 clients."""
+        _reset_singleton()
+        from nexent.utils import http_client_manager as module
+        from nexent.utils.http_client_manager import http_client_manager
+
+        with patch.object(module, "_http2_available", return_value=True):
+            h1 = http_client_manager.get_async_client(base_url="https://api.example.com")
+            h2 = http_client_manager.get_async_client(base_url="https://api.example.com", http2=True)
+
+        assert h1 is not h2
+        assert [c["http2"] for c in http_client_manager.get_stats()["clients"]] == [False, True]
+
+    def test_get_async_client_http2_falls_back_without_h2(self):
+        """Test that requesting HTTP/2 without the h2 package reuses the HTTP/1.1 client."""
+        _reset_singleton()
+        from nexent.utils import http_client_manager as module
+        from nexent.utils.http_client_manager import http_client_manager
+
+        with patch.object(module, "_http2_available", return_value=False):
+            h1 = http_client_manager.get_async_client(base_url="https://api.example.com")
+            fallback = http_client_manager.get_async_client(base_url="https://api.example.com", http2=True)
+
+        assert h1 is fallback
+
+
 class TestHttpClientManagerContextManager:
     """Test context manager support (new feature)."""
 
@@ -1021,6 +1021,44 @@ def test_vectorize_documents_small_batch_large_mode_forces_large_path(elasticsea
     assert mock_large.called
     assert not mock_small.called
 
+def test_vectorize_documents_skip_refresh_leaves_settings_and_refresh_to_caller(elasticsearch_core_instance):
+    """skip_refresh writes through the large path without bulk settings or a refresh."""
+    mock_embedding_model = MagicMock()
+    docs = [{"content": "a"}, {"content": "b"}]
+
+    with patch.object(elasticsearch_core_instance, "bulk_operation_context") as mock_ctx, \
+         patch.object(elasticsearch_core_instance, "_large_batch_insert", return_value=2) as mock_large:
+        out = elasticsearch_core_instance.vectorize_documents(
+            "idx", mock_embedding_model, docs, large_mode=True, skip_refresh=True)
+
+    assert out == 2
+    mock_ctx.assert_not_called()
+    assert mock_large.call_args.kwargs["refresh"] is False
+
+
+def test_large_batch_without_refresh_does_not_refresh(elasticsearch_core_instance):
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.embedding_model_name = "test-model"
+    mock_embedding_model.get_embeddings.side_effect = lambda inputs: [[1.0] for _ in inputs]
+
+    with patch.object(elasticsearch_core_instance.client, "bulk", return_value={"errors": False, "items": []}), \
+         patch.object(elasticsearch_core_instance, "_force_refresh_with_retry") as mock_refresh:
+        result = elasticsearch_core_instance._large_batch_insert(
+            "idx", [{"content": "doc"}], batch_size=10, content_field="content",
+            embedding_model=mock_embedding_model, refresh=False,
+        )
+
+    assert result == 1
+    mock_refresh.assert_not_called()
+
+
+def test_refresh_index_forces_refresh(elasticsearch_core_instance):
+    with patch.object(elasticsearch_core_instance, "_force_refresh_with_retry", return_value=True) as mock_refresh:
+        assert elasticsearch_core_instance.refresh_index("idx") is True
+    mock_refresh.assert_called_once_with("idx")
+
+
 def test_large_batch_progress_callback_invoked(elasticsearch_core_instance):
     """Progress callback should be triggered during embedding phase."""
     mock_embedding_model = MagicMock()
@@ -1119,6 +1157,114 @@ def test_large_batch_raises_after_sub_batch_retry_exhausted(elasticsearch_core_i
     mock_bulk.assert_not_called()
 
 
+def test_insert_concurrency_defaults_and_overrides():
+    """Large-insert concurrency comes from the module defaults unless passed in."""
+    default_core = ElasticSearchCore(host="http://localhost:9200", api_key="k")
+    assert default_core.embedding_concurrency == elasticsearch_core_module.DEFAULT_EMBEDDING_CONCURRENCY
+    assert default_core.bulk_concurrency == elasticsearch_core_module.DEFAULT_BULK_CONCURRENCY
+
+    tuned_core = ElasticSearchCore(
+        host="http://localhost:9200", api_key="k", embedding_concurrency=8, bulk_concurrency=3)
+    assert tuned_core.embedding_concurrency == 8
+    assert tuned_core.bulk_concurrency == 3
+
+
+def test_large_batch_pipelines_fixed_size_bulk_batches_in_order(elasticsearch_core_instance):
+    """Embedding sub-batches are regrouped into ES batches of batch_size, preserving order."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.embedding_model_name = "test-model"
+    mock_embedding_model.get_embeddings.side_effect = lambda inputs: [[float(len(text))] for text in inputs]
+    elasticsearch_core_instance.embedding_concurrency = 3
+
+    docs = [{"content": f"doc {i}"} for i in range(25)]
+    progress_calls = []
+
+    with patch.object(elasticsearch_core_instance.client, "bulk") as mock_bulk, \
+         patch.object(elasticsearch_core_instance, "_force_refresh_with_retry") as mock_refresh:
+        mock_bulk.return_value = {"errors": False, "items": []}
+        result = elasticsearch_core_instance._large_batch_insert(
+            "idx", docs, batch_size=10, content_field="content",
+            embedding_model=mock_embedding_model, embedding_batch_size=3,
+            progress_callback=lambda done, total: progress_calls.append(done),
+        )
+
+    assert result == 25
+    batches = [
+        [op["content"] for op in call.kwargs["operations"] if "index" not in op]
+        for call in mock_bulk.call_args_list
+    ]
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [content for batch in batches for content in batch] == [doc["content"] for doc in docs]
+    assert progress_calls == [3, 6, 9, 12, 15, 18, 21, 24, 25]
+    assert all("embedding" not in doc for doc in docs)
+    mock_refresh.assert_called_once_with("idx")
+
+
+def test_large_batch_rolls_back_written_batches_on_failure(elasticsearch_core_instance):
+    """Documents written before a sub-batch fails are deleted before the error propagates."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.embedding_model_name = "test-model"
+
+    def get_embeddings(inputs):
+        if "doc 3" in inputs:
+            raise RuntimeError("embed fail hard")
+        return [[0.1] for _ in inputs]
+
+    mock_embedding_model.get_embeddings.side_effect = get_embeddings
+    elasticsearch_core_instance.embedding_concurrency = 1
+    elasticsearch_core_instance.bulk_concurrency = 1
+    docs = [{"content": f"doc {i}"} for i in range(4)]
+
+    def bulk(index, operations, refresh):
+        ids = [f"id-{n}" for n in range(len(operations) // 2)]
+        return {"errors": False, "items": [{"index": {"_id": doc_id}} for doc_id in ids]}
+
+    with patch.object(elasticsearch_core_instance.client, "bulk", side_effect=bulk) as mock_bulk, \
+         patch.object(elasticsearch_core_instance, "_force_refresh_with_retry"), \
+         patch("time.sleep", lambda *args, **kwargs: None):
+        with pytest.raises(RuntimeError, match="embed fail hard"):
+            elasticsearch_core_instance._large_batch_insert(
+                "idx", docs, batch_size=2, content_field="content",
+                embedding_model=mock_embedding_model, embedding_batch_size=2,
+            )
+
+    rollback_ops = mock_bulk.call_args_list[-1].kwargs["operations"]
+    assert rollback_ops == [
+        {"delete": {"_index": "idx", "_id": "id-0"}},
+        {"delete": {"_index": "idx", "_id": "id-1"}},
+    ]
+
+
+def test_large_batch_reuses_cached_embeddings_for_unchanged_chunks(elasticsearch_core_instance):
+    """Re-indexing unchanged chunks is served from the embedding cache."""
+    from sdk.nexent.core.models.embedding_cache import EmbeddingCache, set_embedding_cache
+
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.model = "test-model"
+    mock_embedding_model.embedding_dim = 1
+    mock_embedding_model.get_embeddings.side_effect = lambda inputs: [[0.1] for _ in inputs]
+    docs = [{"content": f"doc {i}"} for i in range(4)]
+    cache = EmbeddingCache()
+    set_embedding_cache(cache)
+    try:
+        with patch.object(elasticsearch_core_instance.client, "bulk") as mock_bulk, \
+             patch.object(elasticsearch_core_instance, "_force_refresh_with_retry"):
+            mock_bulk.return_value = {"errors": False, "items": []}
+            for revision in (docs, docs + [{"content": "doc new"}]):
+                elasticsearch_core_instance._large_batch_insert(
+                    "idx", revision, batch_size=10, content_field="content",
+                    embedding_model=mock_embedding_model, embedding_batch_size=10,
+                )
+    finally:
+        set_embedding_cache(None)
+
+    assert mock_embedding_model.get_embeddings.call_args_list[-1].args == (["doc new"],)
+    assert cache.stats()["local_hits"] == 4
+
+
 def test_delete_documents_success(elasticsearch_core_instance):
     """Test deleting documents by path_or_url successfully."""
     with patch.object(elasticsearch_core_instance.client, 'delete_by_query') as mock_delete:
@@ -1131,6 +1277,40 @@ def test_delete_documents_success(elasticsearch_core_instance):
 
         assert result == 5
         mock_delete.assert_called_once()
+        # Deleted chunks must be invisible before the search cache generation is bumped
+        assert mock_delete.call_args.kwargs["refresh"] is True
+
+
+def test_index_writes_bump_search_cache_generation(elasticsearch_core_instance):
+    """Writes invalidate cached knowledge-base search results of the index."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.return_value = [[0.1] * 4]
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.delete_by_query.return_value = {"deleted": 1}
+    elasticsearch_core_instance.client.bulk.return_value = {"errors": False, "items": []}
+
+    with patch.object(elasticsearch_core_module, 'bump_index_generation') as mock_bump:
+        elasticsearch_core_instance.vectorize_documents(
+            "kb-index", mock_embedding_model, [{"content": "A"}])
+        elasticsearch_core_instance.delete_documents("kb-index", "/path/to/file.pdf")
+        elasticsearch_core_instance.create_chunk("kb-index", {"id": "chunk-1", "content": "A"})
+        elasticsearch_core_instance.delete_index("kb-index")
+
+    assert [c.args for c in mock_bump.call_args_list] == [("kb-index",)] * 4
+
+
+def test_failed_vectorize_still_bumps_search_cache_generation(elasticsearch_core_instance):
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.side_effect = RuntimeError("embedding down")
+
+    with patch.object(elasticsearch_core_module, 'bump_index_generation') as mock_bump:
+        with pytest.raises(Exception):
+            elasticsearch_core_instance.vectorize_documents(
+                "kb-index", mock_embedding_model, [{"content": "A"}])
+
+    mock_bump.assert_called_once_with("kb-index")
 
 
 def test_create_chunk_success(elasticsearch_core_instance):
@@ -1563,33 +1743,27 @@ def test_semantic_search_sets_knn_parameters(elasticsearch_core_instance):
         assert search_query["_source"]["excludes"] == ["embedding"]
 
 
+def _msearch_response(*hit_lists):
+    return {"responses": [{"hits": {"hits": hits}} for hits in hit_lists]}
+
+
 def test_hybrid_search_success(elasticsearch_core_instance):
-    """Test hybrid search combining accurate and semantic results."""
+    """Test hybrid search combining accurate and semantic results in one msearch."""
     mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.return_value = [[0.1, 0.2]]
 
-    with patch.object(elasticsearch_core_instance, 'accurate_search') as mock_accurate, \
-            patch.object(elasticsearch_core_instance, 'semantic_search') as mock_semantic:
-
-        mock_accurate.return_value = [
-            {
-                "score": 10.0,
-                "document": {"id": "doc1", "content": "Test doc 1"},
-                "index": "test_index"
-            }
-        ]
+    accurate_hits = [
+        {"_score": 10.0, "_source": {"id": "doc1", "content": "Test doc 1"}, "_index": "test_index"}
+    ]
+    semantic_hits = [
+        {"_score": 0.9, "_source": {"id": "doc1", "content": "Test doc 1"}, "_index": "test_index"},
+        {"_score": 0.8, "_source": {"id": "doc2", "content": "Test doc 2"}, "_index": "test_index"},
+    ]
 
-        mock_semantic.return_value = [
-            {
-                "score": 0.9,
-                "document": {"id": "doc1", "content": "Test doc 1"},
-                "index": "test_index"
-            },
-            {
-                "score": 0.8,
-                "document": {"id": "doc2", "content": "Test doc 2"},
-                "index": "test_index"
-            }
-        ]
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch, \
+            patch.object(elasticsearch_core_instance.client, 'search') as mock_search:
+        mock_msearch.return_value = _msearch_response(accurate_hits, semantic_hits)
 
         result = elasticsearch_core_instance.hybrid_search(
             ["test_index"],
@@ -1602,8 +1776,138 @@ def test_hybrid_search_success(elasticsearch_core_instance):
         assert len(result) == 2
         assert all("score" in r for r in result)
         assert all("document" in r for r in result)
-        mock_accurate.assert_called_once()
-        mock_semantic.assert_called_once()
+        assert result[0]["document"]["id"] == "doc1"
+        assert result[0]["score"] == pytest.approx(1.0)
+        assert result[1]["score"] == pytest.approx(0.7 * 0.8 / 0.9)
+        mock_msearch.assert_called_once()
+        mock_search.assert_not_called()
+        body = mock_msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "test_index"}
+        assert "knn" not in body[1] and body[1]["size"] == 5
+        assert body[3]["knn"]["query_vector"] == [0.1, 0.2]
+        assert body[3]["knn"]["field"] == "embedding"
+
+
+def test_hybrid_search_multimodal_single_round_trip(elasticsearch_core_instance):
+    """Multimodal hybrid search sends the text and image kNN queries in the same msearch."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "multimodal"
+    mock_embedding_model.get_embeddings.return_value = [[0.3]]
+
+    image_hits = [{
+        "_score": 0.5,
+        "_source": {"id": "img1", "process_source": "UniversalImageExtractor"},
+        "_index": "idx1",
+    }]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = _msearch_response([], [], image_hits)
+
+        result = elasticsearch_core_instance.hybrid_search(
+            ["idx1", "idx2"], "cat", mock_embedding_model, top_k=3)
+
+        mock_msearch.assert_called_once()
+        body = mock_msearch.call_args.kwargs["body"]
+        assert len(body) == 6
+        assert all(header == {"index": "idx1,idx2"} for header in body[::2])
+        assert body[5]["knn"]["field"] == "multi_embedding"
+        assert [r["document"]["id"] for r in result] == ["img1"]
+
+
+def test_hybrid_search_raises_on_failed_sub_query(elasticsearch_core_instance):
+    """An error entry in the msearch response fails the whole hybrid search."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.return_value = [[0.1]]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = {"responses": [
+            {"hits": {"hits": []}}, {"error": {"type": "search_phase_execution_exception"}}]}
+
+        with pytest.raises(Exception, match="Hybrid search query failed"):
+            elasticsearch_core_instance.hybrid_search(["idx"], "q", mock_embedding_model)
+
+
+def test_build_document_paths_filter_chunks_large_lists():
+    """Allow-lists become one terms clause, or OR-ed chunks once they exceed the chunk size."""
+    build = ElasticSearchCore._build_document_paths_filter
+    chunk = elasticsearch_core_module.TERMS_FILTER_CHUNK_SIZE
+
+    assert build(None) is None
+    assert build([]) is None
+    assert build(["a", "b", "a"]) == {"terms": {"path_or_url": ["a", "b"]}}
+
+    paths = [f"doc{i}" for i in range(chunk * 2 + 1)]
+    path_filter = build(paths)
+    clauses = path_filter["bool"]["should"]
+    assert path_filter["bool"]["minimum_should_match"] == 1
+    assert [len(c["terms"]["path_or_url"]) for c in clauses] == [chunk, chunk, 1]
+    assert [p for c in clauses for p in c["terms"]["path_or_url"]] == paths
+
+
+def test_accurate_search_filters_by_document_paths(elasticsearch_core_instance):
+    """The allow-list is applied in filter context around the scoring query."""
+    with patch.object(elasticsearch_core_instance, 'exec_query') as mock_exec, \
+            patch.object(elasticsearch_core_module, 'calculate_term_weights', return_value={"q": 1.0}), \
+            patch.object(elasticsearch_core_module, 'build_weighted_query',
+                         return_value={"query": {"function_score": {}}}):
+        mock_exec.return_value = []
+
+        elasticsearch_core_instance.accurate_search(["idx"], "q", top_k=3, document_paths=["a.pdf", "b.pdf"])
+
+        _, search_query = mock_exec.call_args[0]
+        assert search_query["query"] == {"bool": {
+            "must": {"function_score": {}},
+            "filter": {"terms": {"path_or_url": ["a.pdf", "b.pdf"]}},
+        }}
+        assert search_query["size"] == 3
+
+
+def test_semantic_search_prefilters_knn_by_document_paths(elasticsearch_core_instance):
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "multimodal"
+    mock_embedding_model.get_embeddings.return_value = [[0.2] * 8]
+
+    with patch.object(elasticsearch_core_instance, 'exec_query') as mock_exec:
+        mock_exec.return_value = []
+
+        elasticsearch_core_instance.semantic_search(
+            ["idx"], "q", mock_embedding_model, top_k=4, document_paths=["a.pdf"])
+
+        knn_queries = [call.args[1]["knn"] for call in mock_exec.call_args_list]
+        assert [knn["field"] for knn in knn_queries] == ["embedding", "multi_embedding"]
+        assert all(knn["filter"] == {"terms": {"path_or_url": ["a.pdf"]}} for knn in knn_queries)
+
+
+def test_hybrid_search_filters_every_sub_query_by_document_paths(elasticsearch_core_instance):
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.return_value = [[0.1]]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = _msearch_response([], [])
+
+        elasticsearch_core_instance.hybrid_search(["idx"], "q", mock_embedding_model, document_paths=["a.pdf"])
+
+        body = mock_msearch.call_args.kwargs["body"]
+        path_filter = {"terms": {"path_or_url": ["a.pdf"]}}
+        assert body[1]["query"]["bool"]["filter"] == path_filter
+        assert body[3]["knn"]["filter"] == path_filter
+
+
+def test_search_without_document_paths_sends_no_filter(elasticsearch_core_instance):
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model_type = "text"
+    mock_embedding_model.get_embeddings.return_value = [[0.1]]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = _msearch_response([], [])
+
+        elasticsearch_core_instance.hybrid_search(["idx"], "q", mock_embedding_model, document_paths=[])
+
+        body = mock_msearch.call_args.kwargs["body"]
+        assert "filter" not in body[1]["query"].get("bool", {})
+        assert "filter" not in body[3]["knn"]
 
 
 def test_get_indices_detail_success(elasticsearch_core_instance):
@@ -1838,11 +2142,10 @@ def test_hybrid_search_skips_semantic_result_with_missing_fields(elasticsearch_c
     """
     mock_embedding_model = MagicMock()
 
-    with patch.object(elasticsearch_core_instance, 'accurate_search') as mock_accurate, \
-            patch.object(elasticsearch_core_instance, 'semantic_search') as mock_semantic:
+    with patch.object(elasticsearch_core_instance, '_run_hybrid_queries') as mock_queries:
 
         # Accurate returns doc1
-        mock_accurate.return_value = [
+        accurate_results = [
             {
                 "score": 10.0,
                 "document": {"id": "doc1", "content": "Test doc 1"},
@@ -1852,7 +2155,7 @@ def test_hybrid_search_skips_semantic_result_with_missing_fields(elasticsearch_c
 
         # Semantic returns a result with missing 'document' field (triggers KeyError)
         # and another valid result
-        mock_semantic.return_value = [
+        semantic_results = [
             {
                 "score": 0.9,
                 # Missing "document" field - will cause KeyError
@@ -1864,6 +2167,8 @@ def test_hybrid_search_skips_semantic_result_with_missing_fields(elasticsearch_c
             }
         ]
 
+        mock_queries.return_value = (accurate_results, semantic_results)
+
         result = elasticsearch_core_instance.hybrid_search(
             ["test_index"],
             "test query",
@@ -1888,11 +2193,10 @@ def test_hybrid_search_adds_new_documents_from_semantic_results(elasticsearch_co
     """
     mock_embedding_model = MagicMock()
 
-    with patch.object(elasticsearch_core_instance, 'accurate_search') as mock_accurate, \
-            patch.object(elasticsearch_core_instance, 'semantic_search') as mock_semantic:
+    with patch.object(elasticsearch_core_instance, '_run_hybrid_queries') as mock_queries:
 
         # Accurate returns doc1
-        mock_accurate.return_value = [
+        accurate_results = [
             {
                 "score": 10.0,
                 "document": {"id": "doc1", "content": "Test doc 1"},
@@ -1901,7 +2205,7 @@ def test_hybrid_search_adds_new_documents_from_semantic_results(elasticsearch_co
         ]
 
         # Semantic returns doc1 (exists in accurate) AND doc2 (new document, not in accurate)
-        mock_semantic.return_value = [
+        semantic_results = [
             {
                 "score": 0.9,
                 "document": {"id": "doc1", "content": "Test doc 1"},
@@ -1914,6 +2218,8 @@ def test_hybrid_search_adds_new_documents_from_semantic_results(elasticsearch_co
             }
         ]
 
+        mock_queries.return_value = (accurate_results, semantic_results)
+
         result = elasticsearch_core_instance.hybrid_search(
             ["test_index"],
             "test query",
@@ -0,0 +1,152 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nexent.core.utils import two_tier_cache
+from nexent.vector_database.search_result_cache import (
+    SearchResultCache,
+    bump_index_generation,
+    get_search_result_cache,
+    set_search_result_cache,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipe:
+            def setex(self, key, ttl, value):
+                redis.store[key] = value
+
+            def execute(self):
+                return []
+
+        return Pipe()
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+
+RESULTS = [{"content": "chunk", "path_or_url": "a.pdf", "score": 0.9}]
+
+
+@pytest.fixture(autouse=True)
+def reset_global_cache():
+    set_search_result_cache(None)
+    yield
+    set_search_result_cache(None)
+
+
+def test_key_normalizes_query_and_index_order():
+    cache = SearchResultCache()
+
+    key = cache.make_key(["kb2", "kb1"], "  what   is RAG ", "hybrid", 5, ["b", "a"], "rerank-v1")
+
+    assert key == cache.make_key(["kb1", "kb2"], "what is RAG", "hybrid", 5, ["a", "b"], "rerank-v1")
+    assert key != cache.make_key(["kb1", "kb2"], "what is RAG", "semantic", 5, ["a", "b"], "rerank-v1")
+    assert key != cache.make_key(["kb1", "kb2"], "what is RAG", "hybrid", 10, ["a", "b"], "rerank-v1")
+    assert key != cache.make_key(["kb1", "kb2"], "what is RAG", "hybrid", 5, ["a"], "rerank-v1")
+    assert key != cache.make_key(["kb1", "kb2"], "what is RAG", "hybrid", 5, ["a", "b"], None)
+
+
+def test_hit_returns_independent_copy_and_counts_saved_latency():
+    cache = SearchResultCache()
+    key = cache.make_key(["kb1"], "q", "hybrid", 5)
+    assert cache.get(key) is None
+
+    cache.put(key, RESULTS, cost_ms=120.0)
+    first = cache.get(key)
+    first[0]["score"] = 0.1
+
+    assert cache.get(key) == RESULTS
+    stats = cache.stats()
+    assert stats["local_hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == pytest.approx(2 / 3, abs=1e-4)
+    assert stats["saved_ms"] == 240.0
+
+
+def test_generation_bump_invalidates_only_that_index():
+    cache = SearchResultCache()
+    set_search_result_cache(cache)
+    kb1_key = cache.make_key(["kb1"], "q", "hybrid", 5)
+    kb2_key = cache.make_key(["kb2"], "q", "hybrid", 5)
+    cache.put(kb1_key, RESULTS, 10.0)
+    cache.put(kb2_key, RESULTS, 10.0)
+
+    bump_index_generation("kb1")
+
+    assert cache.make_key(["kb1"], "q", "hybrid", 5) != kb1_key
+    assert cache.get(cache.make_key(["kb1"], "q", "hybrid", 5)) is None
+    assert cache.get(cache.make_key(["kb2"], "q", "hybrid", 5)) == RESULTS
+
+
+def test_bump_without_installed_cache_is_noop():
+    assert get_search_result_cache() is None
+    bump_index_generation("kb1")
+
+
+def test_entries_expire_after_ttl():
+    cache = SearchResultCache(ttl_seconds=60)
+    with patch.object(two_tier_cache.time, "monotonic", return_value=1000.0):
+        cache.put("k", RESULTS, 10.0)
+    with patch.object(two_tier_cache.time, "monotonic", return_value=1059.0):
+        assert cache.get("k") == RESULTS
+    with patch.object(two_tier_cache.time, "monotonic", return_value=1061.0):
+        assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_local_tier_evicts_least_recently_used():
+    cache = SearchResultCache(max_entries=2)
+    cache.put("a", RESULTS, 1.0)
+    cache.put("b", RESULTS, 1.0)
+    cache.get("a")
+    cache.put("c", RESULTS, 1.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULTS
+
+
+def test_redis_tier_shares_results_and_generations_across_processes():
+    redis = FakeRedis()
+    writer = SearchResultCache(redis_client=redis, ttl_seconds=30)
+    reader = SearchResultCache(redis_client=redis, ttl_seconds=30)
+
+    key = writer.make_key(["kb1"], "q", "semantic", 3)
+    writer.put(key, RESULTS, 80.0)
+    assert json.loads(redis.store[key])["cost_ms"] == 80.0
+
+    assert reader.get(reader.make_key(["kb1"], "q", "semantic", 3)) == RESULTS
+    assert reader.stats()["redis_hits"] == 1
+    assert reader.stats()["entries"] == 1
+
+    # A write seen by another process changes the key everywhere
+    writer.bump_generation("kb1")
+    assert reader.make_key(["kb1"], "q", "semantic", 3) != key
+
+
+def test_redis_errors_fall_back_to_local_tier():
+    redis = MagicMock()
+    redis.get.side_effect = ConnectionError("down")
+    redis.mget.side_effect = ConnectionError("down")
+    redis.pipeline.side_effect = ConnectionError("down")
+    redis.incr.side_effect = ConnectionError("down")
+    cache = SearchResultCache(redis_client=redis)
+
+    key = cache.make_key(["kb1"], "q", "hybrid", 5)
+    cache.put(key, RESULTS, 5.0)
+    assert cache.get(key) == RESULTS
+    assert cache.get("other") is None
+
+    cache.bump_generation("kb1")
+    assert cache.make_key(["kb1"], "q", "hybrid", 5) != key